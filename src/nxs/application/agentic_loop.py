@@ -17,20 +17,47 @@ The refactored design separates concerns:
 import asyncio
 import time
 from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
 from anthropic.types import ContentBlockDeltaEvent, Message, MessageStopEvent, ToolUseBlock
 
 from nxs.application.approval import ApprovalManager, ApprovalType, create_approval_request
+from nxs.application.cancellation import CancellationToken, run_cancellable
 from nxs.application.claude import Claude
 from nxs.application.conversation import Conversation
 from nxs.application.tool_registry import ToolRegistry
 from nxs.application.cost_calculator import CostCalculator
+from nxs.application.token_usage import TokenUsage
 from nxs.logger import get_logger
 
 logger = get_logger("agent_loop")
 
 
+@dataclass
+class ToolExecutionConfig:
+    """Configuration for how AgentLoop executes tool_use blocks.
+
+    Attributes:
+        parallel: Run approved tool calls from the same response concurrently.
+            Approval prompts are always serialized.
+        max_concurrency: Maximum number of tool calls in flight at once.
+        provider_concurrency: Per-provider caps keyed by provider name
+            (e.g. {"mcp": 2, "local": 4}).
+        default_provider_concurrency: Cap for providers not listed in
+            provider_concurrency (None = only the global cap applies).
+    """
+
+    parallel: bool = False
+    max_concurrency: int = 4
+    provider_concurrency: dict[str, int] = field(default_factory=dict)
+    default_provider_concurrency: Optional[int] = None
+
+    def get_provider_limit(self, provider_name: str) -> Optional[int]:
+        """Get the concurrency cap for a provider (None = uncapped)."""
+        return self.provider_concurrency.get(provider_name, self.default_provider_concurrency)
+
+
 class AgentLoop:
     """Orchestrates conversation loop with Claude using tools.
 
@@ -67,6 +94,7 @@ class AgentLoop:
         tool_registry: Optional[ToolRegistry] = None,
         callbacks: Optional[dict[str, Callable]] = None,
         approval_manager: Optional[ApprovalManager] = None,
+        tool_execution_config: Optional[ToolExecutionConfig] = None,
         # Legacy parameter for backward compatibility
         clients: Optional[Mapping[str, Any]] = None,
     ):
@@ -82,6 +110,8 @@ class AgentLoop:
             tool_registry: ToolRegistry instance (optional for legacy mode).
             callbacks: Optional callbacks for streaming, tool execution, etc.
             approval_manager: Optional ApprovalManager for tool execution approval.
+            tool_execution_config: Optional ToolExecutionConfig controlling
+                sequential vs. concurrent tool execution (default: sequential).
             clients: Legacy parameter - Mapping[str, MCPClient] (deprecated).
 
         Example (new mode):
@@ -95,6 +125,7 @@ class AgentLoop:
         self.llm = llm
         self.callbacks = callbacks or {}
         self.approval_manager = approval_manager
+        self.tool_execution_config = tool_execution_config or ToolExecutionConfig()
 
         # Backward compatibility: If clients provided, create Conversation and ToolRegistry
         if clients is not None and (conversation is None or tool_registry is None):
@@ -133,6 +164,13 @@ class AgentLoop:
 
         # Progress tracker integration (Phase 2)
         self._current_tracker: Optional[Any] = None  # ResearchProgressTracker
+        # Number of _execute_with_tool_tracking() calls in flight; parallel
+        # plan steps share one tracker, so it is only cleared by the last one
+        self._tracking_depth = 0
+        self._previous_skip_reasoning = False
+        # When set to a list, conversations used by tracked executions are
+        # collected here (the reasoning loop inspects them for evaluation)
+        self._subtask_conversations: Optional[list[Conversation]] = None
 
         logger.debug(
             f"AgentLoop initialized: {conversation.get_message_count()} "
@@ -152,6 +190,8 @@ class AgentLoop:
         query: str,
         callbacks: Optional[dict[str, Callable]] = None,
         use_streaming: bool = True,
+        conversation: Optional[Conversation] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Run the agent loop for a user query.
 
@@ -160,16 +200,26 @@ class AgentLoop:
             callbacks: Optional callbacks override (uses instance callbacks if None).
             use_streaming: Whether to use real streaming (default True).
                 Set to False for backward compatibility with fake chunking.
+            conversation: Conversation to run against instead of
+                self.conversation (e.g. a fork for an isolated subtask).
+            cancel_token: Optional CancellationToken. Cancelling it closes the
+                API stream and in-flight tool calls at once; the messages this
+                run added are then removed, so the conversation is left as it
+                was before the query.
 
         Returns:
             Final text response from Claude.
 
+        Raises:
+            QueryCancelledError: If cancel_token is cancelled.
+
         Callback interface:
             - on_start(): Called at start of run
             - on_stream_chunk(chunk: str): Called for each streamed text chunk
             - on_tool_call(name: str, input: dict): Called when tool requested
             - on_tool_result(name: str, result: str, success: bool): Called with tool result
             - on_usage(usage: dict, cost: float): Called after each API response with token usage
+              (TokenUsage.to_dict() fields plus "component")
             - on_stream_complete(): Called when streaming completes
 
         Example:
@@ -182,6 +232,7 @@ class AgentLoop:
             ... )
         """
         callbacks = callbacks or self.callbacks
+        conversation = conversation or self.conversation
 
         logger.info(f"Starting agent loop: query='{query[:100]}...'")
 
@@ -189,100 +240,112 @@ class AgentLoop:
         if "on_start" in callbacks:
             await callbacks["on_start"]()
 
-        # Add user query to conversation (skip if empty - used for pre-added messages like commands)
-        if query:
-            self.conversation.add_user_message(query)
-
-        final_text_response = ""
-        # Track cumulative usage for this conversation round (may include multiple API calls)
-        round_input_tokens = 0
-        round_output_tokens = 0
-
-        # Main conversation loop: continue until Claude stops requesting tools
-        while True:
-            # Get conversation state with cache control
-            messages = self.conversation.get_messages_for_api()
-            system = self.conversation.get_system_message_for_api()
-            tools = await self.tool_registry.get_tool_definitions_for_api()
-
-            logger.debug(
-                f"Claude API call: {len(messages)} messages, "
-                f"{len(tools)} tools, system={'yes' if system else 'no'}"
-            )
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
 
-            # Choose streaming or non-streaming based on flag
-            if use_streaming and "on_stream_chunk" in callbacks:
-                # Real streaming path
-                response = await self._run_with_streaming(
-                    messages, system, tools, callbacks
-                )
-            else:
-                # Non-streaming path (legacy compatibility)
-                response = await self._run_without_streaming(
-                    messages, system, tools, callbacks
+        # Messages this run adds, removed again if it is cancelled
+        added_messages = 0
+        try:
+            # Add user query to conversation (skip if empty - used for pre-added messages like commands)
+            if query:
+                conversation.add_user_message(query)
+                added_messages += 1
+
+            final_text_response = ""
+            # Track cumulative usage for this conversation round (may include multiple API calls)
+            round_usage = TokenUsage()
+
+            # Main conversation loop: continue until Claude stops requesting tools
+            while True:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+
+                # Get conversation state with cache control
+                messages = conversation.get_messages_for_api()
+                system = conversation.get_system_message_for_api()
+                tools = await self.tool_registry.get_tool_definitions_for_api()
+
+                logger.debug(
+                    f"Claude API call: {len(messages)} messages, "
+                    f"{len(tools)} tools, system={'yes' if system else 'no'}"
                 )
 
-            # Add assistant response to conversation
-            self.conversation.add_assistant_message(response)
-
-            # Extract usage from response and notify callback
-            if hasattr(response, "usage") and response.usage:
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-                round_input_tokens += input_tokens
-                round_output_tokens += output_tokens
+                # Choose streaming or non-streaming based on flag
+                if use_streaming and "on_stream_chunk" in callbacks:
+                    # Real streaming path
+                    response = await run_cancellable(
+                        self._run_with_streaming(messages, system, tools, callbacks, cancel_token),
+                        cancel_token,
+                    )
+                else:
+                    # Non-streaming path (legacy compatibility)
+                    response = await run_cancellable(
+                        self._run_without_streaming(messages, system, tools, callbacks),
+                        cancel_token,
+                    )
 
-                # Calculate cost for this API call
-                cost = self.cost_calculator.calculate_cost(
-                    self.llm.model, input_tokens, output_tokens
-                )
+                # Add assistant response to conversation
+                conversation.add_assistant_message(response)
+                added_messages += 1
 
-                # Notify callback with usage
-                if "on_usage" in callbacks:
-                    usage = {
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                    }
-                    await callbacks["on_usage"](usage, cost)
-            else:
-                logger.warning("API response missing usage field - cannot track tokens/cost")
+                # Extract usage from response and notify callback
+                if hasattr(response, "usage") and response.usage:
+                    token_usage = TokenUsage.from_response(response)
+                    round_usage = round_usage + token_usage
 
-            # Check stop reason
-            if response.stop_reason == "tool_use":
-                logger.info("Claude requested tool execution")
+                    # Calculate cost for this API call
+                    cost = self.cost_calculator.calculate_usage_cost(self.llm.model, token_usage)
 
-                # Extract tool use blocks
-                tool_blocks = [
-                    block for block in response.content if block.type == "tool_use"
-                ]
+                    # Notify callback with usage
+                    if "on_usage" in callbacks:
+                        usage = {**token_usage.to_dict(), "component": "agent_loop"}
+                        await callbacks["on_usage"](usage, cost)
+                else:
+                    logger.warning("API response missing usage field - cannot track tokens/cost")
 
-                # Execute tools and add results to conversation
-                await self._execute_tools(tool_blocks, callbacks)
+                # Check stop reason
+                if response.stop_reason == "tool_use":
+                    logger.info("Claude requested tool execution")
 
-                # Loop continues - send tool results back to Claude
+                    # Extract tool use blocks
+                    tool_blocks = [
+                        block for block in response.content if block.type == "tool_use"
+                    ]
 
-            else:
-                # Claude returned final text response
-                final_text_response = self._extract_text(response)
+                    # Execute tools and add results to conversation
+                    await self._execute_tools(tool_blocks, callbacks, conversation, cancel_token)
+                    added_messages += 1
 
-                logger.info(
-                    f"Agent loop completed: {len(final_text_response)} chars returned"
-                )
+                    # Loop continues - send tool results back to Claude
 
-                if "on_stream_complete" in callbacks:
-                    await callbacks["on_stream_complete"]()
+                else:
+                    # Claude returned final text response
+                    final_text_response = self._extract_text(response)
 
-                # Log round totals if we had multiple API calls
-                if round_input_tokens > 0 or round_output_tokens > 0:
-                    round_cost = self.cost_calculator.calculate_cost(
-                        self.llm.model, round_input_tokens, round_output_tokens
-                    )
-                    logger.debug(
-                        f"Round totals: {round_input_tokens} input, "
-                        f"{round_output_tokens} output tokens, ${round_cost:.6f}"
+                    logger.info(
+                        f"Agent loop completed: {len(final_text_response)} chars returned"
                     )
 
-                break
+                    if "on_stream_complete" in callbacks:
+                        await callbacks["on_stream_complete"]()
+
+                    # Log round totals if we had multiple API calls
+                    if round_usage.prompt_tokens > 0 or round_usage.output_tokens > 0:
+                        round_cost = self.cost_calculator.calculate_usage_cost(self.llm.model, round_usage)
+                        logger.debug(
+                            f"Round totals: {round_usage.input_tokens} input, "
+                            f"{round_usage.output_tokens} output tokens, "
+                            f"{round_usage.cache_creation_input_tokens} cache write, "
+                            f"{round_usage.cache_read_input_tokens} cache read, ${round_cost:.6f}"
+                        )
+
+                    break
+        except asyncio.CancelledError:
+            # Drop the unfinished exchange (the query, and any assistant
+            # tool_use still waiting for its results)
+            conversation.remove_last_messages(added_messages)
+            logger.info(f"Agent loop cancelled: removed {added_messages} unfinished messages")
+            raise
 
         return final_text_response
 
@@ -292,6 +355,8 @@ class AgentLoop:
         tracker: Any,  # ResearchProgressTracker
         use_streaming: bool = False,
         callbacks: Optional[dict[str, Callable]] = None,
+        conversation: Optional[Conversation] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """
         Execute query with tool call tracking.
@@ -302,24 +367,42 @@ class AgentLoop:
         IMPORTANT: Calls parent AgentLoop.run() directly to avoid recursive
         calls to AdaptiveReasoningLoop.run() which would trigger reasoning again.
 
+        The query runs in a fork of the conversation (unless one is passed),
+        so subtask queries and their tool traffic never reach the main
+        history; callers merge back the final answer, or the whole fork
+        (Conversation.merge_fork()) for a direct answer.
+
+        Several calls may run concurrently (parallel plan steps) as long as
+        they share the same tracker; the tracker and recursion flag are only
+        reset when the last one finishes.
+
         Args:
             query: User query to execute
             tracker: ResearchProgressTracker instance
             use_streaming: Whether to use streaming (default False for buffered execution)
             callbacks: Optional callbacks override
+            conversation: Optional conversation to run against, defaults to a
+                fresh fork of self.conversation
+            cancel_token: Optional CancellationToken of the query
 
         Returns:
             Final text response from Claude
         """
+        if conversation is None:
+            conversation = self.conversation.fork()
+        if self._subtask_conversations is not None:
+            self._subtask_conversations.append(conversation)
+
         # Set current tracker for tool execution interception
+        if self._tracking_depth == 0:
+            self._previous_skip_reasoning = getattr(self, "_skip_reasoning", False)
+        self._tracking_depth += 1
         self._current_tracker = tracker
 
         # Set recursion prevention flag (for AdaptiveReasoningLoop)
         # If self is AdaptiveReasoningLoop, this tells run() to skip reasoning logic
         # and delegate directly to AgentLoop for simple query execution with tool tracking
-        previous_skip_reasoning = False
         if hasattr(self, '_skip_reasoning'):
-            previous_skip_reasoning = self._skip_reasoning
             self._skip_reasoning = True
 
         try:
@@ -327,13 +410,21 @@ class AgentLoop:
             # - If self is AdaptiveReasoningLoop: _skip_reasoning flag causes it to
             #   bypass reasoning and call parent AgentLoop.run() directly
             # - If self is just AgentLoop: flag is ignored, executes normally
-            response = await self.run(query, callbacks=callbacks, use_streaming=use_streaming)
+            response = await self.run(
+                query,
+                callbacks=callbacks,
+                use_streaming=use_streaming,
+                conversation=conversation,
+                cancel_token=cancel_token,
+            )
             return response
         finally:
-            # Clean up: restore original state
-            self._current_tracker = None
-            if hasattr(self, '_skip_reasoning'):
-                self._skip_reasoning = previous_skip_reasoning
+            # Clean up: restore original state once no tracked run is left
+            self._tracking_depth -= 1
+            if self._tracking_depth == 0:
+                self._current_tracker = None
+                if hasattr(self, '_skip_reasoning'):
+                    self._skip_reasoning = self._previous_skip_reasoning
 
     async def _run_with_streaming(
         self,
@@ -341,6 +432,7 @@ class AgentLoop:
         system: Any,
         tools: list,
         callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
     ) -> Message:
         """Run Claude with real streaming.
 
@@ -349,6 +441,9 @@ class AgentLoop:
             system: System message with cache control.
             tools: Tool definitions with cache control.
             callbacks: Callbacks dictionary.
+            cancel_token: Optional CancellationToken; checked for every event,
+                leaving the stream context (which closes the HTTP response)
+                as soon as it is cancelled.
 
         Returns:
             Complete Message object after stream finishes.
@@ -379,6 +474,8 @@ class AgentLoop:
         async with self.llm.async_client.messages.stream(**params) as stream:
             # Process stream events
             async for event in stream:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
                 try:
                     # Log event type for debugging
                     event_type = getattr(event, "type", None)
@@ -459,33 +556,50 @@ class AgentLoop:
         return response
 
     async def _execute_tools(
-        self, tool_blocks: list[ToolUseBlock], callbacks: dict[str, Callable]
+        self,
+        tool_blocks: list[ToolUseBlock],
+        callbacks: dict[str, Callable],
+        conversation: Optional[Conversation] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> None:
         """Execute tool requests and add results to conversation.
 
         Modified to integrate with ResearchProgressTracker (Phase 2):
-        - Checks tracker cache before executing tools
         - Logs tool executions to tracker with timing
         - Tracks success/failure metadata
 
+        Results are reused only through ToolRegistry's result cache, which
+        follows each tool's declared cache policy.
+
+        When ``tool_execution_config.parallel`` is enabled, approval prompts
+        are still resolved one block at a time (so the user never sees
+        overlapping prompts), but the approved calls are then run
+        concurrently, bounded by the global and per-provider caps. Results are
+        always passed to the conversation in the original block order.
+
         Args:
             tool_blocks: List of ToolUseBlock from Claude's response.
             callbacks: Callbacks dictionary.
+            conversation: Conversation receiving the results (defaults to
+                self.conversation).
+            cancel_token: Optional CancellationToken; cancelling it cancels
+                the in-flight calls and no results are added.
         """
-        results: list[str] = []
+        results: list[str] = [""] * len(tool_blocks)
+        pending: list[tuple[int, str, dict[str, Any]]] = []  # (index, name, args)
+        parallel = self.tool_execution_config.parallel and len(tool_blocks) > 1
         approve_all = False
         deny_all = False
 
-        for tool_block in tool_blocks:
+        for index, tool_block in enumerate(tool_blocks):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
             tool_name = tool_block.name
             tool_input = tool_block.input
 
             logger.debug(f"Executing tool: {tool_name}")
 
-            # NEW: Check tracker for cached result (Phase 2)
-            cached_result = None
-            should_execute = True
-
             # Convert tool_input to dict[str, Any] for tracker and execution
             # ToolUseBlock.input is typed as object but is actually a dict
             tool_args: dict[str, Any] = {}
@@ -494,30 +608,6 @@ class AgentLoop:
             elif hasattr(tool_input, "__dict__"):
                 tool_args = {str(k): v for k, v in tool_input.__dict__.items()}
 
-            if self._current_tracker:
-                should_execute, cached_result = self._current_tracker.should_execute_tool(
-                    tool_name, tool_args
-                )
-
-                if not should_execute and cached_result:
-                    logger.info(f"Using cached result for {tool_name}")
-                    results.append(cached_result)
-
-                    # Notify tool result (cached)
-                    if "on_tool_result" in callbacks:
-                        await callbacks["on_tool_result"](tool_name, cached_result, True)
-
-                    # Log cached execution to tracker
-                    self._current_tracker.log_tool_execution(
-                        tool_name=tool_name,
-                        arguments=tool_args,
-                        success=True,
-                        result=cached_result,
-                        execution_time_ms=0.0,  # Cached, no execution time
-                    )
-
-                    continue
-
             # Notify tool call
             if "on_tool_call" in callbacks:
                 await callbacks["on_tool_call"](tool_name, tool_input)
@@ -563,7 +653,7 @@ class AgentLoop:
                 if not response.approved or deny_all:
                     logger.info(f"Tool execution denied: {tool_name}")
                     error_msg = f"Tool '{tool_name}' execution denied by user"
-                    results.append(error_msg)
+                    results[index] = error_msg
 
                     # Notify tool result
                     if "on_tool_result" in callbacks:
@@ -583,58 +673,140 @@ class AgentLoop:
 
                 logger.info(f"Tool execution approved: {tool_name}")
 
-            # NEW: Track execution time (Phase 2)
-            start_time = time.time()
-            execution_time_ms = 0.0
-
-            try:
-                # Execute via ToolRegistry (tool_args already converted above)
-                result = await self.tool_registry.execute_tool(tool_name, tool_args)
-                execution_time_ms = (time.time() - start_time) * 1000
-                results.append(result)
-
-                # Notify tool result
-                if "on_tool_result" in callbacks:
-                    await callbacks["on_tool_result"](tool_name, result, True)
-
-                logger.debug(f"Tool '{tool_name}' succeeded: {len(result)} chars")
-
-                # NEW: Log successful execution to tracker (Phase 2)
-                if self._current_tracker:
-                    self._current_tracker.log_tool_execution(
-                        tool_name=tool_name,
-                        arguments=tool_args,
-                        success=True,
-                        result=result,
-                        execution_time_ms=execution_time_ms,
-                    )
+            if parallel:
+                # Defer execution until every block has been approved
+                pending.append((index, tool_name, tool_args))
+                continue
 
-            except Exception as e:
-                execution_time_ms = (time.time() - start_time) * 1000
-                error_msg = f"Error executing tool '{tool_name}': {e}"
-                logger.error(error_msg, exc_info=True)
-
-                results.append(error_msg)
-
-                # Notify tool error
-                if "on_tool_result" in callbacks:
-                    await callbacks["on_tool_result"](tool_name, error_msg, False)
-
-                # NEW: Log failed execution to tracker (Phase 2)
-                if self._current_tracker:
-                    self._current_tracker.log_tool_execution(
-                        tool_name=tool_name,
-                        arguments=tool_args,
-                        success=False,
-                        error=error_msg,
-                        execution_time_ms=execution_time_ms,
-                    )
+            results[index] = await self._run_tool(tool_name, tool_args, callbacks, cancel_token)
+
+        if pending:
+            await self._run_tools_concurrently(pending, results, callbacks, cancel_token)
 
         # Add all tool results to conversation
-        self.conversation.add_tool_results(tool_blocks, results)
+        (conversation or self.conversation).add_tool_results(tool_blocks, results)
 
         logger.debug(f"Added {len(results)} tool results to conversation")
 
+    async def _run_tool(
+        self,
+        tool_name: str,
+        tool_args: dict[str, Any],
+        callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> str:
+        """Execute a single approved tool call.
+
+        Handles timing, the ``on_tool_result`` callback and tracker logging.
+        Errors are converted into an error message rather than raised, so a
+        failing tool never aborts its siblings.
+
+        Args:
+            tool_name: Name of the tool to execute.
+            tool_args: Tool arguments dictionary.
+            callbacks: Callbacks dictionary.
+            cancel_token: Optional CancellationToken passed to the registry.
+
+        Returns:
+            Tool result, or an error message if execution failed.
+        """
+        # NEW: Track execution time (Phase 2)
+        start_time = time.time()
+        execution_time_ms = 0.0
+
+        try:
+            # Execute via ToolRegistry (tool_args already converted above)
+            result = await self.tool_registry.execute_tool(tool_name, tool_args, cancel_token=cancel_token)
+            execution_time_ms = (time.time() - start_time) * 1000
+
+            # Notify tool result
+            if "on_tool_result" in callbacks:
+                await callbacks["on_tool_result"](tool_name, result, True)
+
+            logger.debug(f"Tool '{tool_name}' succeeded: {len(result)} chars")
+
+            # NEW: Log successful execution to tracker (Phase 2)
+            if self._current_tracker:
+                self._current_tracker.log_tool_execution(
+                    tool_name=tool_name,
+                    arguments=tool_args,
+                    success=True,
+                    result=result,
+                    execution_time_ms=execution_time_ms,
+                )
+
+            return result
+
+        except Exception as e:
+            execution_time_ms = (time.time() - start_time) * 1000
+            error_msg = f"Error executing tool '{tool_name}': {e}"
+            logger.error(error_msg, exc_info=True)
+
+            # Notify tool error
+            if "on_tool_result" in callbacks:
+                await callbacks["on_tool_result"](tool_name, error_msg, False)
+
+            # NEW: Log failed execution to tracker (Phase 2)
+            if self._current_tracker:
+                self._current_tracker.log_tool_execution(
+                    tool_name=tool_name,
+                    arguments=tool_args,
+                    success=False,
+                    error=error_msg,
+                    execution_time_ms=execution_time_ms,
+                )
+
+            return error_msg
+
+    async def _run_tools_concurrently(
+        self,
+        pending: list[tuple[int, str, dict[str, Any]]],
+        results: list[str],
+        callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> None:
+        """Run approved tool calls concurrently, writing results in place.
+
+        Args:
+            pending: (block index, tool name, arguments) for each approved call.
+            results: Result slots indexed by original block position.
+            callbacks: Callbacks dictionary.
+            cancel_token: Optional CancellationToken passed to the registry.
+        """
+        config = self.tool_execution_config
+        global_limit = asyncio.Semaphore(max(1, config.max_concurrency))
+        provider_limits: dict[str, asyncio.Semaphore] = {}
+
+        def provider_limit(tool_name: str) -> Optional[asyncio.Semaphore]:
+            provider_name = self.tool_registry.get_provider_name(tool_name)
+            if provider_name is None:
+                return None
+            limit = config.get_provider_limit(provider_name)
+            if limit is None:
+                return None
+            if provider_name not in provider_limits:
+                provider_limits[provider_name] = asyncio.Semaphore(max(1, limit))
+            return provider_limits[provider_name]
+
+        async def run_one(index: int, tool_name: str, tool_args: dict[str, Any]) -> None:
+            # Acquire the provider slot first so a saturated provider doesn't
+            # hold global slots that other providers could use
+            per_provider = provider_limit(tool_name)
+            if per_provider is None:
+                async with global_limit:
+                    results[index] = await self._run_tool(tool_name, tool_args, callbacks, cancel_token)
+                return
+            async with per_provider, global_limit:
+                results[index] = await self._run_tool(tool_name, tool_args, callbacks, cancel_token)
+
+        logger.info(
+            f"Executing {len(pending)} tools concurrently "
+            f"(max_concurrency={config.max_concurrency})"
+        )
+        await asyncio.gather(
+            *[run_one(index, tool_name, tool_args) for index, tool_name, tool_args in pending]
+        )
+
     def _extract_text(self, message: Message) -> str:
         """Extract text content from a Message.
 
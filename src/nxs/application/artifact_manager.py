@@ -149,6 +149,10 @@ class ArtifactManager:
         logger.info("Retrieved %d prompt(s) from all servers", len(prompts))
         return prompts
 
+    async def get_prompts_by_server(self, server_names: list[str] | None = None) -> dict[str, list[Prompt]]:
+        """Get prompts grouped by server (one list_prompts() per server, run concurrently)."""
+        return await self._artifact_repository.get_prompts_by_server(server_names)
+
     async def get_tools(self) -> list[Tool]:
         """Get tools from all connected servers."""
         tools = await self._artifact_repository.get_tools()
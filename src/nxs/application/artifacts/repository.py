@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, Callable, Mapping
+from typing import Any, Awaitable, Callable, Iterable, Mapping, TypeVar
 
 from mcp.types import Prompt, Resource, Tool
 
@@ -14,15 +14,57 @@ from nxs.logger import get_logger
 
 logger = get_logger("artifact_repository")
 
+T = TypeVar("T")
+
+
+def _describe(err: BaseException) -> str:
+    """Readable error text (asyncio.TimeoutError has an empty message)."""
+    if isinstance(err, asyncio.TimeoutError):
+        return "timed out"
+    return str(err)
+
+
+def _format_artifacts(category: str, items: list[Any]) -> list[dict[str, str | None]]:
+    """Convert MCP artifact objects into the name/description dicts used by the UI."""
+    if category == "resources":
+        return [
+            {
+                "name": str(resource.uri),
+                "description": (
+                    resource.description
+                    if hasattr(resource, "description") and resource.description
+                    else resource.name if hasattr(resource, "name") and resource.name else None
+                ),
+            }
+            for resource in items
+        ]
+    return [{"name": item.name, "description": item.description} for item in items]
+
 
 class ArtifactRepository:
-    """Fetch artifacts (resources, prompts, tools) from MCP clients."""
+    """Fetch artifacts (resources, prompts, tools) from MCP clients.
+
+    Servers (and, for a single server, the three artifact categories) are
+    queried concurrently. Each server gets its own deadline so one hung
+    server cannot consume a shared budget and starve the others.
+    """
 
     def __init__(
         self,
         clients_provider: Callable[[], Mapping[str, MCPClient]],
+        *,
+        server_timeout: float | None = 15.0,
     ) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            clients_provider: Callable returning the current server -> client mapping
+            server_timeout: Per-server deadline in seconds for fan-out fetches
+                (None disables it)
+        """
         self._clients_provider = clients_provider
+        self._server_timeout = server_timeout
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -30,6 +72,30 @@ class ArtifactRepository:
     def _connected_clients(self) -> Mapping[str, MCPClient]:
         return {name: client for name, client in self._clients_provider().items() if client.is_connected}
 
+    async def _fan_out(
+        self,
+        fetch: Callable[[str, MCPClient], Awaitable[T]],
+        clients: Mapping[str, MCPClient],
+    ) -> dict[str, T | BaseException]:
+        """
+        Run ``fetch`` for every client concurrently, each under the per-server deadline.
+
+        Args:
+            fetch: Coroutine function called with (server_name, client)
+            clients: Clients to query
+
+        Returns:
+            Mapping of server name to result, or to the exception raised
+            (asyncio.TimeoutError when the server missed its deadline).
+            Keys keep the order of ``clients``.
+        """
+        names = list(clients)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(fetch(name, clients[name]), timeout=self._server_timeout) for name in names),
+            return_exceptions=True,
+        )
+        return dict(zip(names, results, strict=True))
+
     # ------------------------------------------------------------------
     # Artifact fetch methods
     # ------------------------------------------------------------------
@@ -37,27 +103,55 @@ class ArtifactRepository:
         """Return mapping of server name to resource URIs."""
         all_resource_ids: dict[str, list[str]] = {}
 
-        for server_name, client in self._connected_clients().items():
-            try:
-                logger.debug("Listing resources from %s", server_name)
-                resource_list: list[Resource] = await client.list_resources()
-                all_resource_ids[server_name] = [str(resource.uri) for resource in resource_list]
-            except Exception as err:
-                logger.error("Failed to list resources from %s: %s", server_name, err)
+        async def _list(server_name: str, client: MCPClient) -> list[Resource]:
+            logger.debug("Listing resources from %s", server_name)
+            return await client.list_resources()
+
+        for server_name, result in (await self._fan_out(_list, self._connected_clients())).items():
+            if isinstance(result, BaseException):
+                logger.error("Failed to list resources from %s: %s", server_name, _describe(result))
                 all_resource_ids[server_name] = []
+            else:
+                all_resource_ids[server_name] = [str(resource.uri) for resource in result]
 
         return all_resource_ids
 
     async def get_prompts(self) -> list[Prompt]:
         """Return prompts from all connected servers."""
         prompts: list[Prompt] = []
+        for server_prompts in (await self.get_prompts_by_server()).values():
+            prompts.extend(server_prompts)
+        return prompts
 
-        for server_name, client in self._connected_clients().items():
-            try:
-                logger.debug("Listing prompts from %s", server_name)
-                prompts.extend(await client.list_prompts())
-            except Exception as err:
-                logger.error("Failed to list prompts from %s: %s", server_name, err)
+    async def get_prompts_by_server(
+        self,
+        server_names: Iterable[str] | None = None,
+    ) -> dict[str, list[Prompt]]:
+        """
+        Return prompts grouped by server, with one list_prompts() call per server.
+
+        Args:
+            server_names: Restrict the fetch to these servers (all connected if None)
+
+        Returns:
+            Mapping of server name to its prompts, in server order. Servers
+            whose fetch failed are omitted, so callers can keep stale data.
+        """
+        clients = self._connected_clients()
+        if server_names is not None:
+            wanted = set(server_names)
+            clients = {name: client for name, client in clients.items() if name in wanted}
+
+        async def _list(server_name: str, client: MCPClient) -> list[Prompt]:
+            logger.debug("Listing prompts from %s", server_name)
+            return await client.list_prompts()
+
+        prompts: dict[str, list[Prompt]] = {}
+        for server_name, result in (await self._fan_out(_list, clients)).items():
+            if isinstance(result, BaseException):
+                logger.error("Failed to list prompts from %s: %s", server_name, _describe(result))
+            else:
+                prompts[server_name] = list(result)
 
         return prompts
 
@@ -65,20 +159,21 @@ class ArtifactRepository:
         """Return tools from all connected servers."""
         tools: list[Tool] = []
 
-        for server_name, client in self._connected_clients().items():
-            try:
-                logger.debug("Listing tools from %s", server_name)
-                result = await client.list_tools()
-                if isinstance(result, list):
-                    tools.extend(result)
-                else:
-                    logger.warning(
-                        "Unexpected return type from list_tools() on %s: %s",
-                        server_name,
-                        type(result),
-                    )
-            except Exception as err:
-                logger.error("Failed to list tools from %s: %s", server_name, err)
+        async def _list(server_name: str, client: MCPClient) -> list[Tool]:
+            logger.debug("Listing tools from %s", server_name)
+            return await client.list_tools()
+
+        for server_name, result in (await self._fan_out(_list, self._connected_clients())).items():
+            if isinstance(result, BaseException):
+                logger.error("Failed to list tools from %s: %s", server_name, _describe(result))
+            elif isinstance(result, list):
+                tools.extend(result)
+            else:
+                logger.warning(
+                    "Unexpected return type from list_tools() on %s: %s",
+                    server_name,
+                    type(result),
+                )
 
         return tools
 
@@ -89,18 +184,22 @@ class ArtifactRepository:
 
     async def find_prompt(self, prompt_name: str) -> tuple[Prompt, str] | None:
         """Find a prompt by name across all servers."""
-        for server_name, client in self._connected_clients().items():
-            try:
-                prompts = await client.list_prompts()
-                for prompt in prompts:
-                    if prompt.name == prompt_name:
-                        return prompt, server_name
-            except Exception as err:
+
+        async def _list(server_name: str, client: MCPClient) -> list[Prompt]:
+            return await client.list_prompts()
+
+        # First match in server order wins, as with a sequential search
+        for server_name, result in (await self._fan_out(_list, self._connected_clients())).items():
+            if isinstance(result, BaseException):
                 logger.error(
                     "Failed to search prompts in %s: %s",
                     server_name,
-                    err,
+                    _describe(result),
                 )
+                continue
+            for prompt in result:
+                if prompt.name == prompt_name:
+                    return prompt, server_name
         return None
 
     async def get_server_artifacts(
@@ -112,6 +211,10 @@ class ArtifactRepository:
         """
         Fetch all artifact categories for a server.
 
+        Tools, prompts and resources are listed concurrently. A category that
+        fails (or is still pending when the timeout expires) is left empty;
+        categories that completed are still returned.
+
         Args:
             server_name: Name of the server
             retry_on_empty: If True, retry if result is empty
@@ -135,56 +238,34 @@ class ArtifactRepository:
             logger.debug("Server %s is not connected, skipping artifact fetch", server_name)
             return artifacts
 
-        # Wrap fetch operations with timeout if specified
-        async def _fetch_all():
-            # Tools
-            tools = await self._fetch_with_retry(
-                client.list_tools,
-                server_name,
-                "tools",
-                retry_on_empty=retry_on_empty,
-            )
-            artifacts["tools"] = [{"name": tool.name, "description": tool.description} for tool in tools]
+        fetchers: dict[str, Callable[[], Awaitable[list]]] = {
+            "tools": client.list_tools,
+            "prompts": client.list_prompts,
+            "resources": client.list_resources,
+        }
+        tasks = {
+            asyncio.create_task(
+                self._fetch_with_retry(fetch, server_name, category, retry_on_empty=retry_on_empty)
+            ): category
+            for category, fetch in fetchers.items()
+        }
 
-            # Prompts
-            prompts = await self._fetch_with_retry(
-                client.list_prompts,
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(
+                "Timeout fetching %s for %s",
+                ", ".join(sorted(tasks[task] for task in pending)),
                 server_name,
-                "prompts",
-                retry_on_empty=retry_on_empty,
             )
-            artifacts["prompts"] = [{"name": prompt.name, "description": prompt.description} for prompt in prompts]
 
-            # Resources
-            resources = await self._fetch_with_retry(
-                client.list_resources,
-                server_name,
-                "resources",
-                retry_on_empty=retry_on_empty,
-            )
-            artifacts["resources"] = [
-                {
-                    "name": str(resource.uri),
-                    "description": (
-                        resource.description
-                        if hasattr(resource, "description") and resource.description
-                        else resource.name if hasattr(resource, "name") and resource.name else None
-                    ),
-                }
-                for resource in resources
-            ]
-
-        try:
-            if timeout is not None:
-                await asyncio.wait_for(_fetch_all(), timeout=timeout)
-            else:
-                await _fetch_all()
-        except asyncio.TimeoutError:
-            logger.warning("Timeout fetching artifacts for %s", server_name)
-            return artifacts  # Return empty artifacts on timeout
-        except Exception as err:
-            logger.error("Error fetching artifacts for %s: %s", server_name, err)
-            return artifacts  # Return empty artifacts on error
+        for task in done:
+            category = tasks[task]
+            if task.exception() is not None:
+                logger.error("Error fetching %s for %s: %s", category, server_name, task.exception())
+                continue
+            artifacts[category] = _format_artifacts(category, task.result())
 
         logger.debug(
             "Fetched artifacts for %s: %d tools, %d prompts, %d resources",
@@ -201,7 +282,10 @@ class ArtifactRepository:
         timeout: float | None = None,
     ) -> dict[str, ArtifactCollection]:
         """
-        Fetch artifacts for all servers.
+        Fetch artifacts for all servers concurrently.
+
+        Each server is bounded by the per-server timeout (capped by ``timeout``),
+        so a hung server only empties its own entry.
 
         Args:
             timeout: Optional timeout in seconds for the entire operation
@@ -209,25 +293,23 @@ class ArtifactRepository:
         Returns:
             Dictionary mapping server names to their artifacts
         """
+        server_names = list(self._clients_provider().keys())
+        per_server = self._server_timeout
+        if timeout is not None:
+            per_server = timeout if per_server is None else min(per_server, timeout)
+
+        results = await asyncio.gather(
+            *(self.get_server_artifacts(name, timeout=per_server) for name in server_names),
+            return_exceptions=True,
+        )
 
-        async def _fetch_all_servers():
-            results: dict[str, ArtifactCollection] = {}
-            for server_name in self._clients_provider().keys():
-                results[server_name] = await self.get_server_artifacts(server_name)
-            return results
-
-        try:
-            if timeout is not None:
-                return await asyncio.wait_for(_fetch_all_servers(), timeout=timeout)
-            else:
-                return await _fetch_all_servers()
-        except asyncio.TimeoutError:
-            logger.warning("Timeout fetching artifacts for all servers")
-            # Return empty artifacts for all servers
-            return {
-                server_name: {"tools": [], "prompts": [], "resources": []}
-                for server_name in self._clients_provider().keys()
-            }
+        all_artifacts: dict[str, ArtifactCollection] = {}
+        for server_name, result in zip(server_names, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Error fetching artifacts for %s: %s", server_name, result)
+                result = {"tools": [], "prompts": [], "resources": []}
+            all_artifacts[server_name] = result
+        return all_artifacts
 
     # ------------------------------------------------------------------
     # Internal utilities
@@ -0,0 +1,141 @@
+"""Cooperative cancellation of running queries.
+
+A CancellationToken is created per query and passed down through AgentLoop,
+the reasoning strategies and ToolRegistry. Work awaited through the token
+(run_cancellable()) runs in a task that cancel() cancels at once, so an
+Anthropic stream is closed by its context manager and in-flight tool calls
+are cancelled (MCP calls send notifications/cancelled). Between steps,
+raise_if_cancelled() stops the query before new work starts.
+
+Cancellation surfaces as QueryCancelledError, a subclass of
+asyncio.CancelledError, so it passes through the ``except Exception``
+handlers used for tool and component failures.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from nxs.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["CancellationToken", "QueryCancelledError", "run_cancellable"]
+
+T = TypeVar("T")
+
+DEFAULT_REASON = "Cancelled by user"
+
+
+class QueryCancelledError(asyncio.CancelledError):
+    """Raised when a query is cancelled through its CancellationToken."""
+
+
+class CancellationToken:
+    """Cancellation signal shared by everything working on one query.
+
+    Example:
+        >>> token = CancellationToken()
+        >>> task = asyncio.create_task(agent.run(query, cancel_token=token))
+        >>> token.cancel()  # e.g. from a key binding
+        >>> await task
+        Traceback (most recent call last):
+        QueryCancelledError: Cancelled by user
+    """
+
+    def __init__(self) -> None:
+        """Initialize a token that is not cancelled."""
+        self._reason: Optional[str] = None
+        self._tasks: set[asyncio.Future] = set()
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._reason is not None
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Reason passed to cancel() (None while not cancelled)."""
+        return self._reason
+
+    def cancel(self, reason: str = DEFAULT_REASON) -> bool:
+        """Cancel the query: cancel all work running under the token.
+
+        Args:
+            reason: Human-readable reason, carried by QueryCancelledError.
+
+        Returns:
+            True if the token was cancelled by this call, False if it already was.
+        """
+        if self._reason is not None:
+            return False
+        self._reason = reason
+        logger.info(f"Query cancelled ({reason}): stopping {len(self._tasks)} running operations")
+
+        for task in list(self._tasks):
+            task.cancel()
+        for callback in list(self._callbacks):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Cancellation callback failed: {e}", exc_info=True)
+        return True
+
+    def raise_if_cancelled(self) -> None:
+        """Raise QueryCancelledError if the token is cancelled."""
+        if self._reason is not None:
+            raise QueryCancelledError(self._reason)
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked once when the token is cancelled.
+
+        Called immediately if the token is already cancelled.
+        """
+        if self._reason is not None:
+            callback()
+            return
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        """Remove a previously registered callback (no-op if absent)."""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """Await awaitable in a task that cancel() cancels.
+
+        Args:
+            awaitable: Coroutine or future to run.
+
+        Returns:
+            The result of awaitable.
+
+        Raises:
+            QueryCancelledError: If the token is (or becomes) cancelled.
+        """
+        if self._reason is not None:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            self.raise_if_cancelled()
+
+        task = asyncio.ensure_future(awaitable)
+        self._tasks.add(task)
+        try:
+            return await task
+        except asyncio.CancelledError as e:
+            # A cancelled task re-raises a plain CancelledError; report it as
+            # a query cancellation if it came from this token
+            if self._reason is not None and not isinstance(e, QueryCancelledError):
+                raise QueryCancelledError(self._reason) from None
+            raise
+        finally:
+            self._tasks.discard(task)
+
+
+async def run_cancellable(awaitable: Awaitable[T], cancel_token: Optional[CancellationToken]) -> T:
+    """Await awaitable under cancel_token, or directly if there is no token."""
+    if cancel_token is None:
+        return await awaitable
+    return await cancel_token.run(awaitable)
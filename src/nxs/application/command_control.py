@@ -1,8 +1,10 @@
+import asyncio
 from typing import Any, List, Tuple, Optional, Callable, cast, TYPE_CHECKING
 from mcp.types import Prompt, PromptMessage
 from anthropic.types import MessageParam
 
 from nxs.application.agentic_loop import AgentLoop
+from nxs.application.cancellation import CancellationToken
 from nxs.application.reasoning_loop import AdaptiveReasoningLoop
 from nxs.application.conversation import Conversation
 from nxs.application.claude import Claude
@@ -12,6 +14,7 @@ from nxs.logger import get_logger
 
 if TYPE_CHECKING:
     from nxs.application.session_state import SessionState
+    from nxs.application.tool_registry import ToolRegistry
 
 logger = get_logger("main")
 
@@ -74,6 +77,11 @@ class CommandControlAgent:
         """Set the conversation in the reasoning loop."""
         self.reasoning_loop.conversation = value
 
+    @property
+    def tool_registry(self) -> "ToolRegistry":
+        """Get the tool registry from the reasoning loop."""
+        return self.reasoning_loop.tool_registry
+
     async def _extract_resources(self, query: str) -> str:
         mentions = [word[1:] for word in query.split() if word.startswith("@")]
 
@@ -236,6 +244,7 @@ class CommandControlAgent:
         query: str,
         use_streaming: bool = True,
         callbacks: Optional[dict[str, Callable]] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Process a query with command/resource extraction, then delegate appropriately.
 
@@ -246,9 +255,14 @@ class CommandControlAgent:
             query: User query (may contain /commands or @resources)
             use_streaming: Whether to stream the response
             callbacks: Optional callbacks (merged with instance callbacks)
+            cancel_token: Optional CancellationToken for aborting the query;
+                a cancelled query leaves no messages in the conversation
 
         Returns:
             The final response
+
+        Raises:
+            QueryCancelledError: If cancel_token is cancelled.
         """
         logger.info(f"CommandControlAgent processing query: '{query[:50]}{'...' if len(query) > 50 else ''}'")
 
@@ -280,6 +294,8 @@ class CommandControlAgent:
         added_resources = await self._extract_resources(query)
 
         # Check if this is a command
+        conversation = self.reasoning_loop.conversation
+        message_count = conversation.get_message_count()
         is_command = await self._process_command(query)
         if is_command:
             logger.info("Query was processed as a command, executing directly via base AgentLoop")
@@ -321,12 +337,20 @@ Note: The content above is provided as reference material. Use it as needed to c
 """
                 self.reasoning_loop.conversation.add_user_message(context_message)
 
+            # Prompt and context messages, removed again if the query is cancelled
+            command_messages = conversation.get_message_count() - message_count
+
             # Execute directly via base AgentLoop (bypass reasoning loop overhead)
-            return await self._execute_direct(
-                query="",  # Empty query since command already added to conversation
-                use_streaming=use_streaming,
-                callbacks=merged_callbacks,
-            )
+            try:
+                return await self._execute_direct(
+                    query="",  # Empty query since command already added to conversation
+                    use_streaming=use_streaming,
+                    callbacks=merged_callbacks,
+                    cancel_token=cancel_token,
+                )
+            except asyncio.CancelledError:
+                conversation.remove_last_messages(command_messages)
+                raise
 
         # Not a command - process as regular query with resources
 
@@ -383,6 +407,7 @@ Don't refer to or mention the provided context in any way - just use it to infor
                 query=enriched_query,
                 use_streaming=use_streaming,
                 callbacks=merged_callbacks,
+                cancel_token=cancel_token,
             )
         else:
             logger.debug("No resources or session context found - using plain query")
@@ -392,6 +417,7 @@ Don't refer to or mention the provided context in any way - just use it to infor
                 query=query,
                 use_streaming=use_streaming,
                 callbacks=merged_callbacks,
+                cancel_token=cancel_token,
             )
 
     async def _execute_direct(
@@ -399,6 +425,7 @@ Don't refer to or mention the provided context in any way - just use it to infor
         query: str,
         use_streaming: bool,
         callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Execute query directly via base AgentLoop, bypassing reasoning overhead.
 
@@ -409,6 +436,7 @@ Don't refer to or mention the provided context in any way - just use it to infor
             query: Query to execute (may be empty if messages already in conversation)
             use_streaming: Whether to stream the response
             callbacks: Callbacks for execution
+            cancel_token: Optional CancellationToken for aborting the query
 
         Returns:
             The response from Claude
@@ -420,6 +448,7 @@ Don't refer to or mention the provided context in any way - just use it to infor
             query=query,
             use_streaming=use_streaming,
             callbacks=callbacks,
+            cancel_token=cancel_token,
         )
 
 
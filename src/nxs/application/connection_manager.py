@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Mapping
+from functools import partial
 from typing import Dict, Optional
 from types import MappingProxyType
 
 from nxs.application.mcp_config import MCPServersConfig, load_mcp_config
 from nxs.domain.protocols import MCPClient, ClientProvider
 from nxs.domain.events import (
+    ArtifactsListChanged,
     ConnectionStatusChanged,
     EventBus,
     ReconnectProgress,
@@ -26,7 +28,7 @@ class MCPConnectionManager:
 
     Responsibilities:
     - Create MCP clients from configuration
-    - Connect/disconnect all clients
+    - Connect/disconnect all clients (concurrently, with per-server deadlines)
     - Track connection status across all servers
     - Publish connection events to event bus
 
@@ -39,6 +41,7 @@ class MCPConnectionManager:
         config: Optional[MCPServersConfig] = None,
         event_bus: Optional[EventBus] = None,
         client_provider: Optional[ClientProvider] = None,
+        connect_timeout: float = 20.0,
     ):
         """
         Initialize the MCPConnectionManager.
@@ -47,6 +50,8 @@ class MCPConnectionManager:
             config: MCP server configuration (loads from default if None)
             event_bus: Event bus for publishing connection events
             client_provider: Factory for creating MCP clients (uses default if None)
+            connect_timeout: Default seconds initialize() waits for each server
+                (overridable per server via ``connect_timeout`` in its config)
         """
         self._config = config or load_mcp_config()
         self.event_bus = event_bus or EventBus()
@@ -60,13 +65,22 @@ class MCPConnectionManager:
 
         self._clients: Dict[str, MCPClient] = {}
         self._previous_statuses: Dict[str, ConnectionStatus] = {}
+        self._connect_timeout = connect_timeout
+        self._connect_tasks: Dict[str, asyncio.Task] = {}
 
-    async def initialize(self, use_auth: bool = False) -> None:
+    async def initialize(self, use_auth: bool = False, wait_for_all: bool = False) -> None:
         """
-        Create and connect MCP clients for all configured servers.
+        Create MCP clients for all configured servers and connect them concurrently.
+
+        Returns as soon as any server is ready (or once every server has either
+        finished connecting or passed its deadline). Servers that are still
+        connecting keep going in the background and announce themselves through
+        ConnectionStatusChanged events when they become ready.
 
         Args:
             use_auth: Whether to use OAuth authentication for remote servers
+            wait_for_all: Wait for every server (up to its deadline) instead of
+                returning when the first one is ready
         """
         logger.info("Initializing MCPConnectionManager")
 
@@ -74,21 +88,110 @@ class MCPConnectionManager:
             self._config.mcpServers,
             status_callback=self._handle_status_change,
             progress_callback=self._handle_reconnect_progress,
+            list_changed_callback=self._handle_list_changed,
         )
 
         self._clients.update(created_clients)
         logger.info("Prepared %d MCP client(s)", len(created_clients))
 
+        tasks: Dict[asyncio.Task, str] = {}
         for server_name, client in created_clients.items():
-            try:
-                await client.connect(use_auth=use_auth)
-                logger.info("Successfully connected to %s", server_name)
-            except Exception as err:  # pragma: no cover - defensive logging
-                logger.error("Failed to connect to %s: %s", server_name, err)
-                self._handle_status_change(server_name, ConnectionStatus.ERROR)
+            task = asyncio.create_task(
+                self._connect_client(server_name, client, use_auth),
+                name=f"mcp-connect-{server_name}",
+            )
+            self._connect_tasks[server_name] = task
+            task.add_done_callback(partial(self._forget_connect_task, server_name))
+            tasks[task] = server_name
+
+        await self._wait_for_connections(tasks, wait_for_all)
+
+    def _forget_connect_task(self, server_name: str, task: asyncio.Task) -> None:
+        """Drop a finished connection task, unless a newer one replaced it."""
+        if self._connect_tasks.get(server_name) is task:
+            del self._connect_tasks[server_name]
+
+    async def _connect_client(self, server_name: str, client: MCPClient, use_auth: bool) -> bool:
+        """
+        Connect a single client.
+
+        Args:
+            server_name: Name of the server
+            client: Client to connect
+            use_auth: Whether to use OAuth authentication
+
+        Returns:
+            True if the client ended up connected
+        """
+        try:
+            await client.connect(use_auth=use_auth)  # type: ignore[attr-defined]
+        except Exception as err:  # pragma: no cover - defensive logging
+            logger.error("Failed to connect to %s: %s", server_name, err)
+            self._handle_status_change(server_name, ConnectionStatus.ERROR)
+            return False
+
+        if client.is_connected:
+            logger.info("Successfully connected to %s", server_name)
+            return True
+        logger.warning("Initial connection attempt to %s did not succeed; retrying in background", server_name)
+        return False
+
+    async def _wait_for_connections(self, tasks: Dict[asyncio.Task, str], wait_for_all: bool) -> None:
+        """
+        Wait for connection tasks until one is ready or every deadline has passed.
+
+        Tasks are never cancelled here; servers that miss their deadline keep
+        connecting in the background.
+
+        Args:
+            tasks: Mapping of connection task to server name
+            wait_for_all: Keep waiting after the first server is ready
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadlines = {name: start + self._get_connect_timeout(name) for name in tasks.values()}
+        pending = dict(tasks)
+
+        while pending:
+            now = loop.time()
+            for task, name in list(pending.items()):
+                if now >= deadlines[name]:
+                    logger.warning(
+                        "%s not ready after %.1fs; it will join in the background",
+                        name,
+                        now - start,
+                    )
+                    del pending[task]
+            if not pending:
+                break
+
+            timeout = min(deadlines[name] for name in pending.values()) - now
+            done, _ = await asyncio.wait(pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = pending.pop(task)
+                if task.result() and not wait_for_all:
+                    logger.info(
+                        "%s ready after %.1fs; %d server(s) still connecting",
+                        name,
+                        loop.time() - start,
+                        len(pending),
+                    )
+                    return
+
+    def _get_connect_timeout(self, server_name: str) -> float:
+        """Get the startup deadline for a server."""
+        server_config = self._config.mcpServers.get(server_name)
+        if server_config is not None and server_config.connect_timeout is not None:
+            return server_config.connect_timeout
+        return self._connect_timeout
 
     async def cleanup(self) -> None:
         """Disconnect all clients and clear state."""
+        # Stop waiting on connections that are still in their first handshake
+        for task in list(self._connect_tasks.values()):
+            task.cancel()
+        self._connect_tasks.clear()
+
         if not self._clients:
             return
 
@@ -208,3 +311,27 @@ class MCPConnectionManager:
                 server_name,
                 err,
             )
+
+    def _handle_list_changed(self, server_name: str, artifact_type: str) -> None:
+        """
+        Handle a server list_changed notification and publish event.
+
+        Args:
+            server_name: Name of the server
+            artifact_type: Which list changed ("tools", "prompts" or "resources")
+        """
+        if not self.event_bus:
+            return
+        try:
+            self.event_bus.publish(
+                ArtifactsListChanged(
+                    server_name=server_name,
+                    artifact_type=artifact_type,
+                )
+            )
+        except Exception as err:  # pragma: no cover - defensive logging
+            logger.error(
+                "Error publishing ArtifactsListChanged for %s: %s",
+                server_name,
+                err,
+            )
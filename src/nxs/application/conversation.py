@@ -7,13 +7,21 @@ Key features:
 - Message history management (user, assistant, tool results)
 - Anthropic prompt caching with cache_control markers
 - Conversation persistence (to_dict/from_dict)
-- Token estimation and history management
+- Token estimation and history management (message-count or token-budget
+  limits that evict whole exchanges, keeping tool_use/tool_result pairs intact)
+- Summary compaction: once history passes a token threshold, messages covered
+  by the session summary are replaced by one summary block in the API payload
+  (the raw messages are kept for display and export)
 - Separation of state from orchestration (AgentLoop)
 
 Prompt Caching Strategy:
 - System messages: Always cached (long-lived prompts)
 - Tools: Always cached (stable across conversation)
-- Messages: Cache last user message + assistant response pair
+- Messages: Up to max_cache_breakpoints markers (the API allows four in
+  total, tools and system take one each). The last user message is always
+  marked; the remaining markers go to prefixes that earlier requests already
+  wrote (previous request, start of the current turn, compaction summary)
+  so they are read back instead of re-written
 - Minimum 1,024 tokens per cache checkpoint (Anthropic requirement)
 
 Cache Processing Order (Anthropic API):
@@ -22,6 +30,7 @@ Cache Processing Order (Anthropic API):
 3. Conversation messages (chronological)
 """
 
+import json
 from datetime import datetime
 from typing import Any, Optional, cast
 
@@ -38,6 +47,11 @@ from nxs.logger import get_logger
 
 logger = get_logger(__name__)
 
+# The API accepts at most four cache_control breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+# Shorter prefixes are not cached, so a marker on them would be wasted
+MIN_CACHE_TOKENS = 1024
+
 
 class Conversation:
     """Manages conversation message history with prompt caching support.
@@ -66,6 +80,9 @@ class Conversation:
         system_message: Optional[str] = None,
         max_history_messages: Optional[int] = None,
         enable_caching: bool = True,
+        max_history_tokens: Optional[int] = None,
+        compaction_threshold_tokens: Optional[int] = None,
+        max_cache_breakpoints: int = MAX_CACHE_BREAKPOINTS - 2,
     ):
         """Initialize a new conversation.
 
@@ -77,17 +94,64 @@ class Conversation:
             enable_caching: Whether to apply cache_control markers for
                 Anthropic prompt caching. Defaults to True for 90% cost
                 reduction on cached content.
+            max_history_tokens: Token budget for the message history
+                (estimated, ~4 chars per token). If set, the oldest complete
+                exchanges are evicted once the history exceeds the budget;
+                the latest exchange is always kept.
+            compaction_threshold_tokens: Estimated history size above which
+                get_messages_for_api() replaces the messages covered by the
+                summary (see set_summary()) with a single summary block. None
+                disables compaction.
+            max_cache_breakpoints: Number of cache_control markers placed in
+                the messages. Defaults to the API maximum minus the markers
+                used by the tools and the system prompt.
         """
         self._messages: list[MessageParam] = []
+        # Forks share the parent's history instead of copying it: _prefix is
+        # the parent's message list and only its first _prefix_length entries
+        # belong to this conversation (the parent only appends or rebinds)
+        self._prefix: list[MessageParam] = []
+        self._prefix_length = 0
+        # Messages added since the fork (trailing part of the history that
+        # merge_fork() copies into the parent)
+        self._fork_added = 0
+        # Estimated tokens per message, parallel to _messages / _prefix (same
+        # sharing rules), with running totals so budgets are checked in O(1)
+        self._token_counts: list[int] = []
+        self._token_total = 0
+        self._prefix_token_counts: list[int] = []
+        self._prefix_token_total = 0
         self._system_message = system_message
         self._max_history_messages = max_history_messages
+        self._max_history_tokens = max_history_tokens
+        self.compaction_threshold_tokens = compaction_threshold_tokens
+        self.max_cache_breakpoints = max_cache_breakpoints
+        # Summary of the first _summary_covered messages (used for compaction)
+        self._summary: Optional[str] = None
+        self._summary_covered = 0
+        # API payload kept in step with the history (see _sync_payload()):
+        # new messages are appended, and cache markers are overlaid in place
+        # and undone on the next call, so a call costs O(new messages)
+        self._payload: list[MessageParam] = []
+        self._payload_token_counts: list[int] = []
+        self._payload_token_total = 0
+        self._payload_source = 0  # History messages reflected in _payload
+        self._payload_key: tuple[Any, ...] = ()
+        self._payload_marked: dict[int, MessageParam] = {}
+        # Position of the last exchange start in _payload and the estimated
+        # tokens up to and including it (-1: none)
+        self._payload_turn_start = -1
+        self._payload_turn_start_tokens = 0
         self._enable_caching = enable_caching
         self._created_at = datetime.now()
         self._last_modified_at = datetime.now()
+        # Bumped whenever existing messages are removed or rewritten, so
+        # persistence layers know an append-only delta is no longer valid
+        self._history_epoch = 0
 
         logger.debug(
             f"Conversation initialized: caching={enable_caching}, "
-            f"max_messages={max_history_messages}"
+            f"max_messages={max_history_messages}, max_tokens={max_history_tokens}"
         )
 
     def add_user_message(self, content: str | list[dict[str, Any]]) -> None:
@@ -108,11 +172,9 @@ class Conversation:
         # Type checkers need help with the flexible content parameter
         # We cast to the proper MessageParam structure
         message: MessageParam = {"role": "user", "content": cast(Any, content)}
-        self._messages.append(message)
-        self._last_modified_at = datetime.now()
-        self._apply_history_limit()
+        self._append_message(message)
 
-        logger.debug(f"Added user message: {len(self._messages)} total messages")
+        logger.debug(f"Added user message: {self.get_message_count()} total messages")
 
     def add_assistant_message(self, message: Message) -> None:
         """Add an assistant message to the conversation.
@@ -133,13 +195,11 @@ class Conversation:
             "role": "assistant",
             "content": content,
         }
-        self._messages.append(assistant_message)
-        self._last_modified_at = datetime.now()
-        self._apply_history_limit()
+        self._append_message(assistant_message)
 
         logger.debug(
             f"Added assistant message with {len(content)} content blocks: "
-            f"{len(self._messages)} total messages"
+            f"{self.get_message_count()} total messages"
         )
 
     def add_tool_results(self, tool_use_blocks: list[ToolUseBlock], results: list[str]) -> None:
@@ -182,25 +242,31 @@ class Conversation:
             "role": "user",
             "content": cast(Any, tool_result_content),
         }
-        self._messages.append(tool_message)
-        self._last_modified_at = datetime.now()
-        self._apply_history_limit()
+        self._append_message(tool_message)
 
         logger.debug(
-            f"Added {len(results)} tool results: {len(self._messages)} total messages"
+            f"Added {len(results)} tool results: {self.get_message_count()} total messages"
         )
 
     def get_messages_for_api(self) -> list[MessageParam]:
         """Get messages formatted for Anthropic API with cache control.
 
-        Applies cache_control markers to optimize costs:
-        - Caches the last user message in the conversation
-        - This enables 90% cost reduction on cached content
+        Places up to max_cache_breakpoints cache_control markers (see
+        _plan_cache_breakpoints()):
+        - The last user message, so this request's prefix is written
+        - The previous request's last user message, so the prefix written
+          last time is read back even after a long tool exchange
+        - The start of the current turn and the compaction summary, which
+          stay in place while the turn or the summary lasts
 
-        Cache placement rationale:
-        - Last user message is most likely to be stable and reused
-        - Covers common patterns: streaming responses, tool calls, retries
-        - Meets 1,024 token minimum for caching efficiency
+        The payload is maintained incrementally: messages added since the
+        last call are appended and only the marked messages are copied, so
+        the cost of a call does not grow with the history. The returned list
+        is reused by the next call; it must not be modified, and callers that
+        keep it must copy it.
+
+        Once the history passes compaction_threshold_tokens, messages covered
+        by the summary are replaced by one summary block (see set_summary()).
 
         Returns:
             List of MessageParam dicts ready for Anthropic API, with
@@ -213,38 +279,128 @@ class Conversation:
             ...     system=conversation.get_system_message_for_api()
             ... )
         """
-        if not self._enable_caching or not self._messages:
-            return self._messages
+        # Undo the markers of the previous call before the payload changes
+        for i, message in self._payload_marked.items():
+            self._payload[i] = message
+        self._payload_marked = {}
+
+        self._sync_payload()
+        if not self._enable_caching or not self._payload:
+            return self._payload
+
+        breakpoints = self._plan_cache_breakpoints()
+        for i in breakpoints:
+            self._payload_marked[i] = self._payload[i]
+            self._payload[i] = self._with_cache_control(self._payload[i])
 
-        # Clone messages to avoid mutating internal state
-        messages = [msg.copy() for msg in self._messages]
+        logger.debug(f"Applied cache control to messages at {breakpoints}")
+        return self._payload
+
+    def _sync_payload(self) -> None:
+        """Bring the API payload up to date with the history.
+
+        Appended messages are added to the end of the payload. It is rebuilt
+        only when messages were removed (history_epoch changed) or the
+        compaction cut or summary changed.
+        """
+        cut = self._compaction_cut()
+        count = self.get_message_count()
+        key = (self._history_epoch, cut, self._summary if cut else None)
+
+        if key != self._payload_key or self._payload_source > count:
+            history = self._history()
+            counts = self._history_token_counts()
+            if cut:
+                head = self._summary_message(history[cut], cut)
+                self._payload = [head, *history[cut + 1 :]]
+                self._payload_token_counts = [self._estimate_message_tokens(head), *counts[cut + 1 :]]
+                logger.debug(f"Compacted API history: {cut} messages replaced by summary")
+            else:
+                self._payload = list(history)
+                self._payload_token_counts = list(counts)
+            self._payload_token_total = 0
+            self._payload_turn_start = -1
+            self._track_turn_start(0)
+            self._payload_key = key
+        elif self._payload_source < count:
+            # The payload already covers any shared prefix, so new messages
+            # are always in _messages
+            offset = self._payload_source - self._prefix_length
+            first_new = len(self._payload)
+            self._payload.extend(self._messages[offset:])
+            self._payload_token_counts.extend(self._token_counts[offset:])
+            self._track_turn_start(first_new)
+
+        self._payload_source = count
+
+    def _track_turn_start(self, first_new: int) -> None:
+        """Add the payload messages from first_new on to the running totals."""
+        for i in range(first_new, len(self._payload)):
+            self._payload_token_total += self._payload_token_counts[i]
+            if self._is_exchange_start(self._payload[i]):
+                self._payload_turn_start = i
+                self._payload_turn_start_tokens = self._payload_token_total
+
+    def _plan_cache_breakpoints(self) -> list[int]:
+        """Choose the payload positions that get a cache_control marker.
+
+        The last user message is always marked. Remaining markers go, in
+        order, to the previous user message (the last request's final
+        breakpoint), the start of the current turn (fixed for all tool
+        rounds of the turn) and the compaction summary (fixed until the
+        summary changes), skipping prefixes below MIN_CACHE_TOKENS.
+
+        Only the last two user messages are searched for; the turn start is
+        tracked by _sync_payload().
 
-        # Find the last user message and mark it for caching
+        Returns:
+            Sorted message indices.
+        """
+        if self.max_cache_breakpoints <= 0:
+            return []
+
+        messages = self._payload
+        candidates: list[tuple[int, int]] = []  # (index, prefix tokens)
+        remaining = self._payload_token_total  # Tokens of messages[: i + 1]
         for i in range(len(messages) - 1, -1, -1):
             if messages[i]["role"] == "user":
-                # Apply cache control to the last content block
-                content = messages[i]["content"]
-                if isinstance(content, str):
-                    # Convert string content to list format for cache_control
-                    text_block: TextBlockParam = {
-                        "type": "text",
-                        "text": content,
-                        "cache_control": {"type": "ephemeral"},
-                    }
-                    messages[i]["content"] = cast(Any, [text_block])
-                elif isinstance(content, list) and content:
-                    # Add cache_control to last block in list
-                    # Create new list with all blocks except last, then add modified last block
-                    new_content = list(content[:-1])
-                    last_block = dict(content[-1])  # Convert to dict for modification
-                    last_block["cache_control"] = {"type": "ephemeral"}
-                    new_content.append(last_block)
-                    messages[i]["content"] = cast(Any, new_content)
-
-                logger.debug(f"Applied cache control to last user message at index {i}")
+                candidates.append((i, remaining))
+                if len(candidates) == 2:
+                    break
+            remaining -= self._payload_token_counts[i]
+        if not candidates:
+            return []
+        if self._payload_turn_start >= 0:
+            candidates.append((self._payload_turn_start, self._payload_turn_start_tokens))
+        if self._payload_key[1] > 0:
+            candidates.append((0, self._payload_token_counts[0]))
+
+        breakpoints = {candidates[0][0]}
+        for i, prefix_tokens in candidates[1:]:
+            if len(breakpoints) >= self.max_cache_breakpoints:
                 break
-
-        return messages
+            if i not in breakpoints and prefix_tokens >= MIN_CACHE_TOKENS:
+                breakpoints.add(i)
+        return sorted(breakpoints)
+
+    @staticmethod
+    def _with_cache_control(message: MessageParam) -> MessageParam:
+        """Return a copy of message with a cache_control marker on its last block."""
+        marked = cast(MessageParam, dict(message))
+        content = message["content"]
+        if isinstance(content, str):
+            # Convert string content to list format for cache_control
+            text_block: TextBlockParam = {
+                "type": "text",
+                "text": content,
+                "cache_control": {"type": "ephemeral"},
+            }
+            marked["content"] = cast(Any, [text_block])
+        elif isinstance(content, list) and content:
+            last_block = dict(content[-1])  # Convert to dict for modification
+            last_block["cache_control"] = {"type": "ephemeral"}
+            marked["content"] = cast(Any, [*content[:-1], last_block])
+        return marked
 
     def get_system_message_for_api(self) -> str | list[TextBlockParam] | None:
         """Get system message formatted for API with cache control.
@@ -293,10 +449,280 @@ class Conversation:
             >>> conversation.clear_history()
             >>> assert conversation.get_message_count() == 0
         """
-        self._messages.clear()
+        # Rebind rather than clear in place: forks may still share the old list
+        self._messages = []
+        self._token_counts = []
+        self._token_total = 0
+        self._summary = None
+        self._summary_covered = 0
+        self._fork_added = 0
+        self._drop_prefix()
+        self._history_epoch += 1
         self._last_modified_at = datetime.now()
         logger.info("Conversation history cleared")
 
+    def remove_last_messages(self, count: int) -> None:
+        """Remove the last count messages from the conversation.
+
+        Used to roll back an exchange that did not complete (e.g. a cancelled
+        query), so the history never ends in a tool_use without its results.
+
+        Args:
+            count: Number of trailing messages to remove (capped at the
+                message count).
+        """
+        if count <= 0:
+            return
+
+        keep = max(0, self.get_message_count() - count)
+        if keep >= self._prefix_length:
+            # Rebind rather than slice in place: forks may share these lists
+            own = keep - self._prefix_length
+            self._messages = self._messages[:own]
+            self._token_counts = self._token_counts[:own]
+        else:
+            self._messages = self._history()[:keep]
+            self._token_counts = self._history_token_counts()[:keep]
+            self._drop_prefix()
+        self._token_total = sum(self._token_counts)
+        self._summary_covered = min(self._summary_covered, keep)
+        if not self._summary_covered:
+            self._summary = None
+        self._fork_added = max(0, self._fork_added - count)
+        self._history_epoch += 1
+        self._last_modified_at = datetime.now()
+        logger.debug(f"Removed {count} trailing messages: {self.get_message_count()} total messages")
+
+    def fork(self) -> "Conversation":
+        """Create a lightweight, isolated fork of this conversation.
+
+        The fork starts with the same system message, settings and history,
+        but messages added to it (e.g. a subtask's query and tool traffic) are
+        not visible in the parent, and vice versa. The current history is
+        shared with the parent rather than copied, so forking is O(1).
+
+        Returns:
+            New Conversation whose history starts with the current messages.
+
+        Example:
+            >>> sub = conversation.fork()
+            >>> sub.add_user_message("Research step 1")
+            >>> assert conversation.get_message_count() < sub.get_message_count()
+        """
+        fork = Conversation(
+            system_message=self._system_message,
+            max_history_messages=self._max_history_messages,
+            enable_caching=self._enable_caching,
+            max_history_tokens=self._max_history_tokens,
+            compaction_threshold_tokens=self.compaction_threshold_tokens,
+            max_cache_breakpoints=self.max_cache_breakpoints,
+        )
+        fork._summary = self._summary
+        fork._summary_covered = self._summary_covered
+        if self._prefix_length:
+            # Fork of a fork: flatten once so prefixes never chain
+            fork._prefix = self._history()
+            fork._prefix_token_counts = self._history_token_counts()
+        else:
+            fork._prefix = self._messages
+            fork._prefix_token_counts = self._token_counts
+        fork._prefix_length = self.get_message_count()
+        fork._prefix_token_total = self._history_token_total()
+        logger.debug(f"Forked conversation sharing {fork._prefix_length} messages")
+        return fork
+
+    def merge_fork(self, fork: "Conversation") -> None:
+        """Append the messages added to a fork of this conversation.
+
+        Used when a fork's whole exchange, including its tool_use and
+        tool_result pairs, should become part of this history (e.g. an
+        approved direct answer), rather than just its final text.
+
+        Args:
+            fork: Conversation created by fork() on this conversation.
+        """
+        added = min(fork._fork_added, fork.get_message_count())
+        if not added:
+            return
+        history = fork._history()
+        for message in history[len(history) - added :]:
+            self._append_message(message)
+
+        logger.debug(f"Merged {added} forked messages: {self.get_message_count()} total messages")
+
+    def add_assistant_text(self, text: str) -> None:
+        """Add a plain-text assistant message.
+
+        Used to merge a result produced elsewhere (e.g. the synthesized answer
+        of forked subtasks) back into this conversation.
+
+        Args:
+            text: Assistant response text.
+        """
+        assistant_message: MessageParam = {
+            "role": "assistant",
+            "content": cast(Any, [{"type": "text", "text": text}]),
+        }
+        self._append_message(assistant_message)
+
+        logger.debug(f"Added assistant text: {self.get_message_count()} total messages")
+
+    def set_summary(self, summary: Optional[str], covered_messages: int) -> None:
+        """Record a summary of the first covered_messages messages.
+
+        Used for compaction: once the history passes compaction_threshold_tokens,
+        get_messages_for_api() sends the summary instead of those messages.
+        The stored messages themselves are not changed.
+
+        Args:
+            summary: Summary text (None or empty clears it).
+            covered_messages: Number of leading messages the summary describes.
+        """
+        if not summary or not summary.strip() or covered_messages <= 0:
+            self._summary = None
+            self._summary_covered = 0
+            return
+        self._summary = summary.strip()
+        self._summary_covered = min(covered_messages, self.get_message_count())
+
+    def _compaction_cut(self) -> int:
+        """Return how many leading messages the summary replaces (0: no compaction).
+
+        The cut is the last exchange boundary at or before the end of the
+        summarized range, so tool pairs are never split.
+        """
+        if (
+            self.compaction_threshold_tokens is None
+            or not self._summary
+            or self._history_token_total() <= self.compaction_threshold_tokens
+        ):
+            return 0
+
+        return next(
+            (
+                i
+                for i in range(min(self._summary_covered, self.get_message_count() - 1), 0, -1)
+                if self._is_exchange_start(self._message_at(i))
+            ),
+            0,
+        )
+
+    def _summary_message(self, first: MessageParam, cut: int) -> MessageParam:
+        """Build the user message replacing the first cut messages.
+
+        The summary is prepended to the first kept message (a user turn) to
+        keep roles alternating.
+        """
+        content = first["content"]
+        blocks = [{"type": "text", "text": content}] if isinstance(content, str) else list(content)
+        summary_block: TextBlockParam = {
+            "type": "text",
+            "text": (
+                "<conversation_summary>\n"
+                f"Summary of the {cut} earlier messages of this conversation:\n"
+                f"{self._summary}\n"
+                "</conversation_summary>"
+            ),
+        }
+        return {"role": "user", "content": cast(Any, [summary_block, *blocks])}
+
+    def _append_message(self, message: MessageParam) -> None:
+        """Append a message, update token accounting and apply history limits."""
+        tokens = self._estimate_message_tokens(message)
+        self._messages.append(message)
+        self._token_counts.append(tokens)
+        self._token_total += tokens
+        self._fork_added += 1
+        self._last_modified_at = datetime.now()
+        self._apply_history_limit()
+
+    def _history(self) -> list[MessageParam]:
+        """Return the full message history, including any shared prefix."""
+        if not self._prefix_length:
+            return self._messages
+        return self._prefix[: self._prefix_length] + self._messages
+
+    def _message_at(self, index: int) -> MessageParam:
+        """Return the message at a history position without building the history."""
+        if index < self._prefix_length:
+            return self._prefix[index]
+        return self._messages[index - self._prefix_length]
+
+    def _history_token_counts(self) -> list[int]:
+        """Return estimated tokens per message of the full history."""
+        if not self._prefix_length:
+            return self._token_counts
+        return self._prefix_token_counts[: self._prefix_length] + self._token_counts
+
+    def _history_token_total(self) -> int:
+        """Return the estimated token count of the full message history."""
+        return self._prefix_token_total + self._token_total
+
+    def _drop_prefix(self) -> None:
+        """Stop sharing a prefix with the parent conversation."""
+        self._prefix = []
+        self._prefix_length = 0
+        self._prefix_token_counts = []
+        self._prefix_token_total = 0
+
+    def _recount_tokens(self) -> None:
+        """Recompute token accounting for the own messages (e.g. after restore)."""
+        self._token_counts = [self._estimate_message_tokens(m) for m in self._messages]
+        self._token_total = sum(self._token_counts)
+
+    @classmethod
+    def _estimate_message_tokens(cls, message: MessageParam) -> int:
+        """Estimate a message's tokens (~4 characters per token, rounded up)."""
+        content = message.get("content", "")
+        if isinstance(content, str):
+            chars = len(content)
+        elif isinstance(content, list):
+            chars = sum(cls._block_chars(block) for block in content)
+        else:
+            chars = 0
+        return (chars + 3) // 4
+
+    @classmethod
+    def _block_chars(cls, block: Any) -> int:
+        """Count the characters of a content block (dict or SDK object).
+
+        Text, thinking, tool inputs and tool results are counted; images and
+        documents are not estimated.
+        """
+        if isinstance(block, dict):
+            get = block.get
+        else:
+            def get(key: str, default: Any = None) -> Any:
+                return getattr(block, key, default)
+
+        block_type = get("type")
+        if block_type == "tool_use":
+            return len(get("name", "")) + len(json.dumps(get("input", {}), default=str))
+        if block_type == "tool_result":
+            result = get("content", "")
+            if isinstance(result, list):
+                return sum(cls._block_chars(item) for item in result)
+            return len(str(result or ""))
+        if block_type == "thinking":
+            return len(get("thinking", "") or "")
+        text = get("text")
+        return len(text) if isinstance(text, str) else 0
+
+    @staticmethod
+    def _is_tool_result(message: MessageParam) -> bool:
+        """Whether message is a user message carrying tool results."""
+        content = message["content"]
+        return (
+            message["role"] == "user"
+            and isinstance(content, list)
+            and any(isinstance(block, dict) and block.get("type") == "tool_result" for block in content)
+        )
+
+    @classmethod
+    def _is_exchange_start(cls, message: MessageParam) -> bool:
+        """Whether message opens an exchange (a user turn, not tool results)."""
+        return message["role"] == "user" and not cls._is_tool_result(message)
+
     def get_message_count(self) -> int:
         """Get the total number of messages in the conversation.
 
@@ -307,7 +733,7 @@ class Conversation:
             >>> count = conversation.get_message_count()
             >>> print(f"Conversation has {count} messages")
         """
-        return len(self._messages)
+        return self._prefix_length + len(self._messages)
 
     def get_messages(
         self,
@@ -326,7 +752,7 @@ class Conversation:
         Returns:
             List of MessageParam dictionaries representing the conversation.
         """
-        selected = self._messages[slice(start, end)]
+        selected = self._history()[slice(start, end)]
 
         if not copy:
             return list(selected)
@@ -350,8 +776,10 @@ class Conversation:
 
         Provides a rough estimate based on character count. For accurate
         token counting, use Anthropic's token counting API or library.
+        Message estimates are tracked as messages are added, so this is O(1).
 
-        Estimation: ~4 characters per token (English text average)
+        Estimation: ~4 characters per token (English text average); text,
+        tool inputs and tool results are counted, images/documents are not.
 
         Returns:
             Estimated token count for all messages.
@@ -360,25 +788,11 @@ class Conversation:
             >>> tokens = conversation.get_token_estimate()
             >>> print(f"~{tokens} tokens")
         """
-        total_chars = 0
-
-        # Count system message
-        if self._system_message:
-            total_chars += len(self._system_message)
-
-        # Count conversation messages
-        for message in self._messages:
-            content = message["content"]
-            if isinstance(content, str):
-                total_chars += len(content)
-            elif isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict) and "text" in block:
-                        total_chars += len(block["text"])
-                    # Note: Image/document tokens not estimated here
+        # Count system message (message estimates are kept incrementally)
+        system_chars = len(self._system_message) if self._system_message else 0
 
         # Rough estimate: 4 chars per token
-        return total_chars // 4
+        return (system_chars + 3) // 4 + self._history_token_total()
 
     def _serialize_content_block(self, block: Any) -> dict[str, Any]:
         """Convert Anthropic SDK content block to JSON-serializable dict.
@@ -427,17 +841,20 @@ class Conversation:
             # Fallback: convert to string
             return str(value)
 
-    def _serialize_messages(self) -> list[dict[str, Any]]:
+    def _serialize_messages(self, start: int = 0) -> list[dict[str, Any]]:
         """Convert messages to JSON-serializable format.
         
         Handles Anthropic SDK objects (TextBlock, ToolUseBlock, etc.)
         and converts them to plain dicts.
         
+        Args:
+            start: Index of the first message to serialize
+        
         Returns:
             List of serialized message dicts
         """
         serialized = []
-        for msg in self._messages:
+        for msg in self._history()[start:]:
             msg_dict = dict(msg)  # Copy the message dict
             
             # Serialize content if present
@@ -454,14 +871,39 @@ class Conversation:
         
         return serialized
 
-    def to_dict(self) -> dict[str, Any]:
+    def serialize_messages_since(self, start: int) -> list[dict[str, Any]]:
+        """Serialize only the messages appended after ``start``.
+
+        Used for incremental (journaled) persistence.
+
+        Args:
+            start: Index of the first message to serialize
+
+        Returns:
+            List of serialized message dicts
+        """
+        return self._serialize_messages(start)
+
+    @property
+    def history_epoch(self) -> int:
+        """Counter bumped whenever messages are removed (clear, truncation or rollback)."""
+        return self._history_epoch
+
+    def to_dict(self, include_messages: bool = True) -> dict[str, Any]:
         """Serialize conversation to dictionary for persistence.
 
+        Args:
+            include_messages: Whether to serialize the message history. Journaled
+                persistence passes False and appends messages separately.
+
         Returns:
             Dictionary containing all conversation state:
             - messages: Message history (with SDK objects converted to dicts)
             - system_message: System prompt
             - max_history_messages: History limit
+            - max_history_tokens: History token budget
+            - compaction_threshold_tokens: Summary compaction threshold
+            - max_cache_breakpoints: Cache markers placed in the messages
             - enable_caching: Caching configuration
             - created_at: ISO timestamp
             - last_modified_at: ISO timestamp
@@ -470,14 +912,20 @@ class Conversation:
             >>> data = conversation.to_dict()
             >>> json.dump(data, file)
         """
-        return {
-            "messages": self._serialize_messages(),
-            "system_message": self._system_message,
-            "max_history_messages": self._max_history_messages,
-            "enable_caching": self._enable_caching,
-            "created_at": self._created_at.isoformat(),
-            "last_modified_at": self._last_modified_at.isoformat(),
-        }
+        data: dict[str, Any] = {"messages": self._serialize_messages()} if include_messages else {}
+        data.update(
+            {
+                "system_message": self._system_message,
+                "max_history_messages": self._max_history_messages,
+                "max_history_tokens": self._max_history_tokens,
+                "compaction_threshold_tokens": self.compaction_threshold_tokens,
+                "max_cache_breakpoints": self.max_cache_breakpoints,
+                "enable_caching": self._enable_caching,
+                "created_at": self._created_at.isoformat(),
+                "last_modified_at": self._last_modified_at.isoformat(),
+            }
+        )
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Conversation":
@@ -497,9 +945,13 @@ class Conversation:
             system_message=data.get("system_message"),
             max_history_messages=data.get("max_history_messages"),
             enable_caching=data.get("enable_caching", True),
+            max_history_tokens=data.get("max_history_tokens"),
+            compaction_threshold_tokens=data.get("compaction_threshold_tokens"),
+            max_cache_breakpoints=data.get("max_cache_breakpoints", MAX_CACHE_BREAKPOINTS - 2),
         )
 
         conversation._messages = data.get("messages", [])
+        conversation._recount_tokens()
 
         # Restore timestamps
         if "created_at" in data:
@@ -515,18 +967,65 @@ class Conversation:
         return conversation
 
     def _apply_history_limit(self) -> None:
-        """Apply max_history_messages limit by truncating oldest messages.
+        """Apply max_history_messages / max_history_tokens by evicting old messages.
 
-        Preserves the most recent messages when limit is exceeded.
-        Called automatically after adding messages.
+        Messages are removed from the front without splitting tool_use and
+        tool_result pairs: the message limit skips leading tool results whose
+        request was cut off, and the token budget evicts whole exchanges (from
+        one user turn to the next), always keeping the latest one. Called
+        automatically after adding messages.
         """
-        if self._max_history_messages is None:
+        over_count = (
+            self._max_history_messages is not None
+            and self.get_message_count() > self._max_history_messages
+        )
+        over_budget = (
+            self._max_history_tokens is not None
+            and self._history_token_total() > self._max_history_tokens
+        )
+        if not over_count and not over_budget:
             return
 
-        if len(self._messages) > self._max_history_messages:
-            removed_count = len(self._messages) - self._max_history_messages
-            self._messages = self._messages[-self._max_history_messages :]
-            logger.debug(f"Truncated {removed_count} old messages (limit: {self._max_history_messages})")
+        history = self._history()
+        start = 0
+
+        if over_count:
+            start = len(history) - cast(int, self._max_history_messages)
+            # Don't keep tool results whose tool_use request was cut off
+            while start < len(history) - 1 and self._is_tool_result(history[start]):
+                start += 1
+
+        counts = self._history_token_counts()
+        if self._max_history_tokens is not None:
+            remaining = self._history_token_total() - sum(counts[:start])
+            # Never evict the latest exchange
+            last_start = next(
+                (i for i in range(len(history) - 1, start, -1) if self._is_exchange_start(history[i])),
+                start,
+            )
+            while remaining > self._max_history_tokens and start < last_start:
+                next_start = next(
+                    i for i in range(start + 1, last_start + 1) if self._is_exchange_start(history[i])
+                )
+                remaining -= sum(counts[start:next_start])
+                start = next_start
+
+        if start == 0:
+            return
+
+        # Rebind rather than slice in place: forks may share these lists
+        self._messages = history[start:]
+        self._token_counts = counts[start:]
+        self._token_total = sum(self._token_counts)
+        self._summary_covered = max(0, self._summary_covered - start)
+        if not self._summary_covered:
+            self._summary = None
+        self._drop_prefix()
+        self._history_epoch += 1
+        logger.debug(
+            f"Evicted {start} old messages (limits: messages={self._max_history_messages}, "
+            f"tokens={self._max_history_tokens}, remaining_tokens={self._token_total})"
+        )
 
     @property
     def created_at(self) -> datetime:
@@ -11,6 +11,7 @@ from typing import Optional
 
 from anthropic import Anthropic
 
+from nxs.application.token_usage import TokenUsage
 from nxs.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +32,15 @@ PRICING_RATES = {
     "default": {"input": 3.0, "output": 15.0},
 }
 
+# Prompt caching rates relative to the model's input rate (5-minute cache).
+# A pricing entry may override them with explicit "cache_write"/"cache_read"
+# rates per million tokens.
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+# Prompts above this many tokens use extended context pricing where available
+EXTENDED_CONTEXT_THRESHOLD = 200_000
+
 
 def _build_pricing_table_from_api() -> dict[str, dict[str, float]]:
     """Build pricing table by querying Anthropic API for available models.
@@ -194,6 +204,7 @@ class CostCalculator:
     - Claude Sonnet 4.5 and 4 (extended): $6/MTok input, $22.50/MTok output (>200K tokens)
     - Claude Haiku 4.5: $1/MTok input, $5/MTok output
     - Automatically handles extended context pricing for Sonnet when applicable
+    - Cache writes at 1.25x and cache reads at 0.1x the input rate
     """
 
     def __init__(self, refresh_models: bool = False):
@@ -270,14 +281,20 @@ class CostCalculator:
         input_tokens: int,
         output_tokens: int,
         extended_context: bool = False,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
     ) -> float:
         """Calculate cost for token usage.
 
         Args:
             model: Claude model identifier
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
             extended_context: Whether extended context pricing applies (>200K tokens)
+            cache_creation_tokens: Input tokens written to the prompt cache
+                (usage.cache_creation_input_tokens)
+            cache_read_tokens: Input tokens read from the prompt cache
+                (usage.cache_read_input_tokens)
 
         Returns:
             Total cost in USD (float, typically 4-6 decimal places)
@@ -291,21 +308,69 @@ class CostCalculator:
             ... )
             >>> print(f"Cost: ${cost:.6f}")
         """
+        usage = TokenUsage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_creation_input_tokens=cache_creation_tokens,
+            cache_read_input_tokens=cache_read_tokens,
+        )
+        return self.calculate_usage_cost(model, usage, extended_context)
+
+    def calculate_usage_cost(
+        self, model: str, usage: TokenUsage, extended_context: bool = False
+    ) -> float:
+        """Calculate the cost of a usage record.
+
+        Args:
+            model: Claude model identifier
+            usage: Token usage of an API call
+            extended_context: Force extended context pricing (applied
+                automatically above EXTENDED_CONTEXT_THRESHOLD prompt tokens)
+
+        Returns:
+            Total cost in USD
+        """
+        return sum(self.cost_breakdown(model, usage, extended_context).values())
+
+    def cost_breakdown(
+        self, model: str, usage: TokenUsage, extended_context: bool = False
+    ) -> dict[str, float]:
+        """Split the cost of a usage record by token class.
+
+        Thinking tokens are part of output_tokens and are billed with them.
+
+        Args:
+            model: Claude model identifier
+            usage: Token usage of an API call
+            extended_context: Force extended context pricing (applied
+                automatically above EXTENDED_CONTEXT_THRESHOLD prompt tokens)
+
+        Returns:
+            Cost in USD keyed by "input", "output", "cache_creation" and
+            "cache_read"
+        """
+        extended_context = extended_context or usage.prompt_tokens > EXTENDED_CONTEXT_THRESHOLD
         pricing = self.get_pricing(model, extended_context)
+        cache_write_rate = pricing.get("cache_write", pricing["input"] * CACHE_WRITE_MULTIPLIER)
+        cache_read_rate = pricing.get("cache_read", pricing["input"] * CACHE_READ_MULTIPLIER)
 
         # Calculate cost: (tokens / 1_000_000) * rate_per_million
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        total_cost = input_cost + output_cost
+        breakdown = {
+            "input": (usage.input_tokens / 1_000_000) * pricing["input"],
+            "output": (usage.output_tokens / 1_000_000) * pricing["output"],
+            "cache_creation": (usage.cache_creation_input_tokens / 1_000_000) * cache_write_rate,
+            "cache_read": (usage.cache_read_input_tokens / 1_000_000) * cache_read_rate,
+        }
 
         logger.debug(
             f"Cost calculation: model={model}, "
-            f"input={input_tokens} tokens (${input_cost:.6f}), "
-            f"output={output_tokens} tokens (${output_cost:.6f}), "
-            f"total=${total_cost:.6f}"
+            f"input={usage.input_tokens} tokens (${breakdown['input']:.6f}), "
+            f"output={usage.output_tokens} tokens (${breakdown['output']:.6f}), "
+            f"cache={usage.cache_creation_input_tokens} written (${breakdown['cache_creation']:.6f})/"
+            f"{usage.cache_read_input_tokens} read (${breakdown['cache_read']:.6f})"
         )
 
-        return total_cost
+        return breakdown
 
     def format_cost(self, cost: float, precision: int = 4) -> str:
         """Format cost as a currency string.
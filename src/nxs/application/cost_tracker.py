@@ -1,16 +1,49 @@
 """Cost tracker for accumulating token usage and costs.
 
 This module provides a lightweight tracker for monitoring cumulative
-token usage and costs across a conversation session.
+token usage and costs across a conversation session, with breakdowns
+per component (agent loop, analyzer, planner, ...) and per turn.
 """
 
 from dataclasses import dataclass, field
 from typing import Optional
 
+from nxs.application.token_usage import TokenUsage
 from nxs.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Component name for usage recorded without one
+DEFAULT_COMPONENT = "other"
+
+
+@dataclass
+class UsageBreakdown:
+    """Token usage and cost of a group of API calls (a component or a turn)."""
+
+    usage: TokenUsage = field(default_factory=TokenUsage)
+    cost: float = 0.0
+    calls: int = 0
+
+    def add(self, usage: TokenUsage, cost: float) -> None:
+        """Add the usage and cost of one API call."""
+        self.usage = self.usage + usage
+        self.cost += cost
+        self.calls += 1
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {"usage": self.usage.to_dict(), "cost": self.cost, "calls": self.calls}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UsageBreakdown":
+        """Create from dictionary."""
+        return cls(
+            usage=TokenUsage.from_dict(data.get("usage", {})),
+            cost=data.get("cost", 0.0),
+            calls=data.get("calls", 0),
+        )
+
 
 @dataclass
 class CostSummary:
@@ -20,6 +53,20 @@ class CostSummary:
     total_output_tokens: int = 0
     total_cost: float = 0.0
     round_count: int = 0
+    total_cache_creation_tokens: int = 0
+    total_cache_read_tokens: int = 0
+    total_thinking_tokens: int = 0
+    components: dict[str, UsageBreakdown] = field(default_factory=dict)
+    # Usage per turn number (most recent turns only, see CostTracker.max_turns)
+    turns: dict[int, UsageBreakdown] = field(default_factory=dict)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of prompt tokens served from the prompt cache (0.0 to 1.0)."""
+        prompt_tokens = self.total_input_tokens + self.total_cache_creation_tokens + self.total_cache_read_tokens
+        if prompt_tokens == 0:
+            return 0.0
+        return self.total_cache_read_tokens / prompt_tokens
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -28,6 +75,11 @@ class CostSummary:
             "total_output_tokens": self.total_output_tokens,
             "total_cost": self.total_cost,
             "round_count": self.round_count,
+            "total_cache_creation_tokens": self.total_cache_creation_tokens,
+            "total_cache_read_tokens": self.total_cache_read_tokens,
+            "total_thinking_tokens": self.total_thinking_tokens,
+            "components": {name: breakdown.to_dict() for name, breakdown in self.components.items()},
+            "turns": {str(turn): breakdown.to_dict() for turn, breakdown in self.turns.items()},
         }
 
     @classmethod
@@ -38,6 +90,17 @@ class CostSummary:
             total_output_tokens=data.get("total_output_tokens", 0),
             total_cost=data.get("total_cost", 0.0),
             round_count=data.get("round_count", 0),
+            total_cache_creation_tokens=data.get("total_cache_creation_tokens", 0),
+            total_cache_read_tokens=data.get("total_cache_read_tokens", 0),
+            total_thinking_tokens=data.get("total_thinking_tokens", 0),
+            components={
+                name: UsageBreakdown.from_dict(breakdown)
+                for name, breakdown in data.get("components", {}).items()
+            },
+            turns={
+                int(turn): UsageBreakdown.from_dict(breakdown)
+                for turn, breakdown in data.get("turns", {}).items()
+            },
         )
 
 
@@ -46,15 +109,22 @@ class CostTracker:
 
     Thread-safe accumulation of token counts and costs across
     multiple conversation rounds. Lightweight and efficient.
+
+    Usage is also broken down per component and per turn: start_turn()
+    opens a new turn, and every call recorded until the next start_turn()
+    is attributed to it.
     """
 
-    def __init__(self, initial_summary: Optional[CostSummary] = None):
+    def __init__(self, initial_summary: Optional[CostSummary] = None, max_turns: int = 100):
         """Initialize the cost tracker.
 
         Args:
             initial_summary: Optional initial summary (for restoring from persistence)
+            max_turns: Number of most recent turns kept in the per-turn breakdown
         """
         self._summary = initial_summary or CostSummary()
+        self.max_turns = max_turns
+        self._current_turn = max(self._summary.turns, default=0)
         logger.debug(
             f"CostTracker initialized: "
             f"{self._summary.total_input_tokens} input, "
@@ -63,28 +133,82 @@ class CostTracker:
         )
 
     def add_usage(
-        self, input_tokens: int, output_tokens: int, cost: float
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
     ) -> None:
         """Add token usage and cost for a conversation round.
 
         Args:
-            input_tokens: Number of input tokens used
+            input_tokens: Number of uncached input tokens used
             output_tokens: Number of output tokens used
             cost: Cost in USD for this usage
+            cache_creation_tokens: Input tokens written to the prompt cache
+            cache_read_tokens: Input tokens read from the prompt cache
         """
-        self._summary.total_input_tokens += input_tokens
-        self._summary.total_output_tokens += output_tokens
-        self._summary.total_cost += cost
-        self._summary.round_count += 1
+        self.record_usage(
+            TokenUsage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_creation_input_tokens=cache_creation_tokens,
+                cache_read_input_tokens=cache_read_tokens,
+            ),
+            cost,
+        )
+
+    def record_usage(self, usage: TokenUsage, cost: float, component: Optional[str] = None) -> None:
+        """Add the usage and cost of one API call.
+
+        Args:
+            usage: Token usage of the call
+            cost: Cost in USD of the call
+            component: Component that made the call (e.g. "agent_loop",
+                "planner"); DEFAULT_COMPONENT if not given
+        """
+        summary = self._summary
+        summary.total_input_tokens += usage.input_tokens
+        summary.total_output_tokens += usage.output_tokens
+        summary.total_cache_creation_tokens += usage.cache_creation_input_tokens
+        summary.total_cache_read_tokens += usage.cache_read_input_tokens
+        summary.total_thinking_tokens += usage.thinking_tokens
+        summary.total_cost += cost
+        summary.round_count += 1
+
+        summary.components.setdefault(component or DEFAULT_COMPONENT, UsageBreakdown()).add(usage, cost)
+        if self._current_turn not in summary.turns:
+            summary.turns[self._current_turn] = UsageBreakdown()
+            while len(summary.turns) > self.max_turns:
+                del summary.turns[min(summary.turns)]
+        summary.turns[self._current_turn].add(usage, cost)
 
         logger.debug(
-            f"Added usage: +{input_tokens} input, +{output_tokens} output tokens, "
+            f"Added usage ({component or DEFAULT_COMPONENT}, turn {self._current_turn}): "
+            f"+{usage.input_tokens} input, +{usage.output_tokens} output tokens, "
+            f"+{usage.cache_creation_input_tokens} cache write, "
+            f"+{usage.cache_read_input_tokens} cache read, "
             f"+${cost:.6f} cost. "
-            f"Session totals: {self._summary.total_input_tokens} input, "
-            f"{self._summary.total_output_tokens} output, "
-            f"${self._summary.total_cost:.6f} total"
+            f"Session totals: {summary.total_input_tokens} input, "
+            f"{summary.total_output_tokens} output, "
+            f"${summary.total_cost:.6f} total"
         )
 
+    def start_turn(self) -> int:
+        """Start a new turn for the per-turn breakdown.
+
+        Returns:
+            Number of the new turn
+        """
+        self._current_turn += 1
+        return self._current_turn
+
+    @property
+    def current_turn(self) -> int:
+        """Number of the turn that usage is currently attributed to."""
+        return self._current_turn
+
     def get_total(self) -> CostSummary:
         """Get current total usage and cost summary.
 
@@ -93,10 +217,19 @@ class CostTracker:
         """
         return self._summary
 
+    def get_component_breakdown(self) -> dict[str, UsageBreakdown]:
+        """Get usage and cost per component."""
+        return dict(self._summary.components)
+
+    def get_turn_breakdown(self) -> dict[int, UsageBreakdown]:
+        """Get usage and cost per turn (most recent max_turns turns)."""
+        return dict(self._summary.turns)
+
     def reset(self) -> None:
         """Reset all counters to zero."""
         logger.info("Resetting session cost tracker")
         self._summary = CostSummary()
+        self._current_turn = 0
 
     def to_dict(self) -> dict:
         """Serialize tracker state to dictionary.
@@ -118,4 +251,3 @@ class CostTracker:
         """
         summary = CostSummary.from_dict(data)
         return cls(initial_summary=summary)
-
@@ -6,17 +6,73 @@ API format.
 
 This allows you to easily expose local Python functions as tools that can be
 called by Claude, without needing to create an MCP server.
+
+Execution model:
+- Coroutine functions are awaited directly on the event loop.
+- Synchronous functions run in a bounded thread pool so blocking I/O
+  (e.g. ``requests.get``) never stalls the TUI, streaming or health checks.
+- CPU-heavy functions can opt into a process pool via ``@local_tool(executor="process")``.
+- Every call is bounded by a per-tool timeout and is cancelled with its caller.
+- Functions can declare a ToolCachePolicy so ToolRegistry reuses their results.
 """
 
+import asyncio
+import functools
 import inspect
 import json
 import re
-from typing import Any, Callable, Union, get_args, get_origin
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, Optional, Union, get_args, get_origin
 
+from nxs.application.tool_result_cache import CACHE_POLICY_KEY, ToolCachePolicy
 from nxs.logger import get_logger
 
 logger = get_logger(__name__)
 
+_TOOL_OPTIONS_ATTR = "__nxs_tool_options__"
+
+
+@dataclass(frozen=True)
+class LocalToolOptions:
+    """Per-function execution options for LocalToolProvider.
+
+    Attributes:
+        timeout: Seconds before the call is abandoned (None = provider default).
+        executor: Where synchronous functions run: "thread" (default) for
+            blocking I/O, "process" for CPU-bound work. The function and its
+            arguments must be picklable for "process". Ignored for coroutines.
+        cache_policy: Result caching policy declared to ToolRegistry
+            (None = results are never cached).
+    """
+
+    timeout: Optional[float] = None
+    executor: Literal["thread", "process"] = "thread"
+    cache_policy: Optional[ToolCachePolicy] = None
+
+
+def local_tool(
+    *,
+    timeout: Optional[float] = None,
+    executor: Literal["thread", "process"] = "thread",
+    cache_policy: Optional[ToolCachePolicy] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Attach LocalToolOptions to a function exposed through LocalToolProvider.
+
+    Example:
+        >>> @local_tool(timeout=60, executor="process")
+        ... def crunch(data: list[int]) -> int:
+        ...     "Sum a large list."
+        ...     return sum(data)
+    """
+    options = LocalToolOptions(timeout=timeout, executor=executor, cache_policy=cache_policy)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        setattr(func, _TOOL_OPTIONS_ATTR, options)
+        return func
+
+    return decorator
+
 
 class LocalToolProvider:
     """Tool provider for local Python functions.
@@ -31,6 +87,7 @@ class LocalToolProvider:
     - Required vs optional parameter detection
     - Type conversion and validation
     - Error handling with informative messages
+    - Off-loop execution of sync functions with per-tool timeouts
 
     Example:
         >>> def greet(name: str, greeting: str = "Hello") -> str:
@@ -45,7 +102,15 @@ class LocalToolProvider:
         >>> registry.register_provider(provider)
     """
 
-    def __init__(self, functions: list[Callable[..., Any]]):
+    def __init__(
+        self,
+        functions: list[Callable[..., Any]],
+        *,
+        default_timeout: Optional[float] = 30.0,
+        max_workers: int = 4,
+        max_process_workers: int = 2,
+        tool_options: Optional[dict[str, LocalToolOptions]] = None,
+    ):
         """Initialize local tool provider.
 
         Args:
@@ -54,14 +119,33 @@ class LocalToolProvider:
                 - Type hints for all parameters
                 - A docstring describing the function and its arguments
                 - A return type (preferably dict or str)
+            default_timeout: Timeout in seconds for tools without their own
+                (None = no timeout).
+            max_workers: Size of the thread pool for synchronous functions.
+            max_process_workers: Size of the process pool for functions that
+                opt in with executor="process".
+            tool_options: Optional per-function overrides keyed by function
+                name; take precedence over ``@local_tool`` metadata.
         """
         self._functions: dict[str, Callable[..., Any]] = {}
         self._tool_definitions: list[dict[str, Any]] = []
-
+        self._tool_options: dict[str, LocalToolOptions] = {}
+        self._default_timeout = default_timeout
+        self._max_workers = max_workers
+        self._max_process_workers = max_process_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+        overrides = tool_options or {}
         for func in functions:
             tool_def = self._create_tool_definition(func)
             self._tool_definitions.append(tool_def)
-            self._functions[tool_def["name"]] = func
+            name = tool_def["name"]
+            self._functions[name] = func
+            options = overrides.get(name, getattr(func, _TOOL_OPTIONS_ATTR, LocalToolOptions()))
+            self._tool_options[name] = options
+            if options.cache_policy is not None:
+                tool_def[CACHE_POLICY_KEY] = options.cache_policy
 
         logger.debug(
             f"LocalToolProvider initialized with {len(functions)} functions"
@@ -94,6 +178,7 @@ class LocalToolProvider:
 
         Raises:
             KeyError: If tool_name is not found.
+            TimeoutError: If the function exceeds its timeout.
             Exception: If function execution fails.
         """
         func = self._functions.get(tool_name)
@@ -105,9 +190,12 @@ class LocalToolProvider:
 
         logger.debug(f"Executing local function '{tool_name}' with args: {arguments}")
 
+        options = self._tool_options[tool_name]
+        timeout = options.timeout if options.timeout is not None else self._default_timeout
+
         try:
-            # Execute the function
-            result = func(**arguments)
+            # Coroutines run on the loop; sync functions go to an executor
+            result = await asyncio.wait_for(self._invoke(func, options, arguments), timeout)
 
             # Convert result to string
             if isinstance(result, str):
@@ -124,6 +212,9 @@ class LocalToolProvider:
 
             return result_str
 
+        except asyncio.TimeoutError:
+            logger.error(f"Local function '{tool_name}' timed out after {timeout}s")
+            raise TimeoutError(f"Local tool '{tool_name}' timed out after {timeout}s") from None
         except Exception as e:
             logger.error(
                 f"Local function '{tool_name}' execution failed: {e}",
@@ -131,6 +222,47 @@ class LocalToolProvider:
             )
             raise
 
+    async def _invoke(
+        self,
+        func: Callable[..., Any],
+        options: LocalToolOptions,
+        arguments: dict[str, Any],
+    ) -> Any:
+        """Run a function in the right place for its kind.
+
+        Cancelling the awaiting task cancels a queued executor job; a job that
+        is already running in a worker finishes in the background and its
+        result is discarded.
+        """
+        if inspect.iscoroutinefunction(func):
+            return await func(**arguments)
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, **arguments)
+        return await loop.run_in_executor(self._get_executor(options.executor), call)
+
+    def _get_executor(self, kind: str) -> Executor:
+        """Get (lazily creating) the executor for a function."""
+        if kind == "process":
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._max_process_workers)
+            return self._process_pool
+
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="nxs-local-tool",
+            )
+        return self._thread_pool
+
+    def shutdown(self) -> None:
+        """Shut down worker pools without waiting for running calls."""
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = None
+        self._process_pool = None
+
     def _create_tool_definition(self, func: Callable[..., Any]) -> dict[str, Any]:
         """Create an Anthropic-compatible tool definition from a function.
 
@@ -19,6 +19,18 @@ class MCPServerConfig(BaseModel):
 
     command: str = Field(..., description="Command to execute the MCP server")
     args: list[str] = Field(default_factory=list, description="Arguments for the command")
+    connect_timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds to wait for this server at startup before continuing without it",
+    )
+    call_timeout: Optional[float] = Field(
+        default=None,
+        description="Deadline in seconds for tool calls, prompt and resource reads on this server",
+    )
+    tool_timeouts: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-tool deadlines in seconds, overriding call_timeout",
+    )
 
     def is_remote(self) -> bool:
         """
@@ -6,14 +6,23 @@ appropriate client.
 
 This bridges the existing MCP infrastructure with the new ToolRegistry
 architecture, allowing MCP tools to be used alongside other tool sources.
+
+Result caching policies are derived from the servers' tool annotations:
+tools marked ``readOnlyHint`` are cacheable, tools explicitly marked as not
+read-only invalidate cached results (and are only coalesced with identical
+concurrent calls if marked ``idempotentHint``), and unannotated tools are
+never cached.
 """
 
 import json
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping, Optional
 
 from mcp.types import TextContent
 
+from nxs.application.tool_result_cache import CACHE_POLICY_KEY, ToolCachePolicy
+from nxs.domain.events import ArtifactsListChanged, ConnectionStatusChanged, EventBus
 from nxs.domain.protocols import MCPClient
+from nxs.domain.types import ConnectionStatus
 from nxs.logger import get_logger
 
 logger = get_logger(__name__)
@@ -28,6 +37,8 @@ class MCPToolProvider:
     - Tool execution routing to correct client
     - Error handling for disconnected clients
     - Tool name collision detection
+    - Change notification (reconnects and ``tools/list_changed``) so the
+      ToolRegistry can invalidate its cached tool catalog
 
     Example:
         >>> clients = {"server1": client1, "server2": client2}
@@ -35,17 +46,30 @@ class MCPToolProvider:
         >>> registry.register_provider(provider)
     """
 
-    def __init__(self, clients: Mapping[str, MCPClient], status_callback: Any = None):
+    def __init__(
+        self,
+        clients: Mapping[str, MCPClient],
+        status_callback: Any = None,
+        event_bus: Optional[EventBus] = None,
+    ):
         """Initialize MCP tool provider.
 
         Args:
             clients: Mapping of server_name -> MCPClient instances.
                 Tools from all clients will be aggregated.
             status_callback: Optional callback for status updates (callable).
+            event_bus: Optional event bus. When provided, connection status
+                transitions and tools list_changed notifications are forwarded
+                to change listeners (see add_change_listener()).
         """
         self._clients = clients
         self._tool_to_client: dict[str, str] = {}  # tool_name -> server_name
         self._status_callback = status_callback
+        self._change_listeners: list[Callable[[], None]] = []
+
+        if event_bus is not None:
+            event_bus.subscribe(ConnectionStatusChanged, self._on_connection_status_changed)
+            event_bus.subscribe(ArtifactsListChanged, self._on_artifacts_list_changed)
 
         logger.debug(f"MCPToolProvider initialized with {len(clients)} clients")
 
@@ -54,6 +78,40 @@ class MCPToolProvider:
         """Return provider name for logging and identification."""
         return "mcp"
 
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked when the set of MCP tools may have changed.
+
+        Args:
+            listener: Zero-argument callable (e.g. ToolRegistry invalidation).
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def _notify_change(self, reason: str) -> None:
+        """Invoke change listeners, isolating listener failures."""
+        logger.debug(f"MCP tool set may have changed: {reason}")
+        for listener in list(self._change_listeners):
+            try:
+                listener()
+            except Exception as e:
+                logger.warning(f"MCP tool change listener failed: {e}")
+
+    def _on_connection_status_changed(self, event: ConnectionStatusChanged) -> None:
+        """Invalidate on (re)connect or loss of connection for one of our servers."""
+        if event.server_name not in self._clients:
+            return
+        # DEGRADED keeps the session (and the tool set), so it counts as connected
+        usable = (ConnectionStatus.CONNECTED, ConnectionStatus.DEGRADED)
+        connected_now = event.status in usable
+        was_connected = event.previous_status in usable
+        if connected_now != was_connected:
+            self._notify_change(f"{event.server_name} is now {event.status.value}")
+
+    def _on_artifacts_list_changed(self, event: ArtifactsListChanged) -> None:
+        """Invalidate when one of our servers reports tools/list_changed."""
+        if event.server_name in self._clients and event.artifact_type == "tools":
+            self._notify_change(f"{event.server_name} tools list changed")
+
     async def get_tool_definitions(self) -> list[dict[str, Any]]:
         """Get tool definitions from all MCP clients.
 
@@ -84,11 +142,14 @@ class MCPToolProvider:
                         continue
 
                     # Convert Tool model to dict format for Anthropic API
-                    tool_dict = {
+                    tool_dict: dict[str, Any] = {
                         "name": tool.name,
                         "description": tool.description,
                         "input_schema": tool.inputSchema,
                     }
+                    policy = self._cache_policy(tool)
+                    if policy is not None:
+                        tool_dict[CACHE_POLICY_KEY] = policy
                     all_tools.append(tool_dict)
                     self._tool_to_client[tool_name] = server_name
 
@@ -128,6 +189,19 @@ class MCPToolProvider:
 
         return all_tools
 
+    @staticmethod
+    def _cache_policy(tool: Any) -> Optional[ToolCachePolicy]:
+        """Derive a result caching policy from a tool's MCP annotations."""
+        annotations = getattr(tool, "annotations", None)
+        read_only = getattr(annotations, "readOnlyHint", None)
+        if not isinstance(read_only, bool):
+            return None
+        if read_only:
+            return ToolCachePolicy()
+        # MCP treats tools as non-idempotent unless they say otherwise
+        idempotent = getattr(annotations, "idempotentHint", None) is True
+        return ToolCachePolicy(cacheable=False, read_only=False, idempotent=idempotent)
+
     async def execute_tool(
         self, tool_name: str, arguments: dict[str, Any]
     ) -> str:
@@ -172,6 +246,10 @@ class MCPToolProvider:
                 item.text for item in items if isinstance(item, TextContent)
             ]
 
+            # Tool-level errors are failures, so they are never cached as results
+            if getattr(result, "isError", False) is True:
+                raise RuntimeError("; ".join(content_list) or f"MCP tool '{tool_name}' reported an error")
+
             # Return JSON-formatted result for consistency
             result_str = json.dumps(content_list)
 
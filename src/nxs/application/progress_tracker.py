@@ -6,13 +6,12 @@ phases (DIRECT → LIGHT_PLANNING → DEEP_REASONING).
 
 Key Features:
 - Tracks execution history across all escalation phases
-- Records tool executions to avoid redundant calls
+- Records tool executions (results are reused by ToolRegistry's result cache)
 - Preserves evaluation feedback to guide subsequent attempts
 - Maintains a plan skeleton showing completed/pending steps
 - Serializes to natural language context for LLM consumption
 """
 
-import hashlib
 import json
 from collections import defaultdict
 from dataclasses import asdict, dataclass, field
@@ -27,34 +26,13 @@ from nxs.application.reasoning.types import (
     ResearchPlan,
     SubTask,
 )
+from nxs.application.similarity import MinHashLSH, jaccard_similarity
+from nxs.application.tool_result_cache import hash_tool_call
 from nxs.logger import get_logger
 
 logger = get_logger("progress_tracker")
 
 
-# Tool Caching Policy (Phase 7.1 - Edge Cases)
-# Defines which tools should bypass caching due to non-deterministic behavior
-# or time-sensitive data requirements
-TOOL_CACHING_POLICY = {
-    # Time-sensitive tools - always execute fresh
-    "get_current_time": "no-cache",
-    "get_date": "no-cache",
-    "get_datetime": "no-cache",
-
-    # Real-time data tools - may return stale data if cached
-    "web_search": "cache",  # Search results are generally stable for short periods
-    "fetch_url": "no-cache",  # URLs may update frequently
-    "get_weather": "no-cache",  # Weather changes frequently
-
-    # Random/non-deterministic tools
-    "random_sample": "no-cache",
-    "generate_random": "no-cache",
-
-    # Default: cache all other tools
-    # Tools not listed here will be cached by default
-}
-
-
 # Maximum size for individual tool results (in characters)
 # Results larger than this will be truncated to prevent context explosion
 # With 50 max tool executions, this caps tool results at ~500KB total
@@ -209,6 +187,9 @@ class ResearchProgressTracker:
     - Phase 6: Persistence and debugging support
     """
 
+    # Jaccard word-overlap threshold for treating two plan steps as the same
+    STEP_SIMILARITY_THRESHOLD = 0.7
+
     def __init__(self, query: str, complexity: ComplexityAnalysis):
         """Initialize progress tracker.
 
@@ -227,7 +208,6 @@ class ResearchProgressTracker:
 
         # Tool tracking
         self.tool_executions: list[ToolExecution] = []
-        self._tool_result_cache: dict[str, str] = {}  # Hash → result
 
         # Plan tracking
         self.plan: Optional[ResearchPlanSkeleton] = None
@@ -304,48 +284,6 @@ class ResearchProgressTracker:
 
     # === Tool Tracking ===
 
-    def should_execute_tool(self, tool_name: str, arguments: dict) -> tuple[bool, Optional[str]]:
-        """
-        Check if tool should be executed or if we have cached result.
-
-        Applies tool caching policy to prevent stale data from time-sensitive
-        or non-deterministic tools.
-
-        Args:
-            tool_name: Name of the tool
-            arguments: Tool arguments
-
-        Returns:
-            (should_execute, cached_result)
-            - (True, None): Execute the tool
-            - (False, result): Skip execution, use cached result
-        """
-        # Check tool caching policy
-        policy = TOOL_CACHING_POLICY.get(tool_name, "cache")
-
-        if policy == "no-cache":
-            # Tool should always execute fresh (time-sensitive or non-deterministic)
-            logger.debug(f"Tool {tool_name} has no-cache policy, always executing")
-            return True, None
-
-        arg_hash = self._hash_arguments(tool_name, arguments)
-
-        # Check cache (only for tools with cache policy)
-        if arg_hash in self._tool_result_cache:
-            logger.debug(f"Cache hit for {tool_name} with hash {arg_hash[:8]}")
-            return False, self._tool_result_cache[arg_hash]
-
-        # Check if same tool+args failed before
-        for exec_record in self.tool_executions:
-            if exec_record.tool_name == tool_name and exec_record.result_hash == arg_hash:
-                if not exec_record.success:
-                    # Failed before, but might be worth retrying in different context
-                    # Return True but log warning
-                    logger.debug(f"Tool {tool_name} failed before, but retrying")
-                    return True, None
-
-        return True, None
-
     def log_tool_execution(
         self,
         tool_name: str,
@@ -397,9 +335,7 @@ class ResearchProgressTracker:
 
         self.tool_executions.append(execution)
 
-        # Cache successful results (use truncated version to save memory)
         if success and truncated_result:
-            self._tool_result_cache[arg_hash] = truncated_result
             self.insights.successful_tool_results[tool_name] = truncated_result
         elif not success and error:
             self.insights.failed_tool_attempts[tool_name] = error
@@ -424,8 +360,7 @@ class ResearchProgressTracker:
         Returns:
             MD5 hash as hex string
         """
-        combined = f"{tool_name}:{json.dumps(arguments, sort_keys=True)}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        return hash_tool_call(tool_name, arguments)
 
     # === Plan Management ===
 
@@ -461,6 +396,14 @@ class ResearchProgressTracker:
                 revision_count=0,
                 last_updated=datetime.now(),
             )
+            # Resolve planner-declared dependencies against the new steps so
+            # independent steps can be scheduled together
+            for subtask, step in zip(plan.subtasks, self.plan.steps, strict=True):
+                step.depends_on = [
+                    dep_id
+                    for dep_id in self._extract_dependencies(subtask, self.plan.steps)
+                    if dep_id != step.id
+                ]
             logger.debug(f"Created new plan skeleton with {len(self.plan.steps)} steps")
         else:
             # Refine existing plan
@@ -495,6 +438,10 @@ class ResearchProgressTracker:
             for s in self.plan.steps
         }
 
+        # Near-duplicate index over existing steps (avoids pairwise comparison)
+        step_index = self._build_step_index([s.description for s in self.plan.steps])
+        step_positions = {s.id: i for i, s in enumerate(self.plan.steps)}
+
         # Phase 4: Track which new subtasks match existing steps
         matched_steps = []
         new_steps = []
@@ -512,12 +459,15 @@ class ResearchProgressTracker:
                 continue
 
             # Phase 4: Check for similar steps (fuzzy matching)
-            similar_step = self._find_similar_step(subtask.query, self.plan.steps)
+            similar_step = self._find_similar_step(
+                subtask.query, self.plan.steps, index=step_index
+            )
             if similar_step:
                 # Found similar step - update description if needed, but preserve status
                 if similar_step.status in ["pending", "failed"]:
                     # Update description to match new plan's wording
                     similar_step.description = subtask.query
+                    step_index.add(step_positions[similar_step.id], subtask.query)
                     matched_steps.append(similar_step)
                 else:
                     # Step is completed/in_progress - skip adding duplicate
@@ -544,6 +494,7 @@ class ResearchProgressTracker:
         new_descriptions = {
             self._normalize_step_description(s.query) for s in new_plan.subtasks
         }
+        subtask_index = self._build_step_index([s.query for s in new_plan.subtasks])
         for step in self.plan.steps:
             if (
                 step.status == "pending"
@@ -551,10 +502,7 @@ class ResearchProgressTracker:
                 and self._normalize_step_description(step.description) not in new_descriptions
             ):
                 # Check if it's similar to any new step
-                is_similar = any(
-                    self._are_steps_similar(step.description, s.query)
-                    for s in new_plan.subtasks
-                )
+                is_similar = bool(subtask_index.query(step.description))
                 if not is_similar:
                     orphaned_steps.append(step)
 
@@ -595,18 +543,46 @@ class ResearchProgressTracker:
                 normalized = normalized[len(prefix) :].strip()
         return normalized
 
+    def _build_step_index(self, descriptions: list[str]) -> MinHashLSH[int]:
+        """Build a near-duplicate index over step descriptions.
+
+        Args:
+            descriptions: Step descriptions, keyed in the index by position
+
+        Returns:
+            MinHashLSH using the same normalization and threshold as
+            _are_steps_similar
+        """
+        index: MinHashLSH[int] = MinHashLSH(
+            threshold=self.STEP_SIMILARITY_THRESHOLD,
+            tokenizer=lambda text: self._normalize_step_description(text).split(),
+        )
+        for position, description in enumerate(descriptions):
+            index.add(position, description)
+        return index
+
     def _find_similar_step(
-        self, description: str, existing_steps: list[PlanStep]
+        self,
+        description: str,
+        existing_steps: list[PlanStep],
+        index: Optional[MinHashLSH[int]] = None,
     ) -> Optional[PlanStep]:
         """Find a similar step in existing steps using fuzzy matching.
 
         Args:
             description: New step description
             existing_steps: List of existing plan steps
+            index: Optional index built by _build_step_index over the
+                existing step descriptions; when given, the most similar step
+                is found without a full scan
 
         Returns:
             Similar step if found, None otherwise
         """
+        if index is not None:
+            matches = index.query(description)
+            return existing_steps[matches[0]] if matches else None
+
         # Check similarity using word overlap
         for step in existing_steps:
             if self._are_steps_similar(description, step.description):
@@ -614,7 +590,9 @@ class ResearchProgressTracker:
 
         return None
 
-    def _are_steps_similar(self, desc1: str, desc2: str, threshold: float = 0.7) -> bool:
+    def _are_steps_similar(
+        self, desc1: str, desc2: str, threshold: float = STEP_SIMILARITY_THRESHOLD
+    ) -> bool:
         """Check if two step descriptions are similar.
 
         Uses simple word overlap ratio for similarity detection.
@@ -635,14 +613,7 @@ class ResearchProgressTracker:
             return False
 
         # Calculate Jaccard similarity (intersection over union)
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-
-        if union == 0:
-            return False
-
-        similarity = intersection / union
-        return similarity >= threshold
+        return jaccard_similarity(words1, words2) >= threshold
 
     def _extract_dependencies(
         self, subtask: SubTask, matched_steps: list[PlanStep]
@@ -988,7 +959,6 @@ class ResearchProgressTracker:
         Includes:
         - Summary line: "Progress: X attempts, Y tool calls, Z/W steps"
         - Top 3 knowledge gaps
-        - Available cached tool results
 
         Returns:
             Compact context summary
@@ -1008,10 +978,6 @@ class ResearchProgressTracker:
         if self.insights.knowledge_gaps:
             parts.append(f"Gaps: {', '.join(self.insights.knowledge_gaps[:3])}")
 
-        # Available cached results
-        if self._tool_result_cache:
-            parts.append(f"Cached: {len(self._tool_result_cache)} results")
-
         return " | ".join(parts)
 
     def to_minimal_context(self) -> str:
@@ -1212,9 +1178,6 @@ class ResearchProgressTracker:
                 result_hash=tool_data.get("result_hash", ""),
             )
             tracker.tool_executions.append(tool_exec)
-            # Rebuild cache
-            if tool_exec.success and tool_exec.result:
-                tracker._tool_result_cache[tool_exec.result_hash] = tool_exec.result
 
         # Reconstruct plan
         if data.get("plan"):
@@ -1400,7 +1363,6 @@ class ResearchProgressTracker:
             "total_tool_executions": len(self.tool_executions),
             "successful_tool_executions": len([e for e in self.tool_executions if e.success]),
             "failed_tool_executions": len([e for e in self.tool_executions if not e.success]),
-            "cached_tool_results": len(self._tool_result_cache),
             "plan_steps_total": len(self.plan.steps) if self.plan else 0,
             "plan_steps_completed": len(self.plan.get_completed_steps()) if self.plan else 0,
             "plan_steps_pending": len(self.plan.get_pending_steps()) if self.plan else 0,
@@ -12,6 +12,7 @@ from nxs.application.reasoning.types import (
     ExecutionStrategy,
 )
 from nxs.application.reasoning.utils import format_prompt, load_prompt
+from nxs.application.token_usage import TokenUsage
 from nxs.logger import get_logger
 
 logger = get_logger("reasoning.analyzer")
@@ -90,23 +91,18 @@ class QueryComplexityAnalyzer:
             
             # Track cost for reasoning API call
             if hasattr(response, "usage") and response.usage:
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-                cost = self.cost_calculator.calculate_cost(
-                    self.llm.model, input_tokens, output_tokens
-                )
+                token_usage = TokenUsage.from_response(response)
+                cost = self.cost_calculator.calculate_usage_cost(self.llm.model, token_usage)
                 if self.on_usage:
-                    usage = {
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                    }
+                    usage = {**token_usage.to_dict(), "component": "analyzer"}
                     try:
                         self.on_usage(usage, cost)
                     except Exception as e:
                         logger.warning(f"Error in reasoning cost callback: {e}")
                 logger.debug(
-                    f"Reasoning (analyzer) cost: {input_tokens} input, "
-                    f"{output_tokens} output tokens, ${cost:.6f}"
+                    f"Reasoning (analyzer) cost: {token_usage.input_tokens} input, "
+                    f"{token_usage.cache_read_input_tokens} cache read, "
+                    f"{token_usage.output_tokens} output tokens, ${cost:.6f}"
                 )
             
             # Extract text from response - handle different content block types
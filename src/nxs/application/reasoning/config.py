@@ -33,7 +33,8 @@ class ReasoningConfig:
     # Performance tuning
     max_subtasks: int = 5
     min_subtasks: int = 1
-    parallel_execution: bool = False  # Future feature
+    parallel_execution: bool = True  # Run independent deep-reasoning plan steps concurrently
+    max_parallel_steps: int = 3  # Max plan steps in flight at once when parallel
 
     # Analysis caching
     cache_analysis: bool = True  # Cache similar queries
@@ -12,6 +12,7 @@ from nxs.application.reasoning.types import (
     ResearchPlan,
 )
 from nxs.application.reasoning.utils import format_prompt, load_prompt
+from nxs.application.token_usage import TokenUsage
 from nxs.logger import get_logger
 
 logger = get_logger("reasoning.evaluator")
@@ -89,23 +90,18 @@ class Evaluator:
             
             # Track cost for reasoning API call
             if hasattr(response, "usage") and response.usage:
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-                cost = self.cost_calculator.calculate_cost(
-                    self.llm.model, input_tokens, output_tokens
-                )
+                token_usage = TokenUsage.from_response(response)
+                cost = self.cost_calculator.calculate_usage_cost(self.llm.model, token_usage)
                 if self.on_usage:
-                    usage = {
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                    }
+                    usage = {**token_usage.to_dict(), "component": "evaluator"}
                     try:
                         self.on_usage(usage, cost)
                     except Exception as e:
                         logger.warning(f"Error in reasoning cost callback: {e}")
                 logger.debug(
-                    f"Reasoning (evaluator) cost: {input_tokens} input, "
-                    f"{output_tokens} output tokens, ${cost:.6f}"
+                    f"Reasoning (evaluator) cost: {token_usage.input_tokens} input, "
+                    f"{token_usage.cache_read_input_tokens} cache read, "
+                    f"{token_usage.output_tokens} output tokens, ${cost:.6f}"
                 )
             
             # Extract text from response
@@ -178,23 +174,18 @@ class Evaluator:
             
             # Track cost for reasoning API call
             if hasattr(response_obj, "usage") and response_obj.usage:
-                input_tokens = response_obj.usage.input_tokens
-                output_tokens = response_obj.usage.output_tokens
-                cost = self.cost_calculator.calculate_cost(
-                    self.llm.model, input_tokens, output_tokens
-                )
+                token_usage = TokenUsage.from_response(response_obj)
+                cost = self.cost_calculator.calculate_usage_cost(self.llm.model, token_usage)
                 if self.on_usage:
-                    usage = {
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                    }
+                    usage = {**token_usage.to_dict(), "component": "evaluator"}
                     try:
                         self.on_usage(usage, cost)
                     except Exception as e:
                         logger.warning(f"Error in reasoning cost callback: {e}")
                 logger.debug(
-                    f"Reasoning (evaluator quality) cost: {input_tokens} input, "
-                    f"{output_tokens} output tokens, ${cost:.6f}"
+                    f"Reasoning (evaluator quality) cost: {token_usage.input_tokens} input, "
+                    f"{token_usage.cache_read_input_tokens} cache read, "
+                    f"{token_usage.output_tokens} output tokens, ${cost:.6f}"
                 )
             
             # Extract text from response
@@ -8,10 +8,11 @@ This module implements the core self-correcting reasoning system that:
 - Guarantees quality-approved responses reach users
 """
 
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
-from nxs.application.agentic_loop import AgentLoop
+from nxs.application.agentic_loop import AgentLoop, ToolExecutionConfig
 from nxs.application.approval import ApprovalManager
+from nxs.application.cancellation import CancellationToken, run_cancellable
 from nxs.application.claude import Claude
 from nxs.application.conversation import Conversation
 from nxs.application.progress_tracker import ResearchProgressTracker
@@ -87,6 +88,7 @@ class AdaptiveReasoningLoop(AgentLoop):
         callbacks: Optional[dict] = None,
         force_strategy: Optional[ExecutionStrategy] = None,
         approval_manager: Optional[ApprovalManager] = None,
+        tool_execution_config: Optional[ToolExecutionConfig] = None,
     ):
         """Initialize adaptive reasoning loop.
 
@@ -103,8 +105,15 @@ class AdaptiveReasoningLoop(AgentLoop):
             callbacks: Optional callbacks for TUI integration
             force_strategy: Override strategy for testing/debugging (None = auto)
             approval_manager: Optional ApprovalManager for query analysis approval
+            tool_execution_config: Optional ToolExecutionConfig for concurrent tool execution
         """
-        super().__init__(llm, conversation, tool_registry, callbacks)
+        super().__init__(
+            llm,
+            conversation,
+            tool_registry,
+            callbacks,
+            tool_execution_config=tool_execution_config,
+        )
 
         self.analyzer = analyzer
         self.planner = planner
@@ -136,6 +145,10 @@ class AdaptiveReasoningLoop(AgentLoop):
             tool_registry=self.tool_registry,
             execute_with_tracking=self._execute_with_tool_tracking,
             max_iterations=self.max_iterations,
+            max_parallel_steps=(
+                self.config.max_parallel_steps if self.config.parallel_execution else 1
+            ),
+            fork_conversation=lambda: self.conversation.fork(),
         )
 
         # Recursion prevention flag for tool tracking integration
@@ -181,6 +194,8 @@ class AdaptiveReasoningLoop(AgentLoop):
         query: str,
         use_streaming: bool = True,
         callbacks: Optional[dict[str, Callable]] = None,
+        conversation: Optional[Conversation] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Run with adaptive execution strategy based on query complexity.
 
@@ -201,9 +216,17 @@ class AdaptiveReasoningLoop(AgentLoop):
             query: User's query/message
             use_streaming: Whether to use streaming (default True)
             callbacks: Optional callback overrides
+            conversation: Conversation for sub-executions (only honoured while
+                _skip_reasoning is set, e.g. a forked plan step)
+            cancel_token: Optional CancellationToken. Cancelling it stops the
+                analysis, the running strategy (including in-flight subtasks)
+                and the evaluation; nothing is added to the conversation.
 
         Returns:
             Quality-approved final answer
+
+        Raises:
+            QueryCancelledError: If cancel_token is cancelled.
         """
         callbacks = callbacks or self.callbacks
 
@@ -215,7 +238,13 @@ class AdaptiveReasoningLoop(AgentLoop):
             )
             # Bypass all reasoning (complexity analysis, strategy selection, evaluation)
             # and execute directly via parent AgentLoop for tool tracking
-            return await super().run(query, callbacks=callbacks, use_streaming=use_streaming)
+            return await super().run(
+                query,
+                callbacks=callbacks,
+                use_streaming=use_streaming,
+                conversation=conversation,
+                cancel_token=cancel_token,
+            )
 
         # Check reasoning enabled state from TUI checkbox
         use_reasoning = False
@@ -253,10 +282,13 @@ class AdaptiveReasoningLoop(AgentLoop):
             # Get available tools for analysis
             tool_names = self.tool_registry.get_tool_names()
 
-            complexity = await self.analyzer.analyze(
-                query=query,
-                available_tools=tool_names,
-                conversation_context={},  # Could pass recent messages
+            complexity = await run_cancellable(
+                self.analyzer.analyze(
+                    query=query,
+                    available_tools=tool_names,
+                    conversation_context={},  # Could pass recent messages
+                ),
+                cancel_token,
             )
 
             # Analyzer chooses between LIGHT_PLANNING and DEEP_REASONING
@@ -305,23 +337,34 @@ class AdaptiveReasoningLoop(AgentLoop):
 
             # NEW: Start execution attempt in tracker (Phase 3)
             tracker.start_attempt(current_strategy)
+            # Collect the conversation forks this attempt's subtasks run in
+            self._subtask_conversations = []
 
             # Execute with current strategy (buffered, not streamed to user yet)
             if current_strategy == ExecutionStrategy.DIRECT:
-                result = await self.direct_strategy.execute(
-                    query, complexity, tracker, callbacks
+                result = await run_cancellable(
+                    self.direct_strategy.execute(
+                        query, complexity, tracker, callbacks, cancel_token=cancel_token
+                    ),
+                    cancel_token,
                 )
                 execution_attempts.append(("DIRECT", result, 0.0))
 
             elif current_strategy == ExecutionStrategy.LIGHT_PLANNING:
-                result = await self.light_planning_strategy.execute(
-                    query, complexity, tracker, callbacks
+                result = await run_cancellable(
+                    self.light_planning_strategy.execute(
+                        query, complexity, tracker, callbacks, cancel_token=cancel_token
+                    ),
+                    cancel_token,
                 )
                 execution_attempts.append(("LIGHT", result, 0.0))
 
             else:  # DEEP_REASONING
-                result = await self.deep_reasoning_strategy.execute(
-                    query, complexity, tracker, callbacks
+                result = await run_cancellable(
+                    self.deep_reasoning_strategy.execute(
+                        query, complexity, tracker, callbacks, cancel_token=cancel_token
+                    ),
+                    cancel_token,
                 )
                 execution_attempts.append(("DEEP", result, 0.0))
 
@@ -333,12 +376,18 @@ class AdaptiveReasoningLoop(AgentLoop):
             
             await call_callback(callbacks, "on_quality_check_start")
 
-            evaluation = await self._evaluate_response_quality(
-                query=query,
-                response=result,
-                strategy_used=current_strategy,
-                complexity=complexity,
+            evaluation = await run_cancellable(
+                self._evaluate_response_quality(
+                    query=query,
+                    response=result,
+                    strategy_used=current_strategy,
+                    complexity=complexity,
+                    conversations=self._subtask_conversations,
+                ),
+                cancel_token,
             )
+            attempt_conversations = self._subtask_conversations or []
+            self._subtask_conversations = None
 
             # Update quality score in attempts
             execution_attempts[-1] = (
@@ -379,6 +428,18 @@ class AdaptiveReasoningLoop(AgentLoop):
                     f"quality={evaluation.confidence:.2f}"
                 )
 
+                # Strategies ran in conversation forks; only the approved
+                # answer joins the main history. A direct answer is a single
+                # exchange, so it is merged whole, tool calls included
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                if current_strategy == ExecutionStrategy.DIRECT and len(attempt_conversations) == 1:
+                    self.conversation.merge_fork(attempt_conversations[0])
+                else:
+                    if query:
+                        self.conversation.add_user_message(query)
+                    self.conversation.add_assistant_text(result)
+
                 # Now stream the approved response to user
                 if use_streaming and "on_stream_chunk" in callbacks:
                     # Stream the buffered response
@@ -445,6 +506,7 @@ class AdaptiveReasoningLoop(AgentLoop):
         response: str,
         strategy_used: ExecutionStrategy,
         complexity: ComplexityAnalysis,
+        conversations: Optional[list[Conversation]] = None,
     ) -> EvaluationResult:
         """Evaluate response quality to determine if escalation needed.
 
@@ -459,6 +521,8 @@ class AdaptiveReasoningLoop(AgentLoop):
             response: Generated response to evaluate
             strategy_used: Which strategy produced this response
             complexity: Initial complexity analysis
+            conversations: Conversation forks the response was produced in
+                (defaults to the main conversation)
 
         Returns:
             EvaluationResult with:
@@ -473,7 +537,9 @@ class AdaptiveReasoningLoop(AgentLoop):
         )
 
         # Extract conversation context showing tool executions and strategy
-        conversation_context = self._extract_conversation_context(strategy_used=strategy_used.value)
+        conversation_context = self._extract_conversation_context(
+            strategy_used=strategy_used.value, conversations=conversations
+        )
 
         # DEBUG: Log the context being sent to judge
         logger.info("=" * 80)
@@ -511,7 +577,11 @@ class AdaptiveReasoningLoop(AgentLoop):
 
         return evaluation
 
-    def _extract_conversation_context(self, strategy_used: str = "UNKNOWN") -> str:
+    def _extract_conversation_context(
+        self,
+        strategy_used: str = "UNKNOWN",
+        conversations: Optional[list[Conversation]] = None,
+    ) -> str:
         """Extract tool executions for the CURRENT QUERY ONLY.
 
         CRITICAL: This method is called AFTER the agent has completed execution and BEFORE
@@ -520,16 +590,82 @@ class AdaptiveReasoningLoop(AgentLoop):
 
         Args:
             strategy_used: The strategy that generated the response (DIRECT/LIGHT_PLANNING/DEEP_REASONING)
+            conversations: Conversation forks the attempt's subtasks ran in; each
+                contributes the tool executions of its last query. Defaults to
+                the main conversation.
 
         Returns:
             Formatted string showing execution context for CURRENT QUERY ONLY
         """
-        messages = self.conversation.get_messages()
+        tool_executions: list[dict[str, Any]] = []
+        if conversations:
+            for conversation in conversations:
+                tool_executions.extend(
+                    self._extract_tool_executions(conversation.get_messages()) or []
+                )
+        else:
+            messages = self.conversation.get_messages()
+
+            if not messages:
+                logger.warning("No messages in conversation - cannot extract context")
+                return "=== NO CONVERSATION CONTEXT ===\nNo messages in conversation yet."
+
+            executions = self._extract_tool_executions(messages)
+            if executions is None:
+                return "=== NO USER QUERY FOUND ===\nCould not identify the current user query."
+            tool_executions = executions
+
+        # Build comprehensive context
+        context_parts = []
+
+        # Header with strategy info
+        context_parts.append(f"=== EXECUTION CONTEXT FOR CURRENT QUERY ===")
+        context_parts.append(f"Strategy: {strategy_used}")
+        context_parts.append(f"Tool executions for THIS query: {len(tool_executions)}")
+        context_parts.append("")
+
+        if tool_executions:
+            context_parts.append("=== TOOL EXECUTIONS FOR THIS QUERY ===")
+            context_parts.append("The agent executed the following tools to answer THIS specific query:")
+            context_parts.append("(NOTE: Tools from previous queries are NOT shown here)")
+            context_parts.append("")
+
+            for i, execution in enumerate(tool_executions, 1):
+                context_parts.append(f"{i}. Tool: {execution['tool']}")
+                context_parts.append(f"   Input: {execution['input']}")
+                if execution['result']:
+                    context_parts.append(f"   Result: {execution['result']}")
+                else:
+                    context_parts.append(f"   Result: (no result captured)")
+                context_parts.append("")
+
+            context_parts.append("=== EVALUATION GUIDANCE ===")
+            context_parts.append("✓ The agent DID use the tools shown above for THIS query")
+            context_parts.append("✓ These tools are relevant to the CURRENT query being evaluated")
+            context_parts.append("✓ The final response should be based on these tool results")
+            context_parts.append("✓ The response doesn't need to repeat tool execution details")
+            context_parts.append("✓ Evaluate whether the response uses these tool results appropriately")
+        else:
+            context_parts.append("=== NO TOOL EXECUTIONS FOR THIS QUERY ===")
+            context_parts.append("No tools were executed to answer this specific query.")
+            context_parts.append("")
+            context_parts.append("=== EVALUATION GUIDANCE ===")
+            context_parts.append("- If the query required external data/tools and none were used, this IS a problem")
+            context_parts.append("- If the query could be answered from knowledge alone, no tools may be needed")
+            context_parts.append("- Evaluate whether the lack of tool usage was appropriate for THIS query")
 
-        if not messages:
-            logger.warning("No messages in conversation - cannot extract context")
-            return "=== NO CONVERSATION CONTEXT ===\nNo messages in conversation yet."
+        return "\n".join(context_parts)
+
+    def _extract_tool_executions(self, messages: list) -> Optional[list[dict[str, Any]]]:
+        """Collect tool calls (with result previews) made since the last user query.
+
+        Args:
+            messages: Conversation messages to scan
 
+        Returns:
+            List of {"tool", "input", "result"} dicts, or None if no user
+            query message could be found
+        """
         logger.debug(f"Extracting context from {len(messages)} total conversation messages")
 
         # Find the MOST RECENT user query message (not tool results)
@@ -579,7 +715,7 @@ class AdaptiveReasoningLoop(AgentLoop):
             logger.error(f"Total messages: {len(messages)}")
             for i, msg in enumerate(messages[-5:]):  # Log last 5 messages
                 logger.error(f"  Message {i}: {msg.get('role')} - {type(msg.get('content'))}")
-            return "=== NO USER QUERY FOUND ===\nCould not identify the current user query."
+            return None
 
         # Extract messages from the current query onwards
         current_query_messages = messages[last_query_idx:]
@@ -589,7 +725,7 @@ class AdaptiveReasoningLoop(AgentLoop):
         )
 
         # Extract tool executions from current query cycle only
-        tool_executions = []
+        tool_executions: list[dict[str, Any]] = []
 
         logger.info(f"Scanning {len(current_query_messages)} messages for tool executions...")
 
@@ -712,46 +848,7 @@ class AdaptiveReasoningLoop(AgentLoop):
                     logger.error(f"      content: {type(content).__name__}")
             logger.error("=" * 80)
 
-        # Build comprehensive context
-        context_parts = []
-
-        # Header with strategy info
-        context_parts.append(f"=== EXECUTION CONTEXT FOR CURRENT QUERY ===")
-        context_parts.append(f"Strategy: {strategy_used}")
-        context_parts.append(f"Tool executions for THIS query: {len(tool_executions)}")
-        context_parts.append("")
-
-        if tool_executions:
-            context_parts.append("=== TOOL EXECUTIONS FOR THIS QUERY ===")
-            context_parts.append("The agent executed the following tools to answer THIS specific query:")
-            context_parts.append("(NOTE: Tools from previous queries are NOT shown here)")
-            context_parts.append("")
-
-            for i, execution in enumerate(tool_executions, 1):
-                context_parts.append(f"{i}. Tool: {execution['tool']}")
-                context_parts.append(f"   Input: {execution['input']}")
-                if execution['result']:
-                    context_parts.append(f"   Result: {execution['result']}")
-                else:
-                    context_parts.append(f"   Result: (no result captured)")
-                context_parts.append("")
-
-            context_parts.append("=== EVALUATION GUIDANCE ===")
-            context_parts.append("✓ The agent DID use the tools shown above for THIS query")
-            context_parts.append("✓ These tools are relevant to the CURRENT query being evaluated")
-            context_parts.append("✓ The final response should be based on these tool results")
-            context_parts.append("✓ The response doesn't need to repeat tool execution details")
-            context_parts.append("✓ Evaluate whether the response uses these tool results appropriately")
-        else:
-            context_parts.append("=== NO TOOL EXECUTIONS FOR THIS QUERY ===")
-            context_parts.append("No tools were executed to answer this specific query.")
-            context_parts.append("")
-            context_parts.append("=== EVALUATION GUIDANCE ===")
-            context_parts.append("- If the query required external data/tools and none were used, this IS a problem")
-            context_parts.append("- If the query could be answered from knowledge alone, no tools may be needed")
-            context_parts.append("- Evaluate whether the lack of tool usage was appropriate for THIS query")
-
-        return "\n".join(context_parts)
+        return tool_executions
 
     # Note: Prompt caching for tracker context is handled by the Conversation class
     #
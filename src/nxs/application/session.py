@@ -15,6 +15,7 @@ Sessions can be:
 - Identified by unique session_id
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Optional, Protocol, runtime_checkable, TYPE_CHECKING
@@ -24,6 +25,7 @@ from nxs.application.conversation import Conversation
 from nxs.application.cost_tracker import CostTracker
 from nxs.application.progress_tracker import ResearchProgressTracker
 from nxs.application.session_state import SessionState
+from nxs.application.tool_result_cache import ToolResultCache
 from nxs.logger import get_logger
 
 if TYPE_CHECKING:
@@ -185,6 +187,12 @@ class Session:
         self.conversation = conversation
         self.agent_loop = agent_loop
 
+        # Let the conversation compact summarized history in API requests
+        if metadata.conversation_summary:
+            conversation.set_summary(
+                metadata.conversation_summary, metadata.summary_last_message_index
+            )
+
         # Support legacy cost_tracker parameter for backward compatibility
         if cost_tracker is not None:
             self.conversation_cost_tracker = cost_tracker
@@ -209,6 +217,12 @@ class Session:
                 f"Injected SessionState into agent for context injection"
             )
 
+        # Report tool result cache hits/misses of this session in its state metadata
+        tool_registry = getattr(agent_loop, "tool_registry", None)
+        result_cache = getattr(tool_registry, "result_cache", None)
+        if isinstance(result_cache, ToolResultCache):
+            result_cache.add_listener(self._on_tool_cache_lookup)
+
         # StateUpdateService - event-driven state updates
         # StateExtractor - LLM-powered extraction (optional)
         # Create StateUpdateService if not provided but dependencies are available
@@ -259,6 +273,12 @@ class Session:
             f"state_update_service={'active' if self.state_update_service else 'inactive'}"
         )
 
+    def _on_tool_cache_lookup(self, scope: Optional[str], tool_name: str, hit: bool) -> None:
+        """Tool result cache listener (ignores lookups of other sessions sharing the cache)."""
+        if scope is not None and scope != self.metadata.session_id:
+            return
+        self.state.state_metadata.record_tool_cache_lookup(hit)
+
     async def run_query(
         self,
         query: str,
@@ -313,6 +333,26 @@ class Session:
         self.metadata.last_active_at = datetime.now()
         logger.info(f"Session {self.metadata.session_id} history cleared")
 
+    async def stop_state_updates(self, timeout: float = 10.0) -> None:
+        """Finish pending state extractions and stop the extraction worker.
+
+        Call before saving the session on exit so exchanges still queued for
+        background extraction end up in the saved state.
+
+        Args:
+            timeout: Seconds to wait for queued extractions before giving up.
+        """
+        if self.state_update_service is None:
+            return
+        try:
+            await asyncio.wait_for(self.state_update_service.drain_extractions(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Session {self.metadata.session_id}: state extraction did not finish "
+                f"within {timeout}s, discarding pending exchanges"
+            )
+        await self.state_update_service.close()
+
     def update_conversation_summary(self, summary: str, last_message_index: int) -> None:
         """Update stored conversation summary metadata.
 
@@ -323,6 +363,7 @@ class Session:
         self.metadata.conversation_summary = summary
         self.metadata.summary_last_message_index = last_message_index
         self.metadata.last_active_at = datetime.now()
+        self.conversation.set_summary(summary, last_message_index)
         logger.debug(
             "Updated session summary: session_id=%s messages=%s",
             self.metadata.session_id,
@@ -350,60 +391,99 @@ class Session:
 
         Returns:
             Dictionary with total cost summary (conversation + reasoning + summarization):
-            - total_input_tokens: Total input tokens used
+            - total_input_tokens: Total uncached input tokens used
             - total_output_tokens: Total output tokens used
+            - total_cache_creation_tokens: Total tokens written to the prompt cache
+            - total_cache_read_tokens: Total tokens read from the prompt cache
+            - total_thinking_tokens: Total output tokens spent on thinking
+            - cache_hit_rate: Fraction of prompt tokens read from the cache
             - total_cost: Total cost in USD
             - round_count: Total conversation rounds
         """
-        conv_summary = self.conversation_cost_tracker.get_total()
-        reason_summary = self.reasoning_cost_tracker.get_total()
-        summ_summary = self.summarization_cost_tracker.get_total()
-        
-        return {
-            "total_input_tokens": conv_summary.total_input_tokens + reason_summary.total_input_tokens + summ_summary.total_input_tokens,
-            "total_output_tokens": conv_summary.total_output_tokens + reason_summary.total_output_tokens + summ_summary.total_output_tokens,
-            "total_cost": conv_summary.total_cost + reason_summary.total_cost + summ_summary.total_cost,
-            "round_count": conv_summary.round_count,
+        summaries = [tracker.get_total() for tracker in self._cost_trackers().values()]
+        totals = {
+            key: sum(getattr(summary, key) for summary in summaries)
+            for key in (
+                "total_input_tokens",
+                "total_output_tokens",
+                "total_cache_creation_tokens",
+                "total_cache_read_tokens",
+                "total_thinking_tokens",
+                "total_cost",
+            )
         }
-    
+        prompt_tokens = (
+            totals["total_input_tokens"] + totals["total_cache_creation_tokens"] + totals["total_cache_read_tokens"]
+        )
+        totals["cache_hit_rate"] = totals["total_cache_read_tokens"] / prompt_tokens if prompt_tokens else 0.0
+        totals["round_count"] = self.conversation_cost_tracker.get_total().round_count
+        return totals
+
     def get_conversation_cost_summary(self) -> dict[str, Any]:
         """Get conversation cost summary (excludes reasoning and summarization).
 
         Returns:
             Dictionary with conversation cost summary
         """
-        summary = self.conversation_cost_tracker.get_total()
-        return {
-            "total_input_tokens": summary.total_input_tokens,
-            "total_output_tokens": summary.total_output_tokens,
-            "total_cost": summary.total_cost,
-            "round_count": summary.round_count,
-        }
-    
+        return self._format_cost_summary(self.conversation_cost_tracker)
+
     def get_reasoning_cost_summary(self) -> dict[str, Any]:
         """Get reasoning cost summary (excludes conversation and summarization).
 
         Returns:
             Dictionary with reasoning cost summary
         """
-        summary = self.reasoning_cost_tracker.get_total()
-        return {
-            "total_input_tokens": summary.total_input_tokens,
-            "total_output_tokens": summary.total_output_tokens,
-            "total_cost": summary.total_cost,
-            "round_count": summary.round_count,
-        }
-    
+        return self._format_cost_summary(self.reasoning_cost_tracker)
+
     def get_summarization_cost_summary(self) -> dict[str, Any]:
         """Get summarization cost summary (excludes conversation and reasoning).
 
         Returns:
             Dictionary with summarization cost summary
         """
-        summary = self.summarization_cost_tracker.get_total()
+        return self._format_cost_summary(self.summarization_cost_tracker)
+
+    def get_cost_breakdown(self) -> dict[str, Any]:
+        """Get usage and cost per component and per turn for each cost type.
+
+        Returns:
+            Dictionary keyed by cost type ("conversation", "reasoning",
+            "summarization"), each with "components" and "turns" mapping to
+            serialized UsageBreakdown entries.
+        """
+        return {
+            name: {
+                "components": {
+                    component: breakdown.to_dict()
+                    for component, breakdown in tracker.get_component_breakdown().items()
+                },
+                "turns": {turn: breakdown.to_dict() for turn, breakdown in tracker.get_turn_breakdown().items()},
+            }
+            for name, tracker in self._cost_trackers().items()
+        }
+
+    def start_cost_turn(self) -> None:
+        """Start a new turn in the per-turn cost breakdown of all cost trackers."""
+        for tracker in self._cost_trackers().values():
+            tracker.start_turn()
+
+    def _cost_trackers(self) -> dict[str, CostTracker]:
+        return {
+            "conversation": self.conversation_cost_tracker,
+            "reasoning": self.reasoning_cost_tracker,
+            "summarization": self.summarization_cost_tracker,
+        }
+
+    @staticmethod
+    def _format_cost_summary(tracker: CostTracker) -> dict[str, Any]:
+        summary = tracker.get_total()
         return {
             "total_input_tokens": summary.total_input_tokens,
             "total_output_tokens": summary.total_output_tokens,
+            "total_cache_creation_tokens": summary.total_cache_creation_tokens,
+            "total_cache_read_tokens": summary.total_cache_read_tokens,
+            "total_thinking_tokens": summary.total_thinking_tokens,
+            "cache_hit_rate": summary.cache_hit_rate,
             "total_cost": summary.total_cost,
             "round_count": summary.round_count,
         }
@@ -415,12 +495,16 @@ class Session:
         self.summarization_cost_tracker.reset()
         logger.info(f"Session {self.metadata.session_id} costs reset")
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, include_messages: bool = True) -> dict[str, Any]:
         """Serialize session to dictionary for persistence.
 
         Phase 1: Now includes SessionState for semantic knowledge tracking.
         Phase 6: Includes tracker persistence.
 
+        Args:
+            include_messages: Whether to include the conversation messages.
+                Journaled saves pass False and append new messages separately.
+
         Returns:
             Dictionary containing:
             - metadata: Session metadata
@@ -445,7 +529,7 @@ class Session:
 
         return {
             "metadata": self.metadata.to_dict(),
-            "conversation": self.conversation.to_dict(),
+            "conversation": self.conversation.to_dict(include_messages=include_messages),
             "conversation_cost_tracker": self.conversation_cost_tracker.to_dict(),
             "reasoning_cost_tracker": self.reasoning_cost_tracker.to_dict(),
             "summarization_cost_tracker": self.summarization_cost_tracker.to_dict(),
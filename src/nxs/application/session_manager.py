@@ -16,7 +16,9 @@ TUI Integration (Future):
 """
 
 import asyncio
+import hashlib
 import json
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional, Dict, cast, Any, TYPE_CHECKING
 
@@ -32,10 +34,30 @@ from nxs.logger import get_logger
 
 if TYPE_CHECKING:
     from anthropic import AsyncAnthropic
+    from nxs.infrastructure.state import StateJournal
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class _JournalCursor:
+    """What has already been persisted for a session (journaled saves).
+
+    Attributes:
+        conversation: Conversation object the cursor refers to.
+        history_epoch: Conversation.history_epoch at the last save.
+        message_count: Number of messages already persisted.
+        generation: Snapshot generation the journal records apply to.
+        section_digests: Digest of each top-level section at the last save.
+    """
+
+    conversation: Conversation
+    history_epoch: int
+    message_count: int
+    generation: int
+    section_digests: dict[str, str] = field(default_factory=dict)
+
+
 class SessionManager:
     """Manages conversation sessions with persistence.
 
@@ -45,6 +67,11 @@ class SessionManager:
     - Session creation and deletion
     - Auto-save and auto-restore for all sessions
     - Per-session JSON files: {session_id}.json
+    - Lazy restore: a small metadata index ("session_index" key) lists every
+      stored session; full sessions are only loaded when activated
+    - Journaled saves (FileStateProvider): only new messages and changed
+      sections are appended to {session_id}.journal.jsonl, which is folded
+      back into the JSON snapshot in the background once it grows large
 
     Example (Single Session - Default Usage):
         >>> from nxs.application.summarization import SummarizationService
@@ -88,6 +115,7 @@ class SessionManager:
     """
 
     DEFAULT_SESSION_ID = "default"
+    SESSION_INDEX_KEY = "session_index"
 
     def __init__(
         self,
@@ -102,6 +130,10 @@ class SessionManager:
         state_provider: Optional[StateProvider] = None,
         event_bus: Optional[EventBus] = None,
         anthropic_client: Optional["AsyncAnthropic"] = None,
+        enable_journal: bool = True,
+        session_journal: Optional["StateJournal"] = None,
+        max_history_tokens: Optional[int] = None,
+        compaction_threshold_tokens: Optional[int] = 20_000,
     ):
         """Initialize session manager.
 
@@ -121,6 +153,16 @@ class SessionManager:
                            If None, creates FileStateProvider with storage_dir.
             event_bus: Optional EventBus for state change notifications (Phase 2).
             anthropic_client: Optional AsyncAnthropic client for StateExtractor (Phase 3).
+            enable_journal: Use journaled (append-only) saves when persisting to
+                files. Ignored for non-file providers unless session_journal is given.
+            session_journal: Optional StateJournal to use instead of the default
+                one created next to the FileStateProvider snapshots.
+            max_history_tokens: Optional token budget for new conversations; the
+                oldest complete exchanges are evicted once it is exceeded.
+            compaction_threshold_tokens: Estimated history size above which
+                requests send the conversation summary instead of the messages
+                it covers (None disables compaction). Applied to created and
+                restored sessions.
 
         Example (with custom agent factory):
             >>> def create_command_agent(conversation):
@@ -145,6 +187,8 @@ class SessionManager:
         self.tool_registry = tool_registry
         self.system_message = system_message
         self.enable_caching = enable_caching
+        self.max_history_tokens = max_history_tokens
+        self.compaction_threshold_tokens = compaction_threshold_tokens
         self.callbacks = callbacks or {}
         self._agent_factory = agent_factory
         self._summarizer = summarizer
@@ -179,13 +223,26 @@ class SessionManager:
         # Multi-session support
         self._sessions: Dict[str, Session] = {}
         self._active_session_id: Optional[str] = None
+        # Metadata of every stored session (loaded or not), by session_id
+        self._session_index: Dict[str, dict[str, Any]] = {}
 
         # Migrate old session.json to new default.json format if needed
         # Only needed for FileStateProvider
-        from nxs.infrastructure.state import FileStateProvider
+        from nxs.infrastructure.state import FileStateProvider, StateJournal
         if isinstance(self.state_provider, FileStateProvider):
             self._migrate_legacy_session_file()
 
+        # Journaled persistence: append deltas instead of rewriting the session
+        self._journal: Optional[StateJournal] = None
+        if enable_journal:
+            if session_journal is not None:
+                self._journal = session_journal
+            elif isinstance(self.state_provider, FileStateProvider):
+                self._journal = StateJournal(base_dir=self.storage_dir, fsync=self.state_provider.fsync)
+        self._journal_cursors: Dict[str, _JournalCursor] = {}
+        self._save_locks: Dict[str, asyncio.Lock] = {}
+        self._compaction_tasks: Dict[str, asyncio.Task] = {}
+
         logger.info(
             f"SessionManager initialized: provider={type(self.state_provider).__name__}"
         )
@@ -243,7 +300,7 @@ class SessionManager:
         if self.DEFAULT_SESSION_ID in self._sessions:
             # Make it active if not already
             if self._active_session_id != self.DEFAULT_SESSION_ID:
-                self._active_session_id = self.DEFAULT_SESSION_ID
+                self._set_active_session(self.DEFAULT_SESSION_ID)
             return self._sessions[self.DEFAULT_SESSION_ID]
 
         # Try to restore from storage using StateProvider
@@ -261,7 +318,7 @@ class SessionManager:
             try:
                 session = await self._load_session(session_key)
                 self._sessions[self.DEFAULT_SESSION_ID] = session
-                self._active_session_id = self.DEFAULT_SESSION_ID
+                self._set_active_session(self.DEFAULT_SESSION_ID)
                 logger.info(
                     f"Session restored: {session.session_id}, "
                     f"{session.get_message_count()} messages"
@@ -271,8 +328,10 @@ class SessionManager:
                 logger.error(f"Failed to restore session: {e}", exc_info=True)
                 logger.warning("Creating new session instead")
 
-        # Create new session
+        # Create new session (replacing an index entry that failed to load)
+        self._session_index.pop(self.DEFAULT_SESSION_ID, None)
         session = self.create_session(self.DEFAULT_SESSION_ID, "Default Session")
+        self._set_active_session(self.DEFAULT_SESSION_ID)
         logger.info(f"Created new session: {self.DEFAULT_SESSION_ID}")
 
         return session
@@ -300,6 +359,8 @@ class SessionManager:
         conversation = Conversation(
             system_message=self.system_message,
             enable_caching=self.enable_caching,
+            max_history_tokens=self.max_history_tokens,
+            compaction_threshold_tokens=self.compaction_threshold_tokens,
         )
 
         # Create agent loop (use factory if provided, otherwise default)
@@ -324,6 +385,7 @@ class SessionManager:
             state_provider=self.state_provider,
             anthropic_client=self.anthropic_client,  # Phase 3
         )
+        self._scope_tool_results(session)
 
         return session
 
@@ -340,9 +402,7 @@ class SessionManager:
             Exception: If loading fails.
         """
         # Load data from StateProvider
-        data = await self.state_provider.load(session_key)
-        if data is None:
-            raise ValueError(f"Session not found: {session_key}")
+        data = await self._read_session_data(session_key)
 
         # Restore conversation from saved data
         conversation = Conversation.from_dict(data["conversation"])
@@ -368,12 +428,61 @@ class SessionManager:
             state_provider=self.state_provider,
             anthropic_client=self.anthropic_client,
         )
+        if self.compaction_threshold_tokens is not None:
+            session.conversation.compaction_threshold_tokens = self.compaction_threshold_tokens
+        self._scope_tool_results(session)
+
+        if self._journal is not None:
+            from nxs.infrastructure.state import StateJournal
+
+            self._journal_cursors[session.session_id] = _JournalCursor(
+                conversation=session.conversation,
+                history_epoch=session.conversation.history_epoch,
+                message_count=session.conversation.get_message_count(),
+                generation=data.get(StateJournal.GENERATION_FIELD, 0),
+            )
 
         return session
 
+    def _scope_tool_results(self, session: Session) -> None:
+        """Scope the cached tool results of a session's own tool registry.
+
+        Agents built by agent_factory have a registry per session, possibly
+        sharing one ToolResultCache, so their entries are keyed by session.
+        The shared self.tool_registry follows the active session instead
+        (see _set_active_session()).
+        """
+        registry = getattr(session.agent_loop, "tool_registry", None)
+        if isinstance(registry, ToolRegistry) and registry is not self.tool_registry:
+            registry.set_result_cache_scope(session.session_id)
+
+    async def _read_session_data(self, session_key: str) -> dict[str, Any]:
+        """Read a stored session (snapshot plus journal) without deserializing it.
+
+        Args:
+            session_key: State key for the session (e.g., "session:default").
+
+        Returns:
+            Session data as produced by Session.to_dict().
+
+        Raises:
+            ValueError: If the session is not stored.
+        """
+        data = await self.state_provider.load(session_key)
+        if data is None:
+            raise ValueError(f"Session not found: {session_key}")
+        if self._journal is not None:
+            data = await self._journal.replay(session_key, data)
+        return data
+
     async def _save_session_async(self, session: Session) -> None:
         """Save a specific session using StateProvider (async).
 
+        With journaling enabled, only the messages appended since the last
+        save and the sections that changed are written. A full snapshot is
+        written on the first save, after the history was cleared or truncated,
+        and by background compaction.
+
         Args:
             session: The Session instance to save.
 
@@ -382,22 +491,297 @@ class SessionManager:
         session_key = f"session:{session.session_id}"
 
         try:
-            data = session.to_dict()
-            msg_count = len(data.get("conversation", {}).get("messages", []))
+            if self._journal is None:
+                await self._write_session_snapshot(session, session_key)
+            else:
+                async with self._get_save_lock(session.session_id):
+                    cursor = self._journal_cursors.get(session.session_id)
+                    if cursor is None or not self._can_append(session, cursor):
+                        await self._write_session_snapshot(session, session_key)
+                    else:
+                        await self._append_session_delta(session, session_key, cursor)
+
+                if self._journal.needs_compaction(session_key):
+                    self._schedule_compaction(session)
+
+            self._session_index[session.session_id] = self._index_entry(session)
+            await self._save_session_index()
+        except Exception as e:
+            logger.error(
+                f"Failed to save session {session.session_id}: {e}", exc_info=True
+            )
+
+    @staticmethod
+    def _index_entry(session: Session) -> dict[str, Any]:
+        """Build the session index entry for a loaded session."""
+        return {
+            "session_id": session.session_id,
+            "title": session.title,
+            "created_at": session.created_at.isoformat(),
+            "last_active_at": session.last_active_at.isoformat(),
+            "message_count": session.get_message_count(),
+            "total_cost": session.get_cost_summary()["total_cost"],
+        }
 
+    @staticmethod
+    def _index_entry_from_data(data: dict[str, Any]) -> dict[str, Any]:
+        """Build the session index entry from stored session data."""
+        metadata = data["metadata"]
+        conversation_costs = data.get("conversation_cost_tracker", data.get("cost_tracker", {}))
+        total_cost = (
+            conversation_costs.get("total_cost", 0.0)
+            + data.get("reasoning_cost_tracker", {}).get("total_cost", 0.0)
+            + data.get("summarization_cost_tracker", {}).get("total_cost", 0.0)
+        )
+        return {
+            "session_id": metadata["session_id"],
+            "title": metadata.get("title", "New Conversation"),
+            "created_at": metadata["created_at"],
+            "last_active_at": metadata["last_active_at"],
+            "message_count": len(data.get("conversation", {}).get("messages", [])),
+            "total_cost": total_cost,
+        }
+
+    async def _save_session_index(self) -> None:
+        """Persist the session metadata index."""
+        try:
+            # Entries are replaced, never mutated, so a shallow copy is a stable snapshot
+            await self.state_provider.save(
+                self.SESSION_INDEX_KEY,
+                {"version": 1, "sessions": dict(self._session_index)},
+            )
+        except Exception as e:
+            logger.error(f"Failed to save session index: {e}", exc_info=True)
+
+    async def _load_session_index(self) -> None:
+        """Load the session index and reconcile it with the stored sessions.
+
+        Sessions missing from the index (e.g. saved by an older version, or
+        a crash between saving a session and its index) are read once to
+        add their entry; entries without a stored session are dropped.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        try:
+            data = await self.state_provider.load(self.SESSION_INDEX_KEY)
+            if data is not None:
+                index = dict(data.get("sessions", {}))
+        except Exception as e:
+            logger.warning(f"Session index unreadable, rebuilding it: {e}")
+
+        session_keys = await self.state_provider.list_keys(prefix="session:")
+        stored_ids = {key.split(":", 1)[1] for key in session_keys}
+        changed = False
+
+        for session_id in set(index) - stored_ids:
+            del index[session_id]
+            changed = True
+
+        for session_id in sorted(stored_ids - set(index)):
+            try:
+                data = await self._read_session_data(f"session:{session_id}")
+                index[session_id] = self._index_entry_from_data(data)
+                changed = True
+            except Exception as e:
+                logger.error(f"Failed to index session {session_id}: {e}", exc_info=True)
+
+        self._session_index = index
+        if changed:
+            await self._save_session_index()
+        logger.info(f"Session index loaded: {len(index)} session(s)")
+
+    async def _ensure_session_loaded(self, session_id: str) -> Session:
+        """Return a session, loading it from storage on first use.
+
+        Args:
+            session_id: ID of the session.
+
+        Returns:
+            The loaded Session instance.
+
+        Raises:
+            ValueError: If session_id does not exist.
+        """
+        session = self._sessions.get(session_id)
+        if session is not None:
+            return session
+        if session_id not in self._session_index:
+            raise ValueError(f"Session '{session_id}' does not exist")
+
+        session = await self._load_session(f"session:{session_id}")
+        self._sessions[session_id] = session
+        logger.info(f"Loaded session on demand: {session_id}")
+        return session
+
+    async def _write_session_snapshot(self, session: Session, session_key: str) -> None:
+        """Write the full session and start a new (empty) journal generation.
+
+        Args:
+            session: The Session instance to save.
+            session_key: State key for the session.
+        """
+        data = session.to_dict()
+        msg_count = len(data.get("conversation", {}).get("messages", []))
+
+        if self._journal is None:
             await self.state_provider.save(session_key, data)
+        else:
+            previous = self._journal_cursors.get(session.session_id)
+            generation = previous.generation + 1 if previous else 1
+            data[self._journal.GENERATION_FIELD] = generation
 
-            summary = data.get('metadata', {}).get('conversation_summary', '')
-            summary_length = len(summary) if summary else 0
+            await self.state_provider.save(session_key, data)
+            await self._journal.reset(session_key)
+
+            self._journal_cursors[session.session_id] = _JournalCursor(
+                conversation=session.conversation,
+                history_epoch=session.conversation.history_epoch,
+                message_count=msg_count,
+                generation=generation,
+                section_digests=self._section_digests(data),
+            )
+
+        summary = data.get('metadata', {}).get('conversation_summary', '')
+        summary_length = len(summary) if summary else 0
+        logger.info(
+            f"Session saved: {session.session_id} (key={session_key}), "
+            f"messages={msg_count}, summary_length={summary_length}"
+        )
+
+    async def _append_session_delta(
+        self, session: Session, session_key: str, cursor: _JournalCursor
+    ) -> None:
+        """Append new messages and changed sections to the session journal.
+
+        Args:
+            session: The Session instance to save.
+            session_key: State key for the session.
+            cursor: What was persisted by the previous save (updated in place).
+        """
+        assert self._journal is not None
+        data = session.to_dict(include_messages=False)
+        digests = self._section_digests(data)
+
+        records: list[dict[str, Any]] = []
+        for name, value in data.items():
+            if cursor.section_digests.get(name) == digests[name]:
+                continue
+            # Merge conversation fields so the journaled messages are kept
+            op = "update" if name == "conversation" else "set"
+            records.append({"op": op, "path": [name], "value": value})
+
+        message_count = session.conversation.get_message_count()
+        if message_count > cursor.message_count:
+            records.append(
+                {
+                    "op": "splice",
+                    "path": ["conversation", "messages"],
+                    "start": cursor.message_count,
+                    "items": session.conversation.serialize_messages_since(cursor.message_count),
+                }
+            )
+
+        if records:
+            size = await self._journal.append(session_key, records, generation=cursor.generation)
             logger.info(
-                f"Session saved: {session.session_id} (key={session_key}), "
-                f"messages={msg_count}, summary_length={summary_length}"
+                f"Session journaled: {session.session_id} (key={session_key}), "
+                f"new_messages={message_count - cursor.message_count}, "
+                f"records={len(records)}, journal_size={size} bytes"
             )
+        else:
+            logger.debug(f"Session unchanged, nothing to journal: {session.session_id}")
+
+        cursor.message_count = message_count
+        cursor.section_digests = digests
+
+    @staticmethod
+    def _can_append(session: Session, cursor: _JournalCursor) -> bool:
+        """Check whether the conversation only grew since the last save."""
+        conversation = session.conversation
+        return (
+            cursor.conversation is conversation
+            and cursor.history_epoch == conversation.history_epoch
+            and conversation.get_message_count() >= cursor.message_count
+        )
+
+    @staticmethod
+    def _section_digests(data: dict[str, Any]) -> dict[str, str]:
+        """Digest each top-level section (conversation without its messages)."""
+        digests: dict[str, str] = {}
+        for name, value in data.items():
+            if name == "conversation":
+                value = {k: v for k, v in value.items() if k != "messages"}
+            encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+            digests[name] = hashlib.sha1(encoded).hexdigest()
+        return digests
+
+    def _get_save_lock(self, session_id: str) -> asyncio.Lock:
+        """Get the lock serializing saves/compactions of one session."""
+        lock = self._save_locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._save_locks[session_id] = lock
+        return lock
+
+    def _schedule_compaction(self, session: Session) -> None:
+        """Fold the session journal into a new snapshot in the background."""
+        task = self._compaction_tasks.get(session.session_id)
+        if task is not None and not task.done():
+            return
+        self._compaction_tasks[session.session_id] = asyncio.create_task(
+            self._compact_session(session)
+        )
+
+    async def _compact_session(self, session: Session) -> None:
+        """Rewrite the session snapshot and discard its journal.
+
+        Args:
+            session: The Session instance to compact.
+        """
+        session_key = f"session:{session.session_id}"
+        try:
+            async with self._get_save_lock(session.session_id):
+                await self._write_session_snapshot(session, session_key)
+            logger.info(f"Compacted session journal: {session.session_id}")
         except Exception as e:
             logger.error(
-                f"Failed to save session {session.session_id}: {e}", exc_info=True
+                f"Failed to compact session {session.session_id}: {e}", exc_info=True
             )
 
+    async def export_session_async(
+        self, session_id: str, path: Optional[Path] = None
+    ) -> Optional[Path]:
+        """Write a full (non-journaled) copy of a session.
+
+        Args:
+            session_id: ID of the session to export.
+            path: Destination JSON file. If None, the session's snapshot in the
+                state provider is rewritten in full (compacting its journal).
+
+        Returns:
+            The file written, or None when the snapshot was rewritten in place.
+
+        Raises:
+            ValueError: If session_id does not exist.
+
+        Example:
+            >>> await manager.export_session_async("work", Path("~/work-session.json"))
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise ValueError(f"Session '{session_id}' does not exist")
+
+        if path is None:
+            async with self._get_save_lock(session_id):
+                await self._write_session_snapshot(session, f"session:{session_id}")
+            return None
+
+        export_path = Path(path).expanduser()
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(export_path, "w", encoding="utf-8") as f:
+            json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+        logger.info(f"Exported session {session_id} to {export_path}")
+        return export_path
+
     def _save_session(self, session: Session) -> None:
         """Save a specific session (synchronous wrapper).
 
@@ -628,6 +1012,20 @@ class SessionManager:
                 "message_count": session.get_message_count(),
                 "created_at": session.created_at,
                 "last_active": session.last_active_at,
+                "total_cost": session.get_cost_summary()["total_cost"],
+            })
+
+        # Sessions not loaded yet come from the metadata index
+        for session_id, entry in self._session_index.items():
+            if session_id in self._sessions:
+                continue
+            sessions_info.append({
+                "session_id": session_id,
+                "title": entry["title"],
+                "message_count": entry["message_count"],
+                "created_at": datetime.fromisoformat(entry["created_at"]),
+                "last_active": datetime.fromisoformat(entry["last_active_at"]),
+                "total_cost": entry.get("total_cost", 0.0),
             })
 
         # Sort by last_active descending (most recent first)
@@ -652,7 +1050,7 @@ class SessionManager:
             >>> session = manager.create_session("work", "Work Chat")
             >>> print(session.session_id)  # "work"
         """
-        if session_id in self._sessions:
+        if session_id in self._sessions or session_id in self._session_index:
             raise ValueError(f"Session '{session_id}' already exists")
 
         session = self._create_new_session(session_id, title)
@@ -660,7 +1058,7 @@ class SessionManager:
 
         # Auto-set as active if first session
         if self._active_session_id is None:
-            self._active_session_id = session_id
+            self._set_active_session(session_id)
 
         logger.info(f"Created session: {session_id}")
         return session
@@ -678,15 +1076,72 @@ class SessionManager:
             The newly active Session instance.
 
         Raises:
-            ValueError: If session_id does not exist.
+            ValueError: If session_id does not exist or is not loaded yet
+                (use switch_session_async() for sessions known only from
+                the index).
 
         Example:
             >>> session = manager.switch_session("work")
             >>> print(session.session_id)  # "work"
         """
         if session_id not in self._sessions:
+            if session_id in self._session_index:
+                raise ValueError(
+                    f"Session '{session_id}' is not loaded; use switch_session_async()"
+                )
             raise ValueError(f"Session '{session_id}' does not exist")
 
+        return self._activate_session(session_id)
+
+    async def switch_session_async(self, session_id: str) -> Session:
+        """Switch active session, loading it from storage if needed.
+
+        Args:
+            session_id: ID of the session to switch to.
+
+        Returns:
+            The newly active Session instance.
+
+        Raises:
+            ValueError: If session_id does not exist.
+
+        Example:
+            >>> session = await manager.switch_session_async("work")
+        """
+        await self._ensure_session_loaded(session_id)
+        return self._activate_session(session_id)
+
+    async def get_or_create_session(
+        self, session_id: str, title: str = "New Conversation"
+    ) -> Session:
+        """Switch to a session, loading or creating it as needed.
+
+        Args:
+            session_id: ID of the session.
+            title: Title used if the session has to be created.
+
+        Returns:
+            The newly active Session instance.
+
+        Example:
+            >>> session = await manager.get_or_create_session("work")
+        """
+        if session_id not in self._sessions and session_id not in self._session_index:
+            self.create_session(session_id, title)
+        return await self.switch_session_async(session_id)
+
+    def _set_active_session(self, session_id: Optional[str]) -> None:
+        """Set the active session ID.
+
+        A tool registry shared by all sessions scopes its cached tool
+        results to the active session.
+        """
+        self._active_session_id = session_id
+        if self.tool_registry is not None:
+            self.tool_registry.set_result_cache_scope(session_id)
+
+    def _activate_session(self, session_id: str) -> Session:
+        """Make a loaded session active, auto-saving the previous one."""
         # Auto-save current active session before switching
         if self._active_session_id is not None:
             current_session = self.get_active_session()
@@ -696,7 +1151,7 @@ class SessionManager:
                     f"Auto-saved session before switch: {self._active_session_id}"
                 )
 
-        self._active_session_id = session_id
+        self._set_active_session(session_id)
         logger.info(f"Switched to session: {session_id}")
         return self._sessions[session_id]
 
@@ -716,26 +1171,31 @@ class SessionManager:
         Example:
             >>> await manager.delete_session_async("work")
         """
-        if session_id not in self._sessions:
+        if session_id not in self._sessions and session_id not in self._session_index:
             raise ValueError(f"Session '{session_id}' does not exist")
 
         # Delete session from storage using StateProvider
         session_key = f"session:{session_id}"
         try:
             await self.state_provider.delete(session_key)
+            if self._journal is not None:
+                await self._journal.delete(session_key)
             logger.debug(f"Deleted session from storage: {session_key}")
         except Exception as e:
             logger.error(f"Failed to delete session from storage {session_key}: {e}")
 
-        # Remove from memory
-        del self._sessions[session_id]
+        # Remove from memory and from the index
+        self._sessions.pop(session_id, None)
+        self._journal_cursors.pop(session_id, None)
+        if self._session_index.pop(session_id, None) is not None:
+            await self._save_session_index()
 
         # Clear active session if deleted
         if self._active_session_id == session_id:
-            self._active_session_id = None
+            self._set_active_session(None)
             # Auto-switch to another session if available
             if self._sessions:
-                self._active_session_id = next(iter(self._sessions.keys()))
+                self._set_active_session(next(iter(self._sessions.keys())))
                 logger.info(f"Auto-switched to session: {self._active_session_id}")
 
         logger.info(f"Deleted session: {session_id}")
@@ -762,14 +1222,20 @@ class SessionManager:
         """List all sessions.
 
         Returns:
-            List of SessionMetadata for all sessions.
+            List of SessionMetadata for all sessions (loaded or only indexed).
 
         Example:
             >>> sessions = manager.list_sessions()
             >>> for session_meta in sessions:
             ...     print(f"{session_meta.session_id}: {session_meta.title}")
         """
-        return [session.metadata for session in self._sessions.values()]
+        metadata = [session.metadata for session in self._sessions.values()]
+        metadata.extend(
+            SessionMetadata.from_dict(entry)
+            for session_id, entry in self._session_index.items()
+            if session_id not in self._sessions
+        )
+        return metadata
 
     def save_all_sessions(self) -> None:
         """Save all sessions to disk.
@@ -796,41 +1262,37 @@ class SessionManager:
         logger.info(f"Saved {len(self._sessions)} session(s)")
 
     async def restore_all_sessions(self) -> None:
-        """Restore all sessions from storage.
+        """Restore sessions from storage lazily.
 
-        Loads all session keys found via StateProvider.
-        Sets default session as active if it exists, otherwise
-        sets the first session found as active.
+        Loads the session metadata index (so every stored session can be
+        listed) but deserializes only the session that becomes active: the
+        default session if it exists, otherwise the most recently active one.
+        Other sessions are loaded on demand by switch_session_async() or
+        get_or_create_session().
 
         Example:
             >>> await manager.restore_all_sessions()
         """
         try:
-            # List all session keys using StateProvider
-            session_keys = await self.state_provider.list_keys(prefix="session:")
+            await self._load_session_index()
 
-            if not session_keys:
+            if not self._session_index:
                 logger.debug("No sessions found in storage")
                 return
 
-            # Load each session
-            for session_key in session_keys:
-                try:
-                    session = await self._load_session(session_key)
-                    self._sessions[session.session_id] = session
-                    logger.info(f"Restored session: {session.session_id}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to restore {session_key}: {e}", exc_info=True
-                    )
+            if self.DEFAULT_SESSION_ID in self._session_index:
+                active_id = self.DEFAULT_SESSION_ID
+            else:
+                active_id = max(
+                    self._session_index.values(), key=lambda entry: entry["last_active_at"]
+                )["session_id"]
 
-            # Set default as active if it exists
-            if self.DEFAULT_SESSION_ID in self._sessions:
-                self._active_session_id = self.DEFAULT_SESSION_ID
-                logger.debug(f"Set default session as active")
-            elif self._sessions:
-                self._active_session_id = next(iter(self._sessions.keys()))
-                logger.debug(f"Set first session as active: {self._active_session_id}")
+            try:
+                await self._ensure_session_loaded(active_id)
+                self._set_active_session(active_id)
+                logger.debug(f"Set session as active: {active_id}")
+            except Exception as e:
+                logger.error(f"Failed to restore session:{active_id}: {e}", exc_info=True)
 
         except Exception as e:
             logger.error(f"Error during session restoration: {e}", exc_info=True)
@@ -30,10 +30,14 @@ Example:
     >>> # Context includes user name and API rate limit fact
 """
 
+import heapq
+import math
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+from nxs.application.similarity import MinHashLSH
 from nxs.logger import get_logger
 
 logger = get_logger(__name__)
@@ -331,11 +335,12 @@ class KnowledgeBase:
     fact retrieval, semantic search, and deduplication.
 
     Features:
-    - Fact deduplication based on content similarity
+    - Fact deduplication based on normalized content (O(1) lookup) and
+      near-duplicate detection for reworded facts (MinHash/LSH)
     - Confidence tracking and updating
     - Source-based querying
     - Recency-based retrieval
-    - Relevance-based search
+    - Relevance-based search using BM25 over an incremental term index
 
     Example:
         >>> kb = KnowledgeBase()
@@ -348,13 +353,85 @@ class KnowledgeBase:
         ...     print(fact.content)
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty knowledge base."""
+    # BM25 parameters (term frequency saturation and length normalization)
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+
+    _TERM_RE = re.compile(r"\w+")
+
+    # Words ignored when comparing facts for near-duplicates
+    _DEDUP_STOPWORDS = frozenset(
+        "a an and are as at be by for from has have in is it its of on or that the to was were with".split()
+    )
+
+    def __init__(self, near_duplicate_threshold: Optional[float] = 0.8) -> None:
+        """Initialize an empty knowledge base.
+
+        Args:
+            near_duplicate_threshold: Jaccard similarity (over content words)
+                above which a new fact is merged into an existing one. Facts
+                with different numbers are never merged. None disables
+                near-duplicate detection (exact duplicates are still merged).
+        """
         self.facts: list[Fact] = []
-        self._fact_index: dict[int, Fact] = {}  # Hash → Fact
+        self._fact_index: dict[str, Fact] = {}  # Normalized content → Fact
+
+        # Inverted index over self.facts (fact position → term frequency)
+        self._postings: dict[str, dict[int, int]] = {}
+        self._fact_lengths: list[int] = []  # Term count per indexed fact
+        self._total_length = 0
+
+        # Near-duplicate index over self.facts (keyed by fact position)
+        self._similar_index: Optional[MinHashLSH[int]] = None
+        if near_duplicate_threshold is not None:
+            self._similar_index = MinHashLSH(
+                threshold=near_duplicate_threshold,
+                tokenizer=self._dedup_terms,
+            )
 
         logger.debug("KnowledgeBase initialized")
 
+    @staticmethod
+    def _normalize(content: str) -> str:
+        """Normalize fact content for duplicate detection."""
+        return " ".join(content.lower().split())
+
+    @classmethod
+    def _terms(cls, text: str) -> list[str]:
+        """Split text into lowercase index terms."""
+        return cls._TERM_RE.findall(text.lower())
+
+    @classmethod
+    def _dedup_terms(cls, text: str) -> set[str]:
+        """Content words used for near-duplicate comparison."""
+        return {term for term in cls._terms(text) if term not in cls._DEDUP_STOPWORDS}
+
+    def _index_fact(self, fact: Fact) -> None:
+        """Add a fact (already appended to self.facts) to the indexes."""
+        position = len(self._fact_lengths)
+        terms = self._terms(fact.content)
+        for term in terms:
+            postings = self._postings.setdefault(term, {})
+            postings[position] = postings.get(position, 0) + 1
+        self._fact_lengths.append(len(terms))
+        self._total_length += len(terms)
+        self._fact_index.setdefault(self._normalize(fact.content), fact)
+        if self._similar_index is not None:
+            self._similar_index.add(position, fact.content)
+
+    def _ensure_indexed(self) -> None:
+        """Rebuild the indexes if self.facts was modified directly."""
+        if len(self._fact_lengths) == len(self.facts):
+            return
+        self._fact_index = {}
+        self._postings = {}
+        self._fact_lengths = []
+        self._total_length = 0
+        if self._similar_index is not None:
+            self._similar_index.clear()
+        for fact in self.facts:
+            self._index_fact(fact)
+
     def add_fact(
         self,
         content: str,
@@ -401,11 +478,11 @@ class KnowledgeBase:
         else:
             # Add new fact
             self.facts.append(fact)
-            self._fact_index[hash(content)] = fact
+            self._index_fact(fact)
             logger.debug(f"Added new fact: {content[:50]}... (source={source}, confidence={confidence})")
 
     def _find_similar_fact(self, content: str) -> Optional[Fact]:
-        """Find similar existing fact (simple string matching for now).
+        """Find an existing fact with the same or nearly the same content.
 
         Args:
             content: Fact content to search for
@@ -414,12 +491,21 @@ class KnowledgeBase:
             Existing Fact if found, None otherwise
 
         Note:
-            Currently uses exact case-insensitive matching. Future enhancement
-            could use semantic similarity (embeddings).
+            Exact matches (after lowercasing and collapsing whitespace) are
+            found first; otherwise the near-duplicate index is queried, and a
+            candidate only matches if it mentions the same numbers. Future
+            enhancement could use semantic similarity (embeddings).
         """
-        content_lower = content.lower()
-        for fact in self.facts:
-            if fact.content.lower() == content_lower:
+        self._ensure_indexed()
+        existing = self._fact_index.get(self._normalize(content))
+        if existing is not None or self._similar_index is None:
+            return existing
+
+        numbers = {term for term in self._terms(content) if any(c.isdigit() for c in term)}
+        for position in self._similar_index.query(content):
+            fact = self.facts[position]
+            fact_numbers = {term for term in self._terms(fact.content) if any(c.isdigit() for c in term)}
+            if fact_numbers == numbers:
                 return fact
         return None
 
@@ -431,8 +517,9 @@ class KnowledgeBase:
     ) -> list[Fact]:
         """Retrieve facts relevant to a query.
 
-        Uses simple keyword matching for relevance scoring. Facts are ranked
-        by the number of overlapping terms with the query.
+        Scores facts with BM25 over the term index, so only facts sharing a
+        term with the query are visited. Rare terms weigh more than common ones
+        and short facts are favoured over long ones with the same matches.
 
         Args:
             query: Search query
@@ -451,25 +538,34 @@ class KnowledgeBase:
         Note:
             Future enhancement: Use vector embeddings for semantic similarity.
         """
-        query_lower = query.lower()
-        query_terms = set(query_lower.split())
-
-        scored_facts: list[tuple[float, Fact]] = []
-        for fact in self.facts:
-            if fact.confidence < min_confidence:
+        self._ensure_indexed()
+        if limit <= 0 or not self._fact_lengths:
+            return []
+
+        fact_count = len(self._fact_lengths)
+        avg_length = self._total_length / fact_count or 1.0
+        k1, b = self.BM25_K1, self.BM25_B
+
+        scores: dict[int, float] = {}
+        for term in set(self._terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
                 continue
-
-            fact_terms = set(fact.content.lower().split())
-            overlap = len(query_terms & fact_terms)
-
-            if overlap > 0:
-                score = overlap / len(query_terms)
-                scored_facts.append((score, fact))
-
-        # Sort by score descending
-        scored_facts.sort(key=lambda x: x[0], reverse=True)
-
-        return [fact for _, fact in scored_facts[:limit]]
+            idf = math.log(1 + (fact_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for position, tf in postings.items():
+                norm = k1 * (1 - b + b * self._fact_lengths[position] / avg_length)
+                scores[position] = scores.get(position, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        # Top-k by score, newer facts first on ties
+        top = heapq.nlargest(
+            limit,
+            (
+                (score, position)
+                for position, score in scores.items()
+                if self.facts[position].confidence >= min_confidence
+            ),
+        )
+        return [self.facts[position] for _, position in top]
 
     def search(self, query: str, limit: int = 5) -> list[Fact]:
         """Search facts (alias for get_relevant_facts).
@@ -559,7 +655,7 @@ class KnowledgeBase:
                 references=fact_data.get("references", []),
             )
             kb.facts.append(fact)
-            kb._fact_index[hash(fact.content)] = fact
+            kb._index_fact(fact)
 
         logger.debug(f"Restored KnowledgeBase: {len(kb.facts)} facts")
         return kb
@@ -790,6 +886,8 @@ class StateMetadata:
         cost_breakdown: Detailed cost breakdown
         tool_usage: Tool usage counts
         tool_success_rate: Tool success rates
+        tool_cache_hits: Tool calls answered from the tool result cache
+        tool_cache_misses: Cacheable tool calls that had to execute
         session_duration: Session duration in seconds
         average_response_time: Average response time in seconds
 
@@ -825,6 +923,8 @@ class StateMetadata:
         # Tool usage
         self.tool_usage: dict[str, int] = {}  # tool_name → count
         self.tool_success_rate: dict[str, float] = {}  # tool_name → success rate
+        self.tool_cache_hits: int = 0
+        self.tool_cache_misses: int = 0
 
         # Timing
         self.session_duration: float = 0.0  # seconds
@@ -833,11 +933,13 @@ class StateMetadata:
 
         logger.debug("StateMetadata initialized")
 
-    def record_interaction(self, metadata: dict[str, Any]) -> None:
+    def record_interaction(self, metadata: dict[str, Any], count_message: bool = True) -> None:
         """Record metadata from an interaction.
 
         Args:
             metadata: Dictionary with usage and cost information
+            count_message: Whether to count the interaction as a message
+                (False when the caller already updated message_count)
 
         Example:
             >>> meta = StateMetadata()
@@ -846,7 +948,8 @@ class StateMetadata:
             ...     "cost": 0.001
             ... })
         """
-        self.message_count += 1
+        if count_message:
+            self.message_count += 1
 
         # Token usage
         if "usage" in metadata:
@@ -899,6 +1002,17 @@ class StateMetadata:
 
         logger.debug(f"Recorded tool call: {tool_name} (success={success})")
 
+    def record_tool_cache_lookup(self, hit: bool) -> None:
+        """Record a lookup in the tool result cache.
+
+        Args:
+            hit: Whether a cached result was reused
+        """
+        if hit:
+            self.tool_cache_hits += 1
+        else:
+            self.tool_cache_misses += 1
+
     def get_summary(self) -> dict[str, Any]:
         """Get summary statistics.
 
@@ -919,19 +1033,32 @@ class StateMetadata:
             "total_cost_usd": round(self.total_cost, 4),
             "avg_response_time_sec": round(self.average_response_time, 2),
             "cache_efficiency": self._calculate_cache_efficiency(),
+            "tool_cache_hits": self.tool_cache_hits,
+            "tool_cache_misses": self.tool_cache_misses,
+            "tool_cache_hit_rate": self._calculate_tool_cache_hit_rate(),
         }
 
     def _calculate_cache_efficiency(self) -> float:
         """Calculate cache hit rate.
 
+        input_tokens from the API excludes cached tokens, so the prompt size
+        is uncached input plus cache writes plus cache reads.
+
         Returns:
             Cache efficiency ratio (0.0 to 1.0).
         """
-        total_input = self.total_input_tokens + self.total_cache_read_tokens
+        total_input = self.total_input_tokens + self.total_cache_creation_tokens + self.total_cache_read_tokens
         if total_input == 0:
             return 0.0
         return self.total_cache_read_tokens / total_input
 
+    def _calculate_tool_cache_hit_rate(self) -> float:
+        """Calculate the fraction of cacheable tool calls served from cache."""
+        lookups = self.tool_cache_hits + self.tool_cache_misses
+        if lookups == 0:
+            return 0.0
+        return self.tool_cache_hits / lookups
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary.
 
@@ -950,6 +1077,8 @@ class StateMetadata:
             "cost_breakdown": self.cost_breakdown,
             "tool_usage": self.tool_usage,
             "tool_success_rate": self.tool_success_rate,
+            "tool_cache_hits": self.tool_cache_hits,
+            "tool_cache_misses": self.tool_cache_misses,
             "session_duration": self.session_duration,
             "average_response_time": self.average_response_time,
         }
@@ -0,0 +1,203 @@
+"""Near-duplicate detection with MinHash signatures and LSH buckets.
+
+MinHashLSH indexes short texts (plan step descriptions, knowledge base facts)
+so that texts whose token sets have a Jaccard similarity above a threshold can
+be found without comparing against every indexed text. Candidates from the
+LSH buckets are verified with the exact Jaccard similarity, so results match a
+pairwise scan apart from the rare candidate the buckets miss.
+
+Signatures are computed with NumPy when it is installed and with plain Python
+otherwise; both produce identical values.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from types import ModuleType
+from typing import Callable, Generic, Hashable, Iterable, Optional, TypeVar
+
+from nxs.logger import get_logger
+
+np: Optional[ModuleType]
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = get_logger(__name__)
+
+__all__ = ["MinHashLSH", "jaccard_similarity"]
+
+# Prime just above 2**32; token hashes are 32-bit, so (a * x + b) stays below 2**64
+_PRIME = 4294967311
+_MAX_COEFFICIENT = 2**31
+
+K = TypeVar("K", bound=Hashable)
+
+
+def jaccard_similarity(tokens1: Iterable[str], tokens2: Iterable[str]) -> float:
+    """Return the Jaccard similarity (intersection over union) of two token sets."""
+    set1, set2 = set(tokens1), set(tokens2)
+    if not set1 or not set2:
+        return 0.0
+    return len(set1 & set2) / len(set1 | set2)
+
+
+def _default_tokenizer(text: str) -> set[str]:
+    return set(text.lower().split())
+
+
+def _token_hash(token: str) -> int:
+    """Stable 32-bit hash of a token (independent of PYTHONHASHSEED)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def _choose_bands(num_perm: int, threshold: float) -> tuple[int, int]:
+    """Pick (bands, rows) so the LSH S-curve rises well before threshold.
+
+    The probability that two texts with similarity s share a bucket is
+    1 - (1 - s**rows)**bands, with its midpoint near (1 / bands)**(1 / rows).
+    The midpoint is kept about 0.15 below the threshold for high recall; exact
+    verification removes the extra candidates.
+    """
+    target = max(0.05, threshold - 0.15)
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if bands < 1:
+            break
+        if (1 / bands) ** (1 / rows) <= target:
+            best = (bands, rows)
+        else:
+            break
+    return best
+
+
+class MinHashLSH(Generic[K]):
+    """Index of token sets for sublinear near-duplicate lookup.
+
+    The index is generic in its key type (e.g. ``MinHashLSH[int]`` for texts
+    keyed by list position).
+
+    Example:
+        >>> index: MinHashLSH[str] = MinHashLSH(threshold=0.7)
+        >>> index.add("step_0", "search for python async tutorials")
+        >>> index.query("search python async tutorials")
+        ['step_0']
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        *,
+        num_perm: int = 64,
+        tokenizer: Optional[Callable[[str], Iterable[str]]] = None,
+        seed: int = 1,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            threshold: Minimum Jaccard similarity for a match (0.0 to 1.0)
+            num_perm: Number of hash permutations per signature
+            tokenizer: Function splitting text into tokens (default: lowercase
+                whitespace split)
+            seed: Seed for the permutation coefficients
+        """
+        self.threshold = threshold
+        self.num_perm = max(1, num_perm)
+        self.tokenizer = tokenizer or _default_tokenizer
+        self.bands, self.rows = _choose_bands(self.num_perm, threshold)
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _MAX_COEFFICIENT) for _ in range(self.num_perm)]
+        self._b = [rng.randrange(0, _MAX_COEFFICIENT) for _ in range(self.num_perm)]
+        if np is not None:
+            self._a_array = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_array = np.array(self._b, dtype=np.uint64)[:, None]
+
+        self._buckets: list[dict[tuple[int, ...], set[K]]] = [{} for _ in range(self.bands)]
+        self._signatures: dict[K, tuple[int, ...]] = {}
+        self._tokens: dict[K, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._tokens
+
+    def signature(self, tokens: Iterable[str]) -> tuple[int, ...]:
+        """Compute the MinHash signature of a token set (empty for no tokens)."""
+        hashes = [_token_hash(token) for token in set(tokens)]
+        if not hashes:
+            return ()
+        if np is not None:
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            return tuple(((self._a_array * values + self._b_array) % _PRIME).min(axis=1).tolist())
+        return tuple(min((a * x + b) % _PRIME for x in hashes) for a, b in zip(self._a, self._b, strict=True))
+
+    def add(self, key: K, text: str) -> None:
+        """Index text under key, replacing any text previously indexed for key."""
+        if key in self._tokens:
+            self.remove(key)
+
+        tokens = frozenset(self.tokenizer(text))
+        signature = self.signature(tokens)
+        self._tokens[key] = tokens
+        self._signatures[key] = signature
+        if not signature:
+            return
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+
+    def remove(self, key: K) -> None:
+        """Remove key from the index (no-op if absent)."""
+        self._tokens.pop(key, None)
+        signature = self._signatures.pop(key, ())
+        if not signature:
+            return
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def query(self, text: str, threshold: Optional[float] = None) -> list[K]:
+        """Find indexed keys whose text is similar to text.
+
+        Args:
+            text: Text to look up
+            threshold: Override for the similarity threshold (values well below
+                the index threshold may miss matches)
+
+        Returns:
+            Matching keys, most similar first
+        """
+        threshold = self.threshold if threshold is None else threshold
+        tokens = frozenset(self.tokenizer(text))
+        signature = self.signature(tokens)
+        if not signature:
+            return []
+
+        candidates: set[K] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        scored = []
+        for key in candidates:
+            similarity = jaccard_similarity(tokens, self._tokens[key])
+            if similarity >= threshold:
+                scored.append((similarity, key))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [key for _, key in scored]
+
+    def clear(self) -> None:
+        """Remove all indexed texts."""
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures.clear()
+        self._tokens.clear()
+
+    def _band_keys(self, signature: tuple[int, ...]) -> Iterable[tuple[int, ...]]:
+        for band in range(self.bands):
+            yield signature[band * self.rows : (band + 1) * self.rows]
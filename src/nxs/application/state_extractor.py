@@ -7,7 +7,8 @@ structured information from conversation exchanges, including:
 - Intent classification (question, command, research, chat)
 
 The extractor uses lightweight Claude Haiku for fast, cost-efficient extraction
-with structured JSON output.
+with structured JSON output. extract_combined() returns all three kinds of
+information (for one or several exchanges) from a single request.
 """
 
 import json
@@ -397,3 +398,131 @@ Return ONLY valid JSON, no additional text."""
         except Exception as e:
             logger.error(f"Error during intent classification: {e}", exc_info=True)
             return {"type": "chat", "confidence": 0.5}
+
+    async def extract_combined(
+        self,
+        exchanges: list[tuple[str, str]],
+    ) -> dict[str, Any]:
+        """Extract user info, facts and intent with a single LLM call.
+
+        Covers one or more consecutive exchanges at once (e.g. a backlog of
+        exchanges waiting for extraction), replacing the three separate
+        requests made by extract_user_info, extract_facts and classify_intent.
+
+        Args:
+            exchanges: (user_msg, assistant_msg) pairs in chronological order
+
+        Returns:
+            Dictionary with keys:
+            - "user_info": dict of explicitly stated user fields ({} if none)
+            - "facts": list of factual statements ([] if none)
+            - "intent": intent of the most recent user message, or None if
+              intent extraction is disabled or failed
+            Disabled extraction types are returned empty.
+
+        Example:
+            >>> result = await extractor.extract_combined([
+            ...     ("I'm Alice, a Python dev. What's the rate limit?",
+            ...      "The API rate limit is 1000 requests per hour."),
+            ... ])
+            >>> result["facts"]
+            ["API rate limit is 1000 requests per hour"]
+        """
+        result: dict[str, Any] = {"user_info": {}, "facts": [], "intent": None}
+        if not exchanges:
+            return result
+
+        sections: list[str] = []
+        if self.enable_user_extraction:
+            sections.append(
+                '  "user_info": {"name": "string", "age": number, "location": "string", '
+                '"occupation": "string", "expertise_level": "beginner|intermediate|expert", '
+                '"programming_languages": ["string"], "frameworks": ["string"], '
+                '"interests": ["string"], "current_project": "string", '
+                '"project_tech_stack": ["string"], "communication_style": "concise|detailed|technical"}'
+            )
+        if self.enable_fact_extraction:
+            sections.append('  "facts": ["string"]')
+        if self.enable_intent_extraction:
+            sections.append(
+                '  "intent": {"type": "question|command|research|chat|clarification", '
+                '"confidence": 0.0 to 1.0, "details": {"topic": "string", '
+                '"complexity": "simple|medium|complex"}}'
+            )
+        if not sections:
+            return result
+
+        transcript = "\n\n".join(
+            f"Exchange {i}:\nUser: {user_msg}\nAssistant: {assistant_msg}"
+            for i, (user_msg, assistant_msg) in enumerate(exchanges, start=1)
+        )
+        schema = ",\n".join(sections)
+
+        prompt = f"""Analyze these conversation exchanges and extract structured session state.
+
+{transcript}
+
+Return JSON with these fields:
+
+{{
+{schema}
+}}
+
+Rules:
+1. user_info: only explicitly stated information; omit fields that are not mentioned
+2. facts: clear, self-contained facts from the assistant's responses (configuration
+   values, file paths, technical facts, decisions); maximum 10 in total
+3. intent: classify the MOST RECENT user message only; be conservative with "research"
+4. Use {{}} or [] for fields with nothing to extract
+
+Return ONLY valid JSON, no additional text."""
+
+        try:
+            response: Message = await self.client.messages.create(
+                model=self.model,
+                max_tokens=self.max_tokens * len(sections),
+                messages=[{"role": "user", "content": prompt}],
+            )
+
+            # Extract text content
+            if not response.content or len(response.content) == 0:
+                logger.warning("Empty response from combined extraction")
+                return result
+
+            content_text = response.content[0].text if hasattr(response.content[0], "text") else str(response.content[0])
+
+            # Parse JSON response
+            extracted = json.loads(content_text)
+            if not isinstance(extracted, dict):
+                logger.warning(f"Expected object from combined extraction, got {type(extracted)}")
+                return result
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse combined extraction response: {e}")
+            return result
+        except Exception as e:
+            logger.error(f"Error during combined extraction: {e}", exc_info=True)
+            return result
+
+        user_info = extracted.get("user_info")
+        if self.enable_user_extraction and isinstance(user_info, dict):
+            result["user_info"] = user_info
+
+        facts = extracted.get("facts")
+        if self.enable_fact_extraction and isinstance(facts, list):
+            result["facts"] = [f.strip() for f in facts if isinstance(f, str) and f.strip()][:10]
+
+        intent = extracted.get("intent")
+        if self.enable_intent_extraction and isinstance(intent, dict) and "type" in intent:
+            if not isinstance(intent.get("confidence"), (int, float)):
+                intent["confidence"] = 0.7
+            intent.setdefault("details", {})
+            result["intent"] = intent
+
+        logger.debug(
+            f"Combined extraction over {len(exchanges)} exchange(s): "
+            f"user_fields={list(result['user_info'].keys())}, "
+            f"facts={len(result['facts'])}, "
+            f"intent={result['intent']['type'] if result['intent'] else None}"
+        )
+        return result
@@ -8,10 +8,12 @@ The service decouples state update logic from the agent loop, making state
 management testable, maintainable, and event-driven.
 
 Phase 3 Integration: Supports optional StateExtractor for LLM-powered extraction
-of user profile information and facts from conversation exchanges.
+of user profile information and facts from conversation exchanges. Extraction
+runs in a background worker by default so it never delays the next query.
 """
 
 import asyncio
+from dataclasses import dataclass
 from typing import Any, Optional, TYPE_CHECKING
 
 from nxs.application.session_state import SessionState, Intent
@@ -25,6 +27,27 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@dataclass
+class StateExtractionConfig:
+    """Configuration for how StateUpdateService runs LLM extraction.
+
+    Attributes:
+        background: Run extraction in a background worker instead of inside
+            on_exchange_complete().
+        combined: Get user info, facts and intent from one structured LLM call
+            (StateExtractor.extract_combined) instead of three calls.
+        queue_size: Maximum number of exchanges waiting for extraction. When
+            full, the oldest waiting exchange is dropped so callers never block.
+        max_batch_size: Maximum number of queued exchanges extracted together
+            (combined mode only) when the worker falls behind.
+    """
+
+    background: bool = True
+    combined: bool = True
+    queue_size: int = 32
+    max_batch_size: int = 4
+
+
 class StateUpdateService:
     """Coordinates state updates from agent loop events.
 
@@ -86,6 +109,7 @@ class StateUpdateService:
         state_provider: StateProvider,
         session_id: str,
         state_extractor: Optional["StateExtractor"] = None,
+        extraction_config: Optional[StateExtractionConfig] = None,
     ):
         """Initialize the StateUpdateService.
 
@@ -95,12 +119,21 @@ class StateUpdateService:
             state_provider: StateProvider for async persistence
             session_id: Session ID for state storage key
             state_extractor: Optional StateExtractor for automatic extraction
+            extraction_config: Optional StateExtractionConfig (default: background,
+                combined extraction)
         """
         self.session_state = session_state
         self.event_bus = event_bus
         self.state_provider = state_provider
         self.session_id = session_id
         self.state_extractor = state_extractor
+        self.extraction_config = extraction_config or StateExtractionConfig()
+
+        # Background extraction worker (started lazily on the first exchange)
+        self._extraction_queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(
+            maxsize=max(1, self.extraction_config.queue_size)
+        )
+        self._extraction_worker: Optional[asyncio.Task] = None
 
         if state_extractor:
             logger.debug(
@@ -128,6 +161,9 @@ class StateUpdateService:
         - Factual statements for knowledge base
         - User intent classification
 
+        With background extraction (the default) the exchange is only queued
+        here; call drain_extractions() to wait for the results.
+
         Args:
             user_msg: User's message
             assistant_msg: Assistant's response
@@ -143,13 +179,18 @@ class StateUpdateService:
             # Update state metadata - count as 2 messages
             self.session_state.state_metadata.message_count += 2
 
-            # Record interaction metadata if provided
+            # Record interaction metadata if provided (messages already counted)
             if metadata:
-                self.session_state.state_metadata.record_interaction(metadata)
+                self.session_state.state_metadata.record_interaction(metadata, count_message=False)
 
             # Extract information using LLM if extractor is configured
             if self.state_extractor:
-                await self._extract_from_exchange(user_msg, assistant_msg)
+                if self.extraction_config.background:
+                    self._enqueue_extraction(user_msg, assistant_msg)
+                elif self.extraction_config.combined:
+                    await self._extract_from_exchanges([(user_msg, assistant_msg)])
+                else:
+                    await self._extract_from_exchange(user_msg, assistant_msg)
 
             # Update last_updated timestamp
             from datetime import datetime
@@ -403,56 +444,17 @@ class StateUpdateService:
             user_info = await self.state_extractor.extract_user_info(
                 user_msg, assistant_msg
             )
-            if user_info:
-                self.session_state.user_profile.update_from_dict(user_info)
-                logger.debug(f"Updated user profile with extracted fields: {list(user_info.keys())}")
-
-                # Publish profile update event
-                self.event_bus.publish(
-                    StateChanged(
-                        session_id=self.session_id,
-                        component="user_profile",
-                        change_type="update",
-                        details={"fields": ", ".join(user_info.keys())},
-                    )
-                )
+            self._apply_user_info(user_info)
 
             # Extract facts from assistant response
             facts = await self.state_extractor.extract_facts(
                 user_msg, assistant_msg
             )
-            if facts:
-                for fact_content in facts:
-                    self.session_state.knowledge_base.add_fact(
-                        content=fact_content,
-                        source="conversation",
-                        confidence=0.8,
-                    )
-                logger.debug(f"Added {len(facts)} extracted fact(s) to knowledge base")
-
-                # Publish knowledge base update event
-                self.event_bus.publish(
-                    StateChanged(
-                        session_id=self.session_id,
-                        component="knowledge_base",
-                        change_type="add",
-                        details={"fact_count": str(len(facts))},
-                    )
-                )
+            self._apply_facts(facts)
 
             # Classify user intent
             intent_data = await self.state_extractor.classify_intent(user_msg)
-            if intent_data:
-                intent = Intent(
-                    type=intent_data["type"],
-                    confidence=intent_data["confidence"],
-                    details=intent_data.get("details", {}),
-                )
-                self.session_state.interaction_context.update_intent(intent)
-                logger.debug(
-                    f"Classified intent: {intent.type} "
-                    f"(confidence={intent.confidence:.2f})"
-                )
+            self._apply_intent(intent_data)
 
         except Exception as e:
             logger.error(
@@ -461,6 +463,156 @@ class StateUpdateService:
             )
             # Don't propagate - extraction failures shouldn't break state updates
 
+    async def _extract_from_exchanges(
+        self,
+        exchanges: list[tuple[str, str]],
+    ) -> None:
+        """Extract information from one or more exchanges with a single LLM call.
+
+        Args:
+            exchanges: (user_msg, assistant_msg) pairs in chronological order
+        """
+        if not self.state_extractor:
+            return
+
+        try:
+            extracted = await self.state_extractor.extract_combined(exchanges)
+            self._apply_user_info(extracted["user_info"])
+            self._apply_facts(extracted["facts"])
+            self._apply_intent(extracted["intent"])
+
+        except Exception as e:
+            logger.error(
+                f"Error during combined extraction from {len(exchanges)} exchange(s): {e}",
+                exc_info=True
+            )
+            # Don't propagate - extraction failures shouldn't break state updates
+
+    def _apply_user_info(self, user_info: Optional[dict[str, Any]]) -> None:
+        """Merge extracted user profile fields into the session state."""
+        if not user_info:
+            return
+
+        self.session_state.user_profile.update_from_dict(user_info)
+        logger.debug(f"Updated user profile with extracted fields: {list(user_info.keys())}")
+
+        # Publish profile update event
+        self.event_bus.publish(
+            StateChanged(
+                session_id=self.session_id,
+                component="user_profile",
+                change_type="update",
+                details={"fields": ", ".join(user_info.keys())},
+            )
+        )
+
+    def _apply_facts(self, facts: Optional[list[str]]) -> None:
+        """Add extracted facts to the knowledge base."""
+        if not facts:
+            return
+
+        for fact_content in facts:
+            self.session_state.knowledge_base.add_fact(
+                content=fact_content,
+                source="conversation",
+                confidence=0.8,
+            )
+        logger.debug(f"Added {len(facts)} extracted fact(s) to knowledge base")
+
+        # Publish knowledge base update event
+        self.event_bus.publish(
+            StateChanged(
+                session_id=self.session_id,
+                component="knowledge_base",
+                change_type="add",
+                details={"fact_count": str(len(facts))},
+            )
+        )
+
+    def _apply_intent(self, intent_data: Optional[dict[str, Any]]) -> None:
+        """Record a classified intent in the interaction context."""
+        if not intent_data:
+            return
+
+        intent = Intent(
+            type=intent_data["type"],
+            confidence=intent_data["confidence"],
+            details=intent_data.get("details", {}),
+        )
+        self.session_state.interaction_context.update_intent(intent)
+        logger.debug(
+            f"Classified intent: {intent.type} "
+            f"(confidence={intent.confidence:.2f})"
+        )
+
+    def _enqueue_extraction(self, user_msg: str, assistant_msg: str) -> None:
+        """Queue an exchange for background extraction without blocking.
+
+        Drops the oldest waiting exchange if the queue is full.
+        """
+        if self._extraction_queue.full():
+            try:
+                self._extraction_queue.get_nowait()
+                self._extraction_queue.task_done()
+                logger.warning("State extraction queue full, dropped oldest pending exchange")
+            except asyncio.QueueEmpty:
+                pass
+        self._extraction_queue.put_nowait((user_msg, assistant_msg))
+
+        if self._extraction_worker is None or self._extraction_worker.done():
+            self._extraction_worker = asyncio.create_task(self._run_extraction_worker())
+
+    async def _run_extraction_worker(self) -> None:
+        """Process queued exchanges, batching them while the queue is backed up."""
+        while True:
+            batch = [await self._extraction_queue.get()]
+            if self.extraction_config.combined:
+                # Only exchanges that are already waiting join the batch
+                while (
+                    len(batch) < self.extraction_config.max_batch_size
+                    and not self._extraction_queue.empty()
+                ):
+                    batch.append(self._extraction_queue.get_nowait())
+
+            try:
+                if self.extraction_config.combined:
+                    await self._extract_from_exchanges(batch)
+                else:
+                    for user_msg, assistant_msg in batch:
+                        await self._extract_from_exchange(user_msg, assistant_msg)
+
+                from datetime import datetime
+
+                self.session_state.last_updated = datetime.now()
+                await self._persist_state()
+                logger.debug(f"Background extraction finished for {len(batch)} exchange(s)")
+            except Exception as e:
+                logger.error(f"Error in background state extraction: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._extraction_queue.task_done()
+
+    async def drain_extractions(self) -> None:
+        """Wait until every queued exchange has been extracted and persisted."""
+        if self._extraction_worker is None or self._extraction_worker.done():
+            return
+        await self._extraction_queue.join()
+
+    async def close(self) -> None:
+        """Stop the background extraction worker.
+
+        Exchanges still waiting in the queue are discarded; call
+        drain_extractions() first to process them.
+        """
+        worker, self._extraction_worker = self._extraction_worker, None
+        if worker is None or worker.done():
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+
     async def _persist_state(self) -> None:
         """Persist the session state asynchronously.
 
@@ -5,8 +5,9 @@ used in the AdaptiveReasoningLoop.
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Optional
 
+from nxs.application.cancellation import CancellationToken
 from nxs.application.progress_tracker import ResearchProgressTracker
 from nxs.application.reasoning.types import ComplexityAnalysis
 
@@ -27,6 +28,7 @@ class ExecutionStrategy(ABC):
         complexity: ComplexityAnalysis,
         tracker: ResearchProgressTracker,
         callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Execute the strategy.
 
@@ -35,6 +37,8 @@ class ExecutionStrategy(ABC):
             complexity: Complexity analysis
             tracker: ResearchProgressTracker instance
             callbacks: Callback dictionary
+            cancel_token: Optional CancellationToken of the query, passed on
+                to every execution the strategy starts
 
         Returns:
             Response text (buffered, not yet quality-checked)
@@ -4,8 +4,11 @@ Full reasoning cycle with iterative execution and evaluation.
 Good for complex research queries.
 """
 
-from typing import Callable
+import asyncio
+from typing import Any, Callable, Optional
 
+from nxs.application.cancellation import CancellationToken
+from nxs.application.conversation import Conversation
 from nxs.application.progress_tracker import PlanStep, ResearchProgressTracker
 from nxs.application.reasoning.evaluator import Evaluator
 from nxs.application.reasoning.planner import Planner
@@ -32,7 +35,9 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
 
     Characteristics:
     - Comprehensive planning with full context
-    - Iterative execution with per-step evaluation
+    - Wave-based execution: every step whose dependencies are satisfied runs
+      concurrently (up to max_parallel_steps), each in a forked conversation
+    - Completeness evaluation once per wave
     - Dynamic plan adjustment based on gaps
     - Result filtering before synthesis
     - Maximum robustness and quality
@@ -52,7 +57,9 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
         ...     synthesizer=synthesizer,
         ...     tool_registry=registry,
         ...     execute_with_tracking=loop._execute_with_tool_tracking,
-        ...     max_iterations=3
+        ...     max_iterations=3,
+        ...     max_parallel_steps=3,
+        ...     fork_conversation=lambda: loop.conversation.fork(),
         ... )
         >>> result = await strategy.execute(query, complexity, tracker, callbacks)
     """
@@ -65,6 +72,8 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
         tool_registry: ToolRegistry,
         execute_with_tracking: Callable,
         max_iterations: int = 3,
+        max_parallel_steps: int = 1,
+        fork_conversation: Optional[Callable[[], Conversation]] = None,
     ):
         """Initialize deep reasoning strategy.
 
@@ -74,10 +83,16 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
             synthesizer: Synthesizer for filtering and combining results
             tool_registry: ToolRegistry for tool discovery and availability
             execute_with_tracking: Async callable that executes queries with tool tracking.
-                Signature: async (query, tracker, use_streaming, callbacks) -> str
+                Signature: async (query, tracker, use_streaming, callbacks, conversation) -> str
                 This handles the actual LLM execution with tool call interception.
-            max_iterations: Maximum iterations for deep reasoning (default 3).
-                Actual iterations may be fewer if evaluation determines completion.
+            max_iterations: Maximum iterations (execution waves) for deep reasoning
+                (default 3). Actual iterations may be fewer if evaluation
+                determines completion.
+            max_parallel_steps: Maximum number of ready plan steps executed
+                concurrently within a wave (default 1 = sequential).
+            fork_conversation: Optional factory returning an isolated fork of the
+                main conversation. Each step runs in its own fork so parallel
+                steps don't interleave messages in the user's history.
         """
         self.planner = planner
         self.evaluator = evaluator
@@ -85,6 +100,8 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
         self.tool_registry = tool_registry
         self.execute_with_tracking = execute_with_tracking
         self.max_iterations = max_iterations
+        self.max_parallel_steps = max(1, max_parallel_steps)
+        self.fork_conversation = fork_conversation
 
     async def execute(
         self,
@@ -92,6 +109,7 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
         complexity: ComplexityAnalysis,
         tracker: ResearchProgressTracker,
         callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Execute query using deep reasoning strategy (full cycle).
 
@@ -103,10 +121,11 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
            - Generate comprehensive plan with full tracker context
            - Include previous attempts, knowledge gaps, completed steps
            - Set or refine plan in tracker
-        2. Iterative Execution Phase (up to max_iterations):
-           - Find next pending step
-           - Execute step with full context
-           - Evaluate completeness after each iteration
+        2. Iterative Execution Phase (up to max_iterations waves):
+           - Collect every pending step whose dependencies are resolved
+           - Execute them concurrently (bounded by max_parallel_steps),
+             each with full context in a forked conversation
+           - Evaluate completeness once per wave
            - Identify knowledge gaps and missing information
            - Add dynamic steps if needed
            - Early exit if evaluation confirms completion
@@ -126,6 +145,8 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
                 - "on_step_progress": Step status changes
                 - "on_evaluation": Evaluation start
                 - "on_synthesis": Synthesis start
+            cancel_token: Optional CancellationToken of the query, checked
+                before each wave and passed to each step's execution
 
         Returns:
             Synthesized final answer combining all results
@@ -174,67 +195,64 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
             return "Error: No plan available for deep reasoning execution"
 
         max_iterations = min(self.max_iterations, len(tracker.plan.steps))
+        step_limit = asyncio.Semaphore(self.max_parallel_steps)
+        step_callbacks = {k: v for k, v in callbacks.items() if k not in ["on_stream_chunk"]}
 
         for iteration in range(max_iterations):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
             logger.info(f"Phase 2: Iteration {iteration + 1}/{max_iterations}")
 
-            # Find next pending step from tracker
-            pending_steps = tracker.plan.get_pending_steps()
-            if not pending_steps:
+            # Find every pending step that can run now
+            wave = self._get_ready_steps(tracker)
+            if not wave:
                 break
 
-            step = pending_steps[0]
-            tracker.update_step_status(step.id, "in_progress")
-
-            # Notify step progress for real-time display
-            await call_callback(
-                callbacks, "on_step_progress", step.id, "in_progress", step.description
-            )
-
-            subtask_query = step.description
-            await call_callback(
-                callbacks,
-                "on_iteration",
-                iteration + 1,
-                max_iterations,
-                subtask_query,
-            )
-
-            # Execute step with full context
-            subtask_query_with_context = build_subtask_query_with_full_context(
-                step, tracker
+            logger.info(
+                f"Executing {len(wave)} step(s) in wave {iteration + 1} "
+                f"(max_parallel_steps={self.max_parallel_steps})"
             )
 
-            logger.debug(f"Executing subtask: {subtask_query}")
-
-            # Use execute_with_tracking
-            result = await self.execute_with_tracking(
-                subtask_query_with_context,
-                tracker=tracker,
-                use_streaming=False,
-                callbacks={
-                    k: v for k, v in callbacks.items() if k not in ["on_stream_chunk"]
-                },
-            )
+            async def run_step(step: PlanStep) -> str:
+                async with step_limit:
+                    return await self._execute_step(
+                        step, iteration, max_iterations, tracker, callbacks, step_callbacks, cancel_token
+                    )
 
-            accumulated_results.append(
-                {
-                    "query": subtask_query,
-                    "result": result,
-                    "iteration": iteration,
-                }
+            outcomes = await asyncio.gather(
+                *[run_step(step) for step in wave], return_exceptions=True
             )
-            executed_queries.append(subtask_query)
-
-            # Mark step as completed
-            tracker.update_step_status(step.id, "completed", findings=[result])
+            # Cancelled steps come back as exceptions; don't record them as failures
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            # Record results in plan order, regardless of completion order
+            errors: list[BaseException] = []
+            for step, outcome in zip(wave, outcomes, strict=True):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Step {step.id} failed: {outcome}")
+                    tracker.update_step_status(step.id, "failed")
+                    await call_callback(
+                        callbacks, "on_step_progress", step.id, "failed", step.description
+                    )
+                    errors.append(outcome)
+                    continue
+
+                accumulated_results.append(
+                    {
+                        "query": step.description,
+                        "result": outcome,
+                        "iteration": iteration,
+                    }
+                )
+                executed_queries.append(step.description)
 
-            # Notify step completion for real-time display
-            await call_callback(
-                callbacks, "on_step_progress", step.id, "completed", step.description
-            )
+            if len(errors) == len(wave):
+                # Nothing to evaluate; surface the failure like a sequential run would
+                raise errors[0]
 
-            # Phase 3: Evaluation
+            # Phase 3: Evaluation (once per wave)
             logger.info("Phase 3: Evaluating completeness")
             await call_callback(callbacks, "on_evaluation")
 
@@ -260,6 +278,9 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
                 logger.info(
                     f"Adding {len(evaluation.additional_queries)} additional queries"
                 )
+                # New steps build on everything this wave found
+                parent = wave[-1]
+                wave_ids = [step.id for step in wave]
                 # Add dynamic steps to tracker plan
                 if tracker.plan:
                     for additional_query in evaluation.additional_queries:
@@ -272,10 +293,10 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
                                 completed_at=None,
                                 findings=[],
                                 tools_used=[],
-                                depends_on=[step.id],
-                                spawned_from=step.id,
+                                depends_on=list(wave_ids),
+                                spawned_from=parent.id,
                             )
-                            tracker.plan.add_dynamic_step(new_step, step.id)
+                            tracker.plan.add_dynamic_step(new_step, parent.id)
                         # Also add to plan.subtasks for backward compatibility
                         plan.subtasks.append(
                             SubTask(query=additional_query, priority=1)
@@ -296,3 +317,112 @@ class DeepReasoningStrategy(BaseExecutionStrategy):
         logger.info(f"Deep reasoning complete: {len(final_answer)} chars generated")
 
         return final_answer
+
+    def _get_ready_steps(self, tracker: ResearchProgressTracker) -> list[PlanStep]:
+        """Return pending steps whose dependencies are resolved.
+
+        A dependency is resolved once it is no longer pending or in progress
+        (failed and skipped steps don't block their dependents). Unknown
+        dependency IDs are ignored. If dependencies can never be satisfied
+        (e.g. a cycle), the first pending step is returned so execution still
+        makes progress.
+
+        Args:
+            tracker: Tracker holding the plan
+
+        Returns:
+            Ready steps in plan order (empty if nothing is pending)
+        """
+        if not tracker.plan:
+            return []
+
+        status_by_id = {step.id: step.status for step in tracker.plan.steps}
+        pending = tracker.plan.get_pending_steps()
+        ready = [
+            step
+            for step in pending
+            if all(
+                status_by_id.get(dep) not in ("pending", "in_progress")
+                for dep in step.depends_on
+            )
+        ]
+
+        if pending and not ready:
+            logger.warning(
+                "No plan step has its dependencies satisfied; "
+                f"running {pending[0].id} to make progress"
+            )
+            return pending[:1]
+        return ready
+
+    async def _execute_step(
+        self,
+        step: PlanStep,
+        iteration: int,
+        max_iterations: int,
+        tracker: ResearchProgressTracker,
+        callbacks: dict[str, Callable],
+        step_callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> str:
+        """Execute a single plan step in its own conversation fork.
+
+        Args:
+            step: Plan step to execute
+            iteration: Zero-based wave index
+            max_iterations: Total number of waves
+            tracker: Progress tracker (shared by concurrent steps)
+            callbacks: Callbacks for progress notifications
+            step_callbacks: Callbacks passed to the step's execution
+            cancel_token: Optional CancellationToken of the query
+
+        Returns:
+            The step's result text
+        """
+        tracker.update_step_status(step.id, "in_progress")
+
+        # Notify step progress for real-time display
+        await call_callback(
+            callbacks, "on_step_progress", step.id, "in_progress", step.description
+        )
+
+        subtask_query = step.description
+        await call_callback(
+            callbacks,
+            "on_iteration",
+            iteration + 1,
+            max_iterations,
+            subtask_query,
+        )
+
+        # Execute step with full context
+        subtask_query_with_context = build_subtask_query_with_full_context(
+            step, tracker
+        )
+
+        logger.debug(f"Executing subtask: {subtask_query}")
+
+        execute_kwargs: dict[str, Any] = {}
+        if self.fork_conversation is not None:
+            execute_kwargs["conversation"] = self.fork_conversation()
+        if cancel_token is not None:
+            execute_kwargs["cancel_token"] = cancel_token
+
+        # Use execute_with_tracking
+        result = await self.execute_with_tracking(
+            subtask_query_with_context,
+            tracker=tracker,
+            use_streaming=False,
+            callbacks=step_callbacks,
+            **execute_kwargs,
+        )
+
+        # Mark step as completed
+        tracker.update_step_status(step.id, "completed", findings=[result])
+
+        # Notify step completion for real-time display
+        await call_callback(
+            callbacks, "on_step_progress", step.id, "completed", step.description
+        )
+
+        return result
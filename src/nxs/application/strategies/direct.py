@@ -4,8 +4,9 @@ Fast-path execution with no planning overhead.
 Good for simple, straightforward queries.
 """
 
-from typing import Callable
+from typing import Callable, Optional
 
+from nxs.application.cancellation import CancellationToken
 from nxs.application.progress_tracker import ResearchProgressTracker
 from nxs.application.reasoning.types import ComplexityAnalysis
 from nxs.application.strategies.base import ExecutionStrategy as BaseExecutionStrategy
@@ -55,6 +56,7 @@ class DirectExecutionStrategy(BaseExecutionStrategy):
         complexity: ComplexityAnalysis,
         tracker: ResearchProgressTracker,
         callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Execute query using direct strategy (fast-path).
 
@@ -73,6 +75,7 @@ class DirectExecutionStrategy(BaseExecutionStrategy):
             complexity: Complexity analysis result (not used, kept for API consistency)
             tracker: ResearchProgressTracker tracking execution history and context
             callbacks: Callback dictionary for status updates (e.g., "on_direct_execution")
+            cancel_token: Optional CancellationToken of the query
 
         Returns:
             Response text (buffered, not yet streamed or quality-checked)
@@ -103,6 +106,7 @@ class DirectExecutionStrategy(BaseExecutionStrategy):
                 for k, v in callbacks.items()
                 if k not in ["on_stream_chunk"]  # Suppress streaming
             },
+            cancel_token=cancel_token,
         )
 
         logger.info(f"Direct execution complete: {len(result)} chars")
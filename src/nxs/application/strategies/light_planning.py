@@ -4,8 +4,9 @@ Quick planning with 1-2 iterations and minimal overhead.
 Good for medium-complexity queries.
 """
 
-from typing import Callable
+from typing import Callable, Optional
 
+from nxs.application.cancellation import CancellationToken
 from nxs.application.progress_tracker import ResearchProgressTracker
 from nxs.application.reasoning.planner import Planner
 from nxs.application.reasoning.synthesizer import Synthesizer
@@ -86,6 +87,7 @@ class LightPlanningStrategy(BaseExecutionStrategy):
         complexity: ComplexityAnalysis,
         tracker: ResearchProgressTracker,
         callbacks: dict[str, Callable],
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Execute query using light planning strategy (1-2 iterations).
 
@@ -111,6 +113,8 @@ class LightPlanningStrategy(BaseExecutionStrategy):
                 - "on_planning_complete": Plan generated
                 - "on_iteration": Iteration progress
                 - "on_step_progress": Step status changes
+            cancel_token: Optional CancellationToken of the query, checked
+                before each step and passed to each execution
 
         Returns:
             Synthesized response combining all subtask results
@@ -154,6 +158,7 @@ class LightPlanningStrategy(BaseExecutionStrategy):
                 callbacks={
                     k: v for k, v in callbacks.items() if k not in ["on_stream_chunk"]
                 },
+                cancel_token=cancel_token,
             )
 
         # Limit iterations for light planning
@@ -171,12 +176,16 @@ class LightPlanningStrategy(BaseExecutionStrategy):
                 callbacks={
                     k: v for k, v in callbacks.items() if k not in ["on_stream_chunk"]
                 },
+                cancel_token=cancel_token,
             )
 
         for iteration in range(max_iters):
             if iteration >= len(tracker.plan.steps):
                 break
 
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
             step = tracker.plan.steps[iteration]
 
             # Skip already completed steps
@@ -216,6 +225,7 @@ class LightPlanningStrategy(BaseExecutionStrategy):
                 callbacks={
                     k: v for k, v in callbacks.items() if k not in ["on_stream_chunk"]
                 },
+                cancel_token=cancel_token,
             )
 
             accumulated_results.append(
@@ -242,6 +252,7 @@ class LightPlanningStrategy(BaseExecutionStrategy):
                 callbacks={
                     k: v for k, v in callbacks.items() if k not in ["on_stream_chunk"]
                 },
+                cancel_token=cancel_token,
             )
         elif len(accumulated_results) == 1:
             return accumulated_results[0]["result"]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Callable, Optional, Sequence
 
 from anthropic.types import MessageParam
@@ -10,6 +13,7 @@ from pydantic import BaseModel, ConfigDict, model_validator
 from nxs.application.claude import Claude
 from nxs.application.cost_calculator import CostCalculator
 from nxs.application.reasoning.utils import load_prompt, format_prompt
+from nxs.application.token_usage import TokenUsage
 from nxs.logger import get_logger
 
 logger = get_logger("summarization_service")
@@ -38,6 +42,12 @@ class SummarizationService:
     
     Tracks token usage and costs for all summarization API calls using CostCalculator.
     Supports optional on_usage callback for integration with session cost tracking.
+
+    Message collections are summarised map-reduce style: chunks are summarised
+    concurrently (up to ``max_concurrency`` requests at a time), partial summaries
+    are merged in a tree when there are more than ``max_merge_sections`` of them,
+    and chunk summaries are cached by content hash so repeated runs over the same
+    messages skip the chunk requests.
     """
 
     def __init__(
@@ -51,6 +61,9 @@ class SummarizationService:
         update_prompt_path: str = "summarization/update_summary.txt",
         cost_calculator: Optional[CostCalculator] = None,
         on_usage: Optional[Callable[[dict, float], None]] = None,
+        max_concurrency: int = 4,
+        max_merge_sections: int = 8,
+        chunk_cache_size: int = 512,
     ) -> None:
         """Initialize the summarization service.
         
@@ -64,6 +77,11 @@ class SummarizationService:
             cost_calculator: Optional CostCalculator instance. Creates new one if not provided.
             on_usage: Optional callback for cost tracking: on_usage(usage: dict, cost: float).
                      Called after each API response with token usage and calculated cost.
+            max_concurrency: Maximum number of chunk/merge requests in flight at once.
+            max_merge_sections: Maximum number of partial summaries combined in one
+                merge prompt; more are reduced in a tree of intermediate merges.
+            chunk_cache_size: Number of chunk summaries kept in the content-hash
+                cache (0 disables caching).
         """
         self.llm = llm
         self.chunk_size = max(1, chunk_size)
@@ -73,6 +91,10 @@ class SummarizationService:
         self._update_prompt_template = load_prompt(update_prompt_path)
         self.cost_calculator = cost_calculator or CostCalculator()
         self.on_usage = on_usage
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_merge_sections = max(2, max_merge_sections)
+        self.chunk_cache_size = max(0, chunk_cache_size)
+        self._chunk_cache: OrderedDict[str, str] = OrderedDict()
 
     async def summarize(
         self,
@@ -132,30 +154,25 @@ class SummarizationService:
         messages_processed = start_index
         captured_error: str | None = None
 
-        for index in range(start_index, total_messages, self.chunk_size):
-            chunk_messages = messages[index : index + self.chunk_size]
-            chunk_text = self._format_messages(chunk_messages)
-            logger.debug(
-                "Summarization chunk %s: messages=%s, preview=%r",
-                index // self.chunk_size + 1,
-                len(chunk_messages),
-                chunk_text[:200],
-            )
-
-            # For chunk summaries, we don't pass existing_summary because we want
-            # each chunk to be summarized independently, then we'll combine all chunks
-            # before doing the final update with the existing summary
-            chunk_summary, error = await self._summarize_text(
-                chunk_text,
-                existing_summary="",
+        # Map: summarise all chunks concurrently. For chunk summaries, we don't pass
+        # existing_summary because we want each chunk to be summarized independently,
+        # then we'll combine all chunks before doing the final update with the
+        # existing summary
+        chunk_starts = list(range(start_index, total_messages, self.chunk_size))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        chunk_results = await asyncio.gather(
+            *(
+                self._summarize_chunk(
+                    messages[index : index + self.chunk_size],
+                    index // self.chunk_size + 1,
+                    semaphore,
+                )
+                for index in chunk_starts
             )
+        )
 
+        for index, (chunk_summary, error) in zip(chunk_starts, chunk_results, strict=True):
             summary_text = chunk_summary.strip()
-            logger.debug(
-                "Summarization chunk %s result: %r",
-                index // self.chunk_size + 1,
-                summary_text[:200],
-            )
 
             if error and not summary_text:
                 return SummaryResult(
@@ -168,11 +185,18 @@ class SummarizationService:
             if summary_text:
                 per_chunk_summaries.append(summary_text)
 
-            messages_processed = min(total_messages, index + len(chunk_messages))
+            messages_processed = min(total_messages, index + self.chunk_size)
 
             if error:
                 captured_error = error
 
+        # Reduce: merge partial summaries until they fit one merge prompt
+        if len(per_chunk_summaries) > self.max_merge_sections:
+            per_chunk_summaries, error = await self._reduce_summaries(
+                per_chunk_summaries, semaphore
+            )
+            captured_error = captured_error or error
+
         aggregated_sections = [
             f"Segment {idx + 1} Summary:\n{summary}"
             for idx, summary in enumerate(per_chunk_summaries)
@@ -230,6 +254,108 @@ class SummarizationService:
             error=error or captured_error,
         )
 
+    async def _summarize_chunk(
+        self,
+        chunk_messages: Sequence[MessageParam],
+        chunk_number: int,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[str, str | None]:
+        """Summarise one chunk of messages, reusing a cached summary if available."""
+        chunk_text = self._format_messages(chunk_messages)
+        cache_key = self._chunk_cache_key(chunk_text)
+
+        cached = self._chunk_cache.get(cache_key)
+        if cached is not None:
+            self._chunk_cache.move_to_end(cache_key)
+            logger.debug("Summarization chunk %s: cache hit", chunk_number)
+            return cached, None
+
+        logger.debug(
+            "Summarization chunk %s: messages=%s, preview=%r",
+            chunk_number,
+            len(chunk_messages),
+            chunk_text[:200],
+        )
+        async with semaphore:
+            chunk_summary, error = await self._summarize_text(
+                chunk_text,
+                existing_summary="",
+            )
+        logger.debug(
+            "Summarization chunk %s result: %r",
+            chunk_number,
+            chunk_summary.strip()[:200],
+        )
+
+        if not error and chunk_summary.strip() and self.chunk_cache_size:
+            self._chunk_cache[cache_key] = chunk_summary
+            while len(self._chunk_cache) > self.chunk_cache_size:
+                self._chunk_cache.popitem(last=False)
+
+        return chunk_summary, error
+
+    async def _reduce_summaries(
+        self,
+        summaries: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[list[str], str | None]:
+        """Merge partial summaries in groups until at most max_merge_sections remain.
+
+        Groups at each level are merged concurrently. A group whose merge fails
+        keeps its sections concatenated so no content is lost.
+        """
+        captured_error: str | None = None
+        level = 0
+
+        while len(summaries) > self.max_merge_sections:
+            level += 1
+            groups = [
+                summaries[i : i + self.max_merge_sections]
+                for i in range(0, len(summaries), self.max_merge_sections)
+            ]
+            logger.debug(
+                "Summarization reduce level %s: %s partial summaries -> %s groups",
+                level,
+                len(summaries),
+                len(groups),
+            )
+
+            async def merge(group: list[str]) -> tuple[str, str | None]:
+                group_text = "\n\n".join(
+                    f"Segment {idx + 1} Summary:\n{summary}"
+                    for idx, summary in enumerate(group)
+                )
+                async with semaphore:
+                    merged, error = await self._summarize_text(group_text, existing_summary="")
+                if error or not merged.strip():
+                    return "\n\n".join(group), error
+                return merged.strip(), None
+
+            results = await asyncio.gather(*(merge(group) for group in groups))
+            summaries = [merged for merged, _ in results]
+            captured_error = captured_error or next(
+                (error for _, error in results if error), None
+            )
+
+        return summaries, captured_error
+
+    def _chunk_cache_key(self, chunk_text: str) -> str:
+        """Content hash identifying a chunk summary (model and prompt included)."""
+        digest = hashlib.sha256()
+        for part in (
+            str(getattr(self.llm, "model", "")),
+            str(self.max_tokens),
+            self._initial_prompt_template,
+            chunk_text,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def clear_cache(self) -> None:
+        """Discard all cached chunk summaries."""
+        self._chunk_cache.clear()
+
     async def _summarize_text(
         self,
         text: str,
@@ -253,28 +379,23 @@ class SummarizationService:
             
             # Extract usage and calculate cost (same pattern as AgentLoop)
             if hasattr(response, "usage") and response.usage:
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
+                token_usage = TokenUsage.from_response(response)
                 
                 # Calculate cost for this API call
-                cost = self.cost_calculator.calculate_cost(
-                    self.llm.model, input_tokens, output_tokens
-                )
+                cost = self.cost_calculator.calculate_usage_cost(self.llm.model, token_usage)
                 
                 # Notify callback if provided (for session cost tracking)
                 if self.on_usage:
-                    usage = {
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                    }
+                    usage = {**token_usage.to_dict(), "component": "summarization"}
                     try:
                         self.on_usage(usage, cost)
                     except Exception as e:
                         logger.warning(f"Error in on_usage callback: {e}")
                 
                 logger.debug(
-                    f"Summarization API call: {input_tokens} input, "
-                    f"{output_tokens} output tokens, ${cost:.6f} cost"
+                    f"Summarization API call: {token_usage.input_tokens} input, "
+                    f"{token_usage.cache_read_input_tokens} cache read, "
+                    f"{token_usage.output_tokens} output tokens, ${cost:.6f} cost"
                 )
             else:
                 logger.warning("Summarization API response missing usage field - cannot track tokens/cost")
@@ -0,0 +1,87 @@
+"""Token usage record covering every billed token class.
+
+The Anthropic API reports usage per response as uncached input tokens, cache
+write and cache read tokens, and output tokens. TokenUsage keeps all of them
+together so costs and cache efficiency can be computed consistently, and adds
+thinking tokens (the part of the output spent on extended thinking).
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+__all__ = ["TokenUsage"]
+
+
+@dataclass
+class TokenUsage:
+    """Token counts of one or more API calls.
+
+    Attributes:
+        input_tokens: Uncached input tokens
+        output_tokens: Output tokens, including thinking tokens
+        cache_creation_input_tokens: Input tokens written to the prompt cache
+        cache_read_input_tokens: Input tokens read from the prompt cache
+        thinking_tokens: Part of output_tokens spent on extended thinking
+            (estimated from the thinking blocks; billed as output)
+
+    Example:
+        >>> usage = TokenUsage.from_response(response)
+        >>> usage.cache_hit_rate
+        0.92
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    thinking_tokens: int = 0
+
+    @classmethod
+    def from_response(cls, response: Any) -> "TokenUsage":
+        """Read usage from an API response (zeros if it has no usage)."""
+        usage = getattr(response, "usage", None)
+        if not usage:
+            return cls()
+
+        def count(name: str) -> int:
+            # Cache counters are None when prompt caching was not used
+            return getattr(usage, name, None) or 0
+
+        output_tokens = count("output_tokens")
+        thinking_chars = sum(
+            len(getattr(block, "thinking", "") or "")
+            for block in getattr(response, "content", None) or []
+            if getattr(block, "type", None) == "thinking"
+        )
+        return cls(
+            input_tokens=count("input_tokens"),
+            output_tokens=output_tokens,
+            cache_creation_input_tokens=count("cache_creation_input_tokens"),
+            cache_read_input_tokens=count("cache_read_input_tokens"),
+            thinking_tokens=min(output_tokens, (thinking_chars + 3) // 4),
+        )
+
+    @property
+    def prompt_tokens(self) -> int:
+        """All input tokens of the request (uncached, cache writes and cache reads)."""
+        return self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of prompt tokens served from the prompt cache (0.0 to 1.0)."""
+        prompt_tokens = self.prompt_tokens
+        if prompt_tokens == 0:
+            return 0.0
+        return self.cache_read_input_tokens / prompt_tokens
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(**{f.name: getattr(self, f.name) + getattr(other, f.name) for f in fields(self)})
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to a usage dict (API field names)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TokenUsage":
+        """Create from a usage dict; unknown keys are ignored."""
+        return cls(**{f.name: int(data.get(f.name) or 0) for f in fields(cls)})
@@ -0,0 +1,100 @@
+"""Coalescing of identical concurrent tool calls.
+
+Parallel subtasks of a research plan (and sessions sharing a coalescer) often
+issue the same tool call at the same time, e.g. several subtasks reading the
+same document. ToolCallCoalescer runs one call per (tool name, argument hash)
+at a time: callers that arrive while an identical call is in flight wait for it
+and share its result or exception.
+
+Only idempotent tools may be coalesced; ToolRegistry decides that from the
+tool's declared ToolCachePolicy and never coalesces tools without one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from nxs.application.tool_result_cache import hash_tool_call
+from nxs.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["ToolCallCoalescer"]
+
+
+@dataclass
+class _InFlightCall:
+    task: "asyncio.Future[str]"
+    waiters: int = 0
+
+
+class ToolCallCoalescer:
+    """Share one execution among identical concurrent tool calls.
+
+    A waiter that is cancelled stops waiting without affecting the others; the
+    underlying call is cancelled only when no waiter is left.
+
+    Example:
+        >>> coalescer = ToolCallCoalescer()
+        >>> results = await asyncio.gather(
+        ...     coalescer.run("read_doc", {"id": "a"}, lambda: provider.execute_tool("read_doc", {"id": "a"})),
+        ...     coalescer.run("read_doc", {"id": "a"}, lambda: provider.execute_tool("read_doc", {"id": "a"})),
+        ... )
+        >>> coalescer.coalesced
+        1
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[tuple[str, str], _InFlightCall] = {}
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+    async def run(
+        self,
+        tool_name: str,
+        arguments: dict,
+        call: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Run call(), or join an identical call that is already running.
+
+        Args:
+            tool_name: Name of the tool.
+            arguments: Tool arguments (hashed to identify identical calls).
+            call: Zero-argument coroutine function that executes the tool;
+                only invoked if no identical call is in flight.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        key = (tool_name, hash_tool_call(tool_name, arguments))
+        flight = self._calls.get(key)
+        if flight is None:
+            flight = _InFlightCall(task=asyncio.ensure_future(call()))
+            self._calls[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joined in-flight call of '{tool_name}' ({flight.waiters} already waiting)")
+
+        flight.waiters += 1
+        try:
+            # Shield so one cancelled waiter doesn't cancel the call for the others
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _forget(self, key: tuple[str, str], flight: _InFlightCall) -> None:
+        if self._calls.get(key) is flight:
+            del self._calls[key]
@@ -9,6 +9,10 @@ Key features:
 - Tool execution routing to appropriate provider
 - Tool enable/disable state management via ToolStateManager
 - Cache control support for tool definitions
+- Versioned tool catalog, rebuilt only when providers, tool state or
+  provider-reported tool sets change
+- Session-scoped tool result cache, driven by provider-declared cache policies
+- Coalescing of identical concurrent calls of idempotent tools
 - Separation of tool concerns from agent orchestration
 
 Architecture:
@@ -24,6 +28,9 @@ from typing import Any, Protocol, TYPE_CHECKING
 
 from anthropic.types import ToolParam
 
+from nxs.application.cancellation import CancellationToken, run_cancellable
+from nxs.application.tool_call_coalescer import ToolCallCoalescer
+from nxs.application.tool_result_cache import CACHE_POLICY_KEY, ToolCachePolicy, ToolResultCache
 from nxs.logger import get_logger
 
 if TYPE_CHECKING:
@@ -89,6 +96,10 @@ class ToolProvider(Protocol):
                 },
                 ...
             ]
+
+            A definition may also carry a "cache_policy" entry (a
+            ToolCachePolicy or its dict form) declaring whether results may
+            be reused; it is removed before definitions are sent to the API.
         """
         ...
 
@@ -120,6 +131,34 @@ class ToolRegistry:
     - Tool execution routing to the correct provider
     - Cache control application for Anthropic API
     - Provider lifecycle management
+    - A cached, versioned tool catalog
+    - A tool result cache and coalescing of identical concurrent calls
+
+    Tool catalog caching:
+        get_tool_definitions_for_api() builds the catalog once and returns the
+        same list object until it is invalidated. Invalidation happens when a
+        provider is (un)registered, when the ToolStateManager enables/disables
+        a tool, when a provider that implements ``add_change_listener()``
+        reports a change (MCP reconnects and ``tools/list_changed``), or
+        explicitly via invalidate_tool_catalog()/refresh_tools(). Returning
+        the identical list keeps the serialized tools prefix byte-stable, so
+        it stays a prompt-cache hit across turns.
+
+    Tool result caching:
+        execute_tool() reuses results of tools whose provider declared a
+        cacheable ToolCachePolicy, until the policy's TTL expires or the
+        entry is evicted. Calling a tool declared as not read-only drops the
+        cached results of its provider. Failed calls are never cached, and
+        tools without a policy always execute. Pass the same ToolResultCache
+        to several registries (each with its own set_result_cache_scope())
+        so a mutating call in one session also drops the others' results.
+
+    Call coalescing:
+        Identical calls (same tool, same argument hash) that overlap share one
+        provider execution if the tool's policy declares it idempotent. Tools
+        without a policy may have side effects and always execute. Pass the
+        same ToolCallCoalescer to several registries to coalesce calls across
+        sessions.
 
     Example:
         >>> registry = ToolRegistry(enable_caching=True)
@@ -137,6 +176,8 @@ class ToolRegistry:
         self,
         enable_caching: bool = True,
         tool_state_manager: "ToolStateManager | None" = None,
+        result_cache: ToolResultCache | None = None,
+        call_coalescer: ToolCallCoalescer | None = None,
     ):
         """Initialize the tool registry.
 
@@ -147,12 +188,28 @@ class ToolRegistry:
             tool_state_manager: Optional ToolStateManager for controlling
                 which tools are enabled/disabled. If None, all tools are
                 enabled by default.
+            result_cache: Optional ToolResultCache (e.g. shared across
+                registries, disk-backed or with a custom size). A private
+                in-memory cache is created if None.
+            call_coalescer: Optional ToolCallCoalescer, shared to coalesce
+                calls across registries. A private one is created if None.
         """
         self._providers: dict[str, ToolProvider] = {}
         self._tool_to_provider: dict[str, str] = {}  # tool_name -> provider_name
+        self._tool_definitions: dict[str, dict[str, Any]] = {}  # tool_name -> definition
         self._enable_caching = enable_caching
         self._cache_dirty = True  # Track if tool cache needs refresh
+        self._catalog: list[ToolParam] | None = None
+        self._catalog_version = 0
+        self._catalog_lock = asyncio.Lock()
         self._tool_state_manager = tool_state_manager
+        self._tool_policies: dict[str, ToolCachePolicy] = {}  # tool_name -> declared policy
+        self._result_cache = result_cache if result_cache is not None else ToolResultCache()
+        self._result_cache_scope: str | None = None
+        self._call_coalescer = call_coalescer if call_coalescer is not None else ToolCallCoalescer()
+
+        if tool_state_manager is not None:
+            tool_state_manager.add_listener(self._on_tool_state_changed)
 
         logger.debug(
             f"ToolRegistry initialized: caching={enable_caching}, "
@@ -183,6 +240,13 @@ class ToolRegistry:
         self._providers[provider_name] = provider
         self._cache_dirty = True
 
+        # Providers that can detect their own tool-set changes notify us
+        add_change_listener = getattr(provider, "add_change_listener", None)
+        if callable(add_change_listener):
+            add_change_listener(
+                lambda: self.invalidate_tool_catalog(f"provider '{provider_name}' changed")
+            )
+
         logger.info(f"Registered tool provider: {provider_name}")
 
     def unregister_provider(self, provider_name: str) -> None:
@@ -198,6 +262,7 @@ class ToolRegistry:
             raise KeyError(f"Provider '{provider_name}' not found")
 
         del self._providers[provider_name]
+        self._invalidate_provider_results(provider_name)
 
         # Clean up tool routing table
         self._tool_to_provider = {
@@ -212,13 +277,15 @@ class ToolRegistry:
     async def get_tool_definitions_for_api(self) -> list[ToolParam]:
         """Get all tool definitions formatted for Anthropic API.
 
-        Aggregates tools from all registered providers, filters out disabled tools,
-        and applies cache control if enabled.
+        Returns the cached tool catalog, rebuilding it from all registered
+        providers only if it has been invalidated since the last call.
 
         Returns:
             List of ToolParam dictionaries ready for Anthropic API,
             with cache_control markers applied to the last tool if
             caching is enabled. Only enabled tools are included.
+            The same list object is returned until the catalog is
+            invalidated; callers must not mutate it.
 
         Example:
             >>> tools = await registry.get_tool_definitions_for_api()
@@ -227,9 +294,31 @@ class ToolRegistry:
             ...     tools=tools
             ... )
         """
-        # Gather tools from all providers
+        if not self._cache_dirty and self._catalog is not None:
+            return self._catalog
+
+        async with self._catalog_lock:
+            # Another caller may have rebuilt the catalog while we waited
+            if self._cache_dirty or self._catalog is None:
+                await self._rebuild_catalog()
+
+        assert self._catalog is not None
+        return self._catalog
+
+    async def _rebuild_catalog(self) -> None:
+        """Rebuild the tool catalog and routing table from all providers.
+
+        Aggregates tools from all registered providers, filters out disabled
+        tools, applies cache control if enabled, and bumps the catalog version.
+        """
+        # Clear the dirty flag first so invalidations that arrive while
+        # providers are being queried trigger another rebuild
+        self._cache_dirty = False
+
         all_tools: list[dict[str, Any]] = []
-        self._tool_to_provider.clear()
+        tool_to_provider: dict[str, str] = {}
+        tool_definitions: dict[str, dict[str, Any]] = {}
+        tool_policies: dict[str, ToolCachePolicy] = {}
 
         # Gather tools concurrently from all providers
         provider_names = list(self._providers.keys())
@@ -243,7 +332,7 @@ class ToolRegistry:
 
         # Process results and build routing table
         for provider_name, result in zip(provider_names, provider_results):
-            if isinstance(result, Exception):
+            if isinstance(result, BaseException):
                 logger.error(
                     f"Error fetching tools from {provider_name}: {result}",
                     exc_info=result,
@@ -254,52 +343,91 @@ class ToolRegistry:
                 tool_name = tool["name"]
 
                 # Check for duplicate tool names
-                if tool_name in self._tool_to_provider:
+                if tool_name in tool_to_provider:
                     logger.warning(
                         f"Duplicate tool '{tool_name}' from {provider_name}, "
-                        f"already provided by {self._tool_to_provider[tool_name]}"
+                        f"already provided by {tool_to_provider[tool_name]}"
                     )
                     continue
 
+                # Copy so cache_control never leaks into provider-owned dicts
+                tool = dict(tool)
+                # The cache policy is registry metadata, not part of the API schema
+                policy = ToolCachePolicy.from_metadata(tool.pop(CACHE_POLICY_KEY, None))
+                if policy is not None:
+                    tool_policies[tool_name] = policy
+                tool_to_provider[tool_name] = provider_name
+                tool_definitions[tool_name] = tool
+
                 # Check if tool is enabled (if state manager is configured)
+                # Disabled tools keep their routing entry for potential re-enabling
                 if self._tool_state_manager and not self._tool_state_manager.is_enabled(tool_name):
                     logger.debug(f"Skipping disabled tool: {tool_name}")
-                    # Still track the provider mapping for potential re-enabling
-                    self._tool_to_provider[tool_name] = provider_name
                     continue
 
                 all_tools.append(tool)
-                self._tool_to_provider[tool_name] = provider_name
 
         # Apply cache control to last tool if caching enabled
         if self._enable_caching and all_tools:
             # Cache the last tool for cost optimization
             # Tools are stable across conversation (unlike messages)
-            all_tools[-1]["cache_control"] = {"type": "ephemeral"}
+            all_tools[-1] = {**all_tools[-1], "cache_control": {"type": "ephemeral"}}
 
             logger.debug(
                 f"Applied cache control to last tool: {all_tools[-1]['name']}"
             )
 
-        self._cache_dirty = False
-        total_tools = len(self._tool_to_provider)
+        self._tool_to_provider = tool_to_provider
+        self._tool_definitions = tool_definitions
+        self._tool_policies = tool_policies
+        # Type cast: all_tools are properly formatted ToolParam dicts
+        self._catalog = all_tools  # type: ignore[assignment]
+        self._catalog_version += 1
+
+        total_tools = len(tool_to_provider)
         enabled_tools = len(all_tools)
         logger.debug(
-            f"Retrieved {enabled_tools}/{total_tools} tools from {len(self._providers)} providers "
-            f"({total_tools - enabled_tools} disabled)"
+            f"Built tool catalog v{self._catalog_version}: {enabled_tools}/{total_tools} tools "
+            f"from {len(self._providers)} providers ({total_tools - enabled_tools} disabled)"
         )
 
-        # Type cast: all_tools are properly formatted ToolParam dicts
-        return all_tools  # type: ignore[return-value]
+    def invalidate_tool_catalog(self, reason: str = "") -> None:
+        """Mark the tool catalog stale so the next request rebuilds it.
+
+        Args:
+            reason: Optional description for logging.
+        """
+        if not self._cache_dirty:
+            logger.debug(f"Tool catalog invalidated{': ' + reason if reason else ''}")
+        self._cache_dirty = True
+
+    @property
+    def catalog_version(self) -> int:
+        """Version of the tool catalog (incremented on every rebuild)."""
+        return self._catalog_version
+
+    def _on_tool_state_changed(self) -> None:
+        """ToolStateManager listener: enabled/disabled set changed."""
+        self.invalidate_tool_catalog("tool state changed")
 
     async def execute_tool(
-        self, tool_name: str, arguments: dict[str, Any]
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        cancel_token: CancellationToken | None = None,
     ) -> str:
         """Execute a tool by routing to the appropriate provider.
 
+        Results of cacheable tools are served from the result cache when a
+        valid entry exists, and an identical call already in flight is joined
+        instead of executed again (for tools declared idempotent).
+
         Args:
             tool_name: Name of the tool to execute.
             arguments: Tool arguments dictionary.
+            cancel_token: Optional CancellationToken of the query. Cancelling
+                it cancels the provider call (a coalesced call keeps running
+                while other callers still wait for it).
 
         Returns:
             Tool execution result as string.
@@ -307,6 +435,7 @@ class ToolRegistry:
         Raises:
             KeyError: If tool_name is not found in any provider.
             RuntimeError: If tool is disabled.
+            QueryCancelledError: If cancel_token is cancelled.
             Exception: If tool execution fails.
 
         Example:
@@ -334,6 +463,33 @@ class ToolRegistry:
                 f"Enable it in the artifacts panel to use it."
             )
 
+        policy = self._tool_policies.get(tool_name)
+
+        if policy is not None and policy.should_cache:
+            cached = self._result_cache.get(tool_name, arguments, scope=self._result_cache_scope)
+            if cached is not None:
+                logger.debug(f"Tool '{tool_name}' served from result cache")
+                return cached
+
+        if policy is not None and policy.idempotent:
+            call = self._call_coalescer.run(
+                tool_name,
+                arguments,
+                lambda: self._run_provider_tool(provider_name, tool_name, arguments, policy),
+            )
+        else:
+            # No declared policy: the tool may have side effects
+            call = self._run_provider_tool(provider_name, tool_name, arguments, policy)
+        return await run_cancellable(call, cancel_token)
+
+    async def _run_provider_tool(
+        self,
+        provider_name: str,
+        tool_name: str,
+        arguments: dict[str, Any],
+        policy: ToolCachePolicy | None,
+    ) -> str:
+        """Execute a tool on its provider and update the result cache."""
         provider = self._providers[provider_name]
 
         logger.debug(
@@ -346,14 +502,49 @@ class ToolRegistry:
                 f"Tool '{tool_name}' executed successfully: "
                 f"{len(result)} chars returned"
             )
+            if policy is not None:
+                if policy.should_cache:
+                    self._result_cache.put(tool_name, arguments, result, policy, scope=self._result_cache_scope)
+                elif not policy.read_only:
+                    self._invalidate_provider_results(provider_name)
             return result
         except Exception as e:
             logger.error(
                 f"Tool '{tool_name}' execution failed via {provider_name}: {e}",
                 exc_info=True,
             )
+            # A failed mutating call may still have changed state
+            if policy is not None and not policy.read_only:
+                self._invalidate_provider_results(provider_name)
             raise
 
+    def _invalidate_provider_results(self, provider_name: str) -> None:
+        """Drop cached results of a provider's tools after a mutating call."""
+        tool_names = [tool for tool, prov in self._tool_to_provider.items() if prov == provider_name]
+        dropped = self._result_cache.invalidate(tool_names)
+        if dropped:
+            logger.debug(f"Dropped {dropped} cached results of provider '{provider_name}'")
+
+    @property
+    def result_cache(self) -> ToolResultCache:
+        """Get the tool result cache."""
+        return self._result_cache
+
+    def set_result_cache_scope(self, scope: str | None) -> None:
+        """Set the scope (normally a session ID) of this registry's cached results.
+
+        Needed when sessions share a registry (scope follows the active
+        session) or share a ToolResultCache between their own registries.
+
+        Args:
+            scope: Scope of subsequent lookups and stores.
+        """
+        self._result_cache_scope = scope
+
+    def get_tool_cache_policy(self, tool_name: str) -> ToolCachePolicy | None:
+        """Get the cache policy declared for a tool (None if undeclared or unknown)."""
+        return self._tool_policies.get(tool_name)
+
     def get_tool_count(self) -> int:
         """Get the total number of registered tools.
 
@@ -378,6 +569,17 @@ class ToolRegistry:
         """
         return list(self._providers.keys())
 
+    def get_provider_name(self, tool_name: str) -> str | None:
+        """Get the name of the provider that serves a tool.
+
+        Args:
+            tool_name: Name of the tool.
+
+        Returns:
+            Provider name, or None if the tool is unknown.
+        """
+        return self._tool_to_provider.get(tool_name)
+
     def get_tool_names(self) -> list[str]:
         """Get names of all registered tools.
 
@@ -405,32 +607,19 @@ class ToolRegistry:
         if self._cache_dirty:
             await self.get_tool_definitions_for_api()
 
-        # Check if tool exists
-        provider_name = self._tool_to_provider.get(tool_name)
-        if provider_name is None:
+        tool_def = self._tool_definitions.get(tool_name)
+        if tool_def is None:
             logger.warning(f"Tool '{tool_name}' not found in registry")
             return None
 
-        # Get tool definition from provider
-        provider = self._providers[provider_name]
-        try:
-            tool_defs = await provider.get_tool_definitions()
-            for tool_def in tool_defs:
-                if tool_def["name"] == tool_name:
-                    return tool_def
-        except Exception as e:
-            logger.error(f"Error getting tool schema for '{tool_name}': {e}", exc_info=True)
-            return None
-
-        logger.warning(f"Tool '{tool_name}' found in registry but not in provider")
-        return None
+        return tool_def
 
     async def refresh_tools(self) -> None:
         """Force a refresh of tool definitions from all providers.
 
         Useful when providers may have updated their available tools.
         """
-        self._cache_dirty = True
+        self.invalidate_tool_catalog("explicit refresh")
         await self.get_tool_definitions_for_api()
         logger.info("Tool definitions refreshed from all providers")
 
@@ -449,6 +638,9 @@ class ToolRegistry:
         Args:
             manager: ToolStateManager instance to use
         """
+        if self._tool_state_manager is not None:
+            self._tool_state_manager.remove_listener(self._on_tool_state_changed)
         self._tool_state_manager = manager
-        self._cache_dirty = True  # Force refresh on next get
+        manager.add_listener(self._on_tool_state_changed)
+        self.invalidate_tool_catalog("tool state manager replaced")  # Force refresh on next get
         logger.info("Tool state manager updated")
@@ -0,0 +1,328 @@
+"""Session-scoped cache of tool results.
+
+ToolResultCache stores successful results of read-only tools so that repeated
+calls with the same arguments (a follow-up question, a re-planned research
+step) are answered without running the tool again. ToolRegistry owns the cache
+and consults it in execute_tool().
+
+What may be cached is declared by each provider: a tool definition can carry a
+``cache_policy`` entry (see ToolCachePolicy), which ToolRegistry strips before
+the definition is sent to the API. Tools without a policy are never cached.
+
+Entries expire after their tool's TTL and are evicted least-recently-used when
+the cache or a tool's share of it is full. The cache can optionally be backed
+by a StateProvider so results survive restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from nxs.logger import get_logger
+
+if TYPE_CHECKING:
+    from nxs.domain.protocols.state import StateProvider
+
+logger = get_logger(__name__)
+
+__all__ = ["CACHE_POLICY_KEY", "ToolCachePolicy", "ToolResultCache", "hash_tool_call"]
+
+# Tool definition key under which providers declare a ToolCachePolicy
+CACHE_POLICY_KEY = "cache_policy"
+
+# Default time-to-live of cached results (seconds)
+DEFAULT_TTL = 300.0
+
+# Listener signature: (scope, tool_name, hit)
+CacheListener = Callable[[Optional[str], str, bool], None]
+
+_CacheKey = tuple[Optional[str], str, str]
+
+
+def hash_tool_call(tool_name: str, arguments: dict[str, Any]) -> str:
+    """Deterministic hash of a tool name and its arguments (MD5 hex digest).
+
+    Argument order does not matter. Shared by the result cache, the call
+    coalescer and ResearchProgressTracker.
+    """
+    combined = f"{tool_name}:{json.dumps(arguments, sort_keys=True)}"
+    return hashlib.md5(combined.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """Caching policy a provider declares for one of its tools.
+
+    Attributes:
+        cacheable: Whether results may be reused.
+        ttl: Seconds a result stays valid (None = until evicted).
+        max_entries: Maximum cached results for this tool (None = only the
+            cache-wide limit applies).
+        read_only: Whether the tool leaves state unchanged. Results of tools
+            that are not read-only are never cached, and a call to one drops
+            the cached results of every tool of the same provider.
+        idempotent: Whether repeating a call has no further effect. Identical
+            concurrent calls of idempotent tools are coalesced into one.
+
+    Example:
+        >>> tool = {"name": "search", ..., "cache_policy": {"ttl": 600}}
+        >>> ToolCachePolicy.from_metadata(tool["cache_policy"])
+        ToolCachePolicy(cacheable=True, ttl=600, max_entries=None, read_only=True, idempotent=True)
+    """
+
+    cacheable: bool = True
+    ttl: Optional[float] = DEFAULT_TTL
+    max_entries: Optional[int] = None
+    read_only: bool = True
+    idempotent: bool = True
+
+    @property
+    def should_cache(self) -> bool:
+        """Whether results of the tool are stored."""
+        return self.cacheable and self.read_only and (self.ttl is None or self.ttl > 0)
+
+    @classmethod
+    def from_metadata(cls, metadata: ToolCachePolicy | dict[str, Any] | None) -> Optional["ToolCachePolicy"]:
+        """Read a policy from a tool definition entry; unknown keys are ignored."""
+        if metadata is None or isinstance(metadata, ToolCachePolicy):
+            return metadata
+        defaults = cls()
+        return cls(
+            cacheable=bool(metadata.get("cacheable", defaults.cacheable)),
+            ttl=metadata.get("ttl", defaults.ttl),
+            max_entries=metadata.get("max_entries", defaults.max_entries),
+            read_only=bool(metadata.get("read_only", defaults.read_only)),
+            idempotent=bool(metadata.get("idempotent", defaults.idempotent)),
+        )
+
+    def to_metadata(self) -> dict[str, Any]:
+        """Convert to a tool definition entry."""
+        return asdict(self)
+
+
+@dataclass
+class _Entry:
+    result: str
+    expires_at: Optional[float]
+
+
+class ToolResultCache:
+    """LRU cache of tool results with per-tool TTL and size limits.
+
+    Entries are keyed by scope, tool name and a hash of the arguments. The
+    scope (normally a session ID) keeps sessions that share the cache from
+    seeing each other's results; invalidation applies to every scope.
+
+    Example:
+        >>> cache = ToolResultCache(max_entries=256)
+        >>> policy = ToolCachePolicy(ttl=60)
+        >>> cache.get("search", {"q": "x"})
+        None
+        >>> cache.put("search", {"q": "x"}, "result", policy, scope="session-1")
+        >>> cache.get("search", {"q": "x"}, scope="session-1")
+        'result'
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        *,
+        state_provider: Optional["StateProvider"] = None,
+        storage_key: str = "tool_result_cache",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results across all tools.
+            state_provider: Optional StateProvider used by save()/load() to
+                keep results across restarts.
+            storage_key: Key under which the cache is stored.
+            clock: Time source (wall clock, so persisted expiry times stay
+                meaningful across restarts).
+        """
+        self.max_entries = max_entries
+        self._state_provider = state_provider
+        self._storage_key = storage_key
+        self._clock = clock
+        self._entries: OrderedDict[_CacheKey, _Entry] = OrderedDict()
+        self._tool_counts: dict[str, int] = {}
+        self._listeners: list[CacheListener] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_listener(self, listener: CacheListener) -> None:
+        """Register a callback invoked as listener(scope, tool_name, hit) on every lookup."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: CacheListener) -> None:
+        """Remove a previously registered listener (no-op if absent)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get(self, tool_name: str, arguments: dict[str, Any], *, scope: Optional[str] = None) -> Optional[str]:
+        """Look up a cached result and count the hit or miss.
+
+        Args:
+            tool_name: Name of the tool.
+            arguments: Tool arguments.
+            scope: Scope of the lookup (normally a session ID).
+
+        Returns:
+            The cached result, or None if there is no valid entry.
+        """
+        key = self._key(scope, tool_name, arguments)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        self._notify(scope, tool_name, entry is not None)
+        return entry.result if entry is not None else None
+
+    def put(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        result: str,
+        policy: ToolCachePolicy,
+        *,
+        scope: Optional[str] = None,
+    ) -> None:
+        """Store a result, evicting least-recently-used entries if needed.
+
+        Args:
+            tool_name: Name of the tool.
+            arguments: Tool arguments.
+            result: Tool result to cache.
+            policy: The tool's caching policy (nothing is stored unless
+                policy.should_cache).
+            scope: Scope of the entry (normally a session ID).
+        """
+        if not policy.should_cache or self.max_entries <= 0:
+            return
+
+        key = self._key(scope, tool_name, arguments)
+        self._remove(key)
+        expires_at = self._clock() + policy.ttl if policy.ttl is not None else None
+        self._entries[key] = _Entry(result=result, expires_at=expires_at)
+        self._tool_counts[tool_name] = self._tool_counts.get(tool_name, 0) + 1
+
+        if policy.max_entries is not None and self._tool_counts[tool_name] > policy.max_entries:
+            self._evict(lambda k: k[1] == tool_name, self._tool_counts[tool_name] - policy.max_entries)
+        if len(self._entries) > self.max_entries:
+            self._evict(lambda k: True, len(self._entries) - self.max_entries)
+
+    def invalidate(self, tool_names: Optional[Iterable[str]] = None) -> int:
+        """Drop cached results of the given tools (all tools if None) in every scope.
+
+        Returns:
+            Number of entries dropped.
+        """
+        if tool_names is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._tool_counts.clear()
+            return dropped
+
+        names = set(tool_names)
+        keys = [key for key in self._entries if key[1] in names]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    async def save(self) -> None:
+        """Write unexpired entries to the state provider (no-op without one)."""
+        if self._state_provider is None:
+            return
+        now = self._clock()
+        entries = [
+            {"scope": scope, "tool": tool, "args": args_hash, "result": entry.result, "expires_at": entry.expires_at}
+            for (scope, tool, args_hash), entry in self._entries.items()
+            if entry.expires_at is None or entry.expires_at > now
+        ]
+        await self._state_provider.save(self._storage_key, {"entries": entries})
+        logger.debug(f"Saved {len(entries)} cached tool results")
+
+    async def load(self) -> None:
+        """Restore entries from the state provider (no-op without one)."""
+        if self._state_provider is None:
+            return
+        data = await self._state_provider.load(self._storage_key)
+        if not data:
+            return
+        now = self._clock()
+        for item in data.get("entries", []):
+            expires_at = item.get("expires_at")
+            if expires_at is not None and expires_at <= now:
+                continue
+            key = (item.get("scope"), item["tool"], item["args"])
+            self._remove(key)
+            self._entries[key] = _Entry(result=item["result"], expires_at=expires_at)
+            self._tool_counts[key[1]] = self._tool_counts.get(key[1], 0) + 1
+        if len(self._entries) > self.max_entries:
+            self._evict(lambda k: True, len(self._entries) - self.max_entries)
+        logger.debug(f"Loaded {len(self._entries)} cached tool results")
+
+    @staticmethod
+    def _key(scope: Optional[str], tool_name: str, arguments: dict[str, Any]) -> _CacheKey:
+        return (scope, tool_name, hash_tool_call(tool_name, arguments))
+
+    def _remove(self, key: _CacheKey) -> None:
+        if self._entries.pop(key, None) is None:
+            return
+        tool_name = key[1]
+        self._tool_counts[tool_name] -= 1
+        if not self._tool_counts[tool_name]:
+            del self._tool_counts[tool_name]
+
+    def _evict(self, predicate: Callable[[_CacheKey], bool], count: int) -> None:
+        """Evict the count least-recently-used entries matching predicate."""
+        victims = []
+        for key in self._entries:
+            if len(victims) == count:
+                break
+            if predicate(key):
+                victims.append(key)
+        for key in victims:
+            self._remove(key)
+        self.evictions += len(victims)
+
+    def _notify(self, scope: Optional[str], tool_name: str, hit: bool) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(scope, tool_name, hit)
+            except Exception as e:
+                logger.error(f"Tool cache listener failed: {e}", exc_info=True)
@@ -11,7 +11,7 @@ application state rather than core business logic.
 
 from __future__ import annotations
 
-from typing import Set
+from typing import Callable, Set
 from nxs.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,7 +24,7 @@ class ToolStateManager:
     - Per-tool enable/disable control
     - All tools enabled by default
     - Thread-safe state management
-    - Event notification support (future enhancement)
+    - Change listeners (e.g. ToolRegistry invalidates its tool catalog)
 
     Example:
         >>> state_mgr = ToolStateManager()
@@ -43,8 +43,35 @@ class ToolStateManager:
         explicitly in a set.
         """
         self._disabled_tools: Set[str] = set()
+        self._listeners: list[Callable[[], None]] = []
         logger.debug("ToolStateManager initialized (all tools enabled by default)")
 
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked whenever the enabled/disabled set changes.
+
+        Args:
+            listener: Zero-argument callable
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """Remove a previously registered change listener (no-op if unknown).
+
+        Args:
+            listener: Callable passed to add_listener()
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify_listeners(self) -> None:
+        """Invoke all change listeners, isolating listener failures."""
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception as e:
+                logger.warning(f"Tool state listener failed: {e}")
+
     def is_enabled(self, tool_name: str) -> bool:
         """Check if a tool is enabled.
 
@@ -65,6 +92,7 @@ class ToolStateManager:
         if tool_name in self._disabled_tools:
             self._disabled_tools.remove(tool_name)
             logger.info(f"Tool enabled: {tool_name}")
+            self._notify_listeners()
         else:
             logger.debug(f"Tool already enabled: {tool_name}")
 
@@ -77,6 +105,7 @@ class ToolStateManager:
         if tool_name not in self._disabled_tools:
             self._disabled_tools.add(tool_name)
             logger.info(f"Tool disabled: {tool_name}")
+            self._notify_listeners()
         else:
             logger.debug(f"Tool already disabled: {tool_name}")
 
@@ -109,6 +138,8 @@ class ToolStateManager:
         count = len(self._disabled_tools)
         self._disabled_tools.clear()
         logger.info(f"All tools enabled ({count} tools were disabled)")
+        if count:
+            self._notify_listeners()
 
     def disable_all_tools(self) -> None:
         """Disable all tools.
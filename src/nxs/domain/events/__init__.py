@@ -29,6 +29,7 @@ Example:
 from .bus import EventBus, EventHandler
 from .types import (
     ArtifactsFetched,
+    ArtifactsListChanged,
     ConnectionStatusChanged,
     Event,
     ReconnectProgress,
@@ -42,5 +43,6 @@ __all__ = [
     "ConnectionStatusChanged",
     "ReconnectProgress",
     "ArtifactsFetched",
+    "ArtifactsListChanged",
     "StateChanged",
 ]
@@ -91,6 +91,26 @@ class ArtifactsFetched(Event):
     """Whether the artifacts changed compared to the cached version."""
 
 
+@dataclass
+class ArtifactsListChanged(Event):
+    """Event published when an MCP server reports that an artifact list changed.
+
+    This event is published by the core layer (MCPConnectionManager) when a
+    server sends a ``notifications/tools/list_changed`` (or the prompts /
+    resources equivalent). Subscribers holding cached artifact lists should
+    invalidate them.
+
+    Attributes:
+        server_name: Name of the server whose list changed
+        artifact_type: Which list changed ("tools", "prompts" or "resources")
+    """
+
+    server_name: str
+    """Name of the MCP server."""
+    artifact_type: str
+    """Which artifact list changed (tools, prompts, resources)."""
+
+
 @dataclass
 class StateChanged(Event):
     """Event published when session state is updated.
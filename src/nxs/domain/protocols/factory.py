@@ -20,6 +20,7 @@ class ClientProvider(Protocol):
         *,
         status_callback: Optional[Callable[[str, ConnectionStatus], None]] = None,
         progress_callback: Optional[Callable[[str, int, int, float], None]] = None,
+        list_changed_callback: Optional[Callable[[str, str], None]] = None,
     ) -> dict[str, MCPClient]:
         """Create clients for configured servers.
 
@@ -27,6 +28,7 @@ class ClientProvider(Protocol):
             configs: Dictionary of server configurations
             status_callback: Optional callback for connection status changes
             progress_callback: Optional callback for reconnection progress
+            list_changed_callback: Optional callback for server list_changed notifications
 
         Returns:
             Dictionary mapping server names to MCPClient instances
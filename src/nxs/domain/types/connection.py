@@ -15,5 +15,6 @@ class ConnectionStatus(Enum):
     DISCONNECTED = "disconnected"
     CONNECTING = "connecting"
     CONNECTED = "connected"
+    DEGRADED = "degraded"  # Connected, but recent calls timed out or failed
     RECONNECTING = "reconnecting"
     ERROR = "error"
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 from datetime import timedelta
-from typing import Any, Callable, Optional, cast
+from typing import Any, Awaitable, Callable, Optional, TypeVar, cast
 
 from mcp import types
 from mcp.client.session import ClientSession
@@ -20,6 +20,11 @@ from nxs.domain.types import ConnectionStatus
 
 logger = get_logger("mcp_client")
 
+# Default deadline (seconds) for tool calls, prompt and resource reads
+DEFAULT_CALL_TIMEOUT = 60.0
+
+T = TypeVar("T")
+
 
 class MCPAuthClient:
     """MCP protocol client with connection management and session operations.
@@ -28,6 +33,11 @@ class MCPAuthClient:
     - Connection lifecycle (connect, disconnect, reconnect)
     - Session management with health monitoring
     - Direct MCP operations (tools, prompts, resources)
+
+    Tool calls, prompt and resource reads are bounded by deadlines. A call
+    that misses its deadline is cancelled on the server (notifications/cancelled),
+    reported to the connection manager (which marks the server DEGRADED), and
+    answered with a structured timeout result instead of hanging the caller.
     """
 
     def __init__(
@@ -38,10 +48,30 @@ class MCPAuthClient:
         connection_manager: Optional[SingleConnectionManager] = None,
         on_status_change: Optional[Callable[[ConnectionStatus], None]] = None,
         on_reconnect_progress: Optional[Callable[[int, int, float], None]] = None,
+        on_list_changed: Optional[Callable[[str], None]] = None,
+        call_timeout: Optional[float] = DEFAULT_CALL_TIMEOUT,
+        tool_timeouts: Optional[dict[str, float]] = None,
     ):
+        """
+        Initialize the client.
+
+        Args:
+            server_url: URL of the MCP server.
+            transport_type: Transport to use (only "streamable_http" is supported).
+            connection_manager: Optional pre-configured connection manager.
+            on_status_change: Callback for connection status changes.
+            on_reconnect_progress: Callback for reconnection progress.
+            on_list_changed: Callback for tools/prompts/resources list changes.
+            call_timeout: Deadline in seconds for tool calls, prompt and
+                resource reads (None = no deadline).
+            tool_timeouts: Per-tool deadlines overriding call_timeout.
+        """
         self.server_url = server_url
         self.transport_type = transport_type
         self._use_auth = False
+        self._on_list_changed = on_list_changed
+        self.call_timeout = call_timeout
+        self.tool_timeouts: dict[str, float] = dict(tool_timeouts or {})
 
         if connection_manager is not None and (on_status_change or on_reconnect_progress):
             logger.debug(
@@ -142,14 +172,28 @@ class MCPAuthClient:
         tool_name: str,
         arguments: Optional[dict[str, Any]] = None,
     ) -> Optional[CallToolResult]:
-        """Invoke a tool on the connected server."""
+        """
+        Invoke a tool on the connected server.
+
+        Returns:
+            The tool result, an error result (isError=True) describing the
+            timeout if the tool missed its deadline, or None on other failures.
+        """
         session = self._get_session()
         if session is None:
             logger.warning("Cannot call tool '%s': no active MCP session", tool_name)
             return None
 
+        timeout = self.get_tool_timeout(tool_name)
         try:
-            return await session.call_tool(tool_name, arguments or {})
+            return await self._with_deadline(
+                session,
+                f"call_tool({tool_name})",
+                timeout,
+                lambda: session.call_tool(tool_name, arguments or {}),
+            )
+        except TimeoutError:
+            return self._timeout_result(tool_name, cast(float, timeout))
         except Exception as exc:
             logger.error("Failed to call tool '%s': %s", tool_name, exc)
             return None
@@ -185,9 +229,17 @@ class MCPAuthClient:
             return []
 
         try:
-            result = await session.get_prompt(prompt_name, args)
+            result = await self._with_deadline(
+                session,
+                f"get_prompt({prompt_name})",
+                self.call_timeout,
+                lambda: session.get_prompt(prompt_name, args),
+            )
             messages = getattr(result, "messages", None)
             return list(messages or [])
+        except TimeoutError:
+            logger.error("Getting prompt '%s' timed out after %ss", prompt_name, self.call_timeout)
+            return []
         except Exception as exc:
             logger.error("Failed to get prompt '%s': %s", prompt_name, exc)
             return []
@@ -219,7 +271,12 @@ class MCPAuthClient:
             return None
 
         try:
-            result = await session.read_resource(AnyUrl(uri))
+            result = await self._with_deadline(
+                session,
+                f"read_resource({uri})",
+                self.call_timeout,
+                lambda: session.read_resource(AnyUrl(uri)),
+            )
             contents = getattr(result, "contents", None)
             if not contents:
                 return None
@@ -234,11 +291,87 @@ class MCPAuthClient:
                         return None
                 return resource.text
 
+            return None
+        except TimeoutError:
+            logger.error("Reading resource '%s' timed out after %ss", uri, self.call_timeout)
             return None
         except Exception as exc:
             logger.error("Failed to read resource '%s': %s", uri, exc)
             return None
 
+    # --------------------------------------------------------------------- #
+    # Deadlines and cancellation
+    # --------------------------------------------------------------------- #
+
+    def get_tool_timeout(self, tool_name: str) -> Optional[float]:
+        """Deadline in seconds for a tool (per-tool override or call_timeout)."""
+        return self.tool_timeouts.get(tool_name, self.call_timeout)
+
+    async def _with_deadline(
+        self,
+        session: ClientSession,
+        operation: str,
+        timeout: Optional[float],
+        request: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Run a session request, cancelling it on the server if it is abandoned.
+
+        The request runs inline (no extra task), so the JSON-RPC id it gets is
+        the session's next request id read just before it starts.
+
+        Raises:
+            TimeoutError: If the request missed its deadline.
+            asyncio.CancelledError: If the caller was cancelled.
+        """
+        request_id = getattr(session, "_request_id", None)
+        try:
+            async with asyncio.timeout(timeout):
+                return await request()
+        except TimeoutError:
+            logger.warning("%s on %s timed out after %ss", operation, self.server_url, timeout)
+            await self._cancel_request(session, request_id, f"{operation} timed out after {timeout}s")
+            self._connection_manager.report_timeout(operation)
+            raise
+        except asyncio.CancelledError:
+            await self._cancel_request(session, request_id, f"{operation} cancelled by client")
+            raise
+
+    async def _cancel_request(self, session: ClientSession, request_id: Any, reason: str) -> None:
+        """Tell the server to stop working on an abandoned request (best effort)."""
+        if not isinstance(request_id, int):
+            return
+        notification = types.ClientNotification(
+            types.CancelledNotification(
+                method="notifications/cancelled",
+                params=types.CancelledNotificationParams(requestId=request_id, reason=reason),
+            )
+        )
+        try:
+            await session.send_notification(notification)
+            logger.debug("Sent cancellation for request %s: %s", request_id, reason)
+        except Exception as exc:
+            logger.debug("Failed to send cancellation for request %s: %s", request_id, exc)
+
+    def _timeout_result(self, tool_name: str, timeout: float) -> CallToolResult:
+        """Build the error result returned for a tool call that missed its deadline."""
+        payload = {
+            "error": "timeout",
+            "tool": tool_name,
+            "server": self.server_url,
+            "timeout_seconds": timeout,
+            "message": (
+                f"Tool '{tool_name}' did not respond within {timeout}s and was cancelled. "
+                "The server may be slow or overloaded. Retry later, try narrower arguments, "
+                "or continue without this result."
+            ),
+        }
+        return CallToolResult(
+            content=[types.TextContent(type="text", text=json.dumps(payload))],
+            structuredContent=payload,
+            isError=True,
+        )
+
     # --------------------------------------------------------------------- #
     # Internal connection helpers
     # --------------------------------------------------------------------- #
@@ -270,6 +403,32 @@ class MCPAuthClient:
 
         logger.debug("Connection function exiting (connection lost or stopped)")
 
+    async def _handle_message(self, message: Any) -> None:
+        """
+        Handle incoming server messages that are not responses to our requests.
+
+        Translates ``notifications/*/list_changed`` into the ``on_list_changed``
+        callback with the affected artifact type ("tools", "prompts" or "resources").
+        """
+        if self._on_list_changed is None or not isinstance(message, types.ServerNotification):
+            return
+
+        notification = message.root
+        if isinstance(notification, types.ToolListChangedNotification):
+            artifact_type = "tools"
+        elif isinstance(notification, types.PromptListChangedNotification):
+            artifact_type = "prompts"
+        elif isinstance(notification, types.ResourceListChangedNotification):
+            artifact_type = "resources"
+        else:
+            return
+
+        logger.info("Server %s reported %s list changed", self.server_url, artifact_type)
+        try:
+            self._on_list_changed(artifact_type)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error("List-changed callback failed: %s", exc)
+
     async def _setup_session(
         self,
         read_stream,
@@ -278,7 +437,7 @@ class MCPAuthClient:
         stop_event: asyncio.Event,
     ) -> None:
         """Initialize the MCP session and keep it alive until instructed to stop."""
-        async with ClientSession(read_stream, write_stream) as session:
+        async with ClientSession(read_stream, write_stream, message_handler=self._handle_message) as session:
             logger.debug("Initializing MCP session")
 
             await session.initialize()
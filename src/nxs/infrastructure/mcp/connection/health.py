@@ -50,12 +50,15 @@ class HealthChecker:
         self._task: Optional[asyncio.Task] = None
         self._stop_event: Optional[asyncio.Event] = None
         self._consecutive_failures = 0
+        self._on_unhealthy: Optional[Callable[[], None]] = None
+        self._on_recovered: Optional[Callable[[], None]] = None
 
     async def start(
         self,
         get_session: Callable[[], Optional[SessionProtocol]],
         on_unhealthy: Callable[[], None],
         stop_event: asyncio.Event,
+        on_recovered: Optional[Callable[[], None]] = None,
     ) -> None:
         """
         Start health check monitoring.
@@ -64,6 +67,7 @@ class HealthChecker:
             get_session: Callable that returns the current session or None
             on_unhealthy: Callback to invoke when connection becomes unhealthy
             stop_event: Event to signal stopping
+            on_recovered: Optional callback to invoke when a check passes after failures
         """
         if self._task and not self._task.done():
             logger.warning("Health checker already running")
@@ -71,6 +75,8 @@ class HealthChecker:
 
         self._stop_event = stop_event
         self._consecutive_failures = 0
+        self._on_unhealthy = on_unhealthy
+        self._on_recovered = on_recovered
         self._task = asyncio.create_task(self._health_check_loop(get_session, on_unhealthy, stop_event))
         mode = "keep-alive + health monitoring" if self._keep_alive_enabled else "health monitoring only"
         logger.info(f"Health checker started (interval={self._check_interval}s, mode={mode}, operation={self._health_check_operation})")
@@ -93,8 +99,33 @@ class HealthChecker:
         self._task = None
         self._stop_event = None
         self._consecutive_failures = 0
+        self._on_unhealthy = None
+        self._on_recovered = None
         logger.info("Health checker stopped")
 
+    def report_failure(self, reason: str) -> None:
+        """
+        Record a failure observed outside the health check loop (e.g. a timed-out call).
+
+        Counts toward the failure threshold like a failed health check, so a
+        server whose calls keep timing out is reconnected without waiting
+        for the periodic checks to fail as well.
+
+        Args:
+            reason: Description of the failure for logging
+        """
+        if not self.is_running:
+            return
+
+        self._consecutive_failures += 1
+        logger.warning(f"Reported failure: {reason} ({self._consecutive_failures}/{self._failure_threshold})")
+        if self._consecutive_failures >= self._failure_threshold and self._on_unhealthy is not None:
+            logger.warning(f"Connection unhealthy after {self._consecutive_failures} consecutive failures, triggering callback")
+            try:
+                self._on_unhealthy()
+            except Exception as e:
+                logger.error(f"Error in unhealthy callback: {e}")
+
     async def _health_check_loop(
         self,
         get_session: Callable[[], Optional[SessionProtocol]],
@@ -123,6 +154,11 @@ class HealthChecker:
                     # Reset failure counter on successful check
                     if self._consecutive_failures > 0:
                         logger.info(f"Connection recovered after {self._consecutive_failures} failure(s)")
+                        if self._on_recovered is not None:
+                            try:
+                                self._on_recovered()
+                            except Exception as e:
+                                logger.error(f"Error in recovered callback: {e}")
                     self._consecutive_failures = 0
                 else:
                     # Increment failure counter
@@ -35,8 +35,8 @@ class ConnectionLifecycle:
 
     @property
     def is_connected(self) -> bool:
-        """Check if currently connected."""
-        return self._status == ConnectionStatus.CONNECTED
+        """Check if currently connected (including degraded connections)."""
+        return self._status in (ConnectionStatus.CONNECTED, ConnectionStatus.DEGRADED)
 
     @property
     def is_disconnected(self) -> bool:
@@ -163,6 +163,7 @@ class SingleConnectionManager:
             get_session=lambda: self._session,
             on_unhealthy=self._on_unhealthy,
             stop_event=stop_event,
+            on_recovered=self._on_recovered,
         )
 
         # Wait for connection to be ready
@@ -313,12 +314,35 @@ class SingleConnectionManager:
         """Handle unhealthy connection detected by health checker."""
         logger.warning("Health check detected unhealthy connection - triggering reconnection")
         self._session = None
-        if self._lifecycle.status == ConnectionStatus.CONNECTED:
-            logger.info("Transitioning from CONNECTED to RECONNECTING due to health check failure")
+        if self._lifecycle.is_connected:
+            logger.info(
+                f"Transitioning from {self._lifecycle.status.value.upper()} to RECONNECTING due to health check failure"
+            )
             self._lifecycle.set_status(ConnectionStatus.RECONNECTING)
         else:
             logger.debug(f"Health check failed but status is already {self._lifecycle.status.value}")
 
+    def report_timeout(self, operation: str) -> None:
+        """
+        Record a call that exceeded its deadline.
+
+        Marks the connection DEGRADED right away and counts the timeout as a
+        health failure, so repeated timeouts trigger reconnection.
+
+        Args:
+            operation: Description of the timed-out call (e.g. "call_tool(search)")
+        """
+        if self._lifecycle.status == ConnectionStatus.CONNECTED:
+            logger.info(f"Marking connection DEGRADED: {operation} timed out")
+            self._lifecycle.set_status(ConnectionStatus.DEGRADED)
+        self._health_checker.report_failure(f"{operation} timed out")
+
+    def _on_recovered(self) -> None:
+        """Handle a passing health check after failures."""
+        if self._lifecycle.status == ConnectionStatus.DEGRADED:
+            logger.info("Connection recovered; transitioning from DEGRADED to CONNECTED")
+            self._lifecycle.set_status(ConnectionStatus.CONNECTED)
+
     async def _cleanup(self) -> None:
         """Clean up connection resources."""
         # Stop health checker
@@ -6,7 +6,7 @@ from typing import Callable, Dict, Optional
 
 from nxs.application.mcp_config import MCPServerConfig
 from nxs.logger import get_logger
-from nxs.infrastructure.mcp.client import MCPAuthClient
+from nxs.infrastructure.mcp.client import DEFAULT_CALL_TIMEOUT, MCPAuthClient
 from nxs.infrastructure.mcp.connection import SingleConnectionManager
 from nxs.domain.types import ConnectionStatus
 
@@ -23,6 +23,7 @@ class ClientFactory:
         *,
         status_callback: Optional[Callable[[str, ConnectionStatus], None]] = None,
         progress_callback: Optional[Callable[[str, int, int, float], None]] = None,
+        list_changed_callback: Optional[Callable[[str, str], None]] = None,
     ) -> MCPAuthClient | None:
         """
         Create a client for the provided server configuration.
@@ -32,6 +33,8 @@ class ClientFactory:
             config: Resolved server configuration.
             status_callback: Optional callback invoked when connection status changes.
             progress_callback: Optional callback invoked during reconnection attempts.
+            list_changed_callback: Optional callback invoked with (server_name, artifact_type)
+                when the server reports that its tools/prompts/resources list changed.
 
         Returns:
             Configured `MCPAuthClient` instance or `None` if configuration is invalid.
@@ -61,6 +64,14 @@ class ClientFactory:
 
             progress_cb = _progress_cb
 
+        list_changed_cb = None
+        if list_changed_callback is not None:
+
+            def _list_changed_cb(artifact_type: str) -> None:
+                list_changed_callback(server_name, artifact_type)
+
+            list_changed_cb = _list_changed_cb
+
         connection_manager = SingleConnectionManager(
             on_status_change=status_cb,
             on_reconnect_progress=progress_cb,
@@ -69,6 +80,9 @@ class ClientFactory:
         client = MCPAuthClient(
             server_url=url,
             connection_manager=connection_manager,
+            on_list_changed=list_changed_cb,
+            call_timeout=config.call_timeout if config.call_timeout is not None else DEFAULT_CALL_TIMEOUT,
+            tool_timeouts=config.tool_timeouts,
         )
 
         logger.debug("Created MCPAuthClient for %s", server_name)
@@ -80,6 +94,7 @@ class ClientFactory:
         *,
         status_callback: Optional[Callable[[str, ConnectionStatus], None]] = None,
         progress_callback: Optional[Callable[[str, int, int, float], None]] = None,
+        list_changed_callback: Optional[Callable[[str, str], None]] = None,
     ) -> Dict[str, MCPAuthClient]:
         """Create MCP clients for all configured servers."""
         clients: Dict[str, MCPAuthClient] = {}
@@ -89,6 +104,7 @@ class ClientFactory:
                 server_config,
                 status_callback=status_callback,
                 progress_callback=progress_callback,
+                list_changed_callback=list_changed_callback,
             )
             if client is not None:
                 clients[server_name] = client
@@ -6,8 +6,10 @@ for different storage backends.
 
 from nxs.infrastructure.state.memory import InMemoryStateProvider
 from nxs.infrastructure.state.file import FileStateProvider
+from nxs.infrastructure.state.journal import StateJournal
 
 __all__ = [
     "InMemoryStateProvider",
     "FileStateProvider",
+    "StateJournal",
 ]
@@ -4,15 +4,21 @@ This module provides persistent state storage using JSON files on the local
 filesystem. Each state key is stored as a separate JSON file.
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from nxs.logger import get_logger
 
 logger = get_logger(__name__)
 
+FsyncPolicy = Literal["none", "file", "full"]
+"""Durability of writes: "none" (leave flushing to the OS), "file" (fsync the
+written file before renaming it into place) or "full" (additionally fsync the
+directory so the rename itself is durable)."""
+
 
 class FileStateProvider:
     """File-based state provider for local persistence.
@@ -25,7 +31,9 @@ class FileStateProvider:
     - Automatic directory creation
     - Safe file operations with error handling
     - Pretty-printed JSON for readability
-    - Atomic writes (write to temp, then rename)
+    - Atomic writes (write to temp, then rename) with optional fsync
+    - Serialization and disk I/O in a worker thread (never blocks the loop)
+    - Concurrent saves to the same key coalesced into the latest snapshot
 
     Example:
         >>> provider = FileStateProvider(base_dir="~/.nexus/sessions")
@@ -37,13 +45,14 @@ class FileStateProvider:
         {'data': 'value'}
     """
 
-    def __init__(self, base_dir: str | Path = "~/.nexus/sessions"):
+    def __init__(self, base_dir: str | Path = "~/.nexus/sessions", fsync: FsyncPolicy = "none"):
         """Initialize file-based state provider.
 
         Args:
             base_dir: Base directory for storing state files.
                      Supports ~ expansion and relative paths.
                      Created if it doesn't exist.
+            fsync: Durability policy for writes ("none", "file" or "full").
 
         Example:
             >>> # Use default directory
@@ -53,8 +62,12 @@ class FileStateProvider:
             >>> provider = FileStateProvider("/var/lib/nexus/sessions")
         """
         self.base_dir = Path(base_dir).expanduser().resolve()
+        self.fsync: FsyncPolicy = fsync
         self._ensure_directory_exists()
-        logger.info(f"FileStateProvider initialized: base_dir={self.base_dir}")
+        # Save coalescing: latest unwritten snapshot and the writer task per key
+        self._pending_saves: dict[str, dict[str, Any]] = {}
+        self._save_tasks: dict[str, asyncio.Task] = {}
+        logger.info(f"FileStateProvider initialized: base_dir={self.base_dir}, fsync={fsync}")
 
     def _ensure_directory_exists(self) -> None:
         """Create base directory if it doesn't exist."""
@@ -103,9 +116,17 @@ class FileStateProvider:
     async def save(self, key: str, data: dict[str, Any]) -> None:
         """Save state data to a JSON file.
 
+        Serialization and disk I/O run in a worker thread. Saves to the same
+        key are coalesced: while a write is in flight, further saves only
+        replace the pending snapshot, and the latest one is written next.
+        Every caller returns once a snapshot at least as new as its own is
+        on disk.
+
         Args:
             key: Unique key for the state
-            data: State data as a JSON-serializable dictionary
+            data: State data as a JSON-serializable dictionary. It is
+                serialized off the event loop, so it must not be mutated
+                after being passed in.
 
         Raises:
             IOError: If file write fails
@@ -115,6 +136,29 @@ class FileStateProvider:
             Uses atomic write (write to temp file, then rename)
             to prevent corruption if interrupted.
         """
+        self._pending_saves[key] = data
+        writer = self._save_tasks.get(key)
+        if writer is None or writer.done():
+            writer = asyncio.create_task(self._drain_saves(key))
+            self._save_tasks[key] = writer
+        else:
+            logger.debug(f"Coalescing save for key '{key}' into in-flight write")
+        # Shield so a cancelled caller doesn't abort a write others wait on
+        await asyncio.shield(writer)
+
+    async def _drain_saves(self, key: str) -> None:
+        """Write the latest pending snapshot for a key until none is left."""
+        try:
+            while key in self._pending_saves:
+                data = self._pending_saves.pop(key)
+                await asyncio.to_thread(self._write_file, key, data)
+        except BaseException:
+            # Waiters of the newer snapshot get this error too; drop it
+            self._pending_saves.pop(key, None)
+            raise
+
+    def _write_file(self, key: str, data: dict[str, Any]) -> None:
+        """Serialize and atomically write a snapshot (runs in a worker thread)."""
         filepath = self._key_to_filename(key)
         temp_filepath = filepath.with_suffix(".json.tmp")
 
@@ -122,9 +166,14 @@ class FileStateProvider:
             # Write to temporary file first (atomic write pattern)
             with open(temp_filepath, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+                if self.fsync != "none":
+                    f.flush()
+                    os.fsync(f.fileno())
 
             # Atomic rename
-            temp_filepath.rename(filepath)
+            os.replace(temp_filepath, filepath)
+            if self.fsync == "full":
+                self._fsync_directory()
 
             logger.debug(
                 f"Saved state to file: key='{key}', "
@@ -145,9 +194,24 @@ class FileStateProvider:
                 temp_filepath.unlink()
             raise IOError(f"Cannot write state file: {e}") from e
 
+    def _fsync_directory(self) -> None:
+        """Flush the directory entry so a completed rename survives a crash."""
+        try:
+            fd = os.open(self.base_dir, os.O_RDONLY)
+        except OSError:
+            return  # Not supported on this platform (e.g. Windows)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     async def load(self, key: str) -> dict[str, Any] | None:
         """Load state data from a JSON file.
 
+        Disk I/O and parsing run in a worker thread. A save for the same key
+        that is still in flight is waited for first, so loads never observe
+        an older snapshot than the last save() call.
+
         Args:
             key: The state key to load
 
@@ -158,6 +222,11 @@ class FileStateProvider:
             IOError: If file read fails
             ValueError: If JSON is invalid or corrupted
         """
+        await self._wait_for_pending_save(key)
+        return await asyncio.to_thread(self._read_file, key)
+
+    def _read_file(self, key: str) -> dict[str, Any] | None:
+        """Read and parse a snapshot (runs in a worker thread)."""
         filepath = self._key_to_filename(key)
 
         if not filepath.exists():
@@ -184,6 +253,12 @@ class FileStateProvider:
             logger.error(f"Failed to read state file '{filepath}': {e}")
             raise IOError(f"Cannot read state file: {e}") from e
 
+    async def _wait_for_pending_save(self, key: str) -> None:
+        """Wait for an in-flight save of key (its errors belong to the saver)."""
+        writer = self._save_tasks.get(key)
+        if writer is not None and not writer.done():
+            await asyncio.wait([writer])
+
     async def exists(self, key: str) -> bool:
         """Check if state file exists.
 
@@ -193,8 +268,9 @@ class FileStateProvider:
         Returns:
             True if file exists, False otherwise
         """
+        await self._wait_for_pending_save(key)
         filepath = self._key_to_filename(key)
-        exists = filepath.exists()
+        exists = await asyncio.to_thread(filepath.exists)
         logger.debug(f"State file exists check: key='{key}', exists={exists}")
         return exists
 
@@ -207,6 +283,13 @@ class FileStateProvider:
         Note:
             Silently succeeds if file doesn't exist (idempotent)
         """
+        # A queued snapshot must not resurrect the file after deletion
+        self._pending_saves.pop(key, None)
+        await self._wait_for_pending_save(key)
+        await asyncio.to_thread(self._delete_file, key)
+
+    def _delete_file(self, key: str) -> None:
+        """Delete a snapshot file (runs in a worker thread)."""
         filepath = self._key_to_filename(key)
 
         if filepath.exists():
@@ -228,6 +311,10 @@ class FileStateProvider:
         Returns:
             List of keys, optionally filtered by prefix
         """
+        return await asyncio.to_thread(self._list_keys, prefix)
+
+    def _list_keys(self, prefix: str | None) -> list[str]:
+        """Scan the directory for state files (runs in a worker thread)."""
         try:
             # Get all .json files (excluding .tmp files)
             json_files = [
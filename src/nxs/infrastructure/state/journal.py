@@ -0,0 +1,241 @@
+"""Append-only journal for incremental state persistence.
+
+This module provides a JSON-lines journal stored next to the snapshots
+written by FileStateProvider. Instead of rewriting a whole state file on
+every save, callers append small change records and periodically compact
+them into a fresh snapshot.
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from nxs.infrastructure.state.file import FsyncPolicy
+from nxs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StateJournal:
+    """Per-key append-only journal of state changes.
+
+    Each key gets a ``<key>.journal.jsonl`` file in ``base_dir`` (using the
+    same key-to-filename mapping as FileStateProvider, so ``list_keys`` on the
+    provider is unaffected). Every line is one record:
+
+    - ``{"op": "set", "path": [...], "value": ...}``: replace the value at path
+    - ``{"op": "update", "path": [...], "value": {...}}``: merge a dict at path
+    - ``{"op": "splice", "path": [...], "start": n, "items": [...]}``:
+      replace the list at path from index ``n`` onwards with ``items``
+
+    Records are replayed on top of the last snapshot when loading. A truncated
+    trailing line (e.g. from a crash mid-write) ends the replay instead of
+    failing it.
+
+    Each record is stamped with the generation of the snapshot it applies to
+    (stored in the snapshot under GENERATION_FIELD). Writers bump the
+    generation when compacting, so records left behind by a crash between
+    "write snapshot" and "reset journal" are ignored instead of re-applied.
+
+    Example:
+        >>> journal = StateJournal(base_dir="~/.nxs/sessions")
+        >>> await journal.append("session:123", [
+        ...     {"op": "splice", "path": ["conversation", "messages"], "start": 4, "items": [...]},
+        ... ], generation=snapshot[StateJournal.GENERATION_FIELD])
+        >>> data = await journal.replay("session:123", snapshot)
+    """
+
+    GENERATION_FIELD = "journal_generation"
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        compact_threshold_bytes: int = 1_000_000,
+        fsync: FsyncPolicy = "none",
+    ):
+        """Initialize the journal.
+
+        Args:
+            base_dir: Directory holding the journal files (created if missing).
+            compact_threshold_bytes: Journal size above which needs_compaction()
+                reports True.
+            fsync: Durability policy for appends; anything but "none" fsyncs
+                the journal after each append.
+        """
+        self.base_dir = Path(base_dir).expanduser().resolve()
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.compact_threshold_bytes = compact_threshold_bytes
+        self.fsync: FsyncPolicy = fsync
+        # Appends run in worker threads; keep them ordered per key
+        self._locks: dict[str, asyncio.Lock] = {}
+        logger.debug(f"StateJournal initialized: base_dir={self.base_dir}")
+
+    def _key_to_filename(self, key: str) -> Path:
+        """Convert a state key to its journal file path."""
+        safe_name = key.replace(":", "__").replace("/", "_")
+        return self.base_dir / f"{safe_name}.journal.jsonl"
+
+    async def append(self, key: str, records: list[dict[str, Any]], generation: int = 0) -> int:
+        """Append change records to the key's journal.
+
+        Args:
+            key: State key
+            records: JSON-serializable change records
+            generation: Generation of the snapshot these records apply to
+
+        Returns:
+            Size of the journal in bytes after the append
+
+        Raises:
+            IOError: If the write fails
+            ValueError: If a record is not JSON-serializable
+        """
+        try:
+            payload = "".join(
+                json.dumps({**record, "gen": generation}, ensure_ascii=False) + "\n" for record in records
+            )
+        except (TypeError, ValueError) as e:
+            logger.error(f"Journal record not JSON-serializable for key '{key}': {e}")
+            raise ValueError(f"Cannot serialize journal record: {e}") from e
+
+        async with self._get_lock(key):
+            size = await asyncio.to_thread(self._append_file, key, payload)
+
+        logger.debug(f"Appended {len(records)} record(s) to journal: key='{key}', size={size} bytes")
+        return size
+
+    def _append_file(self, key: str, payload: str) -> int:
+        """Append serialized records to the journal (runs in a worker thread)."""
+        filepath = self._key_to_filename(key)
+        try:
+            with open(filepath, "a", encoding="utf-8") as f:
+                f.write(payload)
+                if self.fsync != "none":
+                    f.flush()
+                    os.fsync(f.fileno())
+            return filepath.stat().st_size
+        except OSError as e:
+            logger.error(f"Failed to append to journal '{filepath}': {e}")
+            raise IOError(f"Cannot write journal: {e}") from e
+
+    def _get_lock(self, key: str) -> asyncio.Lock:
+        """Get the lock ordering journal writes for a key."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    async def replay(self, key: str, snapshot: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Apply the key's journal on top of a snapshot.
+
+        Args:
+            key: State key
+            snapshot: Last full snapshot (modified in place), or None
+
+        Returns:
+            The snapshot with all journal records applied, or None if there
+            is no snapshot to apply them to
+        """
+        if snapshot is None:
+            return snapshot
+        async with self._get_lock(key):
+            return await asyncio.to_thread(self._replay_file, key, snapshot)
+
+    def _replay_file(self, key: str, snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Read the journal and apply it to snapshot (runs in a worker thread)."""
+        filepath = self._key_to_filename(key)
+        if not filepath.exists():
+            return snapshot
+
+        generation = snapshot.get(self.GENERATION_FIELD, 0)
+        applied = 0
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(
+                            f"Ignoring truncated journal record at {filepath}:{line_number} "
+                            f"and everything after it"
+                        )
+                        break
+                    if record.get("gen", 0) != generation:
+                        continue  # Already folded into the snapshot
+                    self._apply(snapshot, record)
+                    applied += 1
+        except OSError as e:
+            logger.error(f"Failed to read journal '{filepath}': {e}")
+            raise IOError(f"Cannot read journal: {e}") from e
+
+        logger.debug(f"Replayed {applied} journal record(s) for key '{key}'")
+        return snapshot
+
+    @staticmethod
+    def _apply(data: dict[str, Any], record: dict[str, Any]) -> None:
+        """Apply one journal record to data in place."""
+        *parents, leaf = record["path"]
+        target = data
+        for part in parents:
+            target = target.setdefault(part, {})
+
+        op = record["op"]
+        if op == "set":
+            target[leaf] = record["value"]
+        elif op == "update":
+            target.setdefault(leaf, {}).update(record["value"])
+        elif op == "splice":
+            items = target.setdefault(leaf, [])
+            items[record["start"] :] = record["items"]
+        else:
+            logger.warning(f"Unknown journal op '{op}' (skipped)")
+
+    def size(self, key: str) -> int:
+        """Return the journal size in bytes (0 if there is no journal)."""
+        filepath = self._key_to_filename(key)
+        try:
+            return filepath.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def needs_compaction(self, key: str) -> bool:
+        """Check whether the journal has grown past the compaction threshold."""
+        return self.size(key) > self.compact_threshold_bytes
+
+    async def reset(self, key: str) -> None:
+        """Discard the key's journal (after its changes were folded into a snapshot).
+
+        Note:
+            Silently succeeds if there is no journal (idempotent)
+        """
+        async with self._get_lock(key):
+            await asyncio.to_thread(self._unlink_file, key)
+
+    def _unlink_file(self, key: str) -> None:
+        """Remove the journal file (runs in a worker thread)."""
+        filepath = self._key_to_filename(key)
+        try:
+            filepath.unlink()
+            logger.debug(f"Reset journal: key='{key}'")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to reset journal '{filepath}': {e}")
+            raise IOError(f"Cannot reset journal: {e}") from e
+
+    async def delete(self, key: str) -> None:
+        """Delete the key's journal.
+
+        Note:
+            Silently succeeds if there is no journal (idempotent)
+        """
+        await self.reset(key)
+
+    def get_file_path(self, key: str) -> Path:
+        """Get the journal path for a given key (for debugging and testing)."""
+        return self._key_to_filename(key)
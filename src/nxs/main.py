@@ -6,8 +6,9 @@ from dotenv import load_dotenv
 import typer
 
 # Import logger setup first to ensure logging is configured
-from nxs.application.local_tool_provider import LocalToolProvider
+from nxs.application.local_tool_provider import LocalToolOptions, LocalToolProvider
 from nxs.logger import get_logger, setup_logger
+from nxs.application.agentic_loop import ToolExecutionConfig
 from nxs.application.approval import ApprovalConfig, ApprovalManager
 from nxs.application.claude import Claude
 from nxs.application.command_control import CommandControlAgent
@@ -23,6 +24,8 @@ from nxs.application.reasoning.planner import Planner
 from nxs.application.reasoning.evaluator import Evaluator
 from nxs.application.reasoning.synthesizer import Synthesizer
 from nxs.application.summarization import SummarizationService
+from nxs.application.tool_call_coalescer import ToolCallCoalescer
+from nxs.application.tool_result_cache import ToolCachePolicy, ToolResultCache
 from nxs.application.tool_state import ToolStateManager
 from nxs.presentation.tui import NexusApp
 from nxs.tools.weather import get_weather
@@ -108,10 +111,30 @@ async def main(
     logger.info(f"Reasoning config: max_iterations={reasoning_config.max_iterations}, "
                 f"direct_threshold={reasoning_config.min_quality_direct}")
 
+    # Run independent tool_use blocks from the same response concurrently
+    tool_execution_config = ToolExecutionConfig(parallel=True)
+
     # Create shared ToolStateManager for dynamic tool enable/disable
     tool_state_manager = ToolStateManager()
     logger.info("ToolStateManager initialized (all tools enabled by default)")
 
+    # Shared by all sessions' registries so identical concurrent tool calls run once
+    tool_call_coalescer = ToolCallCoalescer()
+    # Shared by all sessions' registries (scoped per session), so a mutating
+    # tool call in one session drops the stale results of every session
+    tool_result_cache = ToolResultCache()
+
+    # Local tools are shared by all sessions, so their worker pools are shut
+    # down once on exit. Forecasts and IP geolocation change slowly; the
+    # current time is never cached
+    local_provider = LocalToolProvider(
+        [get_weather, get_current_location, get_local_datetime],
+        tool_options={
+            "get_weather": LocalToolOptions(cache_policy=ToolCachePolicy(ttl=600)),
+            "get_current_location": LocalToolOptions(cache_policy=ToolCachePolicy(ttl=3600)),
+        },
+    )
+
     # Create agent factory that produces CommandControlAgent instances
     # This uses composition: CommandControlAgent -> AdaptiveReasoningLoop -> AgentLoop
     def create_command_control_agent(conversation):
@@ -129,15 +152,23 @@ async def main(
             CommandControlAgent instance that uses AdaptiveReasoningLoop
         """
         # Create ToolRegistry with ToolStateManager for dynamic tool control
-        tool_registry = ToolRegistry(tool_state_manager=tool_state_manager)
-        local_provider = LocalToolProvider([get_weather, get_current_location, get_local_datetime])
-
+        tool_registry = ToolRegistry(
+            tool_state_manager=tool_state_manager,
+            call_coalescer=tool_call_coalescer,
+            result_cache=tool_result_cache,
+        )
         # Create MCP provider with status callback for UI feedback
         def mcp_status_callback(message: str):
             """Callback to display MCP tool loading status."""
             logger.info(f"MCP Status: {message}")
 
-        mcp_provider = MCPToolProvider(artifact_manager.clients, status_callback=mcp_status_callback)
+        # The event bus lets the provider invalidate the registry's tool catalog
+        # on reconnects and tools/list_changed notifications
+        mcp_provider = MCPToolProvider(
+            artifact_manager.clients,
+            status_callback=mcp_status_callback,
+            event_bus=artifact_manager.event_bus,
+        )
         tool_registry.register_provider(local_provider)
         tool_registry.register_provider(mcp_provider)
 
@@ -162,6 +193,7 @@ async def main(
             synthesizer=synthesizer,
             config=reasoning_config,
             approval_manager=approval_manager,
+            tool_execution_config=tool_execution_config,
         )
 
         logger.debug("AdaptiveReasoningLoop initialized with session-managed conversation and approval manager")
@@ -257,6 +289,9 @@ Be concise, efficient, and transparent. Use tools purposefully, not performative
     
     logger.info("SessionManager initialized with CommandControlAgent factory")
 
+    # Load the session index (sidebar listing) without deserializing every session
+    await session_manager.restore_all_sessions()
+
     # Get or restore the default session
     # This will either restore from ~/.nxs/sessions/session.json or create new
     session = await session_manager.get_or_create_default_session()
@@ -299,6 +334,10 @@ Be concise, efficient, and transparent. Use tools purposefully, not performative
     try:
         await app.run_async()
     finally:
+        # Finish background state extraction so it is included in the save
+        active_session = session_manager.get_active_session()
+        if active_session is not None:
+            await active_session.stop_state_updates()
         # Ensure conversation summary is synced before saving session state
         await app.ensure_summary_synced()
 
@@ -310,6 +349,9 @@ Be concise, efficient, and transparent. Use tools purposefully, not performative
         # Clean up ArtifactManager connections
         await artifact_manager.cleanup()
 
+        # Stop the local tools' worker pools
+        local_provider.shutdown()
+
 
 def run():
     """Entry point for the Nexus application."""
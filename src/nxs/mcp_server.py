@@ -1,4 +1,5 @@
 from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
 from nxs.utils import read_prompt
 
 mcp = FastMCP("DocumentMCP", log_level="ERROR")
@@ -21,6 +22,7 @@ from mcp.server.fastmcp.prompts import base
 @mcp.tool(
     name="read_doc_contents",
     description="Read the contents of a document and return it as a string.",
+    annotations=ToolAnnotations(readOnlyHint=True),
 )
 def read_document(
     doc_id: str = Field(description="Id of the document to read"),
@@ -34,6 +36,7 @@ def read_document(
 @mcp.tool(
     name="edit_document",
     description="Edit a document by replacing a string in the documents content with a new string",
+    annotations=ToolAnnotations(readOnlyHint=False),
 )
 def edit_document(
     doc_id: str = Field(description="Id of the document that will be edited"),
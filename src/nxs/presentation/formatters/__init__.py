@@ -2,6 +2,7 @@
 Reusable formatter utilities for the Textual presentation layer.
 """
 
+from .markdown_stream import MarkdownBlockSplitter
 from .status import (
     format_artifact_counts_text,
     format_last_check_text,
@@ -13,6 +14,7 @@ from .status import (
 )
 
 __all__ = [
+    "MarkdownBlockSplitter",
     "format_artifact_counts_text",
     "format_last_check_text",
     "format_server_header_text",
@@ -0,0 +1,116 @@
+"""
+Incremental block splitting for streamed markdown.
+"""
+
+from __future__ import annotations
+
+import re
+
+_HEADING_RE = re.compile(r"^#{1,6}\s+")
+_FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})")
+
+
+class MarkdownBlockSplitter:
+    """
+    Split streamed markdown into blocks that are safe to render on their own.
+
+    Chunks are collected in lists and only joined once a line is complete, so
+    feeding many small chunks stays linear in the size of the reply. A block is
+    complete when it is:
+
+    - a paragraph (or list, table, quote) followed by a blank line
+    - a heading line
+    - a fenced code block whose closing fence has arrived
+
+    Everything after the last complete block is the open tail, available via
+    ``pending`` for live previews and returned by ``flush()`` at the end.
+    """
+
+    def __init__(self) -> None:
+        self._partial: list[str] = []  # Chunks of the current, unfinished line
+        self._block_lines: list[str] = []  # Complete lines of the open block
+        self._fence: str | None = None  # Opening fence marker while inside a code block
+
+    @property
+    def in_code_block(self) -> bool:
+        """Whether the open block is an unclosed code fence."""
+        return self._fence is not None
+
+    @property
+    def pending(self) -> str:
+        """Markdown of the open (not yet complete) trailing block."""
+        tail = "".join(self._partial)
+        if not self._block_lines:
+            return tail
+        return "\n".join(self._block_lines) + "\n" + tail
+
+    def feed(self, chunk: str) -> list[str]:
+        """
+        Add a streamed chunk.
+
+        Args:
+            chunk: A piece of the markdown text
+
+        Returns:
+            Blocks completed by this chunk, in order (often empty)
+        """
+        if "\n" not in chunk:
+            if chunk:
+                self._partial.append(chunk)
+            return []
+
+        self._partial.append(chunk)
+        *lines, rest = "".join(self._partial).split("\n")
+        self._partial = [rest] if rest else []
+
+        blocks: list[str] = []
+        for line in lines:
+            self._consume_line(line, blocks)
+        return blocks
+
+    def flush(self) -> str:
+        """
+        Return the open tail and reset the splitter.
+
+        Returns:
+            Remaining markdown (may be empty)
+        """
+        text = self.pending
+        self.reset()
+        return text
+
+    def reset(self) -> None:
+        """Discard all buffered text."""
+        self._partial = []
+        self._block_lines = []
+        self._fence = None
+
+    def _consume_line(self, line: str, blocks: list[str]) -> None:
+        """Route one complete line, appending any finished block to blocks."""
+        if self._fence is not None:
+            self._block_lines.append(line)
+            if line.strip().startswith(self._fence) and not line.strip().strip(self._fence[0]):
+                self._fence = None
+                self._emit(blocks)
+            return
+
+        fence = _FENCE_RE.match(line)
+        if fence:
+            self._emit(blocks)
+            self._fence = fence.group(1)
+            self._block_lines.append(line)
+        elif _HEADING_RE.match(line):
+            self._emit(blocks)
+            blocks.append(line)
+        elif not line.strip():
+            self._emit(blocks)
+        else:
+            self._block_lines.append(line)
+
+    def _emit(self, blocks: list[str]) -> None:
+        """Close the open block, if it has any content."""
+        if self._block_lines:
+            text = "\n".join(self._block_lines)
+            if text.strip():
+                blocks.append(text)
+            self._block_lines = []
@@ -34,6 +34,7 @@ def get_status_icon(status: ConnectionStatus) -> str:
     """Return the emoji used for the given connection status."""
     status_icons = {
         ConnectionStatus.CONNECTED: "🟢",
+        ConnectionStatus.DEGRADED: "🟠",
         ConnectionStatus.DISCONNECTED: "🔴",
         ConnectionStatus.CONNECTING: "🟡",
         ConnectionStatus.RECONNECTING: "🟡",
@@ -46,6 +47,7 @@ def get_status_text(status: ConnectionStatus) -> str:
     """Return the Rich markup representing the connection status."""
     status_texts = {
         ConnectionStatus.CONNECTED: "[green]Connected[/]",
+        ConnectionStatus.DEGRADED: "[yellow]Degraded (slow responses)[/]",
         ConnectionStatus.DISCONNECTED: "[red]Disconnected[/]",
         ConnectionStatus.CONNECTING: "[yellow]Connecting...[/]",
         ConnectionStatus.RECONNECTING: "[yellow]Reconnecting...[/]",
@@ -5,11 +5,14 @@ This handler processes:
 - Query submission and processing
 - Agent loop callbacks (stream chunks, tool calls, etc.)
 - Status updates during query processing
+- Cancellation of the running query
 """
 
 import asyncio
 from typing import TYPE_CHECKING, Callable, Optional, Awaitable
 
+from nxs.application.cancellation import CancellationToken, QueryCancelledError
+from nxs.application.token_usage import TokenUsage
 from nxs.logger import get_logger
 
 if TYPE_CHECKING:
@@ -61,6 +64,31 @@ class QueryHandler:
         self.reasoning_callbacks = reasoning_callbacks or {}
         self.on_conversation_updated = on_conversation_updated
         self.session_getter = session_getter
+        # Usage of the API calls of the current exchange, recorded in the
+        # session state metadata once the exchange completes
+        self._exchange_usage = TokenUsage()
+        self._exchange_cost = 0.0
+        # Token of the query being processed (None when idle)
+        self._cancel_token: Optional[CancellationToken] = None
+
+    @property
+    def is_processing(self) -> bool:
+        """Whether a query is currently being processed."""
+        return self._cancel_token is not None
+
+    def cancel_current_query(self) -> bool:
+        """Cancel the query being processed, if any.
+
+        The API stream and in-flight tool calls are closed immediately, and
+        the conversation is left as it was before the query. Queued queries
+        are not affected.
+
+        Returns:
+            True if a running query was cancelled, False if there was none
+        """
+        if self._cancel_token is None:
+            return False
+        return self._cancel_token.cancel()
 
     async def process_query(self, query: str, query_id: int) -> None:
         """
@@ -82,6 +110,9 @@ class QueryHandler:
                 "Processing query (MCP tools will be available once servers connect)..."
             )
 
+        cancel_token = CancellationToken()
+        self._cancel_token = cancel_token
+
         try:
             # Add assistant message start marker when processing begins
             # This ensures the correct buffer is active when chunks arrive
@@ -108,10 +139,22 @@ class QueryHandler:
             await self.agent_loop.run(
                 query,
                 callbacks=all_callbacks,
+                cancel_token=cancel_token,
             )
 
             logger.info(f"Query processing completed successfully (query_id={query_id})")
 
+        except QueryCancelledError as e:
+            logger.info(f"Query cancelled (query_id={query_id}): {e}")
+            chat = self.chat_panel_getter()
+            chat.finish_assistant_message()
+            chat.add_panel(
+                "[yellow]Query cancelled. The conversation is unchanged.[/]",
+                title="Cancelled",
+                style="yellow",
+            )
+            await self.status_queue.add_info_message("Query cancelled")
+
         except Exception as e:
             # Check if this is a BadRequestError about incomplete tool exchanges
             error_msg = str(e)
@@ -140,6 +183,8 @@ class QueryHandler:
                 )
         finally:
             logger.debug(f"Cleaning up after query processing (query_id={query_id})")
+            if self._cancel_token is cancel_token:
+                self._cancel_token = None
 
             # Refocus the input field so user can continue typing
             self.focus_input()
@@ -147,6 +192,12 @@ class QueryHandler:
     async def _on_start(self) -> None:
         """Called when agent loop starts processing."""
         logger.debug("Agent loop started processing")
+        self._exchange_usage = TokenUsage()
+        self._exchange_cost = 0.0
+        if self.session_getter:
+            session = self.session_getter()
+            if session and hasattr(session, "start_cost_turn"):
+                session.start_cost_turn()
         await self.status_queue.add_info_message("Processing query...")
 
     async def _on_stream_chunk(self, chunk: str) -> None:
@@ -182,6 +233,7 @@ class QueryHandler:
                             await session.state_update_service.on_exchange_complete(
                                 user_msg=user_msg,
                                 assistant_msg=assistant_msg,
+                                metadata={"usage": self._exchange_usage.to_dict(), "cost": self._exchange_cost},
                             )
                             logger.debug("Updated session state with completed exchange")
                 except Exception as e:
@@ -232,23 +284,25 @@ class QueryHandler:
         Handle token usage and cost updates.
 
         Args:
-            usage: Dictionary with 'input_tokens' and 'output_tokens'
+            usage: Usage dictionary (TokenUsage fields plus 'component')
             cost: Cost in USD for this API call
         """
+        token_usage = TokenUsage.from_dict(usage)
         logger.debug(
             f"Token usage: {usage.get('input_tokens', 0)} input, "
-            f"{usage.get('output_tokens', 0)} output, ${cost:.6f} cost"
+            f"{usage.get('output_tokens', 0)} output, "
+            f"{usage.get('cache_read_input_tokens', 0)} cache read, ${cost:.6f} cost"
         )
+        self._exchange_usage = self._exchange_usage + token_usage
+        self._exchange_cost += cost
 
         # Update session conversation cost tracker if available
         # Note: This is for conversation costs from AgentLoop, NOT reasoning costs
         if self.session_getter:
             session = self.session_getter()
             if session and hasattr(session, "conversation_cost_tracker"):
-                session.conversation_cost_tracker.add_usage(
-                    usage.get("input_tokens", 0),
-                    usage.get("output_tokens", 0),
-                    cost,
+                session.conversation_cost_tracker.record_usage(
+                    token_usage, cost, component=usage.get("component")
                 )
 
                 # Update chat panel display with all cost summaries
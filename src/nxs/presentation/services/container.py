@@ -26,6 +26,7 @@ from nxs.domain.events import (
     ArtifactsFetched,
 )
 from nxs.domain.protocols import Cache
+from nxs.domain.types import ConnectionStatus
 from nxs.infrastructure.cache import MemoryCache
 from nxs.logger import get_logger
 
@@ -135,6 +136,7 @@ class ServiceContainer:
         # MCP initialization state
         self._mcp_initialized = False
         self._events_subscribed = False
+        self._late_server_tasks: dict[str, asyncio.Task] = {}
 
     # -------------------------------------------------------------------------
     # Lazy Service Properties
@@ -253,6 +255,7 @@ class ServiceContainer:
         - ConnectionStatusChanged → RefreshService
         - ReconnectProgress → RefreshService
         - ArtifactsFetched → RefreshService
+        - ConnectionStatusChanged → late-joining server reload (autocomplete)
         
         This is idempotent - can be called multiple times safely.
         """
@@ -271,6 +274,10 @@ class ServiceContainer:
             ArtifactsFetched,
             self.mcp_refresher.handle_artifacts_fetched,
         )
+        self.event_bus.subscribe(
+            ConnectionStatusChanged,
+            self._handle_server_connected,
+        )
         
         self._events_subscribed = True
         logger.debug("Event subscriptions configured")
@@ -289,6 +296,9 @@ class ServiceContainer:
 
     async def stop(self) -> None:
         """Stop all services gracefully."""
+        for task in self._late_server_tasks.values():
+            task.cancel()
+        self._late_server_tasks.clear()
         if self._mcp_refresher:
             await self._mcp_refresher.stop_periodic_refresh()
         if self._query_queue:
@@ -405,3 +415,57 @@ class ServiceContainer:
             except Exception as load_error:
                 logger.error(f"Failed to load resources after initialization error: {load_error}")
                 return [], []
+
+    def _handle_server_connected(self, event: ConnectionStatusChanged) -> None:
+        """
+        Reload resources/commands when a server connects after startup.
+
+        initialize_mcp() returns as soon as the first server is ready, so
+        servers that finish connecting later only reach autocomplete through
+        this handler.
+
+        Args:
+            event: ConnectionStatusChanged event
+        """
+        if not self._mcp_initialized or event.status != ConnectionStatus.CONNECTED:
+            return
+        if event.previous_status in (ConnectionStatus.CONNECTED, ConnectionStatus.DEGRADED):
+            return
+
+        # Coalesce status flapping of the same server into a single reload
+        server_name = event.server_name
+        previous = self._late_server_tasks.get(server_name)
+        if previous and not previous.done():
+            previous.cancel()
+        task = asyncio.create_task(self._reload_after_server_joined(server_name))
+        self._late_server_tasks[server_name] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if self._late_server_tasks.get(server_name) is done:
+                del self._late_server_tasks[server_name]
+
+        task.add_done_callback(_forget)
+
+    async def _reload_after_server_joined(self, server_name: str) -> None:
+        """
+        Reload resources/commands and re-index the server's prompts.
+
+        Args:
+            server_name: Name of the server that just connected
+        """
+        try:
+            # Give the refresher's artifact fetch a head start (same delay it uses)
+            await asyncio.sleep(0.5)
+            resources = await self.artifact_manager.get_resource_list()
+            commands = await self.artifact_manager.get_command_names()
+            self._on_resources_loaded(resources)
+            self._on_commands_loaded(commands)
+            logger.info(
+                f"Server '{server_name}' joined: {len(resources)} resource(s), {len(commands)} command(s) available"
+            )
+
+            await self.prompt_service.refresh_server(server_name)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error reloading artifacts after '{server_name}' connected: {e}")
@@ -323,6 +323,18 @@ class RefreshService:
         status = event.status
         logger.info(f"Connection status changed for {server_name}: {status.value}")
 
+        # Degrading and recovering keep the session and its artifacts: only the status changes
+        if ConnectionStatus.DEGRADED in (status, event.previous_status) and status in (
+            ConnectionStatus.CONNECTED,
+            ConnectionStatus.DEGRADED,
+        ):
+            try:
+                self.mcp_panel_getter().update_server_status(server_name, status)
+                self.schedule_refresh()
+            except Exception as e:
+                logger.error(f"Error updating MCP panel status: {e}")
+            return
+
         # Check if this is a real status change (not just setting to already-connected)
         try:
             client = self.artifact_manager.clients.get(server_name)
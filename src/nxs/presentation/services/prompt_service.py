@@ -3,7 +3,8 @@ PromptService for managing prompt caching and preloading.
 
 This service handles:
 - Caching prompt information and schemas
-- Preloading prompt data for all commands
+- Preloading prompt data for all commands from a bulk per-server index
+- Refreshing the index for a single server when it reconnects
 - Formatting prompt arguments for display
 - Providing cached prompt data to other components
 """
@@ -49,41 +50,102 @@ class PromptService:
         self.artifact_manager = artifact_manager
         self._prompt_info_cache: Cache[str, str | None] = prompt_info_cache or MemoryCache[str, str | None]()
         self._prompt_schema_cache: Cache[str, tuple] = prompt_schema_cache or MemoryCache[str, tuple]()
+        # Prompt index: which commands each server contributed to the caches
+        self._server_commands: dict[str, set[str]] = {}
 
     async def preload_all(self, commands: list[str]) -> None:
         """
         Preload prompt information for all commands.
 
-        This method fetches prompt information for all commands and
-        caches both the formatted argument info strings and the full
-        prompt schemas.
+        Builds the prompt index from a single list_prompts() call per server
+        (run concurrently) and fills both the info and schema caches in one
+        pass. When several servers expose the same prompt name, the first
+        server wins, matching find_prompt().
 
         Args:
             commands: List of command names to preload
         """
         try:
             logger.info(f"Preloading prompt information for {len(commands)} commands...")
+            prompts_by_server = await self.artifact_manager.get_prompts_by_server()
+            wanted = set(commands)
             loaded_count = 0
 
-            for command in commands:
-                prompt_info = await self.artifact_manager.find_prompt(command)
-                if prompt_info:
-                    prompt, server_name = prompt_info
-                    # Store full prompt object for argument expansion
-                    self._prompt_schema_cache.set(command, (prompt, server_name))
-                    # Extract argument info string for display
-                    arg_info = self._format_prompt_arguments(prompt)
-                    self._prompt_info_cache.set(command, arg_info)
-                    loaded_count += 1
-                    logger.debug(f"Preloaded info for '{command}': {arg_info}")
-
-            logger.info(f"Successfully preloaded prompt information for {loaded_count} commands")
+            for server_name, prompts in prompts_by_server.items():
+                loaded_count += self._index_server(server_name, prompts, wanted)
+
+            logger.info(
+                f"Successfully preloaded prompt information for {loaded_count} commands "
+                f"from {len(prompts_by_server)} server(s)"
+            )
         except Exception as e:
             logger.error(f"Failed to preload prompt info: {e}")
             import traceback
 
             logger.error(traceback.format_exc())
 
+    async def refresh_server(self, server_name: str) -> None:
+        """
+        Re-index the prompts of a single server (e.g. after it reconnects).
+
+        Only this server's entries are replaced; the rest of the index is
+        left untouched. If the fetch fails, the previous entries are kept.
+
+        Args:
+            server_name: Name of the server to re-index
+        """
+        try:
+            prompts_by_server = await self.artifact_manager.get_prompts_by_server([server_name])
+        except Exception as e:
+            logger.error(f"Failed to refresh prompt info for '{server_name}': {e}")
+            return
+        if server_name not in prompts_by_server:
+            logger.debug(f"No prompt listing for '{server_name}', keeping cached prompt info")
+            return
+
+        for command in self._server_commands.pop(server_name, set()):
+            self._prompt_schema_cache.clear(command)
+            self._prompt_info_cache.clear(command)
+
+        loaded_count = self._index_server(server_name, prompts_by_server[server_name])
+        logger.info(f"Refreshed prompt information for '{server_name}': {loaded_count} command(s)")
+
+    def _index_server(
+        self,
+        server_name: str,
+        prompts: list["Prompt"],
+        wanted: set[str] | None = None,
+    ) -> int:
+        """
+        Cache schema and argument info for a server's prompts.
+
+        Args:
+            server_name: Server the prompts came from
+            prompts: Prompts listed by the server
+            wanted: Only index these command names (all if None)
+
+        Returns:
+            Number of commands indexed
+        """
+        owned = self._server_commands.setdefault(server_name, set())
+        loaded_count = 0
+        for prompt in prompts:
+            command = prompt.name
+            if wanted is not None and command not in wanted:
+                continue
+            # Keep the first server's prompt on name collisions
+            if any(command in cmds for name, cmds in self._server_commands.items() if name != server_name):
+                continue
+            # Store full prompt object for argument expansion
+            self._prompt_schema_cache.set(command, (prompt, server_name))
+            # Extract argument info string for display
+            arg_info = self._format_prompt_arguments(prompt)
+            self._prompt_info_cache.set(command, arg_info)
+            owned.add(command)
+            loaded_count += 1
+            logger.debug(f"Preloaded info for '{command}': {arg_info}")
+        return loaded_count
+
     def get_cached_info(self, command: str) -> str | None:
         """
         Get cached prompt argument info for a command.
@@ -6,7 +6,7 @@ import asyncio
 from typing import Callable, Optional, Sequence
 from textual.app import App, ComposeResult
 from textual.message import Message
-from textual.widgets import Header
+from textual.widgets import Header, Static
 from textual.containers import Container, Vertical, Horizontal
 from textual.binding import Binding
 
@@ -29,6 +29,7 @@ from nxs.application.approval import ApprovalManager, ApprovalRequest
 from nxs.application.session import Session
 from nxs.application.session_manager import SessionManager
 from nxs.application.summarization import SummarizationService
+from nxs.application.token_usage import TokenUsage
 from nxs.domain.events import EventBus
 from nxs.domain.protocols import Cache
 from nxs.logger import get_logger
@@ -79,6 +80,7 @@ class NexusApp(App):
         Binding("ctrl+c", "quit", "Quit", priority=True, show=False),
         Binding("tab", "focus_next", "Next Field", show=False),
         Binding("shift+tab", "focus_previous", "Previous Field", show=False),
+        Binding("escape", "cancel_query", "Cancel Query"),
         Binding("ctrl+l", "clear_chat", "Clear Chat"),
         Binding("ctrl+t", "toggle_thinking", "Toggle Thinking", show=True),
         Binding("ctrl+s", "toggle_sidebar", "Toggle Sidebar", show=True),
@@ -185,7 +187,10 @@ class NexusApp(App):
                 yield LeftSidebar(id="left-sidebar")
 
                 with Vertical(id="main-content"):
-                    yield ChatPanel(session_name=self._session_name, id="chat")
+                    # Open block of a streamed reply, until the chat log receives it
+                    stream_preview = Static(id="chat-stream-preview")
+                    yield ChatPanel(session_name=self._session_name, stream_preview=stream_preview, id="chat")
+                    yield stream_preview
 
                     # Unified thinking panel: reasoning + tool execution (collapsible with Ctrl+T)
                     yield ThinkingPanel(id="thinking")
@@ -258,6 +263,7 @@ class NexusApp(App):
                 "Type [cyan]/[/] to execute commands\n"
                 "Press [cyan]Ctrl+Q[/] to quit\n"
                 "Press [cyan]Ctrl+L[/] to clear chat\n"
+                "Press [cyan]Esc[/] to cancel a running query\n"
                 "Press [cyan]Ctrl+R[/] to toggle reasoning trace",
                 title="Getting Started",
                 style="green",
@@ -481,6 +487,11 @@ class NexusApp(App):
         """Handle app quit - cleanup background tasks."""
         logger.info("Quitting application, cleaning up...")
 
+        # Finish background state extraction so it is included in the save
+        session = self.session_manager.get_active_session() if self.session_manager else self.session
+        if session is not None:
+            await session.stop_state_updates()
+
         # Ensure summary metadata is synced before shutting down
         await self.ensure_summary_synced()
 
@@ -495,6 +506,13 @@ class NexusApp(App):
         # Exit the app
         self.exit()
 
+    def action_cancel_query(self) -> None:
+        """Cancel the query that is currently running (Esc)."""
+        if not self.services.query_handler.cancel_current_query():
+            logger.debug("Cancel requested, but no query is running")
+            return
+        logger.info("Cancelling the running query")
+
     def action_clear_chat(self) -> None:
         """Clear the chat panel (Ctrl+L)."""
         chat = self._get_chat_panel()
@@ -691,10 +709,8 @@ class NexusApp(App):
             try:
                 # Update session reasoning cost tracker (separate from conversation/summarization)
                 if self.session and hasattr(self.session, "reasoning_cost_tracker"):
-                    self.session.reasoning_cost_tracker.add_usage(
-                        usage.get("input_tokens", 0),
-                        usage.get("output_tokens", 0),
-                        cost,
+                    self.session.reasoning_cost_tracker.record_usage(
+                        TokenUsage.from_dict(usage), cost, component=usage.get("component")
                     )
                 
                 # Update chat panel with all cost summaries
@@ -742,10 +758,8 @@ class NexusApp(App):
             try:
                 # Update session summarization cost tracker (separate from conversation/reasoning)
                 if self.session and hasattr(self.session, "summarization_cost_tracker"):
-                    self.session.summarization_cost_tracker.add_usage(
-                        usage.get("input_tokens", 0),
-                        usage.get("output_tokens", 0),
-                        cost,
+                    self.session.summarization_cost_tracker.record_usage(
+                        TokenUsage.from_dict(usage), cost, component=usage.get("component")
                     )
                 
                 # Update chat panel with all cost summaries
@@ -1214,11 +1228,11 @@ class NexusApp(App):
             self.tool_state_manager.disable_tool(event.tool_name)
             logger.info(f"Tool disabled: {event.tool_name}")
 
-        # Mark tool registry as dirty to refresh tools on next query
-        # The ToolRegistry will automatically filter enabled tools
+        # Invalidate the tool catalog so the next query sees the change.
+        # Registries sharing this ToolStateManager are also notified via its listeners.
         try:
             tool_registry = self.agent_loop.reasoning_loop.tool_registry
-            tool_registry._cache_dirty = True
+            tool_registry.invalidate_tool_catalog("tool toggled")
             logger.debug("Tool registry marked for refresh")
         except Exception as e:
             logger.debug(f"Could not access tool registry for refresh: {e}")
@@ -4,6 +4,7 @@ Clean, simple version that works WITH Rich, not against it.
 """
 
 import re
+import time
 
 from rich.console import Group
 from rich.markdown import Markdown
@@ -11,7 +12,10 @@ from rich.padding import Padding
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.text import Text
-from textual.widgets import RichLog
+from textual.timer import Timer
+from textual.widgets import RichLog, Static
+
+from nxs.presentation.formatters import MarkdownBlockSplitter
 
 
 class ChatPanel(RichLog):
@@ -22,6 +26,9 @@ class ChatPanel(RichLog):
     - Auto-scrolling to bottom on new messages
     - Rich markup for colored/styled text
     - Proper markdown rendering for assistant messages
+    - Incremental rendering of streamed replies (finished blocks are written
+      once; only the open trailing block is re-rendered, in a separate
+      preview widget, at most STREAM_FPS times per second)
     - Right-aligned assistant label with indented content
     - Session name in border title
     """
@@ -29,12 +36,16 @@ class ChatPanel(RichLog):
     BORDER_TITLE = "Chat"
     # Standard indentation for assistant messages (left padding in chars)
     ASSISTANT_INDENT = 40
+    # Maximum re-renders per second of the open block while streaming
+    STREAM_FPS = 10
 
-    def __init__(self, session_name: str = "default", **kwargs):
+    def __init__(self, session_name: str = "default", stream_preview: Static | None = None, **kwargs):
         """Initialize the chat panel with Rich markup enabled.
         
         Args:
             session_name: Name of the active session to display in border
+            stream_preview: Optional Static (laid out below the panel) showing
+                the open block of a streamed reply until it is written to the log
             **kwargs: Additional arguments passed to RichLog
         """
         super().__init__(
@@ -45,8 +56,15 @@ class ChatPanel(RichLog):
             **kwargs,
         )
         # State for assistant message streaming
-        self._assistant_buffer = ""
+        self._stream_splitter = MarkdownBlockSplitter()
         self._assistant_active = False
+        self._assistant_blocks_written = 0
+        # Whether the next block needs a blank line before it (plain markdown
+        # blocks don't end with spacing; headers and code blocks do)
+        self._block_gap_pending = False
+        self._stream_preview = stream_preview
+        self._tail_timer: Timer | None = None
+        self._last_tail_render = 0.0
         self._session_name = session_name
         self._update_border_title()
     
@@ -158,40 +176,48 @@ class ChatPanel(RichLog):
         self.write(label)
         self.write("\n\n")
 
-        # Reset buffer for new message
-        self._assistant_buffer = ""
+        # Reset streaming state for new message
+        self._reset_stream_state()
         self._assistant_active = True
 
     def add_assistant_chunk(self, chunk: str):
         """
-        Accumulate assistant response chunks.
+        Add a streamed assistant response chunk.
+
+        Completed markdown blocks (paragraphs, headers, closed code fences) are
+        written immediately; the open trailing block is previewed and
+        re-rendered at most STREAM_FPS times per second.
 
         Args:
             chunk: A piece of the assistant's response
         """
-        if self._assistant_active:
-            self._assistant_buffer += chunk
+        if not self._assistant_active:
+            return
+
+        blocks = self._stream_splitter.feed(chunk)
+        if blocks:
+            self._clear_tail_preview()
+            for block in blocks:
+                self._write_assistant_block(block)
+        self._schedule_tail_preview()
 
     def finish_assistant_message(self):
         """
-        Render the complete assistant message as formatted markdown.
+        Render the rest of the assistant message as formatted markdown.
 
         The message is displayed with left padding to create the indented layout.
         """
-        if self._assistant_active and self._assistant_buffer:
-            # BUGFIX: Render markdown with custom header handling to prevent centering
-            md = self._create_left_aligned_markdown(self._assistant_buffer)
-
-            # Add left padding to create the indented right-side layout
-            padded_md = self._indent_for_assistant(md)
-
-            # Write the formatted markdown
-            self.write(padded_md)
+        if not self._assistant_active:
+            return
+
+        self._clear_tail_preview()
+        tail = self._stream_splitter.flush()
+        if tail.strip():
+            self._write_assistant_block(tail)
+        if self._assistant_blocks_written:
             self.write("\n\n")
 
-            # Reset state
-            self._assistant_buffer = ""
-            self._assistant_active = False
+        self._reset_stream_state()
 
     def add_assistant_message(self, text: str):
         """
@@ -256,8 +282,65 @@ class ChatPanel(RichLog):
 
     def clear_chat(self):
         """Clear all chat history."""
+        self._clear_tail_preview()
         self.clear()
 
+    def _reset_stream_state(self) -> None:
+        """Forget any in-progress streamed message."""
+        if self._tail_timer is not None:
+            self._tail_timer.stop()
+            self._tail_timer = None
+        self._stream_splitter.reset()
+        self._assistant_active = False
+        self._assistant_blocks_written = 0
+        self._block_gap_pending = False
+        self._clear_tail_preview()
+
+    def _write_assistant_block(self, markdown_text: str) -> None:
+        """
+        Write one complete markdown block of a streamed assistant message.
+
+        Args:
+            markdown_text: Markdown of a single block
+        """
+        if self._block_gap_pending:
+            self.write(Text())
+        # BUGFIX: Render markdown with custom header handling to prevent centering
+        renderable = self._create_left_aligned_markdown(markdown_text)
+        self.write(self._indent_for_assistant(renderable))
+        self._block_gap_pending = isinstance(renderable, Markdown)
+        self._assistant_blocks_written += 1
+
+    def _schedule_tail_preview(self) -> None:
+        """Re-render the open block once the frame interval has elapsed."""
+        if self._stream_preview is None or self._tail_timer is not None:
+            return  # A render is already due
+        elapsed = time.monotonic() - self._last_tail_render
+        delay = max(0.0, 1.0 / self.STREAM_FPS - elapsed)
+        self._tail_timer = self.set_timer(delay, self._render_tail_preview)
+
+    def _render_tail_preview(self) -> None:
+        """Show the current open block in the preview widget."""
+        self._tail_timer = None
+        if not self._assistant_active or self._stream_preview is None:
+            return
+
+        tail = self._stream_splitter.pending
+        if not tail.strip():
+            self._clear_tail_preview()
+            return
+
+        self._stream_preview.update(self._indent_for_assistant(self._create_left_aligned_markdown(tail)))
+        self._stream_preview.display = True
+        self._last_tail_render = time.monotonic()
+
+    def _clear_tail_preview(self) -> None:
+        """Empty and hide the preview widget."""
+        if self._stream_preview is None or not self._stream_preview.display:
+            return
+        self._stream_preview.update("")
+        self._stream_preview.display = False
+
     def _indent_for_assistant(self, renderable) -> Padding:
         """
         Apply standard indentation for assistant messages.
@@ -0,0 +1,68 @@
+"""Tests for MCPAuthClient call deadlines and cancellation."""
+
+import asyncio
+import json
+
+import pytest
+
+from nxs.domain.types import ConnectionStatus
+from nxs.infrastructure.mcp.client import MCPAuthClient
+
+
+class HangingSession:
+    """Session stand-in whose requests never complete."""
+
+    def __init__(self) -> None:
+        self._request_id = 7
+        self.notifications: list = []
+
+    async def _hang(self):
+        self._request_id += 1
+        await asyncio.Event().wait()
+
+    async def call_tool(self, name, arguments):
+        return await self._hang()
+
+    async def read_resource(self, uri):
+        return await self._hang()
+
+    async def send_notification(self, notification):
+        self.notifications.append(notification)
+
+
+def _connected_client(**kwargs) -> tuple[MCPAuthClient, HangingSession]:
+    client = MCPAuthClient("https://example.com/mcp", **kwargs)
+    session = HangingSession()
+    client.connection_manager.set_session(session)
+    return client, session
+
+
+@pytest.mark.asyncio
+async def test_tool_call_timeout_returns_structured_error_and_cancels():
+    client, session = _connected_client(call_timeout=5.0, tool_timeouts={"slow": 0.01})
+
+    result = await client.call_tool("slow", {"q": "x"})
+
+    assert result.isError
+    payload = json.loads(result.content[0].text)
+    assert payload["error"] == "timeout"
+    assert payload["tool"] == "slow"
+    assert payload["timeout_seconds"] == 0.01
+    # The abandoned request (id 7) is cancelled on the server
+    assert len(session.notifications) == 1
+    assert session.notifications[0].root.params.requestId == 7
+    assert client.connection_status == ConnectionStatus.DEGRADED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_sends_cancellation():
+    client, session = _connected_client(call_timeout=None)
+
+    task = asyncio.create_task(client.read_resource("docs://documents"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(session.notifications) == 1
+    assert client.connection_status == ConnectionStatus.CONNECTED
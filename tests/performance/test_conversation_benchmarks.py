@@ -0,0 +1,46 @@
+"""Performance benchmarks for Conversation.get_messages_for_api.
+
+Measures the per-call cost of building the API payload as the history grows.
+The payload is maintained incrementally, so the cost of a call should stay
+flat instead of growing with the number of messages.
+"""
+
+import time
+
+from nxs.application.conversation import Conversation
+
+
+def _tool_turn(conv: Conversation, i: int) -> None:
+    conv.add_user_message(f"question {i} " + "x" * 400)
+    conv.add_assistant_text(f"calling tool {i}")
+    conv.add_user_message([{"type": "tool_result", "tool_use_id": f"t{i}", "content": "y" * 400}])
+    conv.add_assistant_text(f"answer {i}")
+
+
+def _per_call_seconds(history_turns: int, calls: int = 200) -> float:
+    """Best-of-5 average time of an API call that follows one new message."""
+    conv = Conversation(enable_caching=True)
+    for i in range(history_turns):
+        _tool_turn(conv, i)
+    conv.get_messages_for_api()
+
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for i in range(calls):
+            conv.add_user_message([{"type": "tool_result", "tool_use_id": f"r{i}", "content": "z"}])
+            conv.get_messages_for_api()
+            conv.add_assistant_text("next tool call")
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def test_get_messages_for_api_cost_is_flat():
+    """A 2,000-message history costs about as much per call as a 100-message one."""
+    small = _per_call_seconds(25)
+    large = _per_call_seconds(500)
+
+    print(f"\nget_messages_for_api: {small * 1e6:.1f}us (100 msgs), {large * 1e6:.1f}us (2000 msgs)")
+
+    # Copying the history on every call would make the large case ~20x slower
+    assert large < small * 4
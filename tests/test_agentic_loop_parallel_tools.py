@@ -0,0 +1,123 @@
+"""Tests for concurrent tool execution in AgentLoop._execute_tools."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from nxs.application.agentic_loop import AgentLoop, ToolExecutionConfig
+from nxs.application.conversation import Conversation
+from nxs.application.tool_registry import ToolRegistry
+from tests.reasoning.conftest import MockClaude
+
+
+class SlowToolProvider:
+    """Tool provider whose tools sleep, recording peak concurrency."""
+
+    def __init__(self, name: str = "slow", delays: dict[str, float] | None = None):
+        self._name = name
+        self._delays = delays or {"tool_a": 0.05, "tool_b": 0.01, "tool_c": 0.03}
+        self.in_flight = 0
+        self.peak = 0
+
+    @property
+    def provider_name(self) -> str:
+        return self._name
+
+    async def get_tool_definitions(self) -> list[dict]:
+        return [
+            {"name": name, "description": name, "input_schema": {"type": "object", "properties": {}}}
+            for name in self._delays
+        ]
+
+    async def execute_tool(self, tool_name: str, arguments: dict) -> str:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self._delays[tool_name])
+            if arguments.get("fail"):
+                raise RuntimeError("boom")
+            return f"{tool_name} done"
+        finally:
+            self.in_flight -= 1
+
+
+def _block(index: int, name: str, **arguments) -> SimpleNamespace:
+    return SimpleNamespace(id=f"toolu_{index}", name=name, input=arguments, type="tool_use")
+
+
+async def _make_agent(provider: SlowToolProvider, config: ToolExecutionConfig) -> AgentLoop:
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    await registry.get_tool_definitions_for_api()
+    return AgentLoop(
+        llm=MockClaude(),
+        conversation=Conversation(enable_caching=False),
+        tool_registry=registry,
+        tool_execution_config=config,
+    )
+
+
+def _tool_results(agent: AgentLoop) -> list[dict]:
+    return agent.conversation.get_messages()[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_results_keep_block_order():
+    """Results are added in block order even if tools finish out of order."""
+    provider = SlowToolProvider()
+    agent = await _make_agent(provider, ToolExecutionConfig(parallel=True))
+    blocks = [_block(0, "tool_a"), _block(1, "tool_b"), _block(2, "tool_c")]
+
+    await agent._execute_tools(blocks, {})
+
+    results = _tool_results(agent)
+    assert [r["tool_use_id"] for r in results] == ["toolu_0", "toolu_1", "toolu_2"]
+    assert [r["content"] for r in results] == ["tool_a done", "tool_b done", "tool_c done"]
+    assert provider.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_runs_one_at_a_time():
+    """Default config keeps the sequential behaviour."""
+    provider = SlowToolProvider()
+    agent = await _make_agent(provider, ToolExecutionConfig())
+
+    await agent._execute_tools([_block(0, "tool_a"), _block(1, "tool_b")], {})
+
+    assert provider.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_caps_are_respected():
+    """Global and per-provider caps bound the number of in-flight calls."""
+    provider = SlowToolProvider()
+    agent = await _make_agent(
+        provider,
+        ToolExecutionConfig(parallel=True, max_concurrency=3, provider_concurrency={"slow": 2}),
+    )
+    blocks = [_block(i, name) for i, name in enumerate(["tool_a", "tool_b", "tool_c", "tool_a"])]
+
+    await agent._execute_tools(blocks, {})
+
+    assert provider.peak == 2
+    assert len(_tool_results(agent)) == 4
+
+
+@pytest.mark.asyncio
+async def test_parallel_failure_does_not_abort_siblings():
+    """A failing tool yields an error result and callbacks fire for every call."""
+    provider = SlowToolProvider()
+    agent = await _make_agent(provider, ToolExecutionConfig(parallel=True))
+    notified: list[tuple[str, bool]] = []
+
+    async def on_tool_result(name: str, result: str, success: bool) -> None:
+        notified.append((name, success))
+
+    blocks = [_block(0, "tool_a", fail=True), _block(1, "tool_b")]
+    await agent._execute_tools(blocks, {"on_tool_result": on_tool_result})
+
+    results = _tool_results(agent)
+    assert "boom" in results[0]["content"]
+    assert results[1]["content"] == "tool_b done"
+    assert sorted(notified) == [("tool_a", False), ("tool_b", True)]
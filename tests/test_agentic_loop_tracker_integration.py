@@ -18,6 +18,9 @@ from tests.reasoning.conftest import MockClaude
 class MockToolProvider:
     """Mock tool provider for testing."""
 
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+
     @property
     def provider_name(self) -> str:
         return "mock"
@@ -32,11 +35,13 @@ class MockToolProvider:
                     "properties": {"query": {"type": "string"}},
                     "required": ["query"],
                 },
+                "cache_policy": {"ttl": 600},
             }
         ]
 
     async def execute_tool(self, tool_name: str, arguments: dict) -> str:
         """Execute tool with deterministic results for testing."""
+        self.calls.append((tool_name, arguments))
         if tool_name == "test_tool":
             query = arguments.get("query", "")
             return f"Result for query: {query}"
@@ -56,11 +61,16 @@ def mock_claude():
 
 
 @pytest.fixture
-def tool_registry():
+def tool_provider():
+    """Create mock tool provider."""
+    return MockToolProvider()
+
+
+@pytest.fixture
+def tool_registry(tool_provider):
     """Create tool registry with mock provider."""
     registry = ToolRegistry()
-    provider = MockToolProvider()
-    registry.register_provider(provider)
+    registry.register_provider(tool_provider)
     return registry
 
 
@@ -109,8 +119,8 @@ async def test_execute_with_tool_tracking_basic(agent_loop, tracker):
 
 
 @pytest.mark.asyncio
-async def test_tool_caching(agent_loop, tracker):
-    """Test that tool results are cached and reused."""
+async def test_tool_caching(agent_loop, tool_provider, tracker):
+    """Test that tool results are reused from the registry's result cache."""
     tracker.start_attempt(ExecutionStrategy.DIRECT)
 
     # First execution - should execute tool
@@ -136,15 +146,9 @@ async def test_tool_caching(agent_loop, tracker):
         use_streaming=False,
     )
 
-    # Should have logged cached execution
+    # Both calls are logged, but the provider only ran the tool once
     assert len(tracker.tool_executions) > initial_exec_count
-
-    # Find the cached execution
-    cached_execs = [
-        e for e in tracker.tool_executions[initial_exec_count:]
-        if e.execution_time_ms == 0.0  # Cached executions have 0ms time
-    ]
-    assert len(cached_execs) > 0
+    assert tool_provider.calls == [("test_tool", {"query": "cached"})]
 
 
 @pytest.mark.asyncio
@@ -323,3 +327,24 @@ async def test_tool_cache_different_arguments(agent_loop, tracker):
     ]
     assert "query1" in queries or "query2" in queries
 
+
+
+@pytest.mark.asyncio
+async def test_tracked_execution_runs_in_conversation_fork(tool_registry, tracker):
+    """Subtask traffic goes to a fork; the main history is left untouched."""
+    conversation = Conversation(enable_caching=False)
+    conversation.add_user_message("Earlier question")
+    agent = AgentLoop(
+        llm=MockClaude(responses=["Subtask answer"]),
+        conversation=conversation,
+        tool_registry=tool_registry,
+    )
+    agent._subtask_conversations = []
+
+    result = await agent._execute_with_tool_tracking("Subtask query", tracker=tracker)
+
+    assert result == "Subtask answer"
+    assert conversation.get_message_count() == 1
+    [fork] = agent._subtask_conversations
+    assert fork.get_message_count() == 3
+    assert fork.get_messages()[1]["content"] == "Subtask query"
@@ -0,0 +1,80 @@
+"""Tests for concurrent artifact fetching in ArtifactRepository."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from nxs.application.artifacts import ArtifactRepository
+
+
+class FakeClient:
+    """MCP client whose list calls sleep for a fixed delay."""
+
+    def __init__(self, name: str, delay: float = 0.05):
+        self.name = name
+        self.delay = delay
+        self.is_connected = True
+
+    async def _list(self, kind: str) -> list:
+        await asyncio.sleep(self.delay)
+        item = SimpleNamespace(name=f"{self.name}-{kind}", description=kind, uri=f"{self.name}://{kind}")
+        return [item]
+
+    async def list_tools(self) -> list:
+        return await self._list("tool")
+
+    async def list_prompts(self) -> list:
+        return await self._list("prompt")
+
+    async def list_resources(self) -> list:
+        return await self._list("resource")
+
+
+def _elapsed(loop: asyncio.AbstractEventLoop, start: float) -> float:
+    return loop.time() - start
+
+
+@pytest.mark.asyncio
+async def test_servers_and_categories_fetched_concurrently():
+    """Three servers x three categories take about one round-trip, not nine."""
+    clients = {name: FakeClient(name) for name in ("a", "b", "c")}
+    repository = ArtifactRepository(lambda: clients)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    artifacts = await repository.get_all_servers_artifacts(timeout=60.0)
+
+    assert _elapsed(loop, start) < 0.2
+    assert list(artifacts) == ["a", "b", "c"]
+    assert artifacts["b"]["tools"] == [{"name": "b-tool", "description": "tool"}]
+    assert artifacts["c"]["resources"] == [{"name": "c://resource", "description": "resource"}]
+
+
+@pytest.mark.asyncio
+async def test_hung_server_does_not_starve_others():
+    """A server past its own deadline comes back empty; the others are unaffected."""
+    clients = {"fast": FakeClient("fast"), "hung": FakeClient("hung", delay=5.0)}
+    repository = ArtifactRepository(lambda: clients, server_timeout=0.1)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    artifacts = await repository.get_all_servers_artifacts(timeout=60.0)
+    tools = await repository.get_tools()
+
+    assert _elapsed(loop, start) < 0.5
+    assert artifacts["hung"] == {"tools": [], "prompts": [], "resources": []}
+    assert len(artifacts["fast"]["prompts"]) == 1
+    assert [tool.name for tool in tools] == ["fast-tool"]
+
+
+@pytest.mark.asyncio
+async def test_find_prompt_prefers_first_server():
+    """find_prompt keeps the sequential search's server-order precedence."""
+    clients = {"first": FakeClient("x", delay=0.05), "second": FakeClient("x", delay=0.0)}
+    repository = ArtifactRepository(lambda: clients)
+
+    found = await repository.find_prompt("x-prompt")
+
+    assert found is not None
+    assert found[1] == "first"
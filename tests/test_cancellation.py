@@ -0,0 +1,149 @@
+"""Tests for cancelling a running query via CancellationToken."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from nxs.application.agentic_loop import AgentLoop
+from nxs.application.cancellation import CancellationToken, QueryCancelledError
+from nxs.application.conversation import Conversation
+from nxs.application.tool_registry import ToolRegistry
+
+
+class BlockingToolProvider:
+    """Provider whose tool runs until cancelled."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    @property
+    def provider_name(self) -> str:
+        return "blocking"
+
+    async def get_tool_definitions(self) -> list[dict]:
+        return [{"name": "slow_search", "description": "", "input_schema": {"type": "object", "properties": {}}}]
+
+    async def execute_tool(self, tool_name: str, arguments: dict) -> str:
+        self.started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "done"
+
+
+class ToolUseLLM:
+    """LLM stand-in that always requests slow_search."""
+
+    model = "claude-test"
+
+    async def create_message(self, messages, **kwargs):
+        block = SimpleNamespace(type="tool_use", id="toolu_1", name="slow_search", input={})
+        return SimpleNamespace(content=[block], stop_reason="tool_use", usage=None)
+
+
+class HangingStream:
+    """Message stream that sends one text delta, then waits forever."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    def __aiter__(self):
+        return self._events()
+
+    async def _events(self):
+        yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text="Hel"))
+        self.started.set()
+        await asyncio.sleep(60)
+        yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text="lo"))
+
+
+def _streaming_llm(stream: HangingStream) -> SimpleNamespace:
+    messages = SimpleNamespace(stream=lambda **params: stream)
+    return SimpleNamespace(model="claude-test", async_client=SimpleNamespace(messages=messages))
+
+
+async def _cancel_when(event: asyncio.Event, token: CancellationToken) -> None:
+    await asyncio.wait_for(event.wait(), timeout=1)
+    token.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cancel_closes_stream_and_restores_conversation():
+    conversation = Conversation(enable_caching=False)
+    conversation.add_user_message("earlier question")
+    stream = HangingStream()
+    agent = AgentLoop(llm=_streaming_llm(stream), conversation=conversation, tool_registry=ToolRegistry())
+    token = CancellationToken()
+    chunks: list[str] = []
+
+    async def on_stream_chunk(chunk: str) -> None:
+        chunks.append(chunk)
+
+    canceller = asyncio.ensure_future(_cancel_when(stream.started, token))
+    with pytest.raises(QueryCancelledError):
+        await agent.run("new question", callbacks={"on_stream_chunk": on_stream_chunk}, cancel_token=token)
+    await canceller
+
+    assert chunks == ["Hel"]
+    assert stream.closed
+    assert conversation.get_message_count() == 1
+    assert conversation.get_messages_for_api()[-1]["content"] == "earlier question"
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_tool_call_leaves_no_dangling_tool_use():
+    provider = BlockingToolProvider()
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    conversation = Conversation(enable_caching=False)
+    agent = AgentLoop(llm=ToolUseLLM(), conversation=conversation, tool_registry=registry)
+    token = CancellationToken()
+
+    canceller = asyncio.ensure_future(_cancel_when(provider.started, token))
+    with pytest.raises(QueryCancelledError):
+        await agent.run("search something", use_streaming=False, cancel_token=token)
+    await canceller
+
+    assert provider.cancelled
+    assert conversation.get_message_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_token_stops_before_any_work():
+    provider = BlockingToolProvider()
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    token = CancellationToken()
+    token.cancel("shutting down")
+
+    with pytest.raises(QueryCancelledError, match="shutting down"):
+        await registry.execute_tool("slow_search", {}, cancel_token=token)
+
+    assert not provider.started.is_set()
+    assert token.cancel() is False
+
+
+def test_remove_last_messages_keeps_parent_of_fork_intact():
+    parent = Conversation(enable_caching=False)
+    parent.add_user_message("q1")
+    parent.add_assistant_text("a1")
+    fork = parent.fork()
+    fork.add_user_message("q2")
+    epoch = fork.history_epoch
+
+    fork.remove_last_messages(2)
+
+    assert [m["content"] for m in fork.get_messages_for_api()] == ["q1"]
+    assert fork.history_epoch == epoch + 1
+    assert parent.get_message_count() == 2
@@ -243,3 +243,127 @@ class TestConnectionManager:
 
         assert manager.session == session
         assert manager.status == ConnectionStatus.CONNECTED
+
+
+class TestMCPConnectionManagerInitialize:
+    """Tests for concurrent MCP server startup in MCPConnectionManager."""
+
+    class FakeClient:
+        def __init__(self, delay: float, succeed: bool = True):
+            self.delay = delay
+            self.succeed = succeed
+            self.is_connected = False
+
+        async def connect(self, use_auth: bool = False) -> None:
+            await asyncio.sleep(self.delay)
+            self.is_connected = self.succeed
+
+        async def disconnect(self) -> None:
+            self.is_connected = False
+
+    class FakeProvider:
+        def __init__(self, clients):
+            self.clients = clients
+
+        def create_clients(self, configs, **callbacks):
+            return dict(self.clients)
+
+    def _manager(self, clients, **kwargs):
+        from nxs.application.connection_manager import MCPConnectionManager
+        from nxs.application.mcp_config import MCPServerConfig, MCPServersConfig
+
+        config = MCPServersConfig(
+            mcpServers={name: MCPServerConfig(command="noop") for name in clients}
+        )
+        return MCPConnectionManager(config=config, client_provider=self.FakeProvider(clients), **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_returns_when_first_server_ready(self):
+        """initialize() returns once any server connects; slow ones keep going."""
+        fast, slow = self.FakeClient(0.01), self.FakeClient(0.3)
+        manager = self._manager({"fast": fast, "slow": slow})
+
+        start = asyncio.get_running_loop().time()
+        await manager.initialize()
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.2
+        assert fast.is_connected and not slow.is_connected
+
+        await asyncio.sleep(0.35)
+        assert slow.is_connected
+        await manager.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_startup(self):
+        """A server that misses its deadline doesn't block startup."""
+        failing, hanging = self.FakeClient(0.01, succeed=False), self.FakeClient(5.0)
+        manager = self._manager({"failing": failing, "hanging": hanging}, connect_timeout=0.1)
+
+        start = asyncio.get_running_loop().time()
+        await manager.initialize()
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert 0.1 <= elapsed < 0.5
+        await manager.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_finished_task_does_not_forget_newer_task(self):
+        """An old connection task finishing late leaves its replacement tracked."""
+        manager = self._manager({"server": self.FakeClient(0.01)})
+        old = asyncio.create_task(asyncio.sleep(0))
+        new = asyncio.create_task(asyncio.sleep(1))
+        manager._connect_tasks["server"] = new
+
+        await old
+        manager._forget_connect_task("server", old)
+        assert manager._connect_tasks["server"] is new
+
+        manager._forget_connect_task("server", new)
+        assert "server" not in manager._connect_tasks
+        new.cancel()
+
+
+class TestCallTimeoutReporting:
+    """Tests for timeouts reported by clients to the connection manager."""
+
+    @pytest.mark.asyncio
+    async def test_reported_timeouts_degrade_then_trigger_reconnect(self):
+        checker = HealthChecker(check_interval=60.0, failure_threshold=2)
+        manager = SingleConnectionManager(health_checker=checker)
+        manager.set_session(object())
+        stop_event = asyncio.Event()
+        await checker.start(
+            get_session=lambda: manager.session,
+            on_unhealthy=manager._on_unhealthy,
+            stop_event=stop_event,
+            on_recovered=manager._on_recovered,
+        )
+
+        manager.report_timeout("call_tool(search)")
+        assert manager.status == ConnectionStatus.DEGRADED
+        assert manager.is_connected
+
+        manager.report_timeout("call_tool(search)")
+        assert manager.status == ConnectionStatus.RECONNECTING
+        await checker.stop()
+
+    @pytest.mark.asyncio
+    async def test_passing_health_check_recovers_degraded_connection(self):
+        session = TestHealthChecker.MockSession()
+        checker = HealthChecker(check_interval=0.05, failure_threshold=3)
+        manager = SingleConnectionManager(health_checker=checker)
+        manager.set_session(session)
+        await checker.start(
+            get_session=lambda: manager.session,
+            on_unhealthy=manager._on_unhealthy,
+            stop_event=asyncio.Event(),
+            on_recovered=manager._on_recovered,
+        )
+
+        manager.report_timeout("read_resource(docs://x)")
+        assert manager.status == ConnectionStatus.DEGRADED
+        await asyncio.sleep(0.15)
+
+        assert manager.status == ConnectionStatus.CONNECTED
+        await checker.stop()
@@ -244,6 +244,117 @@ class TestCacheControl:
         conv = Conversation()
         assert conv.get_system_message_for_api() is None
 
+    @staticmethod
+    def _marked(messages) -> list[int]:
+        return [
+            i
+            for i, message in enumerate(messages)
+            if isinstance(message["content"], list) and "cache_control" in message["content"][-1]
+        ]
+
+    @staticmethod
+    def _tool_result(text: str) -> list[dict]:
+        return [{"type": "tool_result", "tool_use_id": "t1", "content": text}]
+
+    def test_previous_breakpoint_is_marked_again(self):
+        """The last request's breakpoint stays marked so its prefix is read back."""
+        conv = Conversation(enable_caching=True)
+        conv.add_user_message("question " + "x" * 5000)
+        conv.add_assistant_text("calling a tool")
+        conv.add_user_message(self._tool_result("result 1"))
+        assert self._marked(conv.get_messages_for_api()) == [0, 2]
+
+        conv.add_assistant_text("calling another tool")
+        conv.add_user_message(self._tool_result("result 2"))
+        assert self._marked(conv.get_messages_for_api()) == [2, 4]
+
+    def test_turn_start_is_kept_with_a_larger_budget(self):
+        """With a third marker the start of the current turn stays marked."""
+        conv = Conversation(enable_caching=True, max_cache_breakpoints=3)
+        conv.add_user_message("question " + "x" * 5000)
+        for i in range(3):
+            conv.add_assistant_text(f"tool call {i}")
+            conv.add_user_message(self._tool_result(f"result {i}"))
+
+        assert self._marked(conv.get_messages_for_api()) == [0, 4, 6]
+
+    def test_small_prefixes_and_unmarked_messages_are_not_copied(self):
+        """Prefixes below the cache minimum get no marker; unmarked messages are shared."""
+        conv = Conversation(enable_caching=True)
+        conv.add_user_message("short question")
+        conv.add_assistant_text("short answer")
+        conv.add_user_message("follow-up")
+
+        messages = conv.get_messages_for_api()
+
+        assert self._marked(messages) == [2]
+        assert messages[0] is conv._messages[0]
+        assert isinstance(conv._messages[2]["content"], str)
+
+    def test_compaction_summary_is_a_breakpoint(self):
+        conv = Conversation(enable_caching=True, compaction_threshold_tokens=10, max_cache_breakpoints=3)
+        for i in range(3):
+            conv.add_user_message(f"question {i}")
+            conv.add_assistant_text(f"answer {i}")
+        conv.add_user_message("latest question")
+        conv.set_summary("summary " + "x" * 5000, covered_messages=4)
+
+        messages = conv.get_messages_for_api()
+
+        assert len(messages) == 3
+        assert self._marked(messages) == [0, 2]
+
+
+class TestPreparedPayload:
+    """Test the incrementally maintained API payload."""
+
+    def test_payload_is_extended_and_old_markers_are_undone(self):
+        conv = Conversation(enable_caching=True)
+        conv.add_user_message("first")
+        first = conv.get_messages_for_api()
+        payload_id = id(first)
+
+        conv.add_assistant_text("answer")
+        conv.add_user_message("second")
+        messages = conv.get_messages_for_api()
+
+        assert id(messages) == payload_id
+        assert messages[0] is conv._messages[0]  # Marker from the first call removed
+        assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+        assert messages[2]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_payload_matches_history_for_forks_and_evictions(self):
+        conv = Conversation(enable_caching=False, max_history_messages=4)
+        conv.add_user_message("q0")
+        conv.get_messages_for_api()
+        fork = conv.fork()
+        fork.add_assistant_text("fork answer")
+        conv.add_assistant_text("a0")
+
+        assert fork.get_messages_for_api() == fork.get_messages()
+        assert conv.get_messages_for_api() == conv.get_messages()
+
+        for i in range(1, 4):
+            conv.add_user_message(f"q{i}")
+            conv.add_assistant_text(f"a{i}")
+            assert conv.get_messages_for_api() == conv.get_messages()
+        assert len(conv.get_messages_for_api()) == 4
+
+    def test_payload_follows_summary_updates(self):
+        conv = Conversation(enable_caching=False, compaction_threshold_tokens=10)
+        for i in range(4):
+            conv.add_user_message(f"question {i} " + "x" * 40)
+            conv.add_assistant_text(f"answer {i}")
+        assert len(conv.get_messages_for_api()) == 8
+
+        conv.set_summary("first summary", covered_messages=4)
+        assert len(conv.get_messages_for_api()) == 4
+
+        conv.set_summary("second summary", covered_messages=6)
+        messages = conv.get_messages_for_api()
+        assert len(messages) == 2
+        assert "second summary" in messages[0]["content"][0]["text"]
+
 
 class TestHistoryManagement:
     """Test history limits and truncation."""
@@ -421,3 +532,216 @@ class TestSystemMessageProperty:
         conv.system_message = "Updated"
 
         assert conv.last_modified_at > original_time
+
+
+class TestConversationFork:
+    """Test lightweight conversation forks."""
+
+    def test_fork_shares_prefix_without_copying(self):
+        """A fork sees the parent's history through the parent's own list."""
+        conv = Conversation(system_message="sys", enable_caching=False)
+        conv.add_user_message("Hello")
+        conv.add_assistant_text("Hi")
+
+        fork = conv.fork()
+
+        assert fork._prefix is conv._messages
+        assert fork._messages == []
+        assert fork.system_message == "sys"
+        assert fork.get_messages() == conv.get_messages()
+
+    def test_fork_and_parent_are_isolated(self):
+        """Messages added on either side don't leak into the other."""
+        conv = Conversation(enable_caching=False)
+        conv.add_user_message("Question")
+        fork = conv.fork()
+
+        fork.add_user_message("Subtask")
+        fork.add_assistant_text("Subtask answer")
+        conv.add_assistant_text("Answer")
+
+        assert [m["content"] for m in fork.get_messages_for_api()][:2] == ["Question", "Subtask"]
+        assert fork.get_message_count() == 3
+        assert conv.get_message_count() == 2
+        assert conv.get_messages()[-1]["content"] == [{"type": "text", "text": "Answer"}]
+
+    def test_parent_clear_does_not_affect_fork(self):
+        """Clearing the parent rebinds its list instead of emptying the shared one."""
+        conv = Conversation(enable_caching=False)
+        conv.add_user_message("Question")
+        fork = conv.fork()
+
+        conv.clear_history()
+
+        assert fork.get_message_count() == 1
+        assert fork.get_messages()[0]["content"] == "Question"
+
+    def test_fork_of_fork_and_history_limit(self):
+        """Nested forks flatten their prefix; truncation materializes it."""
+        conv = Conversation(max_history_messages=3, enable_caching=False)
+        conv.add_user_message("one")
+        child = conv.fork()
+        child.add_assistant_text("two")
+        grandchild = child.fork()
+
+        assert grandchild.get_message_count() == 2
+
+        grandchild.add_user_message("three")
+        grandchild.add_assistant_text("four")
+
+        assert grandchild.get_message_count() == 3
+        assert grandchild._prefix_length == 0
+        assert grandchild.get_messages()[0]["content"] == [{"type": "text", "text": "two"}]
+        assert conv.get_message_count() == 1
+
+
+    def test_merge_fork_appends_whole_exchange(self):
+        """merge_fork() copies every message added to the fork, in order."""
+        conv = Conversation(enable_caching=False)
+        conv.add_user_message("Earlier")
+        conv.add_assistant_text("Earlier answer")
+        fork = conv.fork()
+        fork.add_user_message("Question")
+        fork.add_assistant_text("Calling a tool")
+        fork.add_user_message([{"type": "tool_result", "tool_use_id": "t1", "content": "42"}])
+        fork.add_assistant_text("Answer")
+
+        conv.merge_fork(fork)
+
+        assert conv.get_messages() == fork.get_messages()
+        assert conv.get_message_count() == 6
+
+    def test_merge_fork_after_fork_evicted_prefix(self):
+        """Only the fork's own messages are merged once its prefix was evicted."""
+        conv = Conversation(max_history_messages=3, enable_caching=False)
+        conv.add_user_message("one")
+        conv.add_assistant_text("two")
+        fork = conv.fork()
+        fork.add_user_message("three")
+        fork.add_assistant_text("four")
+
+        conv.merge_fork(fork)
+
+        assert fork._prefix_length == 0
+        assert [m["content"] for m in conv.get_messages()][1:] == [
+            "three",
+            [{"type": "text", "text": "four"}],
+        ]
+
+class TestTokenBudget:
+    """Test token-budget history management."""
+
+    @staticmethod
+    def _tool_exchange(conv: Conversation, query: str, result: str) -> None:
+        conv.add_user_message(query)
+        tool_use = ToolUseBlock(id=f"tool_{query}", name="search", input={"q": query}, type="tool_use")
+        conv.add_assistant_message(Mock(spec=Message, content=[tool_use]))
+        conv.add_tool_results([tool_use], [result])
+        conv.add_assistant_text(f"answer to {query}")
+
+    def test_token_counts_are_incremental(self):
+        """Estimates include tool inputs/results and track appends."""
+        conv = Conversation(enable_caching=False)
+        conv.add_user_message("x" * 40)
+        assert conv.get_token_estimate() == 10
+
+        self._tool_exchange(conv, "q", "r" * 400)
+        assert conv.get_token_estimate() > 110
+
+    def test_budget_evicts_whole_exchanges(self):
+        """Oldest exchanges go first; tool pairs and the latest exchange stay."""
+        # Each exchange is ~110 tokens, so only the latest fits
+        conv = Conversation(enable_caching=False, max_history_tokens=150)
+        for i in range(4):
+            self._tool_exchange(conv, f"q{i}", "r" * 400)
+
+        messages = conv.get_messages()
+        assert messages[0]["content"] == "q3"
+        assert conv.get_message_count() == 4
+        assert conv.history_epoch > 0
+        assert conv.get_token_estimate() == sum(
+            Conversation._estimate_message_tokens(m) for m in messages
+        )
+
+    def test_budget_keeps_older_exchanges_that_fit(self):
+        conv = Conversation(enable_caching=False, max_history_tokens=30)
+        for i in range(5):
+            conv.add_user_message(f"question {i} " + "x" * 20)
+            conv.add_assistant_text("ok")
+
+        contents = [m["content"] for m in conv.get_messages() if m["role"] == "user"]
+        # Each exchange is ~9 tokens, so the last three fit
+        assert contents == [f"question {i} " + "x" * 20 for i in (2, 3, 4)]
+
+    def test_message_limit_drops_orphaned_tool_results(self):
+        conv = Conversation(enable_caching=False, max_history_messages=2)
+        self._tool_exchange(conv, "q", "result")
+
+        assert conv.get_message_count() == 1
+        assert conv.get_messages()[0]["role"] == "assistant"
+
+    def test_budget_round_trips_and_forks(self):
+        conv = Conversation(enable_caching=False, max_history_tokens=1000)
+        conv.add_user_message("hello there")
+        restored = Conversation.from_dict(conv.to_dict())
+        fork = conv.fork()
+
+        assert restored._max_history_tokens == 1000
+        assert restored.get_token_estimate() == conv.get_token_estimate()
+        assert fork.get_token_estimate() == conv.get_token_estimate()
+
+
+class TestSummaryCompaction:
+    """Test summary-based compaction of the API payload."""
+
+    @staticmethod
+    def _conversation(threshold: int | None = 20) -> Conversation:
+        conv = Conversation(enable_caching=False, compaction_threshold_tokens=threshold)
+        for i in range(4):
+            conv.add_user_message(f"question {i} " + "x" * 40)
+            conv.add_assistant_text(f"answer {i}")
+        return conv
+
+    def test_summarized_messages_replaced_in_payload(self):
+        """Covered exchanges become one summary block; raw history is kept."""
+        conv = self._conversation()
+        conv.set_summary("**Topics:** questions 0-2", covered_messages=6)
+
+        messages = conv.get_messages_for_api()
+
+        assert len(messages) == 2
+        assert messages[0]["role"] == "user"
+        summary_block, question_block = messages[0]["content"]
+        assert "questions 0-2" in summary_block["text"]
+        assert question_block["text"].startswith("question 3")
+        assert conv.get_message_count() == 8
+        assert conv.get_messages()[0]["content"].startswith("question 0")
+
+    def test_no_compaction_below_threshold_or_without_summary(self):
+        conv = self._conversation(threshold=10_000)
+        conv.set_summary("summary", covered_messages=6)
+        assert len(conv.get_messages_for_api()) == 8
+
+        conv = self._conversation(threshold=None)
+        conv.set_summary("summary", covered_messages=6)
+        assert len(conv.get_messages_for_api()) == 8
+
+        assert len(self._conversation().get_messages_for_api()) == 8
+
+    def test_cut_never_splits_an_exchange(self):
+        """A summary ending mid-exchange keeps that whole exchange raw."""
+        conv = self._conversation()
+        conv.set_summary("summary", covered_messages=5)
+
+        messages = conv.get_messages_for_api()
+
+        assert len(messages) == 4
+        assert messages[0]["content"][1]["text"].startswith("question 2")
+
+    def test_clear_history_drops_summary(self):
+        conv = self._conversation()
+        conv.set_summary("summary", covered_messages=6)
+        conv.clear_history()
+        conv.add_user_message("fresh " + "x" * 100)
+
+        assert conv.get_messages_for_api()[0]["content"].startswith("fresh")
@@ -0,0 +1,110 @@
+"""Tests for token usage records, cost calculation and cost tracking."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from nxs.application.cost_calculator import CostCalculator
+from nxs.application.cost_tracker import CostSummary, CostTracker
+from nxs.application.session_state import StateMetadata
+from nxs.application.token_usage import TokenUsage
+
+
+def test_cache_tokens_are_priced_relative_to_input():
+    """Cache writes cost 1.25x and cache reads 0.1x the input rate."""
+    calculator = CostCalculator()
+
+    base = calculator.calculate_cost("claude-haiku-4-5-20251001", 1_000_000, 0)
+    cached = calculator.calculate_cost(
+        "claude-haiku-4-5-20251001",
+        0,
+        0,
+        cache_creation_tokens=1_000_000,
+        cache_read_tokens=1_000_000,
+    )
+
+    assert cached == pytest.approx(base * 1.35)
+
+
+def test_tracker_accumulates_and_persists_cache_tokens():
+    tracker = CostTracker()
+    tracker.add_usage(100, 50, 0.01, cache_creation_tokens=2000)
+    tracker.add_usage(100, 50, 0.01, cache_read_tokens=2000)
+
+    restored = CostTracker.from_dict(tracker.to_dict()).get_total()
+
+    assert restored.total_cache_creation_tokens == 2000
+    assert restored.total_cache_read_tokens == 2000
+    assert restored.cache_hit_rate == pytest.approx(2000 / 4200)
+    assert CostSummary.from_dict({"total_input_tokens": 10}).total_cache_read_tokens == 0
+
+
+def test_cache_efficiency_counts_cache_writes_as_prompt_tokens():
+    meta = StateMetadata()
+    meta.record_interaction(
+        {"usage": {"input_tokens": 100, "cache_creation_input_tokens": 900, "cache_read_input_tokens": 1000}},
+        count_message=False,
+    )
+
+    assert meta.get_summary()["cache_efficiency"] == pytest.approx(0.5)
+    assert meta.message_count == 0
+
+
+def test_usage_record_reads_every_token_class_from_response():
+    response = SimpleNamespace(
+        usage=SimpleNamespace(
+            input_tokens=50,
+            output_tokens=400,
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=3000,
+        ),
+        content=[
+            SimpleNamespace(type="thinking", thinking="x" * 800),
+            SimpleNamespace(type="text", text="answer"),
+        ],
+    )
+
+    usage = TokenUsage.from_response(response)
+
+    assert usage == TokenUsage(
+        input_tokens=50, output_tokens=400, cache_read_input_tokens=3000, thinking_tokens=200
+    )
+    assert usage.cache_hit_rate == pytest.approx(3000 / 3050)
+    assert TokenUsage.from_dict({**usage.to_dict(), "component": "planner"}) == usage
+
+
+def test_cost_breakdown_by_token_class():
+    calculator = CostCalculator()
+    usage = TokenUsage(
+        input_tokens=1_000_000,
+        output_tokens=1_000_000,
+        cache_creation_input_tokens=1_000_000,
+        cache_read_input_tokens=1_000_000,
+    )
+
+    breakdown = calculator.cost_breakdown("claude-haiku-4-5-20251001", usage)
+
+    assert breakdown == pytest.approx(
+        {"input": 1.0, "output": 5.0, "cache_creation": 1.25, "cache_read": 0.1}
+    )
+    assert calculator.calculate_usage_cost("claude-haiku-4-5-20251001", usage) == pytest.approx(7.35)
+
+
+def test_tracker_breaks_usage_down_by_component_and_turn():
+    tracker = CostTracker(max_turns=2)
+    tracker.record_usage(TokenUsage(input_tokens=10), 0.1, component="agent_loop")
+    for _ in range(3):
+        tracker.start_turn()
+        tracker.record_usage(TokenUsage(cache_read_input_tokens=100, thinking_tokens=5), 0.01, component="planner")
+        tracker.record_usage(TokenUsage(input_tokens=10), 0.1, component="agent_loop")
+
+    components = tracker.get_component_breakdown()
+    assert components["agent_loop"].calls == 4
+    assert components["planner"].usage.cache_read_input_tokens == 300
+    assert list(tracker.get_turn_breakdown()) == [2, 3]
+    assert tracker.get_turn_breakdown()[3].cost == pytest.approx(0.11)
+
+    restored = CostTracker.from_dict(tracker.to_dict())
+    assert restored.current_turn == 3
+    assert restored.get_total().total_thinking_tokens == 15
+    assert restored.get_component_breakdown()["planner"].calls == 3
@@ -0,0 +1,177 @@
+"""Tests for wave-based (DAG) plan step execution in DeepReasoningStrategy."""
+
+import asyncio
+
+import pytest
+
+from nxs.application.conversation import Conversation
+from nxs.application.progress_tracker import PlanStep, ResearchProgressTracker
+from nxs.application.reasoning.types import (
+    ComplexityAnalysis,
+    ComplexityLevel,
+    EvaluationResult,
+    ExecutionStrategy,
+    ResearchPlan,
+    SubTask,
+)
+from nxs.application.strategies.deep_reasoning import DeepReasoningStrategy
+
+
+class FakePlanner:
+    def __init__(self, subtasks: list[SubTask]):
+        self.subtasks = subtasks
+
+    async def generate_plan(self, query: str, context=None) -> ResearchPlan:
+        return ResearchPlan(original_query=query, subtasks=list(self.subtasks))
+
+
+class CountingEvaluator:
+    def __init__(self, complete_after: int = 99):
+        self.calls = 0
+        self.complete_after = complete_after
+
+    async def evaluate(self, query, results, current_plan=None) -> EvaluationResult:
+        self.calls += 1
+        return EvaluationResult(
+            is_complete=self.calls >= self.complete_after, confidence=0.5, reasoning="ok"
+        )
+
+
+class EchoSynthesizer:
+    async def filter_results(self, query, results):
+        return results
+
+    async def synthesize(self, query, results):
+        return " | ".join(r["query"] for r in results)
+
+
+class FakeRegistry:
+    def get_tool_names(self) -> list[str]:
+        return []
+
+
+class RecordingExecutor:
+    """execute_with_tracking stand-in recording concurrency and conversations."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.order: list[str] = []
+        self.conversations: list[Conversation] = []
+
+    async def __call__(self, query, tracker, use_streaming, callbacks, conversation=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.conversations.append(conversation)
+        try:
+            await asyncio.sleep(self.delay)
+            step = tracker.plan.current_step_id
+            self.order.append(step)
+            conversation.add_user_message(query)
+            return f"result for {step}"
+        finally:
+            self.in_flight -= 1
+
+
+def _complexity() -> ComplexityAnalysis:
+    return ComplexityAnalysis(
+        complexity_level=ComplexityLevel.COMPLEX,
+        reasoning_required=True,
+        recommended_strategy=ExecutionStrategy.DEEP_REASONING,
+        rationale="test",
+    )
+
+
+def _strategy(subtasks, executor, evaluator, main: Conversation, **kwargs) -> DeepReasoningStrategy:
+    return DeepReasoningStrategy(
+        planner=FakePlanner(subtasks),
+        evaluator=evaluator,
+        synthesizer=EchoSynthesizer(),
+        tool_registry=FakeRegistry(),
+        execute_with_tracking=executor,
+        fork_conversation=main.fork,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_in_one_wave():
+    """Independent steps run concurrently with one evaluation for the wave."""
+    main = Conversation(enable_caching=False)
+    main.add_user_message("original question")
+    executor = RecordingExecutor()
+    evaluator = CountingEvaluator()
+    subtasks = [SubTask(query=f"research {i}", priority=1) for i in range(4)]
+    strategy = _strategy(subtasks, executor, evaluator, main, max_parallel_steps=3)
+    tracker = ResearchProgressTracker("q", _complexity())
+
+    await strategy.execute("q", _complexity(), tracker, {})
+
+    assert executor.peak == 3
+    assert evaluator.calls == 1
+    assert all(step.status == "completed" for step in tracker.plan.steps)
+    # Each step ran in its own fork; the main history is untouched
+    assert len({id(c) for c in executor.conversations}) == 4
+    assert main.get_message_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_dependencies_split_steps_into_waves():
+    """A step waits for the steps it depends on."""
+    main = Conversation(enable_caching=False)
+    executor = RecordingExecutor()
+    evaluator = CountingEvaluator()
+    subtasks = [
+        SubTask(query="collect sources", priority=1),
+        SubTask(query="collect prices", priority=1),
+        SubTask(query="compare findings", priority=1, dependencies=["collect sources"]),
+    ]
+    strategy = _strategy(subtasks, executor, evaluator, main, max_parallel_steps=3)
+    tracker = ResearchProgressTracker("q", _complexity())
+
+    result = await strategy.execute("q", _complexity(), tracker, {})
+
+    assert tracker.plan.steps[2].depends_on == ["step_0"]
+    assert evaluator.calls == 2
+    assert executor.order[-1] == "step_2"
+    # Results keep plan order
+    assert result == "collect sources | collect prices | compare findings"
+
+
+@pytest.mark.asyncio
+async def test_failed_step_does_not_abort_wave():
+    """A failing step is marked failed while its siblings complete."""
+    main = Conversation(enable_caching=False)
+    evaluator = CountingEvaluator(complete_after=1)
+
+    async def executor(query, tracker, use_streaming, callbacks, conversation=None):
+        if "bad" in query:
+            raise RuntimeError("boom")
+        return "fine"
+
+    subtasks = [SubTask(query="bad step", priority=1), SubTask(query="good step", priority=1)]
+    strategy = _strategy(subtasks, executor, evaluator, main, max_parallel_steps=2)
+    tracker = ResearchProgressTracker("q", _complexity())
+
+    result = await strategy.execute("q", _complexity(), tracker, {})
+
+    assert [step.status for step in tracker.plan.steps] == ["failed", "completed"]
+    assert result == "good step"
+
+
+def test_unsatisfiable_dependencies_fall_back_to_first_step():
+    """A dependency cycle still lets one step run."""
+    strategy = _strategy([], RecordingExecutor(), CountingEvaluator(), Conversation())
+    tracker = ResearchProgressTracker("q", _complexity())
+    tracker.set_plan(
+        ResearchPlan(original_query="q", subtasks=[SubTask("a", 1), SubTask("b", 1)]),
+        ExecutionStrategy.DEEP_REASONING,
+    )
+    tracker.plan.steps[0].depends_on = ["step_1"]
+    tracker.plan.steps[1].depends_on = ["step_0"]
+
+    ready = strategy._get_ready_steps(tracker)
+
+    assert [step.id for step in ready] == ["step_0"]
+    assert isinstance(ready[0], PlanStep)
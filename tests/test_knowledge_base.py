@@ -0,0 +1,69 @@
+"""Tests for KnowledgeBase indexing and BM25 retrieval."""
+
+from datetime import datetime
+
+from nxs.application.session_state import Fact, KnowledgeBase
+
+
+def test_rare_terms_rank_higher():
+    """BM25 weighs rare query terms above common ones."""
+    kb = KnowledgeBase()
+    kb.add_fact("The API rate limit is 1000 requests per hour", "tool", 0.9)
+    kb.add_fact("The database timeout is 30 seconds", "tool", 0.9)
+    kb.add_fact("The cache timeout is 5 minutes", "tool", 0.9)
+
+    facts = kb.get_relevant_facts("what is the API limit")
+
+    assert facts[0].content.startswith("The API rate limit")
+    assert len(facts) == 3  # "the"/"is" still match, but score lower
+
+
+def test_confidence_filter_and_top_k():
+    kb = KnowledgeBase()
+    for i in range(20):
+        kb.add_fact(f"server {i} listens on port {8000 + i}", "tool", 0.9 if i % 2 else 0.3)
+
+    facts = kb.get_relevant_facts("server port", limit=3, min_confidence=0.5)
+
+    assert len(facts) == 3
+    assert all(fact.confidence >= 0.5 for fact in facts)
+    assert kb.get_relevant_facts("unrelated words") == []
+
+
+def test_duplicate_lookup_uses_normalized_content():
+    kb = KnowledgeBase()
+    kb.add_fact("Server runs on  port 8080", "tool", 0.7)
+    kb.add_fact("server runs on port 8080", "conversation", 0.95)
+
+    assert len(kb.facts) == 1
+    assert kb.facts[0].confidence == 0.95
+
+
+def test_reworded_fact_is_merged_but_different_numbers_are_not():
+    kb = KnowledgeBase()
+    kb.add_fact("The API rate limit is 1000 requests per hour", "tool", 0.8)
+    kb.add_fact("API rate limit: 1000 requests per hour", "conversation", 0.9)
+    kb.add_fact("API rate limit: 2000 requests per hour", "conversation", 0.9)
+
+    assert [f.content for f in kb.facts] == [
+        "The API rate limit is 1000 requests per hour",
+        "API rate limit: 2000 requests per hour",
+    ]
+    assert kb.facts[0].confidence == 0.9
+
+    exact_only = KnowledgeBase(near_duplicate_threshold=None)
+    exact_only.add_fact("The API rate limit is 1000 requests per hour", "tool")
+    exact_only.add_fact("API rate limit: 1000 requests per hour", "conversation")
+    assert len(exact_only.facts) == 2
+
+
+def test_index_survives_round_trip_and_direct_appends():
+    kb = KnowledgeBase()
+    kb.add_fact("Deploys happen on Fridays", "conversation")
+    restored = KnowledgeBase.from_dict(kb.to_dict())
+    restored.facts.append(
+        Fact(content="Staging uses Postgres 16", source="tool", confidence=0.9, timestamp=datetime.now())
+    )
+
+    assert [f.content for f in restored.get_relevant_facts("deploys")] == ["Deploys happen on Fridays"]
+    assert [f.content for f in restored.get_relevant_facts("postgres")] == ["Staging uses Postgres 16"]
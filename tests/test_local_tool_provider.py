@@ -0,0 +1,90 @@
+"""Tests for LocalToolProvider execution off the event loop."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nxs.application.local_tool_provider import LocalToolOptions, LocalToolProvider, local_tool
+
+
+def blocking_echo(text: str) -> dict:
+    """Echo text after blocking briefly.
+
+    Args:
+        text: Text to echo
+    """
+    time.sleep(0.1)
+    return {"text": text, "thread": threading.current_thread().name}
+
+
+async def async_echo(text: str) -> str:
+    """Echo text asynchronously.
+
+    Args:
+        text: Text to echo
+    """
+    await asyncio.sleep(0)
+    return f"async:{text}"
+
+
+@local_tool(timeout=0.05)
+def slow_tool() -> str:
+    """Sleep longer than the tool timeout."""
+    time.sleep(0.3)
+    return "done"
+
+
+@pytest.mark.asyncio
+async def test_sync_function_runs_in_worker_thread():
+    """Sync functions run in the thread pool and don't block the loop."""
+    provider = LocalToolProvider([blocking_echo])
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        result = await provider.execute_tool("blocking_echo", {"text": "hi"})
+    finally:
+        ticker_task.cancel()
+        provider.shutdown()
+
+    assert '"text": "hi"' in result
+    assert "nxs-local-tool" in result
+    assert ticks >= 3  # Loop kept running while the tool blocked
+
+
+@pytest.mark.asyncio
+async def test_coroutine_function_is_awaited():
+    """Coroutine functions are awaited natively."""
+    provider = LocalToolProvider([async_echo])
+
+    assert await provider.execute_tool("async_echo", {"text": "x"}) == "async:x"
+
+
+@pytest.mark.asyncio
+async def test_timeout_from_decorator_metadata():
+    """@local_tool timeouts abort the call with TimeoutError."""
+    provider = LocalToolProvider([slow_tool])
+
+    with pytest.raises(TimeoutError, match="slow_tool"):
+        await provider.execute_tool("slow_tool", {})
+    provider.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tool_options_override_decorator():
+    """Constructor tool_options take precedence over decorator metadata."""
+    provider = LocalToolProvider(
+        [slow_tool],
+        tool_options={"slow_tool": LocalToolOptions(timeout=5.0)},
+    )
+
+    assert await provider.execute_tool("slow_tool", {}) == "done"
+    provider.shutdown()
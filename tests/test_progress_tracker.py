@@ -145,10 +145,7 @@ class TestToolTracking:
         assert exec_record.result == "Search results"
         assert exec_record.execution_time_ms == 150.5
         assert exec_record.result_hash != ""
-
-        # Check cache
-        assert exec_record.result_hash in tracker._tool_result_cache
-        assert tracker._tool_result_cache[exec_record.result_hash] == "Search results"
+        assert tracker.insights.successful_tool_results["web_search"] == "Search results"
 
     def test_log_tool_execution_failure(self, tracker):
         """Test logging a failed tool execution."""
@@ -167,45 +164,6 @@ class TestToolTracking:
         assert exec_record.error == "Timeout error"
         assert "web_search" in tracker.insights.failed_tool_attempts
 
-    def test_should_execute_tool_cache_hit(self, tracker):
-        """Test tool caching - should not execute if cached."""
-        tracker.start_attempt(ExecutionStrategy.DIRECT)
-        tracker.log_tool_execution(
-            "web_search",
-            {"query": "test"},
-            success=True,
-            result="Cached result",
-        )
-
-        should_execute, cached_result = tracker.should_execute_tool("web_search", {"query": "test"})
-
-        assert should_execute is False
-        assert cached_result == "Cached result"
-
-    def test_should_execute_tool_cache_miss(self, tracker):
-        """Test tool caching - should execute if not cached."""
-        tracker.start_attempt(ExecutionStrategy.DIRECT)
-
-        should_execute, cached_result = tracker.should_execute_tool("web_search", {"query": "new"})
-
-        assert should_execute is True
-        assert cached_result is None
-
-    def test_should_execute_tool_different_args(self, tracker):
-        """Test that different arguments are not cached together."""
-        tracker.start_attempt(ExecutionStrategy.DIRECT)
-        tracker.log_tool_execution(
-            "web_search",
-            {"query": "test1"},
-            success=True,
-            result="Result 1",
-        )
-
-        should_execute, cached_result = tracker.should_execute_tool("web_search", {"query": "test2"})
-
-        assert should_execute is True  # Different args, should execute
-        assert cached_result is None
-
     def test_tool_hash_deterministic(self, tracker):
         """Test that tool argument hashing is deterministic."""
         hash1 = tracker._hash_arguments("tool", {"a": 1, "b": 2})
@@ -247,6 +205,33 @@ class TestPlanManagement:
         assert tracker.plan.revision_count == initial_revision + 1
         assert len(tracker.plan.steps) == 4  # Should have new step
 
+    def test_set_plan_refinement_matches_reworded_steps(self, tracker):
+        """Reworded steps are matched by similarity instead of duplicated."""
+        tracker.set_plan(
+            ResearchPlan(
+                original_query="Test query",
+                subtasks=[
+                    SubTask(query="research the python asyncio event loop internals", priority=1),
+                    SubTask(query="benchmark uvloop against asyncio", priority=2),
+                ],
+            ),
+            ExecutionStrategy.LIGHT_PLANNING,
+        )
+
+        new_plan = ResearchPlan(
+            original_query="Test query",
+            subtasks=[
+                SubTask(query="research the python asyncio event loop internals deeply", priority=1),
+                SubTask(query="write a summary report", priority=2),
+            ],
+        )
+        tracker.set_plan(new_plan, ExecutionStrategy.DEEP_REASONING)
+
+        descriptions = [step.description for step in tracker.plan.steps]
+        assert descriptions[0] == "research the python asyncio event loop internals deeply"
+        assert len(tracker.plan.steps) == 3
+        assert tracker.plan.steps[1].status == "skipped"
+
     def test_update_step_status(self, tracker, sample_plan):
         """Test updating step status."""
         tracker.set_plan(sample_plan, ExecutionStrategy.LIGHT_PLANNING)
@@ -423,8 +408,7 @@ class TestSerialization:
         assert restored.attempts[0].strategy == ExecutionStrategy.DIRECT
         assert restored.attempts[0].quality_score == 0.85
         assert restored.tool_executions[0].tool_name == "tool1"
-        # Check cache was restored
-        assert len(restored._tool_result_cache) == 1
+        assert restored.tool_executions[0].result == "Result"
 
 
 class TestAccumulatedInsights:
@@ -478,7 +462,7 @@ class TestEdgeCases:
         tracker.log_tool_execution("web_search", {"query": "test2"}, success=True, result="Result 2")
 
         assert len(tracker.tool_executions) == 2
-        assert len(tracker._tool_result_cache) == 2  # Different args, different cache entries
+        assert len({e.result_hash for e in tracker.tool_executions}) == 2  # Different args, different hashes
 
     def test_tool_execution_without_current_attempt(self, tracker):
         """Test logging tool execution without current attempt."""
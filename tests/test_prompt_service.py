@@ -0,0 +1,67 @@
+"""Tests for the bulk prompt index in PromptService."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from nxs.presentation.services.prompt_service import PromptService
+
+
+def _prompt(name: str, *args: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        arguments=[SimpleNamespace(name=arg, required=True) for arg in args],
+    )
+
+
+class FakeArtifactManager:
+    """Artifact manager serving prompts per server and counting list calls."""
+
+    def __init__(self, prompts_by_server: dict[str, list]):
+        self.prompts_by_server = prompts_by_server
+        self.list_calls: list[str] = []
+
+    async def get_prompts_by_server(self, server_names=None):
+        names = list(self.prompts_by_server) if server_names is None else server_names
+        self.list_calls.extend(names)
+        return {name: self.prompts_by_server[name] for name in names if name in self.prompts_by_server}
+
+    async def find_prompt(self, name):  # pragma: no cover - must not be used
+        raise AssertionError("preload_all should use the bulk index")
+
+
+@pytest.mark.asyncio
+async def test_preload_all_lists_each_server_once():
+    """One list per server fills both caches for every command."""
+    manager = FakeArtifactManager(
+        {
+            "a": [_prompt("summarize", "text"), _prompt("shared")],
+            "b": [_prompt("translate", "text", "lang"), _prompt("shared", "x")],
+        }
+    )
+    service = PromptService(manager)
+
+    await service.preload_all(["summarize", "translate", "shared"])
+
+    assert sorted(manager.list_calls) == ["a", "b"]
+    assert service.get_cached_info("translate") == "text, lang | Required: text, lang"
+    assert service.get_cached_schema("summarize")[1] == "a"
+    # First server wins on name collisions
+    assert service.get_cached_schema("shared")[1] == "a"
+
+
+@pytest.mark.asyncio
+async def test_refresh_server_only_touches_that_server():
+    """Reconnecting a server replaces just its entries."""
+    manager = FakeArtifactManager({"a": [_prompt("old")], "b": [_prompt("other")]})
+    service = PromptService(manager)
+    await service.preload_all(["old", "other"])
+
+    manager.prompts_by_server["a"] = [_prompt("new", "q")]
+    manager.list_calls.clear()
+    await service.refresh_server("a")
+
+    assert manager.list_calls == ["a"]
+    assert service.get_cached_schema("old") is None
+    assert service.get_cached_info("new") == "q | Required: q"
+    assert service.get_cached_schema("other")[1] == "b"
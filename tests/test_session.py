@@ -10,6 +10,7 @@ import pytest
 from nxs.application.agentic_loop import AgentLoop
 from nxs.application.conversation import Conversation
 from nxs.application.session import Session, SessionMetadata
+from nxs.application.token_usage import TokenUsage
 
 
 class TestSessionMetadata:
@@ -274,6 +275,62 @@ class TestSession:
         assert session.title == "Restored Chat"
         assert session.metadata.created_at == created
 
+    def test_update_conversation_summary_enables_compaction(self, session, mock_conversation):
+        """The summary and its coverage are handed to the conversation."""
+        session.update_conversation_summary("**Topics:** testing", 4)
+
+        assert session.metadata.summary_last_message_index == 4
+        mock_conversation.set_summary.assert_called_once_with("**Topics:** testing", 4)
+
+    def test_cost_summary_includes_cache_tokens_and_turns(self, session):
+        """Cache tokens are totalled across trackers and usage is split per turn."""
+        session.start_cost_turn()
+        session.conversation_cost_tracker.record_usage(
+            TokenUsage(input_tokens=100, cache_read_input_tokens=900), 0.01, component="agent_loop"
+        )
+        session.reasoning_cost_tracker.record_usage(
+            TokenUsage(input_tokens=100, cache_creation_input_tokens=900), 0.02, component="planner"
+        )
+
+        totals = session.get_cost_summary()
+        assert totals["total_cache_read_tokens"] == 900
+        assert totals["cache_hit_rate"] == pytest.approx(0.45)
+        assert session.get_conversation_cost_summary()["cache_hit_rate"] == pytest.approx(0.9)
+
+        breakdown = session.get_cost_breakdown()
+        assert breakdown["reasoning"]["components"]["planner"]["calls"] == 1
+        assert list(breakdown["conversation"]["turns"]) == [1]
+
+    @pytest.mark.asyncio
+    async def test_stop_state_updates_drains_then_closes(self, session):
+        """Pending extractions are drained before the worker is stopped."""
+        calls = []
+        service = Mock()
+        service.drain_extractions = AsyncMock(side_effect=lambda: calls.append("drain"))
+        service.close = AsyncMock(side_effect=lambda: calls.append("close"))
+        session.state_update_service = service
+
+        await session.stop_state_updates()
+
+        assert calls == ["drain", "close"]
+
+    @pytest.mark.asyncio
+    async def test_stop_state_updates_closes_after_timeout(self, session):
+        """A stuck extraction does not block exit past the timeout."""
+        import asyncio
+
+        async def never_drains():
+            await asyncio.sleep(60)
+
+        service = Mock()
+        service.drain_extractions = AsyncMock(side_effect=never_drains)
+        service.close = AsyncMock()
+        session.state_update_service = service
+
+        await asyncio.wait_for(session.stop_state_updates(timeout=0.01), timeout=1)
+
+        service.close.assert_awaited_once()
+
     def test_title_property_setter(self, session):
         """Test setting title via property."""
         original_time = session.metadata.last_active_at
@@ -321,3 +321,201 @@ class TestSessionManager:
         session = manager._create_new_session("test")
 
         assert session.agent_loop.callbacks == callbacks
+
+
+class TestSessionJournal:
+    """Test journaled (append-only) session persistence."""
+
+    @pytest.fixture
+    def mock_llm(self):
+        """Create a mock Claude instance."""
+        llm = Mock(spec=Claude)
+        llm.model = "claude-sonnet-4.5"
+        return llm
+
+    @pytest.fixture
+    def make_manager(self, mock_llm, tmp_path):
+        """Factory for SessionManagers sharing one storage directory."""
+
+        def _make(**kwargs) -> SessionManager:
+            return SessionManager(
+                llm=mock_llm,
+                tool_registry=Mock(spec=ToolRegistry),
+                storage_dir=tmp_path / "sessions",
+                summarizer=SummarizationService(llm=mock_llm),
+                **kwargs,
+            )
+
+        return _make
+
+    @staticmethod
+    def _paths(manager: SessionManager) -> tuple[Path, Path]:
+        key = f"session:{SessionManager.DEFAULT_SESSION_ID}"
+        return manager.state_provider.get_file_path(key), manager._journal.get_file_path(key)
+
+    @pytest.mark.asyncio
+    async def test_second_save_appends_only_new_messages(self, make_manager):
+        """The first save writes a snapshot; later saves only append deltas."""
+        manager = make_manager()
+        session = await manager.get_or_create_default_session()
+        session.conversation.add_user_message("first")
+        await manager.save_active_session_async()
+        snapshot_path, journal_path = self._paths(manager)
+        snapshot_before = snapshot_path.read_text()
+
+        session.conversation.add_user_message("second")
+        await manager.save_active_session_async()
+
+        assert snapshot_path.read_text() == snapshot_before
+        records = [json.loads(line) for line in journal_path.read_text().splitlines()]
+        splices = [r for r in records if r["op"] == "splice"]
+        assert len(splices) == 1
+        assert splices[0]["start"] == 1
+        assert [m["content"] for m in splices[0]["items"]] == ["second"]
+
+        restored = await make_manager().get_or_create_default_session()
+        assert [m["content"] for m in restored.conversation.get_messages()] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_cleared_history_writes_full_snapshot(self, make_manager):
+        """Removing messages invalidates the journal and rewrites the snapshot."""
+        manager = make_manager()
+        session = await manager.get_or_create_default_session()
+        session.conversation.add_user_message("old")
+        await manager.save_active_session_async()
+        session.conversation.add_user_message("older")
+        await manager.save_active_session_async()
+
+        session.clear_history()
+        session.conversation.add_user_message("fresh")
+        await manager.save_active_session_async()
+
+        snapshot_path, journal_path = self._paths(manager)
+        assert not journal_path.exists()
+        data = json.loads(snapshot_path.read_text())
+        assert [m["content"] for m in data["conversation"]["messages"]] == ["fresh"]
+
+    @pytest.mark.asyncio
+    async def test_large_journal_is_compacted(self, make_manager):
+        """Compaction folds the journal back into the snapshot."""
+        manager = make_manager()
+        manager._journal.compact_threshold_bytes = 1
+        session = await manager.get_or_create_default_session()
+        await manager.save_active_session_async()
+
+        session.conversation.add_user_message("needs compaction")
+        await manager.save_active_session_async()
+        await manager._compaction_tasks[SessionManager.DEFAULT_SESSION_ID]
+
+        snapshot_path, journal_path = self._paths(manager)
+        assert not journal_path.exists()
+        data = json.loads(snapshot_path.read_text())
+        assert data["conversation"]["messages"][-1]["content"] == "needs compaction"
+
+    @pytest.mark.asyncio
+    async def test_export_writes_full_session(self, make_manager, tmp_path):
+        """Export keeps the full-rewrite format available."""
+        manager = make_manager()
+        session = await manager.get_or_create_default_session()
+        session.conversation.add_user_message("exported")
+
+        path = await manager.export_session_async(SessionManager.DEFAULT_SESSION_ID, tmp_path / "out.json")
+
+        data = json.loads(path.read_text())
+        assert data["conversation"]["messages"][0]["content"] == "exported"
+
+    @pytest.mark.asyncio
+    async def test_journal_disabled_rewrites_snapshot(self, make_manager):
+        """enable_journal=False keeps the old full-rewrite behaviour."""
+        manager = make_manager(enable_journal=False)
+        session = await manager.get_or_create_default_session()
+        session.conversation.add_user_message("one")
+        await manager.save_active_session_async()
+        session.conversation.add_user_message("two")
+        await manager.save_active_session_async()
+
+        key = f"session:{SessionManager.DEFAULT_SESSION_ID}"
+        data = json.loads(manager.state_provider.get_file_path(key).read_text())
+        assert len(data["conversation"]["messages"]) == 2
+        assert manager._journal is None
+
+
+class TestLazySessionRestore:
+    """Test index-based lazy session restoration."""
+
+    @pytest.fixture
+    def make_manager(self, tmp_path):
+        """Factory for SessionManagers sharing one storage directory."""
+        llm = Mock(spec=Claude)
+        llm.model = "claude-sonnet-4.5"
+
+        def _make() -> SessionManager:
+            return SessionManager(
+                llm=llm,
+                tool_registry=Mock(spec=ToolRegistry),
+                storage_dir=tmp_path / "sessions",
+                summarizer=SummarizationService(llm=llm),
+            )
+
+        return _make
+
+    @staticmethod
+    async def _populate(manager: SessionManager) -> None:
+        for session_id, count in (("default", 1), ("work", 2), ("play", 3)):
+            session = await manager.get_or_create_session(session_id, title=session_id.title())
+            for i in range(count):
+                session.conversation.add_user_message(f"{session_id} {i}")
+            await manager._save_session_async(session)
+
+    @pytest.mark.asyncio
+    async def test_restore_loads_only_active_session(self, make_manager):
+        """Only the active session is deserialized; the rest come from the index."""
+        await self._populate(make_manager())
+
+        manager = make_manager()
+        await manager.restore_all_sessions()
+
+        assert set(manager._sessions) == {"default"}
+        assert manager.get_active_session().session_id == "default"
+        info = {entry["session_id"]: entry["message_count"] for entry in manager.get_all_sessions_info()}
+        assert info == {"default": 1, "work": 2, "play": 3}
+        assert {meta.title for meta in manager.list_sessions()} == {"Default", "Work", "Play"}
+
+    @pytest.mark.asyncio
+    async def test_switch_loads_session_on_demand(self, make_manager):
+        """switch_session_async deserializes an indexed session when needed."""
+        await self._populate(make_manager())
+        manager = make_manager()
+        await manager.restore_all_sessions()
+
+        with pytest.raises(ValueError, match="not loaded"):
+            manager.switch_session("work")
+        session = await manager.switch_session_async("work")
+
+        assert session.get_message_count() == 2
+        assert manager.get_active_session() is session
+        assert set(manager._sessions) == {"default", "work"}
+
+    @pytest.mark.asyncio
+    async def test_missing_index_is_rebuilt(self, make_manager):
+        """Sessions saved without an index are indexed on restore."""
+        await self._populate(make_manager())
+        manager = make_manager()
+        await manager.state_provider.delete(SessionManager.SESSION_INDEX_KEY)
+
+        await manager.restore_all_sessions()
+
+        assert len(manager.get_all_sessions_info()) == 3
+        assert await manager.state_provider.exists(SessionManager.SESSION_INDEX_KEY)
+
+    @pytest.mark.asyncio
+    async def test_delete_unloaded_session(self, make_manager):
+        """Indexed sessions can be deleted without loading them."""
+        await self._populate(make_manager())
+        manager = make_manager()
+        await manager.restore_all_sessions()
+
+        await manager.delete_session_async("play")
+
+        assert "play" not in {entry["session_id"] for entry in manager.get_all_sessions_info()}
+        assert not await manager.state_provider.exists("session:play")
@@ -0,0 +1,55 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+import pytest
+
+import nxs.application.similarity as similarity
+from nxs.application.similarity import MinHashLSH, jaccard_similarity
+
+
+def test_query_finds_near_duplicates_only():
+    index = MinHashLSH(threshold=0.7)
+    index.add("a", "search for python async tutorials online")
+    index.add("b", "compare database connection pool settings")
+
+    assert index.query("search python async tutorials online") == ["a"]
+    assert index.query("write a poem about autumn leaves") == []
+
+
+def test_results_are_verified_with_exact_jaccard():
+    """Every match clears the threshold; clear near-duplicates are never missed."""
+    texts = [f"step {i} gather data about topic {i % 5} quickly" for i in range(50)]
+    index = MinHashLSH(threshold=0.6)
+    for i, text in enumerate(texts):
+        index.add(i, text)
+
+    query = "step 7 gather data about topic 2 quickly"
+    similarities = {i: jaccard_similarity(query.split(), text.split()) for i, text in enumerate(texts)}
+    matches = index.query(query)
+
+    assert matches[0] == 7
+    assert all(similarities[i] >= 0.6 for i in matches)
+    assert {i for i, sim in similarities.items() if sim >= 0.75} <= set(matches)
+
+
+def test_add_replaces_and_remove_drops():
+    index = MinHashLSH(threshold=0.7)
+    index.add("a", "alpha beta gamma delta")
+    index.add("a", "one two three four")
+
+    assert index.query("alpha beta gamma delta") == []
+    assert index.query("one two three four") == ["a"]
+
+    index.remove("a")
+    assert len(index) == 0
+    assert index.query("one two three four") == []
+
+
+def test_pure_python_signature_matches_numpy(monkeypatch):
+    if similarity.np is None:
+        pytest.skip("NumPy not installed")
+    tokens = ["alpha", "beta", "gamma"]
+    vectorized = MinHashLSH().signature(tokens)
+
+    monkeypatch.setattr(similarity, "np", None)
+
+    assert MinHashLSH().signature(tokens) == vectorized
@@ -2,11 +2,12 @@
 
 import asyncio
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
-from nxs.infrastructure.state import InMemoryStateProvider, FileStateProvider
+from nxs.infrastructure.state import InMemoryStateProvider, FileStateProvider, StateJournal
 
 
 class TestInMemoryStateProvider:
@@ -332,6 +333,99 @@ class TestFileStateProvider:
             assert loaded == test_data
 
 
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_are_coalesced(self):
+        """Saves issued while a write is in flight collapse into the latest one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            provider = FileStateProvider(base_dir=tmpdir)
+            written: list[int] = []
+            write_file = provider._write_file
+
+            def slow_write(key, data):
+                time.sleep(0.05)
+                written.append(data["n"])
+                write_file(key, data)
+
+            provider._write_file = slow_write
+
+            await asyncio.gather(*(provider.save("k", {"n": n}) for n in range(5)))
+
+            assert written == [4]  # Only the latest snapshot hits the disk
+            assert await provider.load("k") == {"n": 4}
+
+    @pytest.mark.asyncio
+    async def test_save_does_not_block_event_loop(self):
+        """Disk I/O runs in a worker thread while the loop keeps ticking."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            provider = FileStateProvider(base_dir=tmpdir, fsync="full")
+            write_file = provider._write_file
+            ticks = 0
+
+            def slow_write(key, data):
+                time.sleep(0.1)
+                write_file(key, data)
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            provider._write_file = slow_write
+            ticker_task = asyncio.create_task(ticker())
+            await provider.save("k", {"big": "x" * 1000})
+            ticker_task.cancel()
+
+            assert ticks >= 3
+            assert (await provider.load("k"))["big"] == "x" * 1000
+
+
+class TestStateJournal:
+    """Test StateJournal append/replay."""
+
+    @pytest.mark.asyncio
+    async def test_replay_applies_records_in_order(self):
+        """set/update/splice records are applied on top of the snapshot."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = StateJournal(base_dir=tmpdir)
+            snapshot = {"meta": {"title": "a"}, "conv": {"messages": [1, 2], "x": 0}}
+
+            await journal.append(
+                "session:1",
+                [
+                    {"op": "set", "path": ["meta"], "value": {"title": "b"}},
+                    {"op": "update", "path": ["conv"], "value": {"x": 1}},
+                    {"op": "splice", "path": ["conv", "messages"], "start": 2, "items": [3, 4]},
+                ],
+            )
+            data = await journal.replay("session:1", snapshot)
+
+            assert data == {"meta": {"title": "b"}, "conv": {"messages": [1, 2, 3, 4], "x": 1}}
+            # Journal files don't show up as provider keys
+            assert await FileStateProvider(base_dir=tmpdir).list_keys() == []
+
+    @pytest.mark.asyncio
+    async def test_replay_stops_at_truncated_record(self):
+        """A partially written trailing line is ignored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = StateJournal(base_dir=tmpdir)
+            await journal.append("k", [{"op": "set", "path": ["a"], "value": 1}])
+            with open(journal.get_file_path("k"), "a") as f:
+                f.write('{"op": "set", "path": ["a"], "val')
+
+            assert await journal.replay("k", {}) == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_replay_skips_records_from_older_generation(self):
+        """Records already folded into a newer snapshot are not re-applied."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = StateJournal(base_dir=tmpdir)
+            await journal.append("k", [{"op": "set", "path": ["a"], "value": "stale"}], generation=1)
+
+            snapshot = {"a": "fresh", StateJournal.GENERATION_FIELD: 2}
+            assert (await journal.replay("k", snapshot))["a"] == "fresh"
+
+
 class TestStateProviderComparison:
     """Test that both providers behave identically."""
 
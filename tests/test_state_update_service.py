@@ -0,0 +1,159 @@
+"""Tests for background and combined state extraction in StateUpdateService."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from nxs.application.session_state import SessionState
+from nxs.application.state_extractor import StateExtractor
+from nxs.application.state_update_service import StateExtractionConfig, StateUpdateService
+from nxs.domain.events import EventBus
+
+
+class FakeStateProvider:
+    def __init__(self):
+        self.saves = 0
+
+    async def save(self, key, data):
+        self.saves += 1
+
+
+class FakeExtractor:
+    """StateExtractor stand-in that blocks until released."""
+
+    enable_user_extraction = enable_fact_extraction = enable_intent_extraction = True
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.combined_calls: list[list[tuple[str, str]]] = []
+        self.separate_calls = 0
+
+    async def extract_combined(self, exchanges):
+        await self.release.wait()
+        self.combined_calls.append(list(exchanges))
+        return {
+            "user_info": {"name": "Alice"},
+            "facts": [f"fact from {user}" for user, _ in exchanges],
+            "intent": {"type": "question", "confidence": 0.9, "details": {}},
+        }
+
+    async def extract_user_info(self, user_msg, assistant_msg):
+        self.separate_calls += 1
+        return {}
+
+    async def extract_facts(self, user_msg, assistant_msg):
+        self.separate_calls += 1
+        return []
+
+    async def classify_intent(self, user_msg):
+        self.separate_calls += 1
+        return None
+
+
+def _service(extractor, **config) -> StateUpdateService:
+    return StateUpdateService(
+        session_state=SessionState(session_id="s1"),
+        event_bus=EventBus(),
+        state_provider=FakeStateProvider(),
+        session_id="s1",
+        state_extractor=extractor,
+        extraction_config=StateExtractionConfig(**config),
+    )
+
+
+@pytest.mark.asyncio
+async def test_exchange_returns_before_extraction_finishes():
+    """on_exchange_complete only queues the exchange."""
+    extractor = FakeExtractor()
+    service = _service(extractor)
+
+    await asyncio.wait_for(service.on_exchange_complete("hi", "hello", []), timeout=1)
+    assert extractor.combined_calls == []
+
+    extractor.release.set()
+    await service.drain_extractions()
+
+    assert extractor.combined_calls == [[("hi", "hello")]]
+    assert extractor.separate_calls == 0
+    assert service.session_state.user_profile.name == "Alice"
+    assert service.state_provider.saves >= 2
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_backed_up_exchanges_are_batched():
+    """Exchanges queued while the worker is busy are extracted together."""
+    extractor = FakeExtractor()
+    service = _service(extractor, max_batch_size=2)
+
+    for i in range(4):
+        await service.on_exchange_complete(f"q{i}", f"a{i}", [])
+        await asyncio.sleep(0)  # Let the worker pick up the first exchange
+    extractor.release.set()
+    await service.drain_extractions()
+
+    assert [len(batch) for batch in extractor.combined_calls] == [1, 2, 1]
+    assert [user for batch in extractor.combined_calls for user, _ in batch] == ["q0", "q1", "q2", "q3"]
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_exchange():
+    """A full queue never blocks; the oldest waiting exchange is dropped."""
+    extractor = FakeExtractor()
+    service = _service(extractor, queue_size=2)
+
+    await service.on_exchange_complete("q0", "a0", [])
+    await asyncio.sleep(0)  # Worker takes q0 and blocks
+    for i in range(1, 4):
+        await service.on_exchange_complete(f"q{i}", f"a{i}", [])
+    extractor.release.set()
+    await service.drain_extractions()
+
+    extracted = [user for batch in extractor.combined_calls for user, _ in batch]
+    assert extracted == ["q0", "q2", "q3"]
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_separate_mode_runs_inline():
+    """background=False, combined=False keeps the original three calls."""
+    extractor = FakeExtractor()
+    service = _service(extractor, background=False, combined=False)
+
+    await service.on_exchange_complete("hi", "hello", [])
+
+    assert extractor.separate_calls == 3
+    assert extractor.combined_calls == []
+
+
+class FakeMessages:
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(self.payload))])
+
+
+@pytest.mark.asyncio
+async def test_extract_combined_uses_one_request():
+    """StateExtractor.extract_combined returns all three outputs from one call."""
+    messages = FakeMessages(
+        {
+            "user_info": {"name": "Alice"},
+            "facts": ["API rate limit is 1000/hr"],
+            "intent": {"type": "question", "confidence": 0.8},
+        }
+    )
+    extractor = StateExtractor(client=SimpleNamespace(messages=messages))
+
+    result = await extractor.extract_combined([("I'm Alice", "Hi"), ("What's the limit?", "1000/hr")])
+
+    assert messages.calls == 1
+    assert result["user_info"]["name"] == "Alice"
+    assert result["facts"] == ["API rate limit is 1000/hr"]
+    assert result["intent"]["type"] == "question"
@@ -0,0 +1,87 @@
+"""Tests for concurrent map-reduce summarization in SummarizationService."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from nxs.application.summarization import SummarizationService
+
+
+class FakeLLM:
+    """Claude stand-in recording prompts and request concurrency."""
+
+    model = "claude-haiku-4-5"
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create_message(self, messages, max_tokens):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            prompt = messages[0]["content"]
+            self.prompts.append(prompt)
+            return SimpleNamespace(
+                content=[SimpleNamespace(text=f"summary #{len(self.prompts)}")],
+                usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def _messages(count: int) -> list[dict]:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_summarized_concurrently():
+    """Chunk requests overlap, bounded by max_concurrency."""
+    llm = FakeLLM()
+    service = SummarizationService(llm=llm, chunk_size=2, max_concurrency=3)
+
+    result = await service.summarize(_messages(10))
+
+    assert llm.peak == 3
+    assert len(llm.prompts) == 6  # 5 chunks + final merge
+    assert result.messages_summarized == 10
+    assert result.summary
+
+
+@pytest.mark.asyncio
+async def test_many_partial_summaries_are_reduced_in_a_tree():
+    """More partial summaries than max_merge_sections are merged in groups first."""
+    llm = FakeLLM(delay=0)
+    service = SummarizationService(llm=llm, chunk_size=1, max_merge_sections=3)
+
+    result = await service.summarize(_messages(7))
+
+    # 7 chunks -> 3 group merges -> final merge
+    assert len(llm.prompts) == 7 + 3 + 1
+    assert llm.prompts[-1].count("Segment ") == 3
+    assert result.messages_summarized == 7
+
+
+@pytest.mark.asyncio
+async def test_chunk_summaries_are_cached_by_content():
+    """A repeated run reuses cached chunk summaries and only re-merges."""
+    llm = FakeLLM(delay=0)
+    service = SummarizationService(llm=llm, chunk_size=2)
+    messages = _messages(6)
+
+    await service.summarize(messages)
+    assert len(llm.prompts) == 4
+
+    await service.summarize(messages, force=True)
+    assert len(llm.prompts) == 5  # Only the final merge ran again
+
+    service.clear_cache()
+    await service.summarize(messages, force=True)
+    assert len(llm.prompts) == 9
@@ -0,0 +1,306 @@
+"""Tests for ToolRegistry tool catalog caching."""
+
+import asyncio
+from typing import Callable
+
+import pytest
+
+from nxs.application.tool_call_coalescer import ToolCallCoalescer
+from nxs.application.tool_registry import ToolRegistry
+from nxs.application.tool_result_cache import ToolResultCache
+from nxs.application.tool_state import ToolStateManager
+
+
+class CountingToolProvider:
+    """Tool provider that counts get_tool_definitions() calls."""
+
+    def __init__(self, name: str = "counting", tools: list[str] | None = None):
+        self._name = name
+        self.tools = tools or ["alpha", "beta"]
+        self.list_calls = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def provider_name(self) -> str:
+        return self._name
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        self._listeners.append(listener)
+
+    def fire_change(self) -> None:
+        for listener in self._listeners:
+            listener()
+
+    async def get_tool_definitions(self) -> list[dict]:
+        self.list_calls += 1
+        return [
+            {"name": name, "description": f"{name} tool", "input_schema": {"type": "object", "properties": {}}}
+            for name in self.tools
+        ]
+
+    async def execute_tool(self, tool_name: str, arguments: dict) -> str:
+        return tool_name
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_cached_and_identical():
+    """Repeated calls return the same list without re-listing providers."""
+    provider = CountingToolProvider()
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+
+    first = await registry.get_tool_definitions_for_api()
+    second = await registry.get_tool_definitions_for_api()
+    await registry.execute_tool("alpha", {})
+    await registry.get_tool_schema("beta")
+
+    assert first is second
+    assert provider.list_calls == 1
+    assert registry.catalog_version == 1
+    assert first[-1]["cache_control"] == {"type": "ephemeral"}
+
+
+@pytest.mark.asyncio
+async def test_register_provider_invalidates_catalog():
+    """Registering another provider rebuilds the catalog once."""
+    registry = ToolRegistry()
+    registry.register_provider(CountingToolProvider())
+    first = await registry.get_tool_definitions_for_api()
+
+    registry.register_provider(CountingToolProvider(name="other", tools=["gamma"]))
+    second = await registry.get_tool_definitions_for_api()
+
+    assert first is not second
+    assert [tool["name"] for tool in second] == ["alpha", "beta", "gamma"]
+    assert registry.catalog_version == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_toggle_invalidates_catalog():
+    """Disabling a tool through the ToolStateManager drops it from the catalog."""
+    state = ToolStateManager()
+    provider = CountingToolProvider()
+    registry = ToolRegistry(tool_state_manager=state)
+    registry.register_provider(provider)
+    await registry.get_tool_definitions_for_api()
+
+    state.disable_tool("beta")
+    tools = await registry.get_tool_definitions_for_api()
+
+    assert [tool["name"] for tool in tools] == ["alpha"]
+    assert provider.list_calls == 2
+    # Disabled tools keep their routing entry and schema
+    assert registry.get_provider_name("beta") == "counting"
+    assert await registry.get_tool_schema("beta") is not None
+
+
+@pytest.mark.asyncio
+async def test_provider_change_listener_invalidates_catalog():
+    """Providers reporting a change (e.g. MCP list_changed) trigger a rebuild."""
+    provider = CountingToolProvider()
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    await registry.get_tool_definitions_for_api()
+
+    provider.tools = ["alpha", "beta", "delta"]
+    provider.fire_change()
+    tools = await registry.get_tool_definitions_for_api()
+
+    assert [tool["name"] for tool in tools] == ["alpha", "beta", "delta"]
+    assert provider.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_control_does_not_mutate_provider_definitions():
+    """cache_control is applied to a copy, not the provider's own dicts."""
+
+    class StaticProvider(CountingToolProvider):
+        def __init__(self):
+            super().__init__(name="static")
+            self.definitions = [{"name": "only", "description": "", "input_schema": {"type": "object"}}]
+
+        async def get_tool_definitions(self) -> list[dict]:
+            return self.definitions
+
+    provider = StaticProvider()
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    await registry.get_tool_definitions_for_api()
+
+    assert "cache_control" not in provider.definitions[0]
+
+
+class PolicyToolProvider(CountingToolProvider):
+    """Provider declaring cache policies and counting executions."""
+
+    def __init__(self, policies: dict[str, dict | None]):
+        super().__init__(name="policy", tools=list(policies))
+        self.policies = policies
+        self.calls: list[tuple[str, dict]] = []
+
+    async def get_tool_definitions(self) -> list[dict]:
+        definitions = await super().get_tool_definitions()
+        for definition in definitions:
+            if self.policies[definition["name"]] is not None:
+                definition["cache_policy"] = self.policies[definition["name"]]
+        return definitions
+
+    async def execute_tool(self, tool_name: str, arguments: dict) -> str:
+        self.calls.append((tool_name, arguments))
+        if arguments.get("fail"):
+            raise RuntimeError("boom")
+        return f"{tool_name} #{len(self.calls)}"
+
+
+@pytest.mark.asyncio
+async def test_results_of_cacheable_tools_are_reused():
+    """Declared-cacheable tools execute once per argument set; others every time."""
+    provider = PolicyToolProvider({"search": {"ttl": 60}, "now": None})
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+
+    first = await registry.execute_tool("search", {"q": "x", "page": 1})
+    second = await registry.execute_tool("search", {"page": 1, "q": "x"})
+    await registry.execute_tool("search", {"q": "y"})
+    await registry.execute_tool("now", {})
+    await registry.execute_tool("now", {})
+
+    assert first == second == "search #1"
+    assert [name for name, _ in provider.calls] == ["search", "search", "now", "now"]
+    assert registry.result_cache.stats()["hits"] == 1
+    # The policy is registry metadata and never reaches the API
+    tools = await registry.get_tool_definitions_for_api()
+    assert all("cache_policy" not in tool for tool in tools)
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached_and_mutations_invalidate():
+    provider = PolicyToolProvider({"read": {}, "write": {"cacheable": False, "read_only": False}})
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await registry.execute_tool("read", {"fail": True})
+    await registry.execute_tool("read", {})
+    await registry.execute_tool("read", {})
+    await registry.execute_tool("write", {})
+    await registry.execute_tool("read", {})
+
+    assert [name for name, _ in provider.calls] == ["read", "read", "read", "write", "read"]
+
+
+@pytest.mark.asyncio
+async def test_result_cache_is_scoped():
+    """Sessions sharing a registry don't see each other's results."""
+    provider = PolicyToolProvider({"search": {}})
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    lookups: list[tuple] = []
+    registry.result_cache.add_listener(lambda scope, tool, hit: lookups.append((scope, hit)))
+
+    registry.set_result_cache_scope("a")
+    await registry.execute_tool("search", {})
+    registry.set_result_cache_scope("b")
+    await registry.execute_tool("search", {})
+    registry.set_result_cache_scope("a")
+    await registry.execute_tool("search", {})
+
+    assert len(provider.calls) == 2
+    assert lookups == [("a", False), ("b", False), ("a", True)]
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_mutation_clears_other_registries():
+    """A mutating call in one session drops the cached reads of every session."""
+    provider = PolicyToolProvider({"read": {}, "write": {"cacheable": False, "read_only": False}})
+    cache = ToolResultCache()
+    registry_a = ToolRegistry(result_cache=cache)
+    registry_b = ToolRegistry(result_cache=cache)
+    for scope, registry in (("a", registry_a), ("b", registry_b)):
+        registry.register_provider(provider)
+        registry.set_result_cache_scope(scope)
+
+    await registry_a.execute_tool("read", {})
+    await registry_b.execute_tool("read", {})  # Separate scope: not a hit
+    await registry_b.execute_tool("read", {})
+    await registry_a.execute_tool("write", {})
+    await registry_b.execute_tool("read", {})
+
+    assert [name for name, _ in provider.calls] == ["read", "read", "write", "read"]
+
+
+class SlowToolProvider(PolicyToolProvider):
+    """PolicyToolProvider whose calls block until released."""
+
+    def __init__(self, policies: dict[str, dict | None]):
+        super().__init__(policies)
+        self.release = asyncio.Event()
+
+    async def execute_tool(self, tool_name: str, arguments: dict) -> str:
+        self.calls.append((tool_name, arguments))
+        await self.release.wait()
+        return f"{tool_name} #{len(self.calls)}"
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_are_coalesced():
+    """Overlapping identical calls share one execution; non-idempotent tools don't."""
+    provider = SlowToolProvider(
+        {"read": {"cacheable": False}, "append": {"read_only": False, "idempotent": False}}
+    )
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    await registry.get_tool_definitions_for_api()
+
+    calls = [
+        registry.execute_tool("read", {"id": "a"}),
+        registry.execute_tool("read", {"id": "a"}),
+        registry.execute_tool("read", {"id": "b"}),
+        registry.execute_tool("append", {"id": "a"}),
+        registry.execute_tool("append", {"id": "a"}),
+    ]
+    tasks = [asyncio.create_task(call) for call in calls]
+    await asyncio.sleep(0.01)
+    provider.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results[0] == results[1]
+    assert sorted(name for name, _ in provider.calls) == ["append", "append", "read", "read"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    provider = SlowToolProvider({"read": {"cacheable": False}})
+    registry = ToolRegistry()
+    registry.register_provider(provider)
+    await registry.get_tool_definitions_for_api()
+
+    first = asyncio.create_task(registry.execute_tool("read", {}))
+    second = asyncio.create_task(registry.execute_tool("read", {}))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    assert await second == "read #1"
+    assert first.cancelled()
+    assert len(provider.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_tools_without_policy_are_not_coalesced():
+    """An unannotated tool may have side effects, so identical calls all run."""
+    provider = SlowToolProvider({"send": None})
+    coalescer = ToolCallCoalescer()
+    registry = ToolRegistry(call_coalescer=coalescer)
+    registry.register_provider(provider)
+    await registry.get_tool_definitions_for_api()
+
+    tasks = [asyncio.create_task(registry.execute_tool("send", {"to": "a"})) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    provider.release.set()
+    await asyncio.gather(*tasks)
+
+    assert provider.calls == [("send", {"to": "a"}), ("send", {"to": "a"})]
+    assert coalescer.coalesced == 0
@@ -0,0 +1,99 @@
+"""Tests for ToolResultCache expiry, eviction and persistence."""
+
+import pytest
+
+from nxs.application.session_state import StateMetadata
+from nxs.application.tool_result_cache import ToolCachePolicy, ToolResultCache
+from nxs.infrastructure.state import InMemoryStateProvider
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ToolResultCache(clock=clock)
+    cache.put("search", {"q": "x"}, "result", ToolCachePolicy(ttl=60))
+
+    clock.now += 59
+    assert cache.get("search", {"q": "x"}) == "result"
+    clock.now += 1
+    assert cache.get("search", {"q": "x"}) is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_global_and_per_tool():
+    cache = ToolResultCache(max_entries=3)
+    limited = ToolCachePolicy(max_entries=2)
+    policy = ToolCachePolicy()
+
+    cache.put("a", {"n": 1}, "a1", limited)
+    cache.put("a", {"n": 2}, "a2", limited)
+    cache.get("a", {"n": 1})  # a1 is now most recently used
+    cache.put("a", {"n": 3}, "a3", limited)  # evicts a2 (tool limit)
+
+    assert cache.get("a", {"n": 2}) is None
+    assert cache.get("a", {"n": 1}) == "a1"
+
+    cache.put("b", {}, "b", policy)
+    cache.put("c", {}, "c", policy)  # evicts a3 (global limit)
+
+    assert cache.get("a", {"n": 3}) is None
+    assert cache.get("a", {"n": 1}) == "a1"
+    assert cache.evictions == 2
+
+
+def test_non_cacheable_policies_store_nothing():
+    cache = ToolResultCache()
+    for policy in (
+        ToolCachePolicy(cacheable=False),
+        ToolCachePolicy(read_only=False),
+        ToolCachePolicy(ttl=0),
+    ):
+        cache.put("tool", {}, "result", policy)
+
+    assert len(cache) == 0
+
+
+def test_policy_from_metadata():
+    assert ToolCachePolicy.from_metadata(None) is None
+    policy = ToolCachePolicy.from_metadata({"ttl": 30, "max_entries": 5, "unknown": 1})
+    assert policy == ToolCachePolicy(ttl=30, max_entries=5)
+    assert ToolCachePolicy.from_metadata(policy.to_metadata()) == policy
+
+
+def test_lookups_are_reported_to_state_metadata():
+    cache = ToolResultCache()
+    metadata = StateMetadata()
+    cache.add_listener(lambda scope, tool, hit: metadata.record_tool_cache_lookup(hit))
+
+    cache.get("search", {})
+    cache.put("search", {}, "result", ToolCachePolicy())
+    cache.get("search", {})
+
+    summary = metadata.get_summary()
+    assert (summary["tool_cache_hits"], summary["tool_cache_misses"]) == (1, 1)
+    assert StateMetadata.from_dict(metadata.to_dict()).tool_cache_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_backed_cache_round_trip():
+    provider = InMemoryStateProvider()
+    clock = FakeClock()
+    cache = ToolResultCache(state_provider=provider, clock=clock)
+    cache.put("search", {"q": "x"}, "kept", ToolCachePolicy(ttl=600))
+    cache.put("search", {"q": "y"}, "expired", ToolCachePolicy(ttl=5))
+    await cache.save()
+
+    clock.now += 10
+    restored = ToolResultCache(state_provider=provider, clock=clock)
+    await restored.load()
+
+    assert restored.get("search", {"q": "x"}) == "kept"
+    assert restored.get("search", {"q": "y"}) is None
@@ -0,0 +1 @@
+"""Tests for the Textual TUI."""
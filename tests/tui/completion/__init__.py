@@ -0,0 +1 @@
+"""Tests for input autocompletion."""
@@ -0,0 +1 @@
+"""Tests for TUI formatters."""
@@ -0,0 +1,56 @@
+from nxs.presentation.formatters import MarkdownBlockSplitter
+
+
+def _feed_all(splitter: MarkdownBlockSplitter, chunks: list[str]) -> list[str]:
+    blocks: list[str] = []
+    for chunk in chunks:
+        blocks.extend(splitter.feed(chunk))
+    return blocks
+
+
+def test_paragraph_completes_on_blank_line():
+    splitter = MarkdownBlockSplitter()
+
+    assert _feed_all(splitter, ["Hello ", "wor", "ld\n"]) == []
+    assert splitter.pending == "Hello world\n"
+    assert splitter.feed("\nNext") == ["Hello world"]
+    assert splitter.pending == "Next"
+
+
+def test_heading_is_its_own_block():
+    splitter = MarkdownBlockSplitter()
+
+    blocks = _feed_all(splitter, ["intro line\n", "## Title\n", "body"])
+
+    assert blocks == ["intro line", "## Title"]
+    assert splitter.flush() == "body"
+    assert splitter.pending == ""
+
+
+def test_code_fence_waits_for_closing_fence():
+    splitter = MarkdownBlockSplitter()
+
+    blocks = _feed_all(splitter, ["```python\n", "x = 1\n", "\n", "y = 2\n"])
+    assert blocks == []
+    assert splitter.in_code_block
+
+    blocks = _feed_all(splitter, ["``", "`\n", "after"])
+    assert blocks == ["```python\nx = 1\n\ny = 2\n```"]
+    assert not splitter.in_code_block
+    assert splitter.pending == "after"
+
+
+def test_fence_closes_only_with_matching_marker():
+    splitter = MarkdownBlockSplitter()
+
+    blocks = _feed_all(splitter, ["````\n", "```\n", "````\n"])
+
+    assert blocks == ["````\n```\n````"]
+
+
+def test_flush_returns_open_tail_and_resets():
+    splitter = MarkdownBlockSplitter()
+    _feed_all(splitter, ["- one\n", "- two"])
+
+    assert splitter.flush() == "- one\n- two"
+    assert splitter.feed("fresh\n\n") == ["fresh"]